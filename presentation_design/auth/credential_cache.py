@@ -0,0 +1,299 @@
+"""
+Credential Cache Module
+=======================
+
+In-memory cache of user OAuth credentials with proactive refresh.
+
+Web requests used to rebuild ``Credentials`` from the session dictionary
+several times per request and, because the expiry was not stored, never
+knew when a token was about to lapse. The cache keeps one credentials
+object per identity, refreshes it in the background once it enters the
+refresh margin, and coalesces concurrent refreshes into one token call.
+Callers that need a token for a known duration (background jobs) ask for
+a minimum remaining lifetime and get a synchronous refresh if needed.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from google.oauth2.credentials import Credentials
+
+from ..utils.logger import get_logger
+from ..utils.lru import LRUCache
+from ..utils.single_flight import SingleFlight
+from .service_factory import credential_identity
+
+logger = get_logger(__name__)
+
+# Google access tokens live one hour; a refresh cannot guarantee more
+MAX_TOKEN_LIFETIME_SECONDS = 3500
+
+# OAuth error codes meaning the grant itself is gone; retrying cannot help
+PERMANENT_REFRESH_ERRORS = ('invalid_grant', 'invalid_client', 'unauthorized_client')
+
+
+class CredentialRefreshError(Exception):
+    """
+    Raised when credentials cannot be refreshed.
+
+    Attributes:
+        permanent (bool): The grant was revoked or is invalid (as opposed
+            to a transient network or server error)
+    """
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+def _utcnow() -> datetime:
+    # google-auth stores expiry as a naive UTC datetime
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def credentials_to_dict(credentials: Credentials) -> Dict[str, Any]:
+    """
+    Serialize credentials for the Flask session or a job.
+
+    Args:
+        credentials: OAuth credentials
+
+    Returns:
+        JSON-serializable dictionary including the token expiry
+    """
+    return {
+        'token': credentials.token,
+        'refresh_token': credentials.refresh_token,
+        'token_uri': credentials.token_uri,
+        'client_id': credentials.client_id,
+        'client_secret': credentials.client_secret,
+        'scopes': credentials.scopes,
+        'expiry': credentials.expiry.isoformat() if credentials.expiry else None
+    }
+
+
+def credentials_from_dict(data: Dict[str, Any]) -> Credentials:
+    """
+    Rebuild credentials from credentials_to_dict() output.
+
+    Dictionaries saved before the expiry was stored are accepted; their
+    credentials simply have no known expiry.
+
+    Args:
+        data: Serialized credentials
+
+    Returns:
+        OAuth credentials
+    """
+    expiry = None
+    if data.get('expiry'):
+        try:
+            expiry = datetime.fromisoformat(data['expiry'])
+            if expiry.tzinfo is not None:
+                expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+        except (TypeError, ValueError):
+            expiry = None
+
+    return Credentials(
+        token=data.get('token'),
+        refresh_token=data.get('refresh_token'),
+        token_uri=data.get('token_uri'),
+        client_id=data.get('client_id'),
+        client_secret=data.get('client_secret'),
+        scopes=data.get('scopes'),
+        expiry=expiry
+    )
+
+
+def _default_refresh(credentials: Credentials) -> None:
+    from google.auth.transport.requests import Request
+    credentials.refresh(Request())
+
+
+class CredentialCache:
+    """
+    Per-identity credential cache with refresh-ahead.
+
+    Attributes:
+        refresh_margin (float): Seconds before expiry when a background refresh starts
+        entries (LRUCache): Identity -> current Credentials
+    """
+
+    def __init__(
+        self,
+        refresh_margin_seconds: float = 300,
+        max_entries: int = 1024,
+        entry_ttl_seconds: float = 24 * 3600,
+        refresh: Callable[[Credentials], None] = _default_refresh,
+        now: Callable[[], datetime] = _utcnow,
+        background: bool = True
+    ):
+        """
+        Initialize credential cache.
+
+        Args:
+            refresh_margin_seconds: Start refreshing this long before expiry
+            max_entries: Maximum cached identities
+            entry_ttl_seconds: Drop identities unused for this long
+            refresh: Function refreshing a credentials object in place
+            now: Current naive UTC time (injectable for tests)
+            background: Refresh ahead in a worker thread (False = inline)
+        """
+        self.refresh_margin = refresh_margin_seconds
+        self.entries = LRUCache(maxsize=max_entries, ttl=entry_ttl_seconds)
+        self._refresh = refresh
+        self._now = now
+        self._background = background
+        self._flights = SingleFlight(copy_result=lambda credentials: credentials)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="credential-refresh")
+        self._lock = threading.Lock()
+        self._scheduled = set()
+        self.counters = {'hits': 0, 'misses': 0, 'refreshes': 0, 'background_refreshes': 0, 'refresh_errors': 0}
+
+    def remaining_seconds(self, credentials: Credentials) -> Optional[float]:
+        """Return seconds until the token expires, or None if unknown."""
+        if not credentials.token or credentials.expiry is None:
+            return None
+        return (credentials.expiry - self._now()).total_seconds()
+
+    def get(self, data: Dict[str, Any], min_valid_seconds: float = 0) -> Credentials:
+        """
+        Return cached credentials for a serialized credential set.
+
+        Args:
+            data: Serialized credentials (e.g. from the session)
+            min_valid_seconds: Required remaining token lifetime; refreshed
+                synchronously when it is not met (capped at one token lifetime)
+
+        Returns:
+            Credentials (shared object; do not mutate)
+
+        Raises:
+            CredentialRefreshError: If a required refresh failed and the
+                token is expired (or the grant was revoked)
+        """
+        incoming = credentials_from_dict(data)
+        identity = credential_identity(incoming)
+
+        with self._lock:
+            cached = self.entries.get(identity)
+            if cached is None or self._is_newer(incoming, cached):
+                self.entries.set(identity, incoming)
+                cached = incoming
+                self.counters['misses'] += 1
+            else:
+                self.counters['hits'] += 1
+
+        if not cached.refresh_token:
+            return cached
+
+        remaining = self.remaining_seconds(cached)
+        required = max(0, min(min_valid_seconds, MAX_TOKEN_LIFETIME_SECONDS))
+
+        if remaining is None:
+            if required > 0 or not cached.token:
+                return self.refresh(identity)
+            # Unknown expiry (older session): learn it without blocking
+            self._schedule_refresh(identity)
+            return cached
+
+        if remaining <= required:
+            # Expired, or would expire before the caller is done
+            try:
+                return self.refresh(identity)
+            except CredentialRefreshError as e:
+                if remaining <= 0 or e.permanent:
+                    raise
+                # Still valid for the current request; the token is
+                # refreshed again later (next request or by the job itself)
+                return cached
+
+        if remaining <= self.refresh_margin:
+            self._schedule_refresh(identity)
+
+        return cached
+
+    def refresh(self, identity: str) -> Credentials:
+        """
+        Refresh an identity's credentials now (coalesced with concurrent calls).
+
+        Raises:
+            CredentialRefreshError: If the refresh failed
+        """
+        credentials, _ = self._flights.do(identity, lambda: self._do_refresh(identity))
+        return credentials
+
+    def invalidate(self, data: Dict[str, Any]) -> None:
+        """Forget the cached credentials of a serialized credential set (logout)."""
+        self.entries.pop(credential_identity(credentials_from_dict(data)))
+
+    def _is_newer(self, incoming: Credentials, cached: Credentials) -> bool:
+        if incoming.token == cached.token:
+            return False
+        if incoming.expiry is None:
+            return False
+        return cached.expiry is None or incoming.expiry > cached.expiry
+
+    def _do_refresh(self, identity: str) -> Credentials:
+        current = self.entries.get(identity)
+        if current is None:
+            raise CredentialRefreshError(f"No cached credentials for {identity}")
+
+        # Refresh a copy so requests in flight keep a consistent token
+        fresh = credentials_from_dict(credentials_to_dict(current))
+        try:
+            self._refresh(fresh)
+        except Exception as e:
+            with self._lock:
+                self.counters['refresh_errors'] += 1
+            logger.warning(
+                f"Token refresh failed: {e}",
+                operation="credential_refresh",
+                identity=identity
+            )
+            raise CredentialRefreshError(
+                f"Token refresh failed: {e}",
+                permanent=any(code in str(e) for code in PERMANENT_REFRESH_ERRORS)
+            ) from e
+
+        with self._lock:
+            self.entries.set(identity, fresh)
+            self.counters['refreshes'] += 1
+
+        logger.info(
+            "Refreshed access token",
+            operation="credential_refresh",
+            identity=identity,
+            remaining_seconds=self.remaining_seconds(fresh)
+        )
+        return fresh
+
+    def _schedule_refresh(self, identity: str) -> None:
+        with self._lock:
+            if identity in self._scheduled:
+                return
+            self._scheduled.add(identity)
+            self.counters['background_refreshes'] += 1
+
+        def run():
+            try:
+                self.refresh(identity)
+            except CredentialRefreshError:
+                pass  # already logged; the next synchronous use will fail
+            finally:
+                with self._lock:
+                    self._scheduled.discard(identity)
+
+        if self._background:
+            self._executor.submit(run)
+        else:
+            run()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/refresh counters."""
+        with self._lock:
+            stats = dict(self.counters)
+        stats['entries'] = len(self.entries)
+        return stats
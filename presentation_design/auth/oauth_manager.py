@@ -12,9 +12,9 @@ from pathlib import Path
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 
 from .credentials_store import CredentialsStore
+from .service_factory import get_service_factory
 from ..utils.logger import get_logger
 from ..utils.retry import exponential_backoff
 
@@ -358,6 +358,9 @@ class OAuthManager:
         """
         Build Google API service client.
         
+        Clients are pooled by the global service factory, so repeated
+        calls with the same credentials reuse an existing client.
+        
         Args:
             service_name: Name of Google service (e.g., 'slides', 'drive')
             version: API version (e.g., 'v1')
@@ -371,16 +374,7 @@ class OAuthManager:
         credentials = self.get_credentials()
         
         try:
-            service = build(service_name, version, credentials=credentials)
-            
-            logger.info(
-                f"Built service client for {service_name} {version}",
-                operation="build_service",
-                service_name=service_name,
-                version=version
-            )
-            
-            return service
+            return get_service_factory().build(service_name, version, credentials=credentials)
             
         except Exception as e:
             logger.error(
@@ -0,0 +1,338 @@
+"""
+Google API Service Factory
+==========================
+
+Builds and reuses Google API service clients.
+
+Discovery documents are loaded once from the static copies bundled with
+google-api-python-client, authorized clients are pooled per credential
+identity with a TTL, and all clients share one pooled keep-alive transport.
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import google_auth_httplib2
+from googleapiclient.discovery import build_from_document
+from googleapiclient import discovery_cache
+
+from .transport import PooledHttp
+from ..utils.logger import get_logger
+from ..utils.lru import LRUCache
+
+logger = get_logger(__name__)
+
+
+class ServiceFactoryError(Exception):
+    """Raised when a service client cannot be built."""
+    pass
+
+
+class DiscoveryCache:
+    """
+    Process-wide cache of parsed discovery documents.
+
+    Documents are read from the static discovery cache shipped with
+    google-api-python-client, so building a client never hits the network
+    and each document is parsed only once per process.
+    """
+
+    def __init__(self):
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_name: str, version: str) -> Dict[str, Any]:
+        """
+        Get parsed discovery document for an API.
+
+        Args:
+            service_name: Name of Google service (e.g., 'slides')
+            version: API version (e.g., 'v1')
+
+        Returns:
+            Parsed discovery document
+
+        Raises:
+            ServiceFactoryError: If no bundled document exists for the API
+        """
+        key = f"{service_name}.{version}"
+        document = self._documents.get(key)
+        if document is not None:
+            return document
+
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None:
+                content = discovery_cache.get_static_doc(service_name, version)
+                if content is None:
+                    raise ServiceFactoryError(
+                        f"No bundled discovery document for {service_name} {version}"
+                    )
+                document = json.loads(content)
+                self._documents[key] = document
+
+                logger.debug(
+                    f"Loaded discovery document for {service_name} {version}",
+                    operation="load_discovery_document"
+                )
+        return document
+
+
+class _CredentialHttp:
+    """
+    Authorizing wrapper around a shared transport.
+
+    Credentials can be swapped in place, so a pooled client picks up a
+    refreshed token without being rebuilt.
+    """
+
+    def __init__(self, credentials, transport):
+        self.credentials = credentials
+        self.transport = transport
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        """Implementation of httplib2's Http.request."""
+        if self.credentials is None:
+            return self.transport.request(uri, method, body=body, headers=headers, **kwargs)
+
+        authorized = google_auth_httplib2.AuthorizedHttp(self.credentials, http=self.transport)
+        return authorized.request(uri, method, body=body, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        """Connections belong to the shared transport; nothing to close."""
+        pass
+
+
+def credential_identity(credentials=None, developer_key: Optional[str] = None) -> str:
+    """
+    Compute a stable, non-secret identity for credentials.
+
+    User credentials are identified by client and refresh token, service
+    accounts by their email, API keys by the key itself. The raw values
+    are hashed so secrets never appear in cache keys or logs.
+
+    Args:
+        credentials: google.auth credentials object
+        developer_key: Google API key
+
+    Returns:
+        Identity string (e.g., 'user:3f9a...')
+    """
+    if credentials is None:
+        if developer_key:
+            kind, material = 'key', developer_key
+        else:
+            kind, material = 'anonymous', ''
+    else:
+        service_account_email = getattr(credentials, 'service_account_email', None)
+        if service_account_email:
+            kind, material = 'sa', service_account_email
+        else:
+            client_id = getattr(credentials, 'client_id', '') or ''
+            secret = getattr(credentials, 'refresh_token', None) or getattr(credentials, 'token', '') or ''
+            kind, material = 'user', f"{client_id}:{secret}"
+
+    digest = hashlib.sha256(material.encode('utf-8')).hexdigest()[:16]
+    return f"{kind}:{digest}"
+
+
+class ServiceFactory:
+    """
+    Builds Google API clients and pools them per credential identity.
+
+    Attributes:
+        discovery (DiscoveryCache): Parsed discovery documents
+        transport: Shared httplib2-compatible transport
+        clients (LRUCache): Pooled clients keyed by (identity, service, version)
+    """
+
+    def __init__(
+        self,
+        transport=None,
+        client_ttl_seconds: float = 1800,
+        max_clients: int = 256,
+        timeout_seconds: float = 60,
+        pool_maxsize: int = 32
+    ):
+        """
+        Initialize service factory.
+
+        Args:
+            transport: httplib2-compatible transport (default: PooledHttp)
+            client_ttl_seconds: How long a pooled client is reused
+            max_clients: Maximum number of pooled clients
+            timeout_seconds: Request timeout for the default transport
+            pool_maxsize: Connections kept open per host by the default transport
+        """
+        self.discovery = DiscoveryCache()
+        self.transport = transport or PooledHttp(timeout=timeout_seconds, pool_maxsize=pool_maxsize)
+        self.clients = LRUCache(maxsize=max_clients, ttl=client_ttl_seconds)
+
+    def build(
+        self,
+        service_name: str,
+        version: str,
+        credentials=None,
+        developer_key: Optional[str] = None
+    ):
+        """
+        Get an authorized service client, reusing a pooled one if possible.
+
+        Args:
+            service_name: Name of Google service (e.g., 'slides', 'drive')
+            version: API version (e.g., 'v1')
+            credentials: google.auth credentials object
+            developer_key: Google API key (for public resources)
+
+        Returns:
+            Google API service client
+
+        Raises:
+            ServiceFactoryError: If the client cannot be built
+        """
+        identity = credential_identity(credentials, developer_key)
+        key = (identity, service_name, version)
+
+        entry = self.clients.get(key)
+        if entry is not None:
+            # Same identity may arrive with a freshly refreshed token
+            if credentials is not None:
+                entry['http'].credentials = credentials
+            return entry['service']
+
+        try:
+            http = _CredentialHttp(credentials, self.transport)
+            service = build_from_document(
+                self.discovery.get(service_name, version),
+                http=http,
+                developerKey=developer_key
+            )
+        except ServiceFactoryError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to build service client: {e}",
+                operation="build_service",
+                exc_info=True
+            )
+            raise ServiceFactoryError(f"Failed to build service client: {e}") from e
+
+        self.clients.set(key, {'service': service, 'http': http})
+
+        logger.info(
+            f"Built service client for {service_name} {version}",
+            operation="build_service",
+            service_name=service_name,
+            version=version
+        )
+
+        return service
+
+    def invalidate(self, credentials=None, developer_key: Optional[str] = None) -> None:
+        """
+        Drop pooled clients for a credential identity (e.g., on logout).
+
+        Args:
+            credentials: google.auth credentials object
+            developer_key: Google API key
+        """
+        identity = credential_identity(credentials, developer_key)
+        for key in self.clients.keys():
+            if key[0] == identity:
+                self.clients.pop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return client pool and transport statistics."""
+        stats = {'clients': self.clients.stats()}
+        if hasattr(self.transport, 'stats'):
+            stats['transport'] = self.transport.stats()
+        return stats
+
+
+class CredentialServiceProvider:
+    """
+    Exposes build_service() for a fixed set of credentials.
+
+    Drop-in replacement for OAuthManager where extractors and builders
+    only need service clients (background jobs, service accounts, API keys).
+    """
+
+    def __init__(self, credentials=None, developer_key: Optional[str] = None, factory: Optional[ServiceFactory] = None):
+        """
+        Initialize provider.
+
+        Args:
+            credentials: google.auth credentials object
+            developer_key: Google API key (used when no credentials given)
+            factory: Service factory (default: global factory)
+        """
+        self.credentials = credentials
+        self.developer_key = developer_key
+        self.factory = factory
+
+    def build_service(self, service_name: str, version: str):
+        """Build (or reuse) a service client for these credentials."""
+        factory = self.factory or get_service_factory()
+        return factory.build(
+            service_name,
+            version,
+            credentials=self.credentials,
+            developer_key=self.developer_key
+        )
+
+
+# Global factory instance
+_factory_instance: Optional[ServiceFactory] = None
+_factory_lock = threading.Lock()
+
+
+def get_service_factory() -> ServiceFactory:
+    """
+    Get or create the global service factory.
+
+    Pool settings are read from the optional ``api_clients`` configuration
+    section; defaults are used when it is missing.
+
+    Returns:
+        Global ServiceFactory instance
+    """
+    global _factory_instance
+
+    if _factory_instance is None:
+        with _factory_lock:
+            if _factory_instance is None:
+                settings: Dict[str, Any] = {}
+                timeout = 60
+                try:
+                    from ..utils.config import get_config
+                    config = get_config()
+                    settings = config.get('api_clients', {}) or {}
+                    timeout = config.get('processing.timeout_seconds', timeout)
+                except Exception as e:
+                    logger.warning(
+                        f"Using default service factory settings: {e}",
+                        operation="get_service_factory"
+                    )
+
+                _factory_instance = ServiceFactory(
+                    client_ttl_seconds=settings.get('client_ttl_seconds', 1800),
+                    max_clients=settings.get('max_clients', 256),
+                    timeout_seconds=timeout,
+                    pool_maxsize=settings.get('pool_maxsize', 32)
+                )
+
+    return _factory_instance
+
+
+def set_service_factory(factory: Optional[ServiceFactory]) -> None:
+    """
+    Replace the global service factory (used by tests and benchmarks).
+
+    Args:
+        factory: New factory, or None to recreate defaults on next use
+    """
+    global _factory_instance
+    with _factory_lock:
+        _factory_instance = factory
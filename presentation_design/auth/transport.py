@@ -0,0 +1,174 @@
+"""
+Pooled HTTP Transport
+=====================
+
+Thread-safe, keep-alive HTTP transport for Google API clients.
+
+Adapts a requests Session (urllib3 connection pools) to the httplib2
+interface expected by google-api-python-client, so every client in the
+process shares the same TLS connections to googleapis.com.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httplib2
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PooledHttp:
+    """
+    httplib2-compatible transport backed by urllib3 connection pools.
+
+    A single instance can be shared by all threads and all service
+    clients. Connections are kept alive between the get/batchUpdate/Drive
+    calls of one job and across jobs.
+
+    Attributes:
+        timeout (float): Request timeout in seconds
+        session (requests.Session): Underlying pooled session
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = 60,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32
+    ):
+        """
+        Initialize pooled transport.
+
+        Args:
+            timeout: Request timeout in seconds
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Maximum connections kept open per host
+        """
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0
+        )
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+        self._lock = threading.Lock()
+        self._counters = {
+            'requests': 0,
+            'errors': 0,
+            'bytes_sent': 0,
+            'bytes_received': 0,
+            'total_seconds': 0.0
+        }
+        self._hosts: Dict[str, int] = {}
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+        **kwargs: Any
+    ):
+        """
+        Implementation of httplib2's Http.request.
+
+        Returns:
+            Tuple of (httplib2.Response, content bytes)
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        started = time.perf_counter()
+        try:
+            # httplib2 only follows redirects for safe methods; never follow
+            # on uploads (resumable uploads use 308 as "resume incomplete")
+            response = self.session.request(
+                method,
+                uri,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=method in ('GET', 'HEAD') and redirections > 0
+            )
+        except requests.Timeout as e:
+            self._record(uri, body, None, started, error=True)
+            raise TimeoutError(f"Request to {uri} timed out: {e}") from e
+        except requests.ConnectionError as e:
+            # Raised as builtin ConnectionError so googleapiclient's own
+            # num_retries logic and is_transient_error() recognize it
+            self._record(uri, body, None, started, error=True)
+            raise ConnectionError(f"Connection to {uri} failed: {e}") from e
+        except requests.RequestException as e:
+            self._record(uri, body, None, started, error=True)
+            raise httplib2.HttpLib2Error(f"Request to {uri} failed: {e}") from e
+
+        content = response.content
+        self._record(uri, body, content, started)
+
+        info = {key.lower(): value for key, value in response.headers.items()}
+        info['status'] = str(response.status_code)
+        info['content-location'] = response.url
+
+        http_response = httplib2.Response(info)
+        http_response.reason = response.reason
+        return http_response, content
+
+    def _record(self, uri: str, body: Any, content: Optional[bytes], started: float, error: bool = False) -> None:
+        """Update request counters."""
+        host = urlsplit(uri).netloc
+        sent = len(body) if isinstance(body, (bytes, bytearray)) else 0
+        with self._lock:
+            self._counters['requests'] += 1
+            self._counters['bytes_sent'] += sent
+            self._counters['bytes_received'] += len(content) if content else 0
+            self._counters['total_seconds'] += time.perf_counter() - started
+            if error:
+                self._counters['errors'] += 1
+            self._hosts[host] = self._hosts.get(host, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return transport and connection pool statistics.
+
+        ``connections_opened`` counts new TCP/TLS connections per host; a
+        value far below ``requests`` means keep-alive reuse is working.
+
+        Returns:
+            Dictionary with request counters and per-host pool stats
+        """
+        pools = {}
+        pool_manager = self.adapter.poolmanager
+        for key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(key)
+            if pool is None:
+                continue
+            pools[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                'connections_opened': pool.num_connections,
+                'requests': pool.num_requests,
+                'idle_connections': pool.pool.qsize() if pool.pool else 0,
+                'maxsize': self.pool_maxsize
+            }
+
+        with self._lock:
+            counters = dict(self._counters)
+            hosts = dict(self._hosts)
+
+        counters['hosts'] = hosts
+        counters['pools'] = pools
+        return counters
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
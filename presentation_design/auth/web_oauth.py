@@ -4,17 +4,24 @@ Web OAuth Manager for Flask
 
 Handles OAuth 2.0 authentication flow for web applications.
 Each user authenticates with their own Google account.
-Tokens stored in Flask session.
+Tokens stored in Flask session; live credentials are kept in a shared
+CredentialCache that refreshes them before they expire.
 """
 
 import os
 import json
-from flask import session, url_for, request
+from flask import session, url_for, request, g, has_request_context
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from google.auth.transport.requests import Request
 from typing import Optional
 
+from .service_factory import get_service_factory
+from .credential_cache import (
+    CredentialCache,
+    CredentialRefreshError,
+    credentials_to_dict
+)
+
 # OAuth scopes
 SCOPES = [
     'https://www.googleapis.com/auth/presentations',
@@ -34,15 +41,17 @@ class WebOAuthManager:
     Each user gets their own credentials stored in Flask session.
     """
     
-    def __init__(self, client_secrets_file: str):
+    def __init__(self, client_secrets_file: str, credential_cache: Optional[CredentialCache] = None):
         """
         Initialize Web OAuth Manager.
         
         Args:
             client_secrets_file: Path to Google OAuth client secrets JSON
+            credential_cache: Shared credential cache (default: new cache)
         """
         self.client_secrets_file = client_secrets_file
         self.scopes = SCOPES
+        self.credential_cache = credential_cache or CredentialCache()
     
     def get_authorization_url(self, redirect_uri: str) -> str:
         """
@@ -92,62 +101,69 @@ class WebOAuthManager:
         # Fetch token
         flow.fetch_token(authorization_response=authorization_response)
         
-        # Store credentials in session
-        credentials = flow.credentials
-        session['credentials'] = {
-            'token': credentials.token,
-            'refresh_token': credentials.refresh_token,
-            'token_uri': credentials.token_uri,
-            'client_id': credentials.client_id,
-            'client_secret': credentials.client_secret,
-            'scopes': credentials.scopes
-        }
+        # Store credentials (including expiry) in session
+        session['credentials'] = credentials_to_dict(flow.credentials)
+        g.pop('_oauth_credentials', None)
     
-    def get_credentials(self) -> Optional[Credentials]:
+    def get_credentials(self, min_valid_seconds: float = 0) -> Optional[Credentials]:
         """
-        Get credentials from session with automatic refresh.
+        Get credentials for the current session.
+        
+        Resolved once per request; tokens close to expiry are refreshed in
+        the background and expired ones synchronously (single refresh per
+        user even under concurrent requests).
         
+        Args:
+            min_valid_seconds: Required remaining token lifetime
+            
         Returns:
             Credentials object or None if not authenticated
         """
         if 'credentials' not in session:
             return None
         
-        creds_data = session['credentials']
+        memo = g.get('_oauth_credentials')
+        if memo is not None and min_valid_seconds <= 0:
+            return memo
         
         try:
-            credentials = Credentials(
-                token=creds_data.get('token'),
-                refresh_token=creds_data.get('refresh_token'),
-                token_uri=creds_data.get('token_uri'),
-                client_id=creds_data.get('client_id'),
-                client_secret=creds_data.get('client_secret'),
-                scopes=creds_data.get('scopes')
-            )
-            
-            # Refresh if expired
-            if credentials.expired and credentials.refresh_token:
-                try:
-                    credentials.refresh(Request())
-                    # Update session with refreshed credentials
-                    session['credentials'] = {
-                        'token': credentials.token,
-                        'refresh_token': credentials.refresh_token,
-                        'token_uri': credentials.token_uri,
-                        'client_id': credentials.client_id,
-                        'client_secret': credentials.client_secret,
-                        'scopes': credentials.scopes
-                    }
-                except Exception as e:
-                    print(f"Error refreshing credentials: {e}")
-                    # Clear invalid credentials
-                    self.logout()
-                    return None
-            
-            return credentials
+            credentials = self.credential_cache.get(session['credentials'], min_valid_seconds)
+        except CredentialRefreshError as e:
+            print(f"Error refreshing credentials: {e}")
+            # Clear revoked credentials; transient failures keep the
+            # session so the next request can retry the refresh
+            if e.permanent:
+                self.logout()
+            return None
         except Exception as e:
             print(f"Error reconstructing credentials: {e}")
             return None
+        
+        # Keep the session in step with refreshed tokens
+        if credentials.token != session['credentials'].get('token'):
+            session['credentials'] = credentials_to_dict(credentials)
+        
+        g._oauth_credentials = credentials
+        return credentials
+    
+    def get_credentials_for_job(self, expected_seconds: float) -> Optional[dict]:
+        """
+        Get serialized credentials for a background job.
+        
+        The token is refreshed up front if it would expire within the job's
+        expected duration (capped at one token lifetime), so the job does
+        not stall on a refresh midway.
+        
+        Args:
+            expected_seconds: Expected job duration
+            
+        Returns:
+            Credentials dictionary (with expiry) or None if not authenticated
+        """
+        credentials = self.get_credentials(min_valid_seconds=expected_seconds)
+        if credentials is None:
+            return None
+        return credentials_to_dict(credentials)
     
     def get_user_info(self) -> Optional[dict]:
         """
@@ -161,8 +177,7 @@ class WebOAuthManager:
             return None
         
         try:
-            from googleapiclient.discovery import build
-            oauth_service = build('oauth2', 'v2', credentials=credentials)
+            oauth_service = get_service_factory().build('oauth2', 'v2', credentials=credentials)
             user_info = oauth_service.userinfo().get().execute()
             return user_info
         except Exception as e:
@@ -182,6 +197,12 @@ class WebOAuthManager:
     def logout(self):
         """Remove credentials from session (logout user)."""
         if 'credentials' in session:
+            try:
+                self.credential_cache.invalidate(session['credentials'])
+            except Exception:
+                pass
             session.pop('credentials')
+        if has_request_context():
+            g.pop('_oauth_credentials', None)
         if 'oauth_state' in session:
             session.pop('oauth_state')
@@ -0,0 +1 @@
+"""Benchmark tooling for extraction and parsing."""
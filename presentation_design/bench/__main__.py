@@ -0,0 +1,198 @@
+"""
+Benchmark Command-Line Interface
+================================
+
+Usage::
+
+    # Capture a sanitized copy of a real deck into the corpus
+    python -m presentation_design.bench record <url-or-id> --name course_ru_120
+
+    # Replay every corpus fixture and print stage timings
+    python -m presentation_design.bench replay --repeat 5 [--json out.json]
+
+    # Benchmark the text parsers on generated corpora (1k-200k lines)
+    python -m presentation_design.bench parse --json parse.json
+    python -m presentation_design.bench parse --size 1000 --size 10000 --baseline parse.json
+"""
+
+import argparse
+import json
+import sys
+
+from ..utils.config import get_config
+from .corpus import (
+    DEFAULT_CORPUS_DIR,
+    CorpusError,
+    TextScrambler,
+    list_fixtures,
+    load_fixture,
+    sanitize_presentation,
+    save_fixture
+)
+from .harness import STAGES, format_report, replay_presentation
+from .parsing import (
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    LANGUAGES,
+    STRATEGIES,
+    TARGETS,
+    compare_results,
+    format_parse_report,
+    run_parse_benchmark
+)
+
+
+def _build_provider(args):
+    """Create a provider with build_service() from the CLI arguments."""
+    if args.api_key:
+        from ..auth.service_factory import CredentialServiceProvider
+        return CredentialServiceProvider(developer_key=args.api_key)
+
+    from ..auth.oauth_manager import OAuthManager
+    config = get_config(args.config)
+    auth_config = config.get_section('authentication')
+    oauth_manager = OAuthManager(
+        client_secrets_path=str(config.get_absolute_path(auth_config.get('client_secrets_path', 'credentials/client_secret.json'))),
+        token_path=str(config.get_absolute_path(auth_config['token_path'])),
+        scopes=auth_config['scopes']
+    )
+    oauth_manager.authenticate()
+    return oauth_manager
+
+
+def record(args) -> int:
+    """Fetch a deck, sanitize it and store it in the corpus."""
+    from ..extraction.slides_extractor import SlidesExtractor
+
+    presentation_id = SlidesExtractor.extract_presentation_id(args.presentation)
+    service = _build_provider(args).build_service('slides', 'v1')
+    presentation = service.presentations().get(presentationId=presentation_id).execute()
+
+    sanitized = sanitize_presentation(presentation, args.name, TextScrambler())
+    path = save_fixture(sanitized, args.name, args.corpus_dir, note=args.note)
+
+    print(f"✓ Recorded {len(sanitized.get('slides', []))} slides to {path}")
+    return 0
+
+
+def replay(args) -> int:
+    """Replay corpus fixtures and print or save the report."""
+    names = args.fixture or list_fixtures(args.corpus_dir)
+    if not names:
+        print(f"No fixtures in {args.corpus_dir}; record some with 'record' first")
+        return 1
+
+    results = {}
+    for name in names:
+        results[name] = replay_presentation(
+            load_fixture(name, args.corpus_dir),
+            repeat=args.repeat,
+            trace_memory=not args.no_memory,
+            stages=args.stage
+        )
+
+    print(format_report(results))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Report saved to {args.json}")
+    return 0
+
+
+def parse(args) -> int:
+    """Benchmark the text parsers, optionally against a baseline."""
+    fixtures = {}
+    if args.fixtures:
+        fixtures = {name: load_fixture(name, args.corpus_dir) for name in list_fixtures(args.corpus_dir)}
+
+    results = run_parse_benchmark(
+        sizes=args.size,
+        strategies=args.strategy,
+        languages=args.language,
+        targets=args.target,
+        fixtures=fixtures,
+        repeat=args.repeat,
+        trace_memory=not args.no_memory,
+        seed=args.seed,
+        progress=lambda case: print(f"  {case}...", file=sys.stderr)
+    )
+
+    regressions = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_results(results, json.load(f), threshold=args.threshold)
+
+    print(format_parse_report(results, regressions))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Report saved to {args.json}")
+
+    if regressions:
+        print(f"\n✗ {len(regressions)} case(s) at least {args.threshold}x worse than {args.baseline}")
+        return 2
+    return 0
+
+
+def main(argv=None) -> int:
+    """Entry point of ``python -m presentation_design.bench``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m presentation_design.bench",
+        description="Record and replay presentation payloads and benchmark the parsers"
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        default=str(DEFAULT_CORPUS_DIR),
+        help=f"Corpus directory (default: {DEFAULT_CORPUS_DIR})"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Capture a sanitized deck into the corpus")
+    record_parser.add_argument("presentation", help="Google Slides URL or presentation ID")
+    record_parser.add_argument("--name", required=True, help="Fixture name (letters, digits, '_', '-')")
+    record_parser.add_argument("--note", default="", help="Description stored in the manifest")
+    record_parser.add_argument("--api-key", help="Use an API key instead of OAuth (public decks)")
+    record_parser.add_argument("-c", "--config", help="Path to configuration file")
+    record_parser.set_defaults(func=record)
+
+    replay_parser = subparsers.add_parser("replay", help="Benchmark extraction on corpus fixtures")
+    replay_parser.add_argument("--fixture", action="append", help="Fixture to replay (repeatable; default: all)")
+    replay_parser.add_argument("--stage", action="append", choices=STAGES, help="Stage to run (repeatable; default: all)")
+    replay_parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage (default: 5)")
+    replay_parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc measurement")
+    replay_parser.add_argument("--json", help="Also write the report to this JSON file")
+    replay_parser.set_defaults(func=replay)
+
+    parse_parser = subparsers.add_parser("parse", help="Benchmark the text parsers on generated corpora")
+    parse_parser.add_argument(
+        "--size", action="append", type=int,
+        help=f"Corpus size in lines (repeatable; default: {', '.join(map(str, DEFAULT_SIZES))})"
+    )
+    parse_parser.add_argument("--strategy", action="append", choices=STRATEGIES, help="Detection strategy (repeatable; default: all)")
+    parse_parser.add_argument("--language", action="append", choices=LANGUAGES, help="Corpus language (repeatable; default: all)")
+    parse_parser.add_argument("--target", action="append", choices=TARGETS, help="Parser to benchmark (repeatable; default: all)")
+    parse_parser.add_argument("--fixtures", action="store_true", help="Also benchmark the recorded corpus fixtures")
+    parse_parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+    parse_parser.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+    parse_parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc measurement")
+    parse_parser.add_argument("--json", help="Also write the results to this JSON file")
+    parse_parser.add_argument("--baseline", help="Compare with results stored by an earlier --json run")
+    parse_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Slowdown ratio reported as a regression (default: {DEFAULT_THRESHOLD})"
+    )
+    parse_parser.set_defaults(func=parse)
+
+    args = parser.parse_args(argv)
+
+    try:
+        return args.func(args)
+    except CorpusError as e:
+        print(f"\n✗ Error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
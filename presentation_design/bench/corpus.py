@@ -0,0 +1,315 @@
+"""
+Benchmark Corpus Module
+=======================
+
+Records sanitized ``presentations().get`` responses into a versioned
+corpus directory and loads them back for replay.
+
+Sanitizing keeps everything the parsers care about - JSON structure,
+object IDs, element geometry, text lengths, line breaks, punctuation,
+list markers and letter scripts (Cyrillic stays Cyrillic) - while
+replacing every letter and digit of the text. Each distinct word maps to
+one scrambled word, so repetition across slides is preserved; the
+mapping is keyed by a random secret that is not stored. URLs are replaced
+with placeholders of the same length.
+
+Layout::
+
+    tests/corpus/v1/
+        manifest.json          # fixture name -> shape statistics
+        <name>.json.gz         # sanitized presentation
+"""
+
+import copy
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the sanitizing rules or file layout change
+CORPUS_VERSION = 1
+
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parents[2] / 'tests' / 'corpus' / f"v{CORPUS_VERSION}"
+
+# String fields holding user text
+TEXT_KEYS = frozenset(('content', 'title', 'description'))
+
+# String fields holding URLs
+URL_KEYS = frozenset(('url', 'contentUrl', 'sourceUrl'))
+
+# Fields dropped entirely (identify the source deck or its revision)
+DROPPED_KEYS = frozenset(('revisionId',))
+
+# Words the text parsers key on; kept verbatim so parsing takes the same paths
+PRESERVED_WORDS = frozenset(('slide', 'слайд'))
+PRESERVED_SUFFIX = 'уровень'
+
+_ALPHABETS = (
+    'abcdefghijklmnopqrstuvwxyz',
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'абвгдеёжзийклмнопрстуфхцчшщъыьэюя',
+    'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ',
+    '0123456789'
+)
+_CHAR_CLASS = {char: alphabet for alphabet in _ALPHABETS for char in alphabet}
+
+
+def _alphabet_of(char: str) -> Optional[str]:
+    """Alphabet a character is scrambled within (None = kept as is).
+
+    Letters outside the basic alphabets (accented Latin, ß, other scripts)
+    are replaced by a Cyrillic or Latin letter of the same case, so no
+    original letter survives scrambling.
+    """
+    alphabet = _CHAR_CLASS.get(char)
+    if alphabet is None and char.isalpha():
+        base = 2 if 'CYRILLIC' in unicodedata.name(char, '') else 0
+        alphabet = _ALPHABETS[base + (1 if char.isupper() else 0)]
+    return alphabet
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+_FIXTURE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
+
+
+class CorpusError(Exception):
+    """Raised when a corpus fixture cannot be stored or loaded."""
+    pass
+
+
+class TextScrambler:
+    """
+    Deterministic, length-preserving text scrambler.
+
+    Attributes:
+        secret (bytes): Key of the word mapping (never persisted)
+    """
+
+    def __init__(self, secret: Optional[bytes] = None):
+        """
+        Initialize scrambler.
+
+        Args:
+            secret: Mapping key (default: random; pass a value for reproducible tests)
+        """
+        self.secret = secret if secret is not None else os.urandom(16)
+        self._words: Dict[str, str] = {}
+
+    def scramble_word(self, word: str) -> str:
+        """Replace letters and digits of a word, keeping script, case and length."""
+        lowered = word.lower()
+        if lowered in PRESERVED_WORDS or lowered.endswith(PRESERVED_SUFFIX):
+            return word
+
+        cached = self._words.get(word)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.blake2b(word.encode('utf-8'), key=self.secret[:64], digest_size=64).digest()
+        chars = []
+        for position, char in enumerate(word):
+            alphabet = _alphabet_of(char)
+            if alphabet is None:
+                chars.append(char)
+            else:
+                chars.append(alphabet[digest[position % len(digest)] % len(alphabet)])
+
+        scrambled = ''.join(chars)
+        self._words[word] = scrambled
+        return scrambled
+
+    def scramble(self, text: str) -> str:
+        """Scramble every word of a text; whitespace and punctuation are kept."""
+        return _WORD_PATTERN.sub(lambda match: self.scramble_word(match.group(0)), text)
+
+
+def placeholder_url(url: str) -> str:
+    """Return a placeholder URL of the same length as url."""
+    prefix = 'https://example.invalid/'
+    if len(url) <= len(prefix):
+        return prefix[:len(url)]
+    return prefix + 'x' * (len(url) - len(prefix))
+
+
+def sanitize_presentation(
+    presentation: Dict[str, Any],
+    fixture_name: str,
+    scrambler: Optional[TextScrambler] = None
+) -> Dict[str, Any]:
+    """
+    Produce a sanitized copy of a presentations().get response.
+
+    Args:
+        presentation: Raw Slides API response
+        fixture_name: Corpus name; becomes the fixture's presentationId
+        scrambler: Text scrambler (default: new random key)
+
+    Returns:
+        Sanitized deep copy
+    """
+    scrambler = scrambler or TextScrambler()
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if key in DROPPED_KEYS:
+                    continue
+                if isinstance(item, str) and key in TEXT_KEYS:
+                    result[key] = scrambler.scramble(item)
+                elif isinstance(item, str) and key in URL_KEYS:
+                    result[key] = placeholder_url(item)
+                else:
+                    result[key] = walk(item)
+            return result
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return copy.copy(value)
+
+    sanitized = walk(presentation)
+    sanitized['presentationId'] = f"corpus_{fixture_name}"
+    return sanitized
+
+
+def shape_stats(presentation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize the shape of a presentation for the corpus manifest.
+
+    Returns:
+        Dictionary with slide, element, text run and character counts
+    """
+    stats = {'slides': 0, 'page_elements': 0, 'text_runs': 0, 'text_chars': 0, 'cyrillic_chars': 0}
+
+    def count_text(elements):
+        for element in elements:
+            run = element.get('textRun') or element.get('autoText')
+            if run:
+                content = run.get('content', '')
+                stats['text_runs'] += 1
+                stats['text_chars'] += len(content)
+                stats['cyrillic_chars'] += sum(1 for char in content if 'а' <= char.lower() <= 'я' or char in 'ёЁ')
+
+    def count_element(element):
+        stats['page_elements'] += 1
+        count_text(element.get('shape', {}).get('text', {}).get('textElements', []))
+        for row in element.get('table', {}).get('tableRows', []):
+            for cell in row.get('tableCells', []):
+                count_text(cell.get('text', {}).get('textElements', []))
+        for child in element.get('elementGroup', {}).get('children', []):
+            count_element(child)
+
+    for slide in presentation.get('slides', []):
+        stats['slides'] += 1
+        for element in slide.get('pageElements', []):
+            count_element(element)
+
+    return stats
+
+
+def _fixture_path(corpus_dir: Path, name: str) -> Path:
+    if not _FIXTURE_NAME_PATTERN.match(name):
+        raise CorpusError(f"Invalid fixture name '{name}' (use letters, digits, '_' and '-')")
+    return corpus_dir / f"{name}.json.gz"
+
+
+def load_manifest(corpus_dir: Union[str, Path] = DEFAULT_CORPUS_DIR) -> Dict[str, Any]:
+    """Load the corpus manifest, or an empty one if the corpus is new."""
+    manifest_path = Path(corpus_dir) / 'manifest.json'
+    if not manifest_path.exists():
+        return {'version': CORPUS_VERSION, 'fixtures': {}}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != CORPUS_VERSION:
+        raise CorpusError(
+            f"Corpus {corpus_dir} has version {manifest.get('version')}, expected {CORPUS_VERSION}"
+        )
+    return manifest
+
+
+def save_fixture(
+    presentation: Dict[str, Any],
+    name: str,
+    corpus_dir: Union[str, Path] = DEFAULT_CORPUS_DIR,
+    note: str = ''
+) -> Path:
+    """
+    Store an already sanitized presentation in the corpus.
+
+    Args:
+        presentation: Output of sanitize_presentation
+        name: Fixture name
+        corpus_dir: Corpus directory
+        note: Free-form description kept in the manifest
+
+    Returns:
+        Path of the written fixture file
+    """
+    corpus_dir = Path(corpus_dir)
+    path = _fixture_path(corpus_dir, name)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+
+    payload = json.dumps(presentation, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    # mtime=0 keeps the file byte-identical across recordings of the same data
+    with open(path, 'wb') as f:
+        with gzip.GzipFile(fileobj=f, mode='wb', mtime=0) as gz:
+            gz.write(payload)
+
+    manifest = load_manifest(corpus_dir)
+    entry = shape_stats(presentation)
+    entry.update({
+        'file': path.name,
+        'json_bytes': len(payload),
+        'sha256': hashlib.sha256(payload).hexdigest(),
+        'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'note': note
+    })
+    manifest['fixtures'][name] = entry
+
+    with open(corpus_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+    logger.info(
+        f"Recorded corpus fixture '{name}'",
+        operation="save_fixture",
+        slides=entry['slides'],
+        json_bytes=entry['json_bytes']
+    )
+
+    return path
+
+
+def load_fixture(name: str, corpus_dir: Union[str, Path] = DEFAULT_CORPUS_DIR) -> Dict[str, Any]:
+    """
+    Load a fixture from the corpus, verifying its checksum.
+
+    Raises:
+        CorpusError: If the fixture is missing or does not match the manifest
+    """
+    corpus_dir = Path(corpus_dir)
+    path = _fixture_path(corpus_dir, name)
+    if not path.exists():
+        raise CorpusError(f"Fixture not found: {path}")
+
+    with gzip.open(path, 'rb') as f:
+        payload = f.read()
+
+    expected = load_manifest(corpus_dir)['fixtures'].get(name, {}).get('sha256')
+    if expected and hashlib.sha256(payload).hexdigest() != expected:
+        raise CorpusError(f"Fixture '{name}' does not match its manifest checksum")
+
+    return json.loads(payload.decode('utf-8'))
+
+
+def list_fixtures(corpus_dir: Union[str, Path] = DEFAULT_CORPUS_DIR) -> List[str]:
+    """Return fixture names in the corpus, sorted."""
+    return sorted(load_manifest(corpus_dir)['fixtures'])
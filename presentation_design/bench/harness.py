@@ -0,0 +1,146 @@
+"""
+Benchmark Harness Module
+========================
+
+Replays corpus fixtures through the extraction pipeline and reports
+timing and allocation statistics per stage.
+
+Stages:
+    extract  - SlidesExtractor.extract_presentation(raw_mode=True) served
+               by the offline fake backend (client-side request/response
+               handling plus raw element extraction)
+    parse    - ContentParser.parse_presentation (structured mode)
+    editor   - raw -> editor slide conversion used by the web importer
+
+Timings use ``time.perf_counter`` over several repetitions; memory is the
+``tracemalloc`` peak of one extra, separately traced run so tracing does
+not distort the timings.
+"""
+
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from ..extraction.content_parser import ContentParser
+from ..extraction.editor_format import raw_data_to_editor_slides
+from ..extraction.slides_extractor import SlidesExtractor
+from ..testing.fake_google import FakeGoogleBackend, fake_provider
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+STAGES = ('extract', 'parse', 'editor')
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, trace_memory: bool = True) -> Dict[str, Any]:
+    """
+    Time a callable and measure its peak allocations.
+
+    Args:
+        func: Callable to benchmark
+        repeat: Number of timed runs
+        trace_memory: Also run once under tracemalloc
+
+    Returns:
+        Dictionary with min/median/max seconds and peak_bytes (None if not traced)
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    peak_bytes = None
+    if trace_memory:
+        gc.collect()
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        func()
+        peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+        if not already_tracing:
+            tracemalloc.stop()
+
+    return {
+        'runs': len(timings),
+        'min_seconds': round(min(timings), 6),
+        'median_seconds': round(statistics.median(timings), 6),
+        'max_seconds': round(max(timings), 6),
+        'peak_bytes': peak_bytes
+    }
+
+
+def replay_presentation(
+    presentation: Dict[str, Any],
+    repeat: int = 5,
+    trace_memory: bool = True,
+    stages: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark the extraction stages on one presentation payload.
+
+    Args:
+        presentation: presentations().get response (e.g. a corpus fixture)
+        repeat: Timed runs per stage
+        trace_memory: Measure tracemalloc peaks
+        stages: Subset of STAGES to run (default: all)
+
+    Returns:
+        Dictionary with slide count, per-stage stats and editor slide count
+    """
+    stages = stages or list(STAGES)
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {sorted(unknown)}")
+
+    backend = FakeGoogleBackend()
+    presentation_id = presentation.get('presentationId') or 'corpus_fixture'
+    backend.presentations[presentation_id] = presentation
+    extractor = SlidesExtractor(fake_provider(backend))
+    # Fixture IDs are short, so address the deck by URL
+    url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
+
+    raw_data = extractor.extract_presentation(url, raw_mode=True)
+    editor_slides = raw_data_to_editor_slides(raw_data)
+
+    runners = {
+        'extract': lambda: extractor.extract_presentation(url, raw_mode=True),
+        'parse': lambda: ContentParser.parse_presentation(presentation),
+        'editor': lambda: raw_data_to_editor_slides(raw_data)
+    }
+
+    report = {
+        'slides': len(presentation.get('slides', [])),
+        'editor_slides': len(editor_slides),
+        'stages': {}
+    }
+    for stage in stages:
+        report['stages'][stage] = measure(runners[stage], repeat=repeat, trace_memory=trace_memory)
+
+    return report
+
+
+def format_report(results: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Render replay results as a fixed-width table.
+
+    Args:
+        results: Fixture name -> replay_presentation() output
+
+    Returns:
+        Table text
+    """
+    lines = [f"{'fixture':<28} {'slides':>6} {'stage':<8} {'median ms':>10} {'min ms':>9} {'peak KiB':>9}"]
+    for name, report in results.items():
+        for stage, stats in report['stages'].items():
+            peak = f"{stats['peak_bytes'] / 1024:.0f}" if stats['peak_bytes'] is not None else '-'
+            lines.append(
+                f"{name:<28} {report['slides']:>6} {stage:<8} "
+                f"{stats['median_seconds'] * 1000:>10.2f} {stats['min_seconds'] * 1000:>9.2f} {peak:>9}"
+            )
+    return '\n'.join(lines)
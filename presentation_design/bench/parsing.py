@@ -0,0 +1,407 @@
+"""
+Parser Benchmark Module
+=======================
+
+Benchmarks the text parsers on generated and recorded corpora:
+
+    text_parser    TextParser.parse_slides on the whole pasted text
+    text_splitter  TextSplitter.split_slide_text on every slide text
+    analyzer       ContentAnalyzer.analyze_text_structure on every slide text
+
+Synthetic corpora are generated per detection strategy of TextParser and
+per language, at any size in lines:
+
+    number_after   content followed by a line holding the slide number
+    markers        "Slide N: Title" / "Слайд N: Заголовок" lines
+    blocks         no numbers or markers; "## Title" headers and blank
+                   lines between blocks (intelligent block analysis)
+
+Slides mix titles, paragraphs with inline emphasis, "Header:" lists,
+numbered and bulleted lists and ALL CAPS headings. Generation is seeded,
+so a corpus of a given size is identical across runs and machines.
+
+Recorded corpus fixtures (see corpus) can be benchmarked too; their
+slide texts are joined with "Слайд N" markers for TextParser.
+
+Results are keyed by case ("text_parser/markers/ru/10000") and can be
+compared with a stored baseline to catch heuristic changes that make
+parsing several times slower or hungrier. Logging is silenced and
+TextParser runs without the block cache while measuring, so the numbers
+reflect the parsing itself.
+"""
+
+import contextlib
+import io
+import logging
+import platform
+import random
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..extraction.content_analyzer import ContentAnalyzer
+from ..extraction.content_parser import ContentParser
+from ..extraction.text_parser import TextParser
+from ..extraction.text_splitter import TextSplitter
+from .harness import measure
+
+# Bump when generated corpora or the result layout change
+RESULTS_VERSION = 1
+
+STRATEGIES = ('number_after', 'markers', 'blocks')
+LANGUAGES = ('en', 'ru')
+TARGETS = ('text_parser', 'text_splitter', 'analyzer')
+DEFAULT_SIZES = (1000, 10000, 50000, 200000)
+
+# Slowdown (median time or allocation peak vs baseline) reported as a regression
+DEFAULT_THRESHOLD = 3.0
+
+_WORDS = {
+    'en': (
+        'market', 'growth', 'team', 'product', 'customer', 'revenue', 'plan', 'risk',
+        'quality', 'process', 'data', 'model', 'result', 'strategy', 'goal', 'budget',
+        'review', 'launch', 'support', 'design', 'cost', 'channel', 'partner', 'metric'
+    ),
+    'ru': (
+        'рынок', 'рост', 'команда', 'продукт', 'клиент', 'выручка', 'план', 'риск',
+        'качество', 'процесс', 'данные', 'модель', 'результат', 'стратегия', 'цель',
+        'бюджет', 'обзор', 'запуск', 'поддержка', 'дизайн', 'затраты', 'канал', 'партнёр'
+    )
+}
+_FILLERS = {
+    'en': ('the', 'and', 'for', 'with', 'of', 'to', 'in', 'our', 'new', 'next'),
+    'ru': ('и', 'для', 'с', 'в', 'на', 'по', 'наш', 'новый', 'следующий', 'к')
+}
+_MARKER_WORD = {'en': 'Slide', 'ru': 'Слайд'}
+
+
+class _SlideWriter:
+    """Seeded generator of slide titles and bodies in one language."""
+
+    def __init__(self, language: str, rnd: random.Random):
+        self.words = _WORDS[language]
+        self.fillers = _FILLERS[language]
+        self.rnd = rnd
+
+    def phrase(self, count: int, capitalize: bool = True) -> str:
+        rnd = self.rnd
+        words = [
+            rnd.choice(self.words) if idx % 2 == 0 or rnd.random() < 0.4 else rnd.choice(self.fillers)
+            for idx in range(count)
+        ]
+        text = ' '.join(words)
+        return text[:1].upper() + text[1:] if capitalize else text
+
+    def sentence(self) -> str:
+        rnd = self.rnd
+        words = self.phrase(rnd.randint(7, 16)).split()
+        # Inline emphasis on some words
+        if rnd.random() < 0.3:
+            idx = rnd.randrange(len(words))
+            words[idx] = f"**{words[idx]}**"
+        if rnd.random() < 0.15:
+            idx = rnd.randrange(len(words))
+            words[idx] = f"_{words[idx]}_"
+        text = ' '.join(words) + '.'
+        if rnd.random() < 0.1:
+            text += f" {rnd.randint(2, 95)}%"
+        return text
+
+    def title(self) -> str:
+        return self.phrase(self.rnd.randint(2, 5))
+
+    def body(self) -> List[str]:
+        """Body lines of one slide (blank lines separate sections)."""
+        rnd = self.rnd
+        lines: List[str] = []
+        for section in range(rnd.randint(1, 3)):
+            if section:
+                lines.append('')
+            kind = rnd.random()
+            if kind < 0.35:
+                lines.extend(self.sentence() for _ in range(rnd.randint(1, 3)))
+            elif kind < 0.6:
+                lines.append(self.phrase(rnd.randint(2, 4)) + ':')
+                lines.extend(self.phrase(rnd.randint(2, 6)) for _ in range(rnd.randint(2, 5)))
+            elif kind < 0.8:
+                lines.extend(
+                    f"{idx + 1}. {self.phrase(rnd.randint(2, 8))}" for idx in range(rnd.randint(2, 5))
+                )
+            elif kind < 0.95:
+                marker = rnd.choice(('• ', '- ', '* '))
+                lines.extend(marker + self.phrase(rnd.randint(2, 8)) for _ in range(rnd.randint(2, 5)))
+            else:
+                lines.append(self.phrase(rnd.randint(1, 3)).upper())
+        return lines
+
+
+def synthetic_corpus(
+    strategy: str,
+    language: str,
+    lines: int,
+    seed: int = 0
+) -> Tuple[str, List[str]]:
+    """
+    Generate pasted text for one detection strategy.
+
+    Args:
+        strategy: One of STRATEGIES
+        language: One of LANGUAGES
+        lines: Number of lines of the text
+        seed: Random seed
+
+    Returns:
+        (text, slide_texts): The pasted text with exactly `lines` lines,
+        and the text of every slide in it (title and body)
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    if language not in LANGUAGES:
+        raise ValueError(f"Unknown language: {language}")
+
+    writer = _SlideWriter(language, random.Random(f"{seed}:{strategy}:{language}"))
+    text_lines: List[str] = []
+    slide_texts: List[str] = []
+    number = 0
+
+    while len(text_lines) < lines:
+        number += 1
+        title = writer.title()
+        body = writer.body()
+        slide_texts.append('\n'.join([title] + body))
+
+        if strategy == 'number_after':
+            text_lines.append(title)
+            text_lines.extend(body)
+            text_lines.append(str(number))
+        elif strategy == 'markers':
+            text_lines.append(f"{_MARKER_WORD[language]} {number}: {title}")
+            text_lines.extend(body)
+        else:
+            text_lines.append(f"## {title}")
+            text_lines.append('')
+            text_lines.extend(body)
+        text_lines.append('')
+
+    return '\n'.join(text_lines[:lines]), slide_texts
+
+
+def fixture_corpus(presentation: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """
+    Pasted text and slide texts of a recorded presentation.
+
+    Args:
+        presentation: presentations().get response (e.g. a corpus fixture)
+
+    Returns:
+        (text, slide_texts) as for synthetic_corpus
+    """
+    slide_texts = [
+        ContentParser._extract_all_slide_text(slide)
+        for slide in presentation.get('slides', [])
+    ]
+    text = '\n\n'.join(
+        f"Слайд {idx + 1}\n{slide_text}" for idx, slide_text in enumerate(slide_texts)
+    )
+    return text, slide_texts
+
+
+def _runner(target: str, text: str, slide_texts: List[str]) -> Callable[[], Any]:
+    """Callable running one target on a corpus."""
+    if target == 'text_parser':
+        def run():
+            parser = TextParser()
+            parser.block_cache = None
+            return parser.parse_slides(text)
+        return run
+    if target == 'text_splitter':
+        return lambda: [
+            TextSplitter.split_slide_text(slide_text, idx)
+            for idx, slide_text in enumerate(slide_texts)
+        ]
+    if target == 'analyzer':
+        return lambda: [ContentAnalyzer.analyze_text_structure(slide_text) for slide_text in slide_texts]
+    raise ValueError(f"Unknown target: {target}")
+
+
+@contextlib.contextmanager
+def _quiet() -> Iterator[None]:
+    """Silence logging below WARNING and stdout progress prints."""
+    previous = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(previous)
+
+
+def run_case(
+    target: str,
+    text: str,
+    slide_texts: List[str],
+    repeat: int = 3,
+    trace_memory: bool = True
+) -> Dict[str, Any]:
+    """
+    Benchmark one target on one corpus.
+
+    Args:
+        target: One of TARGETS
+        text: Pasted text
+        slide_texts: Text of every slide
+        repeat: Timed runs
+        trace_memory: Measure the tracemalloc peak
+
+    Returns:
+        measure() statistics plus corpus size and time per line
+    """
+    func = _runner(target, text, slide_texts)
+    with _quiet():
+        stats = measure(func, repeat=repeat, trace_memory=trace_memory)
+
+    line_count = text.count('\n') + 1
+    stats.update({
+        'lines': line_count,
+        'chars': len(text),
+        'slides': len(slide_texts),
+        'us_per_line': round(stats['median_seconds'] / line_count * 1e6, 3)
+    })
+    return stats
+
+
+def run_parse_benchmark(
+    sizes: Optional[List[int]] = None,
+    strategies: Optional[List[str]] = None,
+    languages: Optional[List[str]] = None,
+    targets: Optional[List[str]] = None,
+    fixtures: Optional[Dict[str, Dict[str, Any]]] = None,
+    repeat: int = 3,
+    trace_memory: bool = True,
+    seed: int = 0,
+    progress: Optional[Callable[[str], None]] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark the parsers on synthetic corpora and recorded fixtures.
+
+    Args:
+        sizes: Corpus sizes in lines (default: DEFAULT_SIZES)
+        strategies: Subset of STRATEGIES (default: all)
+        languages: Subset of LANGUAGES (default: all)
+        targets: Subset of TARGETS (default: all)
+        fixtures: Fixture name -> presentation, benchmarked as well
+        repeat: Timed runs per case
+        trace_memory: Measure tracemalloc peaks
+        seed: Corpus seed
+        progress: Called with each case name before it runs
+
+    Returns:
+        Dictionary with run metadata and 'cases': case name -> statistics
+    """
+    targets = targets or list(TARGETS)
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        raise ValueError(f"Unknown targets: {sorted(unknown)}")
+
+    corpora = []
+    for strategy in strategies or STRATEGIES:
+        for language in languages or LANGUAGES:
+            for size in sizes or DEFAULT_SIZES:
+                corpora.append((
+                    f"{strategy}/{language}/{size}",
+                    {'strategy': strategy, 'language': language},
+                    lambda s=strategy, l=language, n=size: synthetic_corpus(s, l, n, seed)
+                ))
+    for name, presentation in (fixtures or {}).items():
+        corpora.append((f"fixture/{name}", {'fixture': name}, lambda p=presentation: fixture_corpus(p)))
+
+    cases = {}
+    for corpus_name, labels, build in corpora:
+        text, slide_texts = build()
+        for target in targets:
+            case = f"{target}/{corpus_name}"
+            if progress:
+                progress(case)
+            stats = run_case(target, text, slide_texts, repeat=repeat, trace_memory=trace_memory)
+            cases[case] = dict(labels, target=target, **stats)
+
+    return {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': seed,
+        'cases': cases
+    }
+
+
+def compare_results(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """
+    Find cases that got slower or allocate more than a baseline allows.
+
+    Cases missing from either side are skipped.
+
+    Args:
+        results: run_parse_benchmark() output
+        baseline: Stored output of an earlier run
+        threshold: Ratio to the baseline reported as a regression
+
+    Returns:
+        Regressions: {'case', 'metric', 'baseline', 'current', 'ratio'},
+        worst first
+    """
+    regressions = []
+    baseline_cases = baseline.get('cases', {})
+    for case, stats in results.get('cases', {}).items():
+        reference = baseline_cases.get(case)
+        if not reference:
+            continue
+        for metric in ('median_seconds', 'peak_bytes'):
+            before = reference.get(metric)
+            after = stats.get(metric)
+            if not before or after is None:
+                continue
+            ratio = after / before
+            if ratio >= threshold:
+                regressions.append({
+                    'case': case,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'ratio': round(ratio, 2)
+                })
+    regressions.sort(key=lambda regression: regression['ratio'], reverse=True)
+    return regressions
+
+
+def format_parse_report(results: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    Render parse benchmark results as a fixed-width table.
+
+    Args:
+        results: run_parse_benchmark() output
+        regressions: compare_results() output to list below the table
+
+    Returns:
+        Table text
+    """
+    lines = [f"{'case':<44} {'slides':>6} {'median ms':>10} {'us/line':>8} {'peak KiB':>9}"]
+    for case, stats in results['cases'].items():
+        peak = f"{stats['peak_bytes'] / 1024:.0f}" if stats['peak_bytes'] is not None else '-'
+        lines.append(
+            f"{case:<44} {stats['slides']:>6} {stats['median_seconds'] * 1000:>10.2f} "
+            f"{stats['us_per_line']:>8.2f} {peak:>9}"
+        )
+
+    if regressions:
+        lines.append('')
+        lines.append(f"Regressions ({len(regressions)}):")
+        for regression in regressions:
+            lines.append(
+                f"  {regression['case']} {regression['metric']}: "
+                f"{regression['baseline']} -> {regression['current']} ({regression['ratio']}x)"
+            )
+    return '\n'.join(lines)
@@ -8,6 +8,7 @@ Applies design templates to extracted presentation content.
 from typing import Dict, Any
 from .layout_engine import LayoutEngine
 from ..extraction.content_analyzer import ContentAnalyzer
+from ..templates.master_deck import master_deck_info
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -47,6 +48,11 @@ class DesignApplicator:
             'slides': []
         }
         
+        # Prebuilt deck to copy instead of creating a blank presentation
+        master_deck = master_deck_info(self.template)
+        if master_deck:
+            designed['master_deck'] = master_deck
+        
         for slide in presentation_data.get('slides', []):
             designed_slide = self._apply_to_slide(slide)
             designed['slides'].append(designed_slide)
@@ -0,0 +1,85 @@
+"""
+Block Cache Module
+==================
+
+Memoizes parsed slides by the content of the text block they came from.
+
+TextParser splits pasted text into per-slide blocks (the lines between
+slide markers or slide numbers). Formatting a block into a slide is the
+expensive part of parsing, and its result depends only on the block's
+lines, so it is cached under a BLAKE2b digest of those lines. When an
+edited version of the same text is pasted again, only blocks that
+actually changed are formatted; all others are reused from the cache.
+
+The cache is shared by all parser instances of the process. Its size is
+read from the optional ``text_parsing.block_cache_size`` setting (0
+disables memoization).
+"""
+
+import hashlib
+import threading
+from typing import List, Optional
+
+from ..utils.logger import get_logger
+from ..utils.lru import LRUCache
+
+logger = get_logger(__name__)
+
+DEFAULT_BLOCK_CACHE_SIZE = 10000
+
+_cache_instance: Optional[LRUCache] = None
+_cache_lock = threading.Lock()
+
+
+def block_key(lines: List[str]) -> bytes:
+    """
+    Return the cache key of a text block.
+
+    Args:
+        lines: Stripped lines of the block, in order
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    # Lines never contain '\n', so joining with it is unambiguous
+    data = '\n'.join(lines).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def get_block_cache() -> Optional[LRUCache]:
+    """
+    Get or create the global block cache.
+
+    Returns:
+        Global LRUCache of parsed slides, or None if disabled
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                size = DEFAULT_BLOCK_CACHE_SIZE
+                try:
+                    from ..utils.config import get_config
+                    size = get_config().get('text_parsing.block_cache_size', DEFAULT_BLOCK_CACHE_SIZE)
+                except Exception as e:
+                    logger.warning(
+                        f"Using default block cache size: {e}",
+                        operation="get_block_cache"
+                    )
+
+                _cache_instance = LRUCache(maxsize=size)
+
+    return _cache_instance if _cache_instance.maxsize > 0 else None
+
+
+def set_block_cache(cache: Optional[LRUCache]) -> None:
+    """
+    Replace the global block cache (used by tests).
+
+    Args:
+        cache: New cache, or None to recreate defaults on next use
+    """
+    global _cache_instance
+    with _cache_lock:
+        _cache_instance = cache
@@ -6,9 +6,9 @@ Advanced content analysis to recognize structure: titles, subtitles,
 numbered lists, bullet lists, and logical content groupings.
 """
 
-import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, List, Optional
 from ..utils.logger import get_logger
+from .line_index import ALL_CAPS, ALL_CAPS_PATTERN, BLANK, BULLET, NUMBERED, LineIndex, index_lines
 
 logger = get_logger(__name__)
 
@@ -25,12 +25,8 @@ class ContentAnalyzer:
     - Logical sections within slides
     """
     
-    # Patterns for list detection
-    NUMBERED_LIST_PATTERN = re.compile(r'^\s*(\d+)[.):]\s+(.+)', re.MULTILINE)
-    BULLET_PATTERN = re.compile(r'^\s*[•\-\*–—]\s+(.+)', re.MULTILINE)
-    
-    # Patterns for emphasis
-    ALL_CAPS_PATTERN = re.compile(r'^[A-ZА-ЯЁ\s\d\W]+$')
+    # Pattern for emphasis (applied per line by line_index)
+    ALL_CAPS_PATTERN = ALL_CAPS_PATTERN
     
     @staticmethod
     def analyze_text_structure(text: str) -> Dict[str, Any]:
@@ -57,28 +53,71 @@ class ContentAnalyzer:
                 'is_title_case': False
             }
         
-        # Check for numbered list
-        numbered_matches = list(ContentAnalyzer.NUMBERED_LIST_PATTERN.finditer(text))
+        index = index_lines(text)
+        return ContentAnalyzer.analyze_lines(index, range(len(index)), text)
+    
+    @staticmethod
+    def analyze_lines(
+        index: LineIndex,
+        rows: Iterable[int],
+        text: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze lines of an existing line index.
         
-        # Check for bullet list
-        bullet_matches = list(ContentAnalyzer.BULLET_PATTERN.finditer(text))
+        Same result as analyze_text_structure on the text of those lines,
+        computed from the stored line kinds, flags and word counts.
         
-        # Determine content type
-        if numbered_matches and len(numbered_matches) >= 2:
+        Args:
+            index: Line index (e.g. the one TextSplitter used)
+            rows: Indexes of the lines to analyze
+            text: Text of those lines (joined from the index if omitted)
+            
+        Returns:
+            Dictionary with structure information (see analyze_text_structure)
+        """
+        kinds = index.kinds
+        flags = index.flags
+        lines = []
+        numbered = []
+        bullets = []
+        words = 0
+        capitals = 0
+        has_emphasis = True
+        
+        for idx in rows:
+            kind = kinds[idx]
+            if kind == BLANK:
+                continue
+            lines.append(idx)
+            if kind == NUMBERED:
+                numbered.append(idx)
+            elif kind == BULLET:
+                bullets.append(idx)
+            words += index.words[idx]
+            capitals += index.capitals[idx]
+            # Emphasis: every line is ALL CAPS
+            if not flags[idx] & ALL_CAPS:
+                has_emphasis = False
+        
+        if text is None:
+            text = index.span(lines)
+        
+        # Determine content type (lists need at least two items)
+        if len(numbered) >= 2:
             content_type = 'numbered_list'
-            items = [match.group(2).strip() for match in numbered_matches]
-        elif bullet_matches and len(bullet_matches) >= 2:
+            items = [index.item(idx) for idx in numbered]
+        elif len(bullets) >= 2:
             content_type = 'bullet_list'
-            items = [match.group(1).strip() for match in bullet_matches]
+            items = [index.item(idx) for idx in bullets]
         else:
             content_type = 'plain'
-            items = [line.strip() for line in text.split('\n') if line.strip()]
+            items = [index.line(idx) for idx in lines]
         
-        # Check for emphasis
-        has_emphasis = bool(ContentAnalyzer.ALL_CAPS_PATTERN.match(text.strip()))
+        has_emphasis = has_emphasis and bool(lines)
         
-        # Check if title case (first letters capitalized)
-        is_title_case = ContentAnalyzer._is_title_case(text)
+        # Title case: at least 50% of words start with a capital
+        is_title_case = bool(words) and capitals / words >= 0.5
         
         return {
             'content_type': content_type,
@@ -88,17 +127,6 @@ class ContentAnalyzer:
             'original_text': text
         }
     
-    @staticmethod
-    def _is_title_case(text: str) -> bool:
-        """Check if text appears to be in title case."""
-        words = text.split()
-        if not words:
-            return False
-        
-        # At least 50% of words should start with capital
-        capitalized = sum(1 for word in words if word and word[0].isupper())
-        return capitalized / len(words) >= 0.5
-    
     @staticmethod
     def detect_slide_sections(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -9,6 +9,7 @@ and hierarchy of text elements.
 from typing import Dict, Any, List
 from ..utils.logger import get_logger
 from .content_analyzer import ContentAnalyzer
+from .line_index import index_lines
 from .text_splitter import TextSplitter
 
 logger = get_logger(__name__)
@@ -76,8 +77,11 @@ class ContentParser:
         all_text = ContentParser._extract_all_slide_text(slide_data)
         
         if all_text:
+            # Classify lines once; splitter and analyzer both read the index
+            line_index = index_lines(all_text)
+            
             # Split text into logical components
-            components = TextSplitter.split_slide_text(all_text, index)
+            components = TextSplitter.split_slide_text(all_text, index, index=line_index)
             
             # Convert components to elements
             for comp in components:
@@ -100,8 +104,8 @@ class ContentParser:
                     }
                 else:
                     # Analyze non-list content
-                    element['text_analysis'] = ContentAnalyzer.analyze_text_structure(
-                        comp['content']
+                    element['text_analysis'] = ContentAnalyzer.analyze_lines(
+                        line_index, comp['rows'], comp['content']
                     )
                 
                 parsed_slide['elements'].append(element)
@@ -190,7 +194,7 @@ class ContentParser:
         # Sort by vertical position (top to bottom), then horizontal (left to right)
         raw_slide['raw_elements'].sort(key=lambda e: (e['position_y'], e['position_x']))
         
-        logger.info(
+        logger.debug(
             f"Extracted {len(raw_slide['raw_elements'])} raw elements from slide {index}",
             operation="extract_raw_slide_elements"
         )
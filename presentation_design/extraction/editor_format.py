@@ -0,0 +1,224 @@
+"""
+Editor Format Module
+====================
+
+Converts extracted Google Slides content into slide editor records.
+
+The slide editor works on one record per slide::
+
+    {
+        'content': '<h1>Title</h1>\\n...',   # HTML edited in the browser
+        'title': str,
+        'mainText': str,
+        'secondaryText': str,
+        'original_objectIds': [str, ...]
+    }
+
+These functions are shared by the web application and the extraction
+benchmarks, so both measure and serve exactly the same conversion.
+
+Pasted text is converted incrementally: iter_editor_chunks groups the
+slides of TextParser.iter_slides into chunks of doubling size, so the
+first slides can be stored and opened in the editor right away while
+storing the growing list after each chunk stays linear overall.
+
+Extracted decks go through three steps, which the extraction pipeline
+times separately: raw_slide_items normalizes the slides into (text,
+slide ID, object IDs) items, parse_slide_items parses them (very large
+decks in worker processes, see parallel_parse) and format_slide_items
+builds the editor records.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..utils.logger import get_logger
+from .parallel_parse import map_slide_chunks, worker_parser
+from .text_parser import TextParser
+
+logger = get_logger(__name__)
+
+# Metadata lines such as "(макроуровень)" that are dropped on import
+METADATA_LINE_PATTERN = re.compile(r'^\([^)]+уровень\)$', re.IGNORECASE)
+
+# Text of one slide, its ID and the object IDs of its source elements
+SlideItem = Tuple[str, str, Optional[List[str]]]
+
+
+def format_slide_content(slide: Dict[str, Any]) -> str:
+    """
+    Format slide content with HTML tags.
+
+    Args:
+        slide: Parsed slide data with title, mainText, etc.
+
+    Returns:
+        Formatted HTML string
+    """
+    html_parts = []
+
+    # Add title if present
+    if slide.get('title'):
+        html_parts.append(f"<h1>{slide['title']}</h1>")
+
+    # Main text is already formatted as HTML by the parser
+    main_text = slide.get('mainText', '')
+    if main_text:
+        html_parts.append(main_text)
+
+    # Add secondary text if present
+    secondary_text = slide.get('secondaryText', '')
+    if secondary_text:
+        html_parts.append(f"<p class='text-sm text-gray-600'>{secondary_text}</p>")
+
+    return '\n'.join(html_parts)
+
+
+def editor_slide(parsed_slide: Dict[str, Any], object_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Build an editor record from a TextParser slide.
+
+    Args:
+        parsed_slide: Slide produced by TextParser
+        object_ids: Object IDs of the source elements, if any
+
+    Returns:
+        Editor slide dictionary
+    """
+    return {
+        'content': format_slide_content(parsed_slide),
+        'title': parsed_slide.get('title', ''),
+        'mainText': parsed_slide.get('mainText', ''),
+        'secondaryText': '',
+        'original_objectIds': object_ids or []
+    }
+
+
+def iter_editor_chunks(parsed_slides: Iterable[Dict[str, Any]], first_chunk: int = 20) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Convert parsed slides to editor records in chunks of doubling size.
+
+    Args:
+        parsed_slides: Slides produced by TextParser (typically the
+            iter_slides generator, consumed lazily)
+        first_chunk: Size of the first chunk (at least 1)
+
+    Yields:
+        Lists of new editor slide dictionaries, in order
+    """
+    chunk_size = max(1, first_chunk)
+    chunk = []
+
+    for parsed_slide in parsed_slides:
+        chunk.append(editor_slide(parsed_slide))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+            chunk_size *= 2
+
+    if chunk:
+        yield chunk
+
+
+def raw_slide_items(raw_slides: Iterable[Dict[str, Any]]) -> List[SlideItem]:
+    """
+    Normalize raw-mode slides into parse items.
+
+    All text of a slide is joined in its original order; vertical tabs
+    and carriage returns become spaces and metadata lines are dropped.
+    Slides without text are skipped (their number is kept by the others).
+
+    Args:
+        raw_slides: Slides of SlidesExtractor.extract_presentation(raw_mode=True)
+
+    Returns:
+        (text, slide ID, object IDs) per slide with text
+    """
+    items: List[SlideItem] = []
+
+    for idx, slide in enumerate(raw_slides):
+        raw_elements = slide.get('raw_elements', [])
+
+        # Collect ALL text in the EXACT order it appears
+        all_text_parts = []
+
+        for element in raw_elements:
+            # Vertical tabs and carriage returns become regular spaces
+            content = element.get('content', '').replace('\v', ' ').replace('\r', ' ')
+
+            content_stripped = content.strip()
+            if METADATA_LINE_PATTERN.match(content_stripped):
+                continue
+
+            if content_stripped:
+                all_text_parts.append(content)
+
+        # Empty and image-only slides are not shown in the editor
+        if not all_text_parts:
+            logger.debug(
+                f"Skipping slide {idx}: no text content",
+                operation="raw_slide_items"
+            )
+            continue
+
+        items.append(('\n'.join(all_text_parts), str(idx + 1), [el.get('objectId', '') for el in raw_elements]))
+
+    return items
+
+
+def _parse_items(items: Sequence[SlideItem], parser: Optional[TextParser] = None) -> List[Dict[str, Any]]:
+    """Parse slide items into TextParser slides (also run in pool workers)."""
+    parser = parser or worker_parser()
+    return [parser.create_slide_from_content(text, slide_id) for text, slide_id, _ in items]
+
+
+def parse_slide_items(items: Sequence[SlideItem], parser: Optional[TextParser] = None) -> List[Dict[str, Any]]:
+    """
+    Parse normalized slide items.
+
+    Large decks are parsed in worker processes (see parallel_parse)
+    unless a specific parser is given.
+
+    Args:
+        items: (text, slide ID, object IDs) per slide
+        parser: TextParser to use in this process
+
+    Returns:
+        TextParser slides, in item order
+    """
+    if parser is not None:
+        return _parse_items(items, parser)
+    return map_slide_chunks(_parse_items, items)
+
+
+def format_slide_items(items: Sequence[SlideItem], parsed_slides: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build editor records for parsed slide items.
+
+    Args:
+        items: Items the slides were parsed from
+        parsed_slides: Result of parse_slide_items for items
+
+    Returns:
+        List of editor slide dictionaries
+    """
+    return [editor_slide(parsed, item[2]) for item, parsed in zip(items, parsed_slides)]
+
+
+def raw_data_to_editor_slides(raw_data: Dict[str, Any], parser: Optional[TextParser] = None) -> List[Dict[str, Any]]:
+    """
+    Convert raw-mode extraction data to editor slides.
+
+    All text of a slide goes to mainText in its original order, and is
+    parsed the same way as pasted text. Slides without text are skipped.
+
+    Args:
+        raw_data: Output of SlidesExtractor.extract_presentation(raw_mode=True)
+        parser: TextParser to use (default: the process parser, or
+            worker processes for large decks)
+
+    Returns:
+        List of editor slide dictionaries
+    """
+    items = raw_slide_items(raw_data.get('slides', []))
+    return format_slide_items(items, parse_slide_items(items, parser))
@@ -0,0 +1,460 @@
+"""
+Extraction Cache Module
+=======================
+
+Revision-aware cache of parsed editor slides for Google Slides imports.
+
+Entries are keyed by presentation ID plus the deck's version token: the
+Slides ``revisionId`` when the caller can see it, otherwise the Drive
+``modifiedTime``. Re-importing an unchanged deck costs one small metadata
+call, which also proves the caller still has access before any cached
+content is returned. Entries live in a bounded in-memory LRU backed by a
+SQLite table; decks that answered 403/404 are remembered briefly per
+credential identity so repeated failing imports do not hit the API.
+
+Concurrent imports of the same deck (a shared link opened by a whole
+class) are coalesced: each caller still makes its own metadata call, and
+callers that proved access to the same version wait for a single
+extraction instead of each fetching the full presentation.
+"""
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..utils.logger import get_logger
+from ..utils.lru import LRUCache
+from ..utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+# Bump when the raw -> editor slide conversion changes, to drop stale entries
+EDITOR_FORMAT_VERSION = 1
+
+# HTTP statuses cached as negative results
+NEGATIVE_STATUSES = (403, 404)
+
+
+class ExtractionAccessError(Exception):
+    """
+    Raised when a presentation is known to be inaccessible.
+
+    Attributes:
+        status (int): HTTP status of the original failure (403 or 404)
+    """
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+
+
+def http_status(exception: Exception) -> Optional[int]:
+    """
+    Find the HTTP status of an API error, following the cause chain.
+
+    Args:
+        exception: Exception raised by an API call (possibly wrapped)
+
+    Returns:
+        HTTP status code, or None for non-HTTP errors
+    """
+    current = exception
+    seen = set()
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, ExtractionAccessError):
+            return current.status
+        status = getattr(getattr(current, 'resp', None), 'status', None)
+        if status is not None:
+            try:
+                return int(status)
+            except (TypeError, ValueError):
+                return None
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def fetch_version_token(provider, presentation_id: str) -> Optional[str]:
+    """
+    Fetch a cheap token that changes whenever the deck changes.
+
+    Tries the Slides ``revisionId`` first (returned only to editors), then
+    falls back to the Drive ``modifiedTime``.
+
+    Args:
+        provider: Object with build_service(name, version)
+        presentation_id: Presentation ID
+
+    Returns:
+        Version token (e.g. 'rev:...' or 'mtime:...'), or None if unavailable
+
+    Raises:
+        Exception: API errors of the Slides metadata call (e.g. 403/404)
+    """
+    slides_service = provider.build_service('slides', 'v1')
+    metadata = slides_service.presentations().get(
+        presentationId=presentation_id,
+        fields='revisionId'
+    ).execute()
+
+    revision_id = metadata.get('revisionId')
+    if revision_id:
+        return f"rev:{revision_id}"
+
+    try:
+        drive_service = provider.build_service('drive', 'v3')
+        file_metadata = drive_service.files().get(
+            fileId=presentation_id,
+            fields='modifiedTime',
+            supportsAllDrives=True
+        ).execute()
+    except Exception as e:
+        logger.debug(
+            f"Drive modifiedTime unavailable: {e}",
+            operation="fetch_version_token",
+            presentation_id=presentation_id
+        )
+        return None
+
+    modified_time = file_metadata.get('modifiedTime')
+    return f"mtime:{modified_time}" if modified_time else None
+
+
+class ExtractionCache:
+    """
+    Two-level (memory + SQLite) cache of parsed editor slides.
+
+    Attributes:
+        db_path (Optional[Path]): SQLite database file (None = memory only)
+        memory (LRUCache): In-memory entries keyed by (id, token, variant)
+        negative (LRUCache): Short-lived 403/404 results keyed by (id, identity)
+        flights (SingleFlight): In-flight metadata calls and extractions
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_entries: int = 128,
+        max_persisted_entries: int = 1000,
+        negative_ttl_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize extraction cache.
+
+        Args:
+            db_path: SQLite database file for persistence (None = memory only)
+            max_entries: Maximum decks kept in memory
+            max_persisted_entries: Maximum decks kept in SQLite
+            negative_ttl_seconds: How long 403/404 results are remembered
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.max_persisted_entries = max_persisted_entries
+        self.memory = LRUCache(maxsize=max_entries)
+        self.negative = LRUCache(maxsize=1024, ttl=negative_ttl_seconds, clock=clock)
+        self.flights = SingleFlight()
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'negative_hits': 0, 'uncacheable': 0, 'coalesced': 0}
+
+        if self.db_path:
+            self._init_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_table(self) -> None:
+        """Create the persistence table if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS extraction_cache (
+                    presentation_id TEXT,
+                    version_token TEXT,
+                    variant TEXT,
+                    slides_json TEXT,
+                    created_at REAL,
+                    last_used_at REAL,
+                    PRIMARY KEY (presentation_id, version_token, variant)
+                )
+            ''')
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_used '
+                'ON extraction_cache(last_used_at)'
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _variant(variant: str) -> str:
+        return f"{variant}:v{EDITOR_FORMAT_VERSION}"
+
+    def get(self, presentation_id: str, version_token: str, variant: str = 'raw') -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached editor slides for a deck version.
+
+        Args:
+            presentation_id: Presentation ID
+            version_token: Token from fetch_version_token
+            variant: Conversion variant (different extractors format differently)
+
+        Returns:
+            Copy of the cached slides, or None on a miss
+        """
+        key = (presentation_id, version_token, self._variant(variant))
+        slides = self.memory.get(key)
+
+        if slides is None and self.db_path:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    'SELECT slides_json FROM extraction_cache '
+                    'WHERE presentation_id = ? AND version_token = ? AND variant = ?',
+                    key
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        'UPDATE extraction_cache SET last_used_at = ? '
+                        'WHERE presentation_id = ? AND version_token = ? AND variant = ?',
+                        (time.time(),) + key
+                    )
+                    conn.commit()
+            finally:
+                conn.close()
+
+            if row:
+                try:
+                    slides = json.loads(row[0])
+                    self.memory.set(key, slides)
+                except json.JSONDecodeError:
+                    slides = None
+
+        return copy.deepcopy(slides) if slides is not None else None
+
+    def put(self, presentation_id: str, version_token: str, slides: List[Dict[str, Any]], variant: str = 'raw') -> None:
+        """
+        Store editor slides for a deck version, replacing older versions.
+
+        Args:
+            presentation_id: Presentation ID
+            version_token: Token from fetch_version_token
+            slides: Editor slides to cache
+            variant: Conversion variant
+        """
+        key = (presentation_id, version_token, self._variant(variant))
+        slides = copy.deepcopy(slides)
+
+        # Older versions of the same deck can never be hit again
+        for old_key in self.memory.keys():
+            if old_key[0] == presentation_id and old_key[2] == key[2] and old_key != key:
+                self.memory.pop(old_key)
+        self.memory.set(key, slides)
+
+        if not self.db_path:
+            return
+
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                'DELETE FROM extraction_cache WHERE presentation_id = ? AND variant = ? AND version_token != ?',
+                (presentation_id, key[2], version_token)
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO extraction_cache '
+                '(presentation_id, version_token, variant, slides_json, created_at, last_used_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                key + (json.dumps(slides, ensure_ascii=False), now, now)
+            )
+            conn.execute(
+                'DELETE FROM extraction_cache WHERE rowid NOT IN ('
+                'SELECT rowid FROM extraction_cache ORDER BY last_used_at DESC LIMIT ?)',
+                (self.max_persisted_entries,)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def check_negative(self, presentation_id: str, identity: str) -> None:
+        """
+        Raise if this identity recently failed to access the deck.
+
+        Raises:
+            ExtractionAccessError: If a 403/404 is cached for (deck, identity)
+        """
+        failure = self.negative.get((presentation_id, identity))
+        if failure is not None:
+            with self._lock:
+                self.counters['negative_hits'] += 1
+            raise ExtractionAccessError(failure['message'], failure['status'])
+
+    def remember_failure(self, presentation_id: str, identity: str, exception: Exception) -> None:
+        """Cache a 403/404 result; other errors are ignored."""
+        status = http_status(exception)
+        if status in NEGATIVE_STATUSES:
+            self.negative.set((presentation_id, identity), {
+                'status': status,
+                'message': f"Presentation {presentation_id} is not accessible (HTTP {status})"
+            })
+
+    def get_or_extract(
+        self,
+        presentation_id: str,
+        provider,
+        identity: str,
+        extract: Callable[[], List[Dict[str, Any]]],
+        variant: str = 'raw'
+    ) -> List[Dict[str, Any]]:
+        """
+        Return editor slides for a deck, extracting only if it changed.
+
+        Concurrent calls share work: the metadata call is shared by callers
+        with the same identity, and the extraction by callers that saw the
+        same version token (access to it was proven by their own metadata
+        call). Without a version token, only the same identity shares.
+
+        Args:
+            presentation_id: Presentation ID
+            provider: Object with build_service(name, version) for the caller
+            identity: Credential identity of the caller (negative cache key)
+            extract: Callable performing the full extraction and parse
+            variant: Conversion variant
+
+        Returns:
+            Editor slides (a private copy for every caller)
+
+        Raises:
+            ExtractionAccessError: If the deck recently returned 403/404
+            Exception: Errors of the metadata call or of extract()
+        """
+        self.check_negative(presentation_id, identity)
+
+        try:
+            version_token, _ = self.flights.do(
+                ('version', presentation_id, identity),
+                lambda: fetch_version_token(provider, presentation_id)
+            )
+        except Exception as e:
+            self.remember_failure(presentation_id, identity, e)
+            raise
+
+        if version_token:
+            slides = self.get(presentation_id, version_token, variant)
+            if slides is not None:
+                with self._lock:
+                    self.counters['hits'] += 1
+                logger.info(
+                    f"Extraction cache hit for {presentation_id}",
+                    operation="extraction_cache",
+                    presentation_id=presentation_id,
+                    version_token=version_token,
+                    slide_count=len(slides)
+                )
+                return slides
+
+        ran_here = []
+
+        def extract_and_store():
+            ran_here.append(True)
+            slides = extract()
+            if version_token:
+                self.put(presentation_id, version_token, slides, variant)
+            return slides
+
+        access_class = version_token or f"identity:{identity}"
+        try:
+            slides, shared = self.flights.do(
+                ('extract', presentation_id, access_class, self._variant(variant)),
+                extract_and_store
+            )
+        except Exception as e:
+            # Another caller's failure says nothing about this identity's access
+            if ran_here:
+                self.remember_failure(presentation_id, identity, e)
+            raise
+
+        with self._lock:
+            if shared:
+                self.counters['coalesced'] += 1
+            else:
+                self.counters['misses' if version_token else 'uncacheable'] += 1
+
+        if shared:
+            logger.info(
+                f"Joined in-flight extraction of {presentation_id}",
+                operation="extraction_cache",
+                presentation_id=presentation_id,
+                version_token=version_token
+            )
+
+        return slides
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and memory usage."""
+        with self._lock:
+            stats = dict(self.counters)
+        stats['memory'] = self.memory.stats()
+        stats['negative_entries'] = len(self.negative)
+        return stats
+
+
+# Global cache instance
+_cache_instance: Optional[ExtractionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Get or create the global extraction cache.
+
+    Settings are read from the optional ``extraction_cache`` configuration
+    section; defaults are used when it is missing.
+
+    Returns:
+        Global ExtractionCache instance
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                settings: Dict[str, Any] = {}
+                db_path = None
+                try:
+                    from ..utils.config import get_config
+                    config = get_config()
+                    settings = config.get('extraction_cache', {}) or {}
+                    if settings.get('db_path'):
+                        db_path = config.get_absolute_path(settings['db_path'])
+                except Exception as e:
+                    logger.warning(
+                        f"Using default extraction cache settings: {e}",
+                        operation="get_extraction_cache"
+                    )
+
+                _cache_instance = ExtractionCache(
+                    db_path=db_path,
+                    max_entries=settings.get('max_entries', 128),
+                    max_persisted_entries=settings.get('max_persisted_entries', 1000),
+                    negative_ttl_seconds=settings.get('negative_ttl_seconds', 60)
+                )
+
+    return _cache_instance
+
+
+def set_extraction_cache(cache: Optional[ExtractionCache]) -> None:
+    """
+    Replace the global extraction cache (used by tests).
+
+    Args:
+        cache: New cache, or None to recreate defaults on next use
+    """
+    global _cache_instance
+    with _cache_lock:
+        _cache_instance = cache
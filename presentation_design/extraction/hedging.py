@@ -0,0 +1,333 @@
+"""
+Hedged Extraction Module
+========================
+
+Runs alternative credential paths (user OAuth, Service Account) for one
+presentation import and returns the first success.
+
+Modes:
+    sequential  - try paths in order (previous behavior)
+    concurrent  - start all paths at once
+    hedged      - start the preferred path; start the next one if no
+                  result arrived within the hedge delay (the observed p95
+                  latency of the running path) or as soon as it fails
+
+The path that last succeeded for a deck is remembered and tried first.
+Losers are cancelled cooperatively: attempts that have not started are
+dropped, and running ones get their cancel event set and their result
+discarded (an in-progress HTTP call cannot be interrupted).
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.lru import LRUCache
+
+logger = get_logger(__name__)
+
+MODES = ('sequential', 'concurrent', 'hedged')
+
+# An attempt receives a cancel event and returns its result
+Attempt = Tuple[str, Callable[[threading.Event], Any]]
+
+
+class HedgingError(Exception):
+    """
+    Raised when every credential path failed.
+
+    Attributes:
+        errors (dict): Path name -> exception, in the order they failed
+    """
+
+    def __init__(self, errors: Dict[str, Exception]):
+        self.errors = errors
+        details = '; '.join(f"{name}: {error}" for name, error in errors.items())
+        super().__init__(f"All extraction paths failed ({details})")
+
+
+class LatencyTracker:
+    """
+    Sliding window of successful attempt durations per path.
+
+    Attributes:
+        window (int): Samples kept per path
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, path: str, seconds: float) -> None:
+        """Record a successful attempt duration."""
+        with self._lock:
+            self._samples.setdefault(path, deque(maxlen=self.window)).append(seconds)
+
+    def paths(self) -> List[str]:
+        """Return paths with recorded samples."""
+        with self._lock:
+            return list(self._samples)
+
+    def quantile(self, path: str, q: float = 0.95, min_samples: int = 5) -> Optional[float]:
+        """
+        Return the q-quantile of a path's durations.
+
+        Returns:
+            Duration in seconds, or None with fewer than min_samples samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(path, ()))
+        if len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class HedgedRunner:
+    """
+    Policy engine choosing how credential paths are raced.
+
+    Attributes:
+        mode (str): One of MODES
+        latency (LatencyTracker): Observed durations per path
+        winners (LRUCache): Deck key -> path that last succeeded
+    """
+
+    def __init__(
+        self,
+        mode: str = 'hedged',
+        hedge_delay: Optional[float] = None,
+        default_hedge_delay: float = 2.0,
+        min_hedge_delay: float = 0.25,
+        max_hedge_delay: float = 10.0,
+        winner_ttl_seconds: float = 3600,
+        max_workers: int = 16
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            mode: 'sequential', 'concurrent' or 'hedged'
+            hedge_delay: Fixed hedge delay (None = observed p95 of the running path)
+            default_hedge_delay: Delay used until enough latency samples exist
+            min_hedge_delay: Lower bound of the p95-based delay
+            max_hedge_delay: Upper bound of the p95-based delay
+            winner_ttl_seconds: How long a deck's winning path is remembered
+            max_workers: Threads shared by all running attempts
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown hedging mode '{mode}', expected one of {MODES}")
+
+        self.mode = mode
+        self.hedge_delay = hedge_delay
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.latency = LatencyTracker()
+        self.winners = LRUCache(maxsize=4096, ttl=winner_ttl_seconds)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedged-extract")
+        self._lock = threading.Lock()
+        self.counters = {'runs': 0, 'hedges': 0, 'cancelled': 0, 'failures': 0}
+
+    def delay_for(self, path: str) -> float:
+        """Return how long to wait on a path before starting the next one."""
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        p95 = self.latency.quantile(path)
+        if p95 is None:
+            return self.default_hedge_delay
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, p95))
+
+    def order(self, key: str, attempts: List[Attempt]) -> List[Attempt]:
+        """Put the deck's remembered winner first."""
+        winner = self.winners.get(key)
+        if winner is None:
+            return list(attempts)
+        return sorted(attempts, key=lambda attempt: attempt[0] != winner)
+
+    def run(self, key: str, attempts: List[Attempt]) -> Tuple[str, Any]:
+        """
+        Run credential paths for a deck according to the mode.
+
+        Args:
+            key: Deck key (e.g. presentation ID) for winner memory
+            attempts: (path name, callable(cancel_event) -> result) pairs,
+                in default preference order
+
+        Returns:
+            Tuple of (winning path name, result)
+
+        Raises:
+            HedgingError: If every path failed
+        """
+        if not attempts:
+            raise HedgingError({})
+
+        with self._lock:
+            self.counters['runs'] += 1
+
+        ordered = self.order(key, attempts)
+        if self.mode == 'sequential' or len(ordered) == 1:
+            name, result = self._run_sequential(ordered)
+        else:
+            name, result = self._race(ordered, hedge=self.mode == 'hedged')
+
+        self.winners.set(key, name)
+        logger.info(
+            f"Extraction path '{name}' won",
+            operation="hedged_extraction",
+            presentation_id=key,
+            mode=self.mode
+        )
+        return name, result
+
+    def _timed(self, name: str, func: Callable[[threading.Event], Any], cancel: threading.Event) -> Any:
+        started = time.monotonic()
+        result = func(cancel)
+        self.latency.observe(name, time.monotonic() - started)
+        return result
+
+    def _run_sequential(self, attempts: List[Attempt]) -> Tuple[str, Any]:
+        errors: Dict[str, Exception] = {}
+        for name, func in attempts:
+            try:
+                return name, self._timed(name, func, threading.Event())
+            except Exception as e:
+                errors[name] = e
+                logger.warning(
+                    f"Extraction path '{name}' failed: {e}",
+                    operation="hedged_extraction"
+                )
+        self._count('failures')
+        raise HedgingError(errors)
+
+    def _race(self, attempts: List[Attempt], hedge: bool) -> Tuple[str, Any]:
+        cancel_events: Dict[Future, threading.Event] = {}
+        names: Dict[Future, str] = {}
+        pending: List[Attempt] = list(attempts)
+        running = set()
+        errors: Dict[str, Exception] = {}
+        started: List[str] = []
+
+        def start_next() -> None:
+            name, func = pending.pop(0)
+            started.append(name)
+            event = threading.Event()
+            future = self._executor.submit(self._timed, name, func, event)
+            cancel_events[future] = event
+            names[future] = name
+            running.add(future)
+
+        start_next()
+        if not hedge:
+            while pending:
+                start_next()
+
+        while running:
+            # Hedge on the most recently started path
+            timeout = self.delay_for(started[-1]) if pending and hedge else None
+
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                self._count('hedges')
+                logger.info(
+                    f"Hedging: starting '{pending[0][0]}' after {timeout:.2f}s",
+                    operation="hedged_extraction"
+                )
+                start_next()
+                continue
+
+            for future in done:
+                running.discard(future)
+                error = future.exception()
+                if error is None:
+                    self._cancel(running, cancel_events)
+                    return names[future], future.result()
+                errors[names[future]] = error
+                logger.warning(
+                    f"Extraction path '{names[future]}' failed: {error}",
+                    operation="hedged_extraction"
+                )
+
+            # A failure starts the next path immediately
+            if not running and pending:
+                start_next()
+
+        self._count('failures')
+        raise HedgingError(errors)
+
+    def _cancel(self, running, cancel_events: Dict[Future, threading.Event]) -> None:
+        for future in running:
+            cancel_events[future].set()
+            future.cancel()
+            self._count('cancelled')
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and current p95 per path."""
+        with self._lock:
+            stats = dict(self.counters)
+        stats['mode'] = self.mode
+        stats['p95_seconds'] = {path: self.latency.quantile(path) for path in self.latency.paths()}
+        return stats
+
+
+# Global runner instance
+_runner_instance: Optional[HedgedRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_hedged_runner() -> HedgedRunner:
+    """
+    Get or create the global hedged runner.
+
+    Settings are read from the optional ``extraction_hedging``
+    configuration section; defaults are used when it is missing.
+
+    Returns:
+        Global HedgedRunner instance
+    """
+    global _runner_instance
+
+    if _runner_instance is None:
+        with _runner_lock:
+            if _runner_instance is None:
+                settings: Dict[str, Any] = {}
+                try:
+                    from ..utils.config import get_config
+                    settings = get_config().get('extraction_hedging', {}) or {}
+                except Exception as e:
+                    logger.warning(
+                        f"Using default extraction hedging settings: {e}",
+                        operation="get_hedged_runner"
+                    )
+
+                _runner_instance = HedgedRunner(
+                    mode=settings.get('mode', 'hedged'),
+                    hedge_delay=settings.get('hedge_delay_seconds'),
+                    default_hedge_delay=settings.get('default_hedge_delay_seconds', 2.0),
+                    min_hedge_delay=settings.get('min_hedge_delay_seconds', 0.25),
+                    max_hedge_delay=settings.get('max_hedge_delay_seconds', 10.0),
+                    winner_ttl_seconds=settings.get('winner_ttl_seconds', 3600)
+                )
+
+    return _runner_instance
+
+
+def set_hedged_runner(runner: Optional[HedgedRunner]) -> None:
+    """
+    Replace the global hedged runner (used by tests).
+
+    Args:
+        runner: New runner, or None to recreate defaults on next use
+    """
+    global _runner_instance
+    with _runner_lock:
+        _runner_instance = runner
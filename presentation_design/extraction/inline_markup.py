@@ -0,0 +1,330 @@
+"""
+Inline Markup Module
+====================
+
+Single-pass tokenizer for inline Markdown emphasis in pasted text.
+
+Supported markup (a practical subset of CommonMark inlines):
+
+    **text** / __text__   strong
+    *text* / _text_       emphasis (nesting such as ***both*** works)
+    `code`                code span (contents are taken literally)
+    \\*                    backslash escape of a punctuation character
+
+Delimiters follow the CommonMark flanking rules, so underscores inside
+words, identifiers and URLs (snake_case, http://a.b/c_d_e) stay literal.
+
+A line is scanned once: a compiled pattern jumps from one special
+character to the next, and emphasis is resolved with a delimiter stack as
+delimiters are found. inline_html returns the HTML used by the slide
+editor; parse_inline also returns the plain text and its style runs.
+
+The presentation builder does not take its runs from here: it works on
+the HTML as the user left it in the editor, which no longer matches the
+parsed text after any edit, so generation.html_text derives the runs
+(same StyleRun type) from that HTML.
+"""
+
+import re
+import string
+from typing import Dict, List, NamedTuple, Tuple
+
+# Lines without any of these characters need no tokenizing
+_SPECIAL_CHARACTERS = re.compile(r'[*_`\\]')
+
+# Next delimiter run, code span opener or escape
+_INLINE_TOKEN = re.compile(r'\*+|_+|`+|\\')
+
+_PUNCTUATION = frozenset(string.punctuation)
+
+# Emphasis pairs that need no delimiter stack: the run is surrounded by
+# whitespace or punctuation other than markup characters, and the content
+# has no markup characters. If such pairs consume every markup character
+# of a line, the result is the same as full tokenizing.
+_EDGE = r'[\s' + re.escape(''.join(sorted(set(string.punctuation) - set('*_`\\')))) + r']'
+_SIMPLE_STRONG = re.compile(r'(?:^|(?<=' + _EDGE + r'))(\*\*|__)(?!\s)([^*_`\\]+?)(?<!\s)\1(?=' + _EDGE + r'|$)')
+_SIMPLE_EM = re.compile(r'(?:^|(?<=' + _EDGE + r'))(\*|_)(?!\s)([^*_`\\]+?)(?<!\s)\1(?=' + _EDGE + r'|$)')
+
+# HTML tags per style
+STRONG = 'strong'
+EM = 'em'
+CODE = 'code'
+
+
+class StyleRun(NamedTuple):
+    """
+    Styled range of plain text.
+
+    Attributes:
+        start: Start offset in the plain text
+        end: End offset (exclusive)
+        bold: Text is strong
+        italic: Text is emphasized
+        code: Text is a code span
+    """
+    start: int
+    end: int
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+
+
+class InlineMarkup(NamedTuple):
+    """
+    Tokenized line.
+
+    Attributes:
+        html: HTML with <strong>, <em> and <code> tags
+        text: Plain text (markup characters removed)
+        runs: Styled ranges of text, in order and non-overlapping
+    """
+    html: str
+    text: str
+    runs: List[StyleRun]
+
+
+class _Delimiter:
+    """Run of '*' or '_' characters while emphasis is being resolved."""
+
+    __slots__ = ('slot', 'char', 'length', 'count', 'can_open', 'can_close', 'opens', 'closes')
+
+    def __init__(self, slot: int, char: str, length: int, can_open: bool, can_close: bool):
+        # Index of the run in the token list
+        self.slot = slot
+        self.char = char
+        self.length = length
+        # Characters not yet used by a match
+        self.count = length
+        self.can_open = can_open
+        self.can_close = can_close
+        # Tags opened/closed here, in the order they were matched
+        self.opens: List[str] = []
+        self.closes: List[str] = []
+
+    def html(self) -> str:
+        """Closing tags, unused characters, then opening tags."""
+        closes = ''.join(f'</{tag}>' for tag in self.closes)
+        opens = ''.join(f'<{tag}>' for tag in reversed(self.opens))
+        return closes + self.char * self.count + opens
+
+
+def _close(closer: _Delimiter, stack: List[_Delimiter], bottoms: Dict[tuple, int]) -> None:
+    """Match a closing delimiter against the openers on the stack."""
+    char = closer.char
+    # Openers below the bottom cannot match closers of this kind (CommonMark)
+    kind = (char, closer.length % 3, closer.can_open)
+    while closer.count:
+        bottom = bottoms.get(kind, 0)
+        index = len(stack) - 1
+        while index >= bottom:
+            opener = stack[index]
+            if opener.char == char:
+                # CommonMark "rule of 3" for runs that can both open and close
+                if not (
+                    (opener.can_close or closer.can_open) and
+                    (opener.length + closer.length) % 3 == 0 and
+                    (opener.length % 3 or closer.length % 3)
+                ):
+                    break
+            index -= 1
+        else:
+            # No opener for this kind of closer below here, now or later
+            bottoms[kind] = len(stack)
+            return
+
+        used = 2 if opener.count >= 2 and closer.count >= 2 else 1
+        tag = STRONG if used == 2 else EM
+        opener.count -= used
+        closer.count -= used
+        opener.opens.append(tag)
+        closer.closes.append(tag)
+
+        # Delimiters between the pair can no longer match anything
+        del stack[index + 1:]
+        if not opener.count:
+            stack.pop()
+        for other, value in bottoms.items():
+            if value > len(stack):
+                bottoms[other] = len(stack)
+
+
+def _tokenize(text: str) -> Tuple[List[str], list]:
+    """
+    Split a line into tokens.
+
+    Returns:
+        Token strings (literal text, delimiter runs and code spans as
+        written) and the marks: delimiters and (slot, code) pairs of
+        code spans, in order
+    """
+    nodes: List[str] = []
+    marks = []
+    stack: List[_Delimiter] = []
+    bottoms: Dict[tuple, int] = {}
+    literal_start = 0
+    pos = 0
+    length = len(text)
+
+    while True:
+        match = _INLINE_TOKEN.search(text, pos)
+        if match is None:
+            break
+        start, end = match.span()
+        char = text[start]
+
+        if char == '\\':
+            escaped = text[end:end + 1]
+            if escaped in _PUNCTUATION:
+                nodes.append(text[literal_start:start])
+                literal_start = end
+                pos = end + 1
+            else:
+                pos = end
+            continue
+
+        if char == '`':
+            # Closing run of exactly the same length
+            closing = re.compile(r'(?<!`)' + re.escape(match.group()) + r'(?!`)').search(text, end)
+            if closing is None:
+                pos = end
+                continue
+            nodes.append(text[literal_start:start])
+            marks.append((len(nodes), text[end:closing.start()]))
+            nodes.append(text[start:closing.end()])
+            literal_start = pos = closing.end()
+            continue
+
+        # Flanking (CommonMark); line ends count as whitespace
+        before = text[start - 1] if start else ' '
+        after = text[end] if end < length else ' '
+        before_space = before.isspace()
+        after_space = after.isspace()
+        before_punct = before in _PUNCTUATION
+        after_punct = after in _PUNCTUATION
+        left = not after_space and (not after_punct or before_space or before_punct)
+        right = not before_space and (not before_punct or after_space or after_punct)
+        if char == '*':
+            can_open, can_close = left, right
+        else:
+            # No intraword emphasis with underscores
+            can_open = left and (not right or before_punct)
+            can_close = right and (not left or after_punct)
+
+        if start > literal_start:
+            nodes.append(text[literal_start:start])
+        literal_start = pos = end
+        if not (can_open or can_close):
+            nodes.append(match.group())
+            continue
+
+        delimiter = _Delimiter(len(nodes), char, end - start, can_open, can_close)
+        nodes.append(match.group())
+        marks.append(delimiter)
+
+        if can_close and stack:
+            _close(delimiter, stack, bottoms)
+        if can_open and delimiter.count:
+            stack.append(delimiter)
+
+    if literal_start < length:
+        nodes.append(text[literal_start:])
+    return nodes, marks
+
+
+def parse_inline(text: str) -> InlineMarkup:
+    """
+    Tokenize the inline markup of one line.
+
+    Args:
+        text: Line of text
+
+    Returns:
+        InlineMarkup with HTML, plain text and style runs
+    """
+    if not _SPECIAL_CHARACTERS.search(text):
+        return InlineMarkup(text, text, [])
+
+    nodes, marks = _tokenize(text)
+    marks_by_slot = {
+        mark.slot if isinstance(mark, _Delimiter) else mark[0]: mark
+        for mark in marks
+    }
+
+    html: List[str] = []
+    plain: List[str] = []
+    runs: List[StyleRun] = []
+    offset = 0
+    bold = 0
+    italic = 0
+
+    def add_text(value: str, code: bool = False) -> None:
+        nonlocal offset
+        if not value:
+            return
+        plain.append(value)
+        start = offset
+        offset += len(value)
+        if bold or italic or code:
+            style = (bool(bold), bool(italic), code)
+            if runs and runs[-1].end == start and runs[-1][2:] == style:
+                runs[-1] = runs[-1]._replace(end=offset)
+            else:
+                runs.append(StyleRun(start, offset, *style))
+
+    for slot, node in enumerate(nodes):
+        mark = marks_by_slot.get(slot)
+        if mark is None:
+            html.append(node)
+            add_text(node)
+        elif not isinstance(mark, _Delimiter):
+            html.append(f'<{CODE}>{mark[1]}</{CODE}>')
+            add_text(mark[1], code=True)
+        else:
+            html.append(mark.html())
+            for tag in mark.closes:
+                if tag == STRONG:
+                    bold -= 1
+                else:
+                    italic -= 1
+            add_text(mark.char * mark.count)
+            for tag in mark.opens:
+                if tag == STRONG:
+                    bold += 1
+                else:
+                    italic += 1
+
+    return InlineMarkup(''.join(html), ''.join(plain), runs)
+
+
+def inline_html(text: str) -> str:
+    """
+    Convert the inline markup of one line to HTML.
+
+    Same HTML as parse_inline, without collecting plain text and runs.
+
+    Args:
+        text: Line of text
+
+    Returns:
+        HTML string
+    """
+    if not _SPECIAL_CHARACTERS.search(text):
+        return text
+
+    # Common case: plain, non-overlapping pairs only
+    html = text
+    if '**' in html or '__' in html:
+        html = _SIMPLE_STRONG.sub(r'<strong>\2</strong>', html)
+    html = _SIMPLE_EM.sub(r'<em>\2</em>', html)
+    if not _SPECIAL_CHARACTERS.search(html):
+        return html
+
+    nodes, marks = _tokenize(text)
+    for mark in marks:
+        if isinstance(mark, _Delimiter):
+            if mark.opens or mark.closes:
+                nodes[mark.slot] = mark.html()
+        else:
+            slot, code = mark
+            nodes[slot] = f'<{CODE}>{code}</{CODE}>'
+    return ''.join(nodes)
@@ -0,0 +1,200 @@
+"""
+Line Index Module
+=================
+
+Per-slide line classification shared by TextSplitter and ContentAnalyzer.
+
+A slide's text is scanned once. For every line the index records:
+
+    kind       blank, text, numbered ("1. item", "2) item", "3: item") or
+               bullet ("• item", "- item", "* item", "– item", "— item")
+    flags      ends with ':', heading-like (TextSplitter rules), all caps
+               (ContentAnalyzer emphasis)
+    words      number of whitespace-separated words
+    capitals   number of words starting with an uppercase letter
+    offsets    start/end of the stripped line and start of the list item
+               text, as offsets into the original string
+
+Columns are compact arrays and line text is sliced from the original
+string only when needed, so components built from the index (a title, a
+paragraph, a list) are analyzed from their line range without splitting
+the text or running the patterns again.
+"""
+
+import re
+from array import array
+from typing import List
+
+# Line kinds
+BLANK = 0
+TEXT = 1
+NUMBERED = 2
+BULLET = 3
+
+# Line flags
+COLON = 1
+HEADING = 2
+ALL_CAPS = 4
+
+# List item markers (after the line is stripped)
+NUMBERED_PATTERN = re.compile(r'\d+[.):]\s+')
+BULLET_PATTERN = re.compile(r'[•\-*–—]\s+')
+
+# Emphasized (all caps) text: uppercase letters, digits, spaces, punctuation
+ALL_CAPS_PATTERN = re.compile(r'^[A-ZА-ЯЁ\s\d\W]+$')
+
+_BULLET_INITIALS = frozenset('•-*–—')
+
+# TextSplitter heading rules
+HEADING_MAX_LENGTH = 80
+TITLE_CASE_MAX_LENGTH = 60
+TITLE_CASE_RATIO = 0.7
+
+
+class LineIndex:
+    """
+    Classified lines of a text, stored column-wise.
+
+    Attributes:
+        text (str): Original text
+        kinds (array): Line kind per line
+        flags (array): Flag bits per line
+        words (array): Word count per line
+        capitals (array): Capitalized word count per line
+        starts (array): Start offset of the stripped line
+        ends (array): End offset of the stripped line
+        item_starts (array): Start offset of the list item text (equals
+            the line start for lines that are not list items)
+    """
+
+    __slots__ = ('text', 'kinds', 'flags', 'words', 'capitals', 'starts', 'ends', 'item_starts')
+
+    def __init__(
+        self,
+        text: str,
+        kinds: List[int],
+        flags: List[int],
+        words: List[int],
+        capitals: List[int],
+        starts: List[int],
+        ends: List[int],
+        item_starts: List[int]
+    ):
+        self.text = text
+        self.kinds = array('B', kinds)
+        self.flags = array('B', flags)
+        self.words = array('I', words)
+        self.capitals = array('I', capitals)
+        self.starts = array('I', starts)
+        self.ends = array('I', ends)
+        self.item_starts = array('I', item_starts)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def line(self, idx: int) -> str:
+        """Stripped text of a line."""
+        return self.text[self.starts[idx]:self.ends[idx]]
+
+    def item(self, idx: int) -> str:
+        """Text of a list item line without its marker."""
+        return self.text[self.item_starts[idx]:self.ends[idx]]
+
+    def span(self, rows: List[int]) -> str:
+        """Lines joined with newlines."""
+        return '\n'.join(self.line(idx) for idx in rows)
+
+    def content_rows(self) -> List[int]:
+        """Indexes of all non-blank lines, in order."""
+        return [idx for idx, kind in enumerate(self.kinds) if kind != BLANK]
+
+    def is_heading(self, idx: int) -> bool:
+        """Line is short and emphasized (caps, title case or trailing ':')."""
+        return bool(self.flags[idx] & HEADING)
+
+    def ends_with_colon(self, idx: int) -> bool:
+        """Line ends with ':' (header of a list)."""
+        return bool(self.flags[idx] & COLON)
+
+    def is_list_item(self, idx: int) -> bool:
+        """Line is a numbered or bulleted list item."""
+        return self.kinds[idx] >= NUMBERED
+
+
+def index_lines(text: str) -> LineIndex:
+    """
+    Classify all lines of a text.
+
+    Args:
+        text: Slide text (lines separated by '\\n')
+
+    Returns:
+        LineIndex
+    """
+    kinds: List[int] = []
+    flags: List[int] = []
+    word_counts: List[int] = []
+    capital_counts: List[int] = []
+    starts: List[int] = []
+    ends: List[int] = []
+    item_starts: List[int] = []
+
+    offset = 0
+    for raw in text.split('\n'):
+        line = raw.strip()
+        line_offset = offset
+        offset += len(raw) + 1
+
+        if not line:
+            kinds.append(BLANK)
+            flags.append(0)
+            word_counts.append(0)
+            capital_counts.append(0)
+            starts.append(line_offset)
+            ends.append(line_offset)
+            item_starts.append(line_offset)
+            continue
+
+        start = line_offset + len(raw) - len(raw.lstrip())
+        length = len(line)
+
+        kind = TEXT
+        item_start = start
+        initial = line[0]
+        if initial.isdecimal():
+            match = NUMBERED_PATTERN.match(line)
+            if match:
+                kind = NUMBERED
+                item_start = start + match.end()
+        elif initial in _BULLET_INITIALS:
+            match = BULLET_PATTERN.match(line)
+            if match:
+                kind = BULLET
+                item_start = start + match.end()
+
+        words = line.split()
+        capitals = len([word for word in words if word[0].isupper()])
+        upper = line.isupper()
+
+        line_flags = 0
+        if line[-1] == ':':
+            line_flags |= COLON
+        if length <= HEADING_MAX_LENGTH and (
+            line_flags & COLON or
+            (length > 3 and upper) or
+            (length < TITLE_CASE_MAX_LENGTH and capitals / len(words) >= TITLE_CASE_RATIO)
+        ):
+            line_flags |= HEADING
+        # A capitalized word in a line that is not all upper means lowercase text
+        if (upper or not capitals) and ALL_CAPS_PATTERN.match(line):
+            line_flags |= ALL_CAPS
+
+        kinds.append(kind)
+        flags.append(line_flags)
+        word_counts.append(len(words))
+        capital_counts.append(capitals)
+        starts.append(start)
+        ends.append(start + length)
+        item_starts.append(item_start)
+
+    return LineIndex(text, kinds, flags, word_counts, capital_counts, starts, ends, item_starts)
@@ -0,0 +1,230 @@
+"""
+Line Lexer Module
+=================
+
+Single-pass line classification for TextParser.
+
+Every line of pasted text is classified exactly once:
+
+    marker        "Slide 3 Title" / "Слайд 3" (slide marker, optional title)
+    number_after  a line holding only a slide number ("3"), not the first line
+    colon_header  a line ending with ':' (bold header opening a list)
+    bullet        "• item", "- item", "* item"
+    numbered      "1. item", "2) item"
+    blank         empty or whitespace-only line
+    text          anything else
+
+The slide detection strategy (see slide_strategy) and the slide
+formatter then work on the result, so no line is split or regex-tested twice. Patterns are
+precompiled and only tried on lines whose first character can match, and
+the classification is stored column-wise (one list per attribute) rather
+than as an object per line, which keeps lexing linear and cheap.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Set
+
+# Token kinds
+MARKER = 'marker'
+NUMBER_AFTER = 'number_after'
+COLON_HEADER = 'colon_header'
+BULLET = 'bullet'
+NUMBERED = 'numbered'
+BLANK = 'blank'
+TEXT = 'text'
+
+# Slide detection strategies, in order of preference
+NUMBER_AFTER_STRATEGY = 'number_after'
+MARKERS_STRATEGY = 'markers'
+BLOCKS_STRATEGY = 'blocks'
+
+BULLET_PREFIXES = ('• ', '- ', '* ')
+
+MARKER_PATTERN = re.compile(r'(slide|слайд)\s*(\d+)', re.IGNORECASE)
+NUMBERED_PATTERN = re.compile(r'\d+[.)]\s')
+NUMBERED_HEADER_PATTERN = re.compile(r'\d+\.')
+MARKDOWN_HEADER_PATTERN = re.compile(r'#{1,3}\s')
+
+# First characters a slide marker can start with
+_MARKER_INITIALS = frozenset('sSсС')
+
+# Punctuation between a marker and its title ("Slide 1: Intro")
+_MARKER_TITLE_SEPARATORS = ' \t:.-–—'
+
+
+class LineToken(NamedTuple):
+    """
+    One classified line (see LineTokens.__getitem__).
+
+    Attributes:
+        kind: Token kind (see module constants)
+        text: Line with surrounding whitespace stripped
+        raw: Line as it appears in the input (without the newline)
+        number: Slide number of marker and number_after lines
+        rest: Marker title on the same line, or list item text without
+            its bullet/number
+        starts_slide: Line looks like the start of a new slide (marker,
+            "1." header or markdown header)
+    """
+    kind: str
+    text: str
+    raw: str
+    number: Optional[str] = None
+    rest: Optional[str] = None
+    starts_slide: bool = False
+
+
+class LineTokens:
+    """
+    Classified lines of a text, stored column-wise.
+
+    Attributes:
+        lines (List[str]): Raw lines
+        texts (List[str]): Stripped lines
+        kinds (List[str]): Token kind per line
+        rests (List[Optional[str]]): Marker title or list item text per line
+        numbers (Dict[int, str]): Slide number of marker lines by index
+        slide_starts (Set[int]): Indexes of lines that look like a slide start
+    """
+
+    __slots__ = ('lines', 'texts', 'kinds', 'rests', 'numbers', 'slide_starts')
+
+    def __init__(
+        self,
+        lines: List[str],
+        texts: List[str],
+        kinds: List[str],
+        rests: List[Optional[str]],
+        numbers: Dict[int, str],
+        slide_starts: Set[int]
+    ):
+        self.lines = lines
+        self.texts = texts
+        self.kinds = kinds
+        self.rests = rests
+        self.numbers = numbers
+        self.slide_starts = slide_starts
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, idx: int) -> LineToken:
+        if idx < 0:
+            idx += len(self.kinds)
+        kind = self.kinds[idx]
+        number = self.texts[idx] if kind == NUMBER_AFTER else self.numbers.get(idx)
+        return LineToken(kind, self.texts[idx], self.lines[idx], number, self.rests[idx], idx in self.slide_starts)
+
+    def indices(self, kind: str) -> List[int]:
+        """Indexes of all lines of one kind, in order."""
+        return [idx for idx, line_kind in enumerate(self.kinds) if line_kind == kind]
+
+
+def tokenize_lines(lines: List[str]) -> LineTokens:
+    """
+    Classify lines that were already split.
+
+    Args:
+        lines: Lines without newlines
+
+    Returns:
+        LineTokens
+    """
+    texts = [line.strip() for line in lines]
+    kinds: List[str] = []
+    rests: List[Optional[str]] = []
+    numbers: Dict[int, str] = {}
+    slide_starts: Set[int] = set()
+    add_kind = kinds.append
+    add_rest = rests.append
+
+    for idx, text in enumerate(texts):
+        if not text:
+            add_kind(BLANK)
+            add_rest(None)
+            continue
+
+        initial = text[0]
+
+        if initial in _MARKER_INITIALS:
+            match = MARKER_PATTERN.match(text)
+            if match:
+                add_kind(MARKER)
+                add_rest(text[match.end():].lstrip(_MARKER_TITLE_SEPARATORS) or None)
+                numbers[idx] = match.group(2)
+                slide_starts.add(idx)
+                continue
+
+        elif initial.isdecimal():
+            if text.isdecimal():
+                add_kind(NUMBER_AFTER)
+                add_rest(None)
+                continue
+            if NUMBERED_HEADER_PATTERN.match(text):
+                slide_starts.add(idx)
+            if text[-1] != ':':
+                match = NUMBERED_PATTERN.match(text)
+                if match:
+                    add_kind(NUMBERED)
+                    add_rest(text[match.end():].lstrip())
+                    continue
+
+        elif initial == '#':
+            if MARKDOWN_HEADER_PATTERN.match(text):
+                slide_starts.add(idx)
+
+        if text[-1] == ':':
+            add_kind(COLON_HEADER)
+            add_rest(None)
+        elif text.startswith(BULLET_PREFIXES):
+            add_kind(BULLET)
+            add_rest(text[2:].strip())
+        else:
+            add_kind(TEXT)
+            add_rest(None)
+
+    return LineTokens(lines, texts, kinds, rests, numbers, slide_starts)
+
+
+def tokenize(text: str) -> LineTokens:
+    """
+    Classify all lines of a text.
+
+    A lone number on the first line is plain text: slide numbers follow
+    the slide they belong to.
+
+    Args:
+        text: Input text (lines separated by '\\n')
+
+    Returns:
+        LineTokens
+    """
+    tokens = tokenize_lines(text.split('\n'))
+    if tokens.kinds and tokens.kinds[0] == NUMBER_AFTER:
+        tokens.kinds[0] = TEXT
+    return tokens
+
+
+def slide_strategy(tokens: LineTokens) -> str:
+    """
+    Choose how a text is split into slides.
+
+    Slide numbers after the content win over "Slide N" markers; text with
+    neither is split into blocks at blank lines.
+
+    Args:
+        tokens: Classified lines of the whole text
+
+    Returns:
+        NUMBER_AFTER_STRATEGY, MARKERS_STRATEGY or BLOCKS_STRATEGY
+    """
+    if NUMBER_AFTER in tokens.kinds:
+        return NUMBER_AFTER_STRATEGY
+    if MARKER in tokens.kinds:
+        return MARKERS_STRATEGY
+    return BLOCKS_STRATEGY
+
+
+def classify_line(line: str) -> LineToken:
+    """Classify a single line."""
+    return tokenize_lines([line])[0]
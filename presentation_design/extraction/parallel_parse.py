@@ -0,0 +1,265 @@
+"""
+Parallel Parse Module
+=====================
+
+Parses the slides of very large decks in a pool of worker processes.
+
+Turning extracted slide text into editor records (TextParser plus HTML
+formatting) is pure Python and holds the GIL, so a big import on a web
+worker slows down every other request served by the same process. Decks
+with at least ``parallel_min_slides`` slides are therefore cut into
+chunks of ``parallel_chunk_slides`` slides and handed to a persistent
+process pool; smaller decks are parsed in place, where the pool's
+pickling overhead would outweigh the gain.
+
+The pool is created on first use and kept for the life of the process.
+Workers are started with the 'spawn' method (forking a threaded web
+server is unsafe). A spawned worker re-runs the parent's main script as
+``__mp_main__``, so scripts that start the pool must keep their start-up
+side effects out of that case (web_app.py does them in init_app()).
+Each worker builds its TextParser once in the pool initializer, so
+compiled patterns and the block cache are shared by all chunks a worker
+handles. Results come back in the order of the chunks.
+
+Settings are read from the optional ``text_parsing`` config section
+(``parallel_min_slides`` 0 disables the pool). If the pool cannot be
+started or a worker dies, the chunk is parsed in place and a new pool is
+created on the next large deck.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from ..utils.logger import get_logger
+from .text_parser import TextParser
+
+logger = get_logger(__name__)
+
+DEFAULT_MIN_SLIDES = 200
+DEFAULT_CHUNK_SLIDES = 50
+MAX_DEFAULT_WORKERS = 4
+
+_pool_instance: Optional["ParsePool"] = None
+_pool_lock = threading.Lock()
+
+# Parser of the current worker process (set by the pool initializer)
+_worker_parser: Optional[TextParser] = None
+
+
+class ParallelParseSettings(NamedTuple):
+    """
+    When and how to parse slides in worker processes.
+
+    Attributes:
+        min_slides: Smallest deck parsed in the pool (0 = never)
+        chunk_slides: Slides sent to a worker at a time
+        workers: Worker processes (0 = CPU count - 1, at most 4)
+    """
+    min_slides: int = DEFAULT_MIN_SLIDES
+    chunk_slides: int = DEFAULT_CHUNK_SLIDES
+    workers: int = 0
+
+
+def get_parallel_settings() -> ParallelParseSettings:
+    """
+    Read the settings from the ``text_parsing`` config section.
+
+    Returns:
+        ParallelParseSettings (defaults for missing settings)
+    """
+    try:
+        from ..utils.config import get_config
+        config = get_config()
+        return ParallelParseSettings(
+            min_slides=config.get('text_parsing.parallel_min_slides', DEFAULT_MIN_SLIDES),
+            chunk_slides=config.get('text_parsing.parallel_chunk_slides', DEFAULT_CHUNK_SLIDES),
+            workers=config.get('text_parsing.parallel_workers', 0)
+        )
+    except Exception as e:
+        logger.warning(
+            f"Using default parallel parse settings: {e}",
+            operation="get_parallel_settings"
+        )
+        return ParallelParseSettings()
+
+
+def default_workers() -> int:
+    """Worker count leaving one CPU to the web server (at least 1)."""
+    return max(1, min(MAX_DEFAULT_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def _init_worker() -> None:
+    """Pool initializer: build the worker's parser once."""
+    global _worker_parser
+    _worker_parser = TextParser()
+
+
+def worker_parser() -> TextParser:
+    """
+    Return the parser of the current process.
+
+    In a pool worker this is the parser built by the initializer; in
+    any other process a new one is created on first use.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = TextParser()
+    return _worker_parser
+
+
+def chunked(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    """Split items into consecutive chunks of at most size items."""
+    size = max(1, size)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+class ParsePool:
+    """
+    Persistent process pool mapping chunk functions in order.
+
+    Attributes:
+        workers (int): Number of worker processes
+        counters (dict): Parallel and in-place runs, worker failures
+    """
+
+    def __init__(self, workers: int = 0):
+        """
+        Initialize pool (processes start on first use).
+
+        Args:
+            workers: Worker processes (0 = default_workers())
+        """
+        self.workers = workers or default_workers()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.counters = {'parallel': 0, 'in_place': 0, 'failures': 0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def map_chunks(self, func: Callable[[Sequence[Any]], List[Any]], chunks: List[Sequence[Any]]) -> List[Any]:
+        """
+        Apply func to every chunk in the pool and concatenate the results.
+
+        Args:
+            func: Module-level function (it is pickled by reference)
+            chunks: Chunks of picklable items
+
+        Returns:
+            Results of all chunks, in chunk order
+        """
+        results: List[Any] = []
+        executor = None
+        try:
+            executor = self._get_executor()
+            for chunk_result in executor.map(func, chunks):
+                results.extend(chunk_result)
+            self._count('parallel')
+            return results
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            self._count('failures')
+            if executor is not None:
+                self._discard_executor(executor)
+            logger.warning(
+                f"Parse pool failed, parsing in place: {e}",
+                operation="parallel_parse",
+                chunks=len(chunks),
+                completed=len(results)
+            )
+
+        # Finish in place, keeping the results already returned
+        self._count('in_place')
+        done = 0
+        for chunk in chunks:
+            if done >= len(results):
+                results.extend(func(chunk))
+            done += len(chunk)
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def get_parse_pool() -> ParsePool:
+    """
+    Get or create the global parse pool.
+
+    Returns:
+        Global ParsePool instance
+    """
+    global _pool_instance
+
+    if _pool_instance is None:
+        with _pool_lock:
+            if _pool_instance is None:
+                _pool_instance = ParsePool(workers=get_parallel_settings().workers)
+
+    return _pool_instance
+
+
+def set_parse_pool(pool: Optional[ParsePool]) -> None:
+    """
+    Replace the global parse pool (used by tests).
+
+    Args:
+        pool: New pool, or None to recreate defaults on next use
+    """
+    global _pool_instance
+    with _pool_lock:
+        previous, _pool_instance = _pool_instance, pool
+    if previous is not None and previous is not pool:
+        previous.shutdown()
+
+
+def map_slide_chunks(
+    func: Callable[[Sequence[Any]], List[Any]],
+    items: Sequence[Any],
+    settings: Optional[ParallelParseSettings] = None
+) -> List[Any]:
+    """
+    Apply a per-chunk parse function to slide items, in parallel if large.
+
+    Args:
+        func: Module-level function mapping a chunk of items to results
+            (one per item); it should parse with worker_parser()
+        items: Picklable per-slide items
+        settings: Settings (default: from config)
+
+    Returns:
+        One result per item, in order
+    """
+    settings = settings or get_parallel_settings()
+    if not settings.min_slides or len(items) < settings.min_slides:
+        return func(items)
+
+    chunks = chunked(items, settings.chunk_slides)
+    logger.info(
+        f"Parsing {len(items)} slides in {len(chunks)} chunks in worker processes",
+        operation="parallel_parse"
+    )
+    return get_parse_pool().map_chunks(func, chunks)
@@ -0,0 +1,318 @@
+"""
+Extraction Pipeline Module
+==========================
+
+Imports a Google Slides deck into editor slides through explicit stages:
+
+    fetch      presentations.get, restricted to the fields the later
+               stages read
+    decode     raw text elements per slide (ContentParser)
+    normalize  per-slide text items; metadata lines such as
+               "(макроуровень)" are dropped
+    parse      TextParser on every item; independent slides of large
+               decks are parsed concurrently in worker processes
+    format     editor records with HTML content
+    persist    caller-supplied callback storing the slides (e.g. the job)
+
+Every stage is timed separately and the timings are returned with the
+slides, so each optimization can be measured where it applies.
+
+Credentials are pluggable: a CredentialSource supplies the service clients
+and the cache identity for one way of reading the deck (user OAuth,
+Service Account, API key). With several sources the hedged runner races
+them (see hedging), and fetch..format run inside the revision-aware
+extraction cache, so an unchanged deck skips them entirely.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from ..auth.credential_cache import credentials_from_dict
+from ..auth.service_factory import CredentialServiceProvider, ServiceFactory, credential_identity
+from ..utils.logger import get_logger
+from ..utils.retry import retry_on_network_error
+from .content_parser import ContentParser
+from .editor_format import format_slide_items, parse_slide_items, raw_slide_items
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .hedging import HedgedRunner, get_hedged_runner
+from .slides_extractor import PAGE_FIELDS, ExtractionError, SlidesExtractor
+
+logger = get_logger(__name__)
+
+STAGES = ('fetch', 'decode', 'normalize', 'parse', 'format', 'persist')
+
+# Only what decode reads: text, placeholders and element positions
+PRESENTATION_FIELDS = f'presentationId,title,slides({PAGE_FIELDS})'
+
+_pipeline_instance: Optional["ExtractionPipeline"] = None
+_pipeline_lock = threading.Lock()
+
+
+class PipelineError(Exception):
+    """Raised when a deck cannot be imported before any stage runs."""
+    pass
+
+
+class CredentialSource:
+    """
+    One way of reading a deck: credentials plus a name for hedging.
+
+    Attributes:
+        name (str): Path name used by the hedged runner and in results
+        credentials: google.auth credentials object (None for API keys)
+        developer_key (Optional[str]): Google API key
+    """
+
+    name = 'credentials'
+
+    def __init__(self, credentials=None, developer_key: Optional[str] = None, factory: Optional[ServiceFactory] = None):
+        """
+        Initialize source.
+
+        Args:
+            credentials: google.auth credentials object
+            developer_key: Google API key (used when no credentials given)
+            factory: Service factory (default: global factory)
+        """
+        self.credentials = credentials
+        self.developer_key = developer_key
+        self.factory = factory
+
+    def service_provider(self) -> CredentialServiceProvider:
+        """Return pooled service clients for these credentials."""
+        return CredentialServiceProvider(self.credentials, self.developer_key, self.factory)
+
+    def identity(self) -> str:
+        """Return the non-secret identity used as cache key."""
+        return credential_identity(self.credentials, self.developer_key)
+
+
+class OAuthSource(CredentialSource):
+    """The signed-in user's OAuth credentials (from the session dictionary)."""
+
+    name = 'oauth'
+
+    def __init__(self, credentials_dict: Dict[str, Any], factory: Optional[ServiceFactory] = None):
+        super().__init__(credentials_from_dict(credentials_dict), factory=factory)
+
+
+class ServiceAccountSource(CredentialSource):
+    """Server-side Service Account credentials (shared or public decks)."""
+
+    name = 'service_account'
+
+    def __init__(self, credentials, factory: Optional[ServiceFactory] = None):
+        super().__init__(credentials, factory=factory)
+
+
+class ApiKeySource(CredentialSource):
+    """Google API key (public decks only)."""
+
+    name = 'api_key'
+
+    def __init__(self, api_key: str, factory: Optional[ServiceFactory] = None):
+        super().__init__(developer_key=api_key, factory=factory)
+
+
+class StageTimer:
+    """
+    Accumulates wall-clock seconds per stage.
+
+    Attributes:
+        seconds (dict): Stage name -> seconds, in the order stages ran
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - started
+
+
+class ExtractionResult(NamedTuple):
+    """
+    Outcome of one import.
+
+    Attributes:
+        slides: Editor slides
+        source: Name of the credential source that succeeded
+        timings: Stage name -> seconds ('total' included)
+        extracted: False if the slides came from the cache or a
+            concurrent identical import (fetch..format did not run here)
+    """
+    slides: List[Dict[str, Any]]
+    source: str
+    timings: Dict[str, float]
+    extracted: bool
+
+
+@retry_on_network_error()
+def fetch_presentation(provider: CredentialServiceProvider, presentation_id: str) -> Dict[str, Any]:
+    """
+    Fetch a deck with the fields the pipeline reads.
+
+    Args:
+        provider: Object with build_service(name, version)
+        presentation_id: Presentation ID
+
+    Returns:
+        presentations.get response
+    """
+    return provider.build_service('slides', 'v1').presentations().get(
+        presentationId=presentation_id,
+        fields=PRESENTATION_FIELDS
+    ).execute()
+
+
+class ExtractionPipeline:
+    """
+    Runs the import stages for a deck with pluggable credential sources.
+
+    Attributes:
+        cache (Optional[ExtractionCache]): Cache of editor slides (None = global)
+        runner (Optional[HedgedRunner]): Races sources (None = global)
+    """
+
+    def __init__(self, cache: Optional[ExtractionCache] = None, runner: Optional[HedgedRunner] = None):
+        """
+        Initialize pipeline.
+
+        Args:
+            cache: Extraction cache (default: get_extraction_cache())
+            runner: Hedged runner (default: get_hedged_runner())
+        """
+        self.cache = cache
+        self.runner = runner
+
+    @staticmethod
+    def convert(presentation: Dict[str, Any], timer: Optional[StageTimer] = None) -> List[Dict[str, Any]]:
+        """
+        Run decode, normalize, parse and format on a fetched deck.
+
+        Args:
+            presentation: presentations.get response
+            timer: Receives the stage timings
+
+        Returns:
+            Editor slides
+        """
+        timer = timer or StageTimer()
+        with timer.stage('decode'):
+            raw_slides = [
+                ContentParser.extract_raw_slide_elements(slide, idx)
+                for idx, slide in enumerate(presentation.get('slides', []))
+            ]
+        with timer.stage('normalize'):
+            items = raw_slide_items(raw_slides)
+        with timer.stage('parse'):
+            parsed_slides = parse_slide_items(items)
+        with timer.stage('format'):
+            return format_slide_items(items, parsed_slides)
+
+    def load(self, presentation_id: str, source: CredentialSource, timer: StageTimer) -> List[Dict[str, Any]]:
+        """
+        Get editor slides with one source (fetch..format unless cached).
+
+        Args:
+            presentation_id: Presentation ID
+            source: Credentials to read the deck with
+            timer: Receives the stage timings
+
+        Returns:
+            Editor slides
+        """
+        provider = source.service_provider()
+
+        def extract():
+            with timer.stage('fetch'):
+                presentation = fetch_presentation(provider, presentation_id)
+            return self.convert(presentation, timer)
+
+        cache = self.cache or get_extraction_cache()
+        return cache.get_or_extract(presentation_id, provider, source.identity(), extract)
+
+    def run(
+        self,
+        presentation_url: str,
+        sources: List[CredentialSource],
+        persist: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None
+    ) -> ExtractionResult:
+        """
+        Import a deck with the first source that succeeds.
+
+        Args:
+            presentation_url: Google Slides URL or presentation ID
+            sources: Credential sources, in default preference order
+            persist: Called with (source name, slides) after a success
+
+        Returns:
+            ExtractionResult
+
+        Raises:
+            PipelineError: If the URL is not a Google Slides URL
+            HedgingError: If every source failed
+        """
+        try:
+            presentation_id = SlidesExtractor.extract_presentation_id(presentation_url)
+        except ExtractionError as e:
+            raise PipelineError(str(e)) from e
+
+        started = time.perf_counter()
+        timers = {source.name: StageTimer() for source in sources}
+        attempts = [
+            (source.name, lambda cancel, source=source: self.load(presentation_id, source, timers[source.name]))
+            for source in sources
+        ]
+        runner = self.runner or get_hedged_runner()
+        name, slides = runner.run(presentation_id, attempts)
+
+        timer = timers[name]
+        if persist:
+            with timer.stage('persist'):
+                persist(name, slides)
+
+        timings = dict(timer.seconds, total=time.perf_counter() - started)
+        logger.info(
+            f"Imported {len(slides)} slides of {presentation_id} via {name}",
+            operation="extraction_pipeline",
+            presentation_id=presentation_id,
+            **{f"{stage}_ms": round(seconds * 1000, 1) for stage, seconds in timings.items()}
+        )
+        return ExtractionResult(slides, name, timings, 'fetch' in timer.seconds)
+
+
+def get_extraction_pipeline() -> ExtractionPipeline:
+    """
+    Get or create the global extraction pipeline.
+
+    Returns:
+        Global ExtractionPipeline instance
+    """
+    global _pipeline_instance
+
+    if _pipeline_instance is None:
+        with _pipeline_lock:
+            if _pipeline_instance is None:
+                _pipeline_instance = ExtractionPipeline()
+
+    return _pipeline_instance
+
+
+def set_extraction_pipeline(pipeline: Optional[ExtractionPipeline]) -> None:
+    """
+    Replace the global extraction pipeline (used by tests).
+
+    Args:
+        pipeline: New pipeline, or None to recreate defaults on next use
+    """
+    global _pipeline_instance
+    with _pipeline_lock:
+        _pipeline_instance = pipeline
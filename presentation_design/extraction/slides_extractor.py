@@ -6,14 +6,24 @@ Extracts presentation content from Google Slides using the Slides API.
 """
 
 import re
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from ..auth.oauth_manager import OAuthManager
 from .content_parser import ContentParser
 from ..utils.logger import get_logger
+from ..utils.lru import LRUCache
 from ..utils.retry import retry_on_network_error
 
 logger = get_logger(__name__)
 
+# Page fields read by ContentParser; everything else is left out of the response
+PAGE_FIELDS = (
+    'objectId,'
+    'slideProperties(layoutObjectId),'
+    'pageElements(objectId,size,transform,'
+    'shape(shapeType,placeholder(type),text(textElements(textRun(content)))))'
+)
+
 
 class ExtractionError(Exception):
     """Raised when content extraction fails."""
@@ -32,15 +42,19 @@ class SlidesExtractor:
         slides_service: Google Slides API service client
     """
     
-    def __init__(self, oauth_manager: OAuthManager):
+    def __init__(self, oauth_manager: OAuthManager, page_cache_ttl: float = 30, page_cache_size: int = 64):
         """
         Initialize slides extractor.
         
         Args:
             oauth_manager: Configured OAuth manager
+            page_cache_ttl: Seconds a fetched page is reused by extract_slide
+            page_cache_size: Maximum number of cached pages
         """
         self.oauth_manager = oauth_manager
         self.slides_service = None
+        self.page_cache = LRUCache(maxsize=page_cache_size, ttl=page_cache_ttl)
+        self.slide_order_cache = LRUCache(maxsize=16, ttl=page_cache_ttl)
     
     def _ensure_service(self) -> None:
         """Ensure Slides API service is initialized."""
@@ -152,32 +166,89 @@ class SlidesExtractor:
             )
             raise ExtractionError(f"Failed to extract presentation: {e}") from e
     
-    def extract_slide(self, presentation_id: str, slide_id: str) -> Dict[str, Any]:
+    def _fetch_page(self, presentation_id: str, slide_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch a single page with only the fields the parser needs.
+        
+        Args:
+            presentation_id: Google Slides presentation ID
+            slide_id: Page object ID
+            refresh: Bypass the page cache
+            
+        Returns:
+            Raw page data from the API
+        """
+        key = (presentation_id, slide_id)
+        if not refresh:
+            page = self.page_cache.get(key)
+            if page is not None:
+                return page
+        
+        self._ensure_service()
+        page = self.slides_service.presentations().pages().get(
+            presentationId=presentation_id,
+            pageObjectId=slide_id,
+            fields=PAGE_FIELDS
+        ).execute()
+        
+        self.page_cache.set(key, page)
+        return page
+    
+    def _slide_index(self, presentation_id: str, slide_id: str) -> int:
+        """
+        Find the position of a slide using a cached objectId-only listing.
+        
+        Raises:
+            ExtractionError: If the slide is not in the presentation
+        """
+        order = self.slide_order_cache.get(presentation_id)
+        if order is None or slide_id not in order:
+            self._ensure_service()
+            listing = self.slides_service.presentations().get(
+                presentationId=presentation_id,
+                fields='slides.objectId'
+            ).execute()
+            order = [slide.get('objectId') for slide in listing.get('slides', [])]
+            self.slide_order_cache.set(presentation_id, order)
+        
+        if slide_id not in order:
+            raise ExtractionError(f"Slide {slide_id} not found in presentation")
+        return order.index(slide_id)
+    
+    def extract_slide(
+        self,
+        presentation_id: str,
+        slide_id: str,
+        index: Optional[int] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Extract single slide content.
         
+        Fetches only the requested page (with a field mask) instead of the
+        whole presentation. Pages are cached briefly per extractor.
+        
         Args:
             presentation_id: Google Slides presentation ID
             slide_id: Specific slide object ID
+            index: Slide position if known (skips the position lookup)
+            refresh: Bypass the page cache (e.g. user asked to reload)
             
         Returns:
             Parsed slide data
+            
+        Raises:
+            ExtractionError: If the slide cannot be fetched or parsed
         """
         try:
-            self._ensure_service()
+            if index is None:
+                index = self._slide_index(presentation_id, slide_id)
             
-            # Fetch presentation to get specific slide
-            presentation_data = self.slides_service.presentations().get(
-                presentationId=presentation_id
-            ).execute()
-            
-            # Find the specific slide
-            for idx, slide in enumerate(presentation_data.get('slides', [])):
-                if slide.get('objectId') == slide_id:
-                    return ContentParser.parse_slide(slide, idx)
-            
-            raise ExtractionError(f"Slide {slide_id} not found in presentation")
+            page = self._fetch_page(presentation_id, slide_id, refresh=refresh)
+            return ContentParser.parse_slide(page, index)
             
+        except ExtractionError:
+            raise
         except Exception as e:
             logger.error(
                 f"Failed to extract slide: {e}",
@@ -185,3 +256,53 @@ class SlidesExtractor:
                 exc_info=True
             )
             raise ExtractionError(f"Failed to extract slide: {e}") from e
+    
+    def extract_slides(
+        self,
+        presentation_id: str,
+        slide_ids: List[str],
+        max_workers: int = 8,
+        refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract several slides, fetching their pages concurrently.
+        
+        Args:
+            presentation_id: Google Slides presentation ID
+            slide_ids: Slide object IDs (result keeps this order)
+            max_workers: Maximum concurrent page requests
+            refresh: Bypass the page cache
+            
+        Returns:
+            List of parsed slides, in the order of slide_ids
+            
+        Raises:
+            ExtractionError: If any slide cannot be extracted
+        """
+        if not slide_ids:
+            return []
+        
+        try:
+            # One objectId-only listing resolves all positions up front
+            indexes = [self._slide_index(presentation_id, slide_id) for slide_id in slide_ids]
+            self._ensure_service()
+        except ExtractionError:
+            raise
+        except Exception as e:
+            raise ExtractionError(f"Failed to list slides: {e}") from e
+        
+        workers = max(1, min(max_workers, len(slide_ids)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="slide-fetch") as executor:
+            slides = list(executor.map(
+                lambda item: self.extract_slide(presentation_id, item[0], index=item[1], refresh=refresh),
+                zip(slide_ids, indexes)
+            ))
+        
+        logger.info(
+            f"Extracted {len(slides)} slides by page",
+            operation="extract_slides",
+            presentation_id=presentation_id,
+            workers=workers
+        )
+        
+        return slides
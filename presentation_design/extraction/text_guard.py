@@ -0,0 +1,318 @@
+"""
+Text Guard Module
+=================
+
+Limits for parsing untrusted pasted text.
+
+Pasted text comes straight from a web form and is parsed on a background
+thread, so one oversized or pathological paste must not tie up a worker
+for minutes. Three limits apply, all read from the optional
+``text_parsing`` config section:
+
+    max_input_chars      larger input is rejected (TextInputError)
+    chunk_chars          larger input is parsed in chunks cut at slide
+                         boundaries of the strategy chosen for the whole
+                         text (the line after a slide number, a slide
+                         marker, a header block); a blank line or a line
+                         break only if a window has no slide boundary
+    time_budget_seconds  CPU time of the parsing thread; once spent, the
+                         rest of the text is split into plain slides at
+                         blank lines without any further analysis
+
+Chunks are parsed one after another with the same budget, so the budget
+covers the whole paste, and with the same strategy, so a paste cut at
+slide boundaries gives the same slides as parsing it whole. The fallback keeps every line of the input; it
+only skips the heuristics (title detection, lists, inline markup).
+"""
+
+import re
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from ..utils.logger import get_logger
+from .line_lexer import (
+    BLANK,
+    MARKER,
+    MARKERS_STRATEGY,
+    NUMBER_AFTER,
+    NUMBER_AFTER_STRATEGY,
+    LineTokens,
+    slide_strategy,
+    tokenize
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_INPUT_CHARS = 2000000
+DEFAULT_CHUNK_CHARS = 200000
+DEFAULT_TIME_BUDGET_SECONDS = 20.0
+
+# Fallback chunk boundary when a window holds no slide boundary
+_BLANK_LINE = re.compile(r'\n[ \t\r]*\n')
+
+
+class TextInputError(Exception):
+    """Raised when pasted text exceeds the configured input size."""
+    pass
+
+
+class TextLimits(NamedTuple):
+    """
+    Limits for parsing pasted text.
+
+    Attributes:
+        max_input_chars: Largest accepted input (0 = unlimited)
+        chunk_chars: Chunk size for large input (0 = never chunk)
+        time_budget_seconds: CPU time allowed for parsing (0 = unlimited)
+    """
+    max_input_chars: int = DEFAULT_MAX_INPUT_CHARS
+    chunk_chars: int = DEFAULT_CHUNK_CHARS
+    time_budget_seconds: float = DEFAULT_TIME_BUDGET_SECONDS
+
+
+def get_text_limits() -> TextLimits:
+    """
+    Read the limits from the ``text_parsing`` config section.
+
+    Returns:
+        TextLimits (defaults for missing settings)
+    """
+    try:
+        from ..utils.config import get_config
+        config = get_config()
+        return TextLimits(
+            max_input_chars=config.get('text_parsing.max_input_chars', DEFAULT_MAX_INPUT_CHARS),
+            chunk_chars=config.get('text_parsing.chunk_chars', DEFAULT_CHUNK_CHARS),
+            time_budget_seconds=config.get('text_parsing.time_budget_seconds', DEFAULT_TIME_BUDGET_SECONDS)
+        )
+    except Exception as e:
+        logger.warning(
+            f"Using default text limits: {e}",
+            operation="get_text_limits"
+        )
+        return TextLimits()
+
+
+class ParseBudget:
+    """
+    CPU time budget of one parse.
+
+    Time is measured with the CPU clock of the calling thread, so other
+    requests running at the same time do not use up this budget.
+
+    Attributes:
+        seconds (float): Allowed CPU time (0 or None = unlimited)
+        exhausted (bool): The budget has been found exceeded
+    """
+
+    def __init__(self, seconds: Optional[float], clock: Callable[[], float] = time.thread_time):
+        """
+        Start the budget.
+
+        Args:
+            seconds: Allowed CPU time in seconds
+            clock: Time source (injectable for tests)
+        """
+        self.seconds = seconds
+        self.exhausted = False
+        self._clock = clock
+        self._started = clock()
+
+    def used(self) -> float:
+        """CPU seconds used since the budget started."""
+        return self._clock() - self._started
+
+    def exceeded(self) -> bool:
+        """Check the budget (once exceeded, it stays exceeded)."""
+        if not self.exhausted and self.seconds and self.used() > self.seconds:
+            self.exhausted = True
+        return self.exhausted
+
+
+def check_input_size(text: str, limits: TextLimits) -> None:
+    """
+    Reject text larger than the configured maximum.
+
+    Args:
+        text: Pasted text
+        limits: Limits to apply
+
+    Raises:
+        TextInputError: If the text is too large
+    """
+    if limits.max_input_chars and len(text) > limits.max_input_chars:
+        raise TextInputError(
+            f"Text is too large: {len(text)} characters (maximum {limits.max_input_chars})"
+        )
+
+
+def slide_boundaries(tokens: LineTokens, strategy: str) -> List[int]:
+    """
+    Character offsets where a slide of the given strategy starts.
+
+    Args:
+        tokens: Classified lines of the whole text
+        strategy: Strategy chosen for the whole text (see slide_strategy)
+
+    Returns:
+        Sorted offsets of line starts; cutting the text there never
+        splits a slide
+    """
+    kinds = tokens.kinds
+    starts = [0] + list(accumulate(len(line) + 1 for line in tokens.lines[:-1]))
+
+    if strategy == NUMBER_AFTER_STRATEGY:
+        # After a slide number (a second number line would lose its kind)
+        lines = [
+            idx + 1 for idx in range(len(kinds) - 1)
+            if kinds[idx] == NUMBER_AFTER and kinds[idx + 1] != NUMBER_AFTER
+        ]
+    elif strategy == MARKERS_STRATEGY:
+        lines = [idx for idx in tokens.indices(MARKER) if idx > 0]
+    else:
+        # A block opening with a slide start line
+        lines = [idx for idx in sorted(tokens.slide_starts) if idx > 0 and kinds[idx - 1] == BLANK]
+
+    return [starts[idx] for idx in lines]
+
+
+def _chunk_end(text: str, start: int, chunk_chars: int, boundaries: List[int]) -> int:
+    """End offset of the chunk starting at start (a slide boundary if possible)."""
+    limit = start + chunk_chars
+    floor = start + chunk_chars // 2
+
+    # Last slide boundary in the window
+    position = bisect_right(boundaries, limit) - 1
+    if position >= 0 and boundaries[position] > floor:
+        return boundaries[position]
+
+    # Otherwise cut after the last blank line, or the last line break
+    last = None
+    for last in _BLANK_LINE.finditer(text, floor, limit):
+        pass
+    if last is not None:
+        return last.end()
+
+    newline = text.rfind('\n', floor, limit)
+    if newline != -1:
+        return newline + 1
+    return limit
+
+
+def split_chunks(text: str, chunk_chars: int, boundaries: Optional[List[int]] = None) -> List[str]:
+    """
+    Split large text into chunks at slide boundaries.
+
+    Args:
+        text: Pasted text
+        chunk_chars: Maximum chunk size (0 = one chunk)
+        boundaries: Result of slide_boundaries (default: computed for the
+            strategy detected on text)
+
+    Returns:
+        Chunks that join back to text; only the last may be shorter
+        than half of chunk_chars
+    """
+    if not chunk_chars or len(text) <= chunk_chars:
+        return [text]
+
+    if boundaries is None:
+        tokens = tokenize(text)
+        boundaries = slide_boundaries(tokens, slide_strategy(tokens))
+
+    chunks = []
+    start = 0
+    while len(text) - start > chunk_chars:
+        end = _chunk_end(text, start, chunk_chars, boundaries)
+        chunks.append(text[start:end])
+        start = end
+    chunks.append(text[start:])
+    return chunks
+
+
+def plain_block_slides(lines: List[str], first_number: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Split lines into slides at blank lines, without any analysis.
+
+    The first line of a block is the slide title; the other lines become
+    paragraphs as they are.
+
+    Args:
+        lines: Raw lines
+        first_number: ID of the first slide
+
+    Yields:
+        Slide dictionaries (same keys as TextParser slides)
+    """
+    number = first_number
+    block: List[str] = []
+    for line in lines + ['']:
+        stripped = line.strip()
+        if stripped:
+            block.append(stripped)
+            continue
+        if not block:
+            continue
+        yield {
+            'id': str(number),
+            'title': block[0],
+            'mainText': '\n'.join(f'<p>{text}</p>' for text in block[1:]),
+            'secondaryText': ''
+        }
+        number += 1
+        block = []
+
+
+def iter_guarded_slides(
+    parser: Any,
+    text: str,
+    limits: Optional[TextLimits] = None,
+    budget: Optional[ParseBudget] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse pasted text lazily within the size, chunk and time limits.
+
+    Args:
+        parser: TextParser
+        text: Pasted text
+        limits: Limits (default: from config)
+        budget: CPU budget to use (default: a new one from limits)
+
+    Yields:
+        Slide dictionaries, in order
+
+    Raises:
+        TextInputError: If the text is larger than allowed
+    """
+    limits = limits or get_text_limits()
+    check_input_size(text, limits)
+    budget = budget or ParseBudget(limits.time_budget_seconds)
+
+    # One strategy for the whole text, chunks cut at its slide boundaries
+    strategy = None
+    chunks = [text]
+    if limits.chunk_chars and len(text) > limits.chunk_chars:
+        tokens = tokenize(text)
+        strategy = slide_strategy(tokens)
+        chunks = split_chunks(text, limits.chunk_chars, slide_boundaries(tokens, strategy))
+
+    emitted = 0
+    for chunk in chunks:
+        if budget.exceeded():
+            slides = plain_block_slides(chunk.split('\n'), emitted + 1)
+        else:
+            slides = parser.iter_slides(chunk, budget=budget, strategy=strategy, first_number=emitted + 1)
+        for slide in slides:
+            emitted += 1
+            yield slide
+
+    if budget.exhausted:
+        logger.warning(
+            f"Parse budget of {limits.time_budget_seconds}s exceeded; rest of the text split into plain slides",
+            operation="parse_text",
+            chars=len(text),
+            chunks=len(chunks),
+            slides=emitted
+        )
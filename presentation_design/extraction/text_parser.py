@@ -6,15 +6,54 @@ Parses raw text input into structured slide data.
 Adapted from index-7.html JavaScript parsing logic.
 """
 
-import re
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..utils.lru import LRUCache
+from .block_cache import block_key, get_block_cache
+from .inline_markup import inline_html
+from .text_guard import ParseBudget, plain_block_slides
+from .line_lexer import (
+    BLANK,
+    BULLET,
+    COLON_HEADER,
+    MARKER,
+    MARKERS_STRATEGY,
+    NUMBER_AFTER,
+    NUMBER_AFTER_STRATEGY,
+    NUMBERED,
+    LineTokens,
+    slide_strategy,
+    tokenize,
+    tokenize_lines
+)
+
+# List item kinds (never a slide title)
+_LIST_KINDS = frozenset((BULLET, NUMBERED))
+
+# (kind, stripped text, list item text) of a line
+Row = Tuple[str, str, Optional[str]]
 
 
 class TextParser:
-    """Parse raw text into structured slide data."""
+    """Parse raw text into structured slide data.
     
-    def __init__(self):
+    The text is classified line by line once (see line_lexer); strategy
+    detection, slide splitting and formatting all work on that result.
+    Formatted slides are memoized per text block (see block_cache), so
+    re-parsing an edited text only formats the blocks that changed.
+    """
+    
+    def __init__(self, block_cache: Optional[LRUCache] = None):
+        """Initialize parser.
+        
+        Args:
+            block_cache: Cache of formatted slides by block (default: the
+                shared cache from get_block_cache(), if enabled)
+        """
         self.slides = []
+        self.block_cache = block_cache if block_cache is not None else get_block_cache()
     
     def parse_slides(self, text: str) -> List[Dict]:
         """Main parsing method.
@@ -25,23 +64,58 @@ class TextParser:
         Returns:
             List of slide dictionaries
         """
+        return list(self.iter_slides(text))
+    
+    def iter_slides(
+        self,
+        text: str,
+        budget: Optional[ParseBudget] = None,
+        strategy: Optional[str] = None,
+        first_number: int = 1
+    ) -> Iterator[Dict]:
+        """Parse slides lazily, in order.
+        
+        The text is classified and the strategy chosen up front; each
+        slide is split off and formatted only when it is requested, so
+        callers can store or show the first slides of a huge paste while
+        the rest is still being parsed.
+        
+        With a budget, it is checked before each slide; once it is
+        exceeded, the remaining lines become plain slides (see
+        text_guard.plain_block_slides).
+        
+        Args:
+            text: Raw text input from user
+            budget: CPU time budget of the parse (default: unlimited)
+            strategy: Strategy chosen for the whole text when this is one
+                chunk of it (default: detected on text, see slide_strategy)
+            first_number: Number of the first slide whose ID is not taken
+                from the text (block slides, trailing text, plain slides)
+            
+        Yields:
+            Slide dictionaries (same as parse_slides)
+        """
         print('🔍 Starting text parsing...')
+        tokens = tokenize(text)
+        strategy = strategy or slide_strategy(tokens)
         
-        # Try strategy 1: Number after text
-        matches = self.detect_number_after_pattern(text)
-        if matches:
+        # Strategy 1: Number after text
+        if strategy == NUMBER_AFTER_STRATEGY:
+            matches = self._number_after_matches(tokens)
             print(f'✅ Found {len(matches)} slides with number-after pattern')
-            return self.parse_number_after_slides(text, matches)
+            yield from self._iter_number_after(tokens, matches, budget, first_number)
+            return
         
-        # Try strategy 2: Explicit markers
-        matches = self.detect_slide_markers(text)
-        if matches:
+        # Strategy 2: Explicit markers
+        if strategy == MARKERS_STRATEGY:
+            matches = self._marker_matches(tokens)
             print(f'✅ Found {len(matches)} slides with explicit markers')
-            return self.parse_marked_slides(text, matches)
+            yield from self._iter_marked(tokens, matches, budget, first_number)
+            return
         
         # Fallback: Intelligent block analysis
         print('⚙️ Using intelligent block analysis...')
-        return self.detect_intelligent_blocks(text)
+        yield from self._iter_blocks(tokens, text, budget, first_number)
     
     def detect_number_after_pattern(self, text: str) -> List[Dict]:
         """Detect slides by number on separate line.
@@ -53,145 +127,249 @@ class TextParser:
             
             More content
             2
+            
+        Returns:
+            List of {'number', 'line', 'index', 'end'}: the index of the
+            number line, and the character offsets of the newline before
+            it and of the end of the line
         """
-        pattern = r'\n(\d+)\s*$'
-        matches = []
-        for match in re.finditer(pattern, text, re.MULTILINE):
-            matches.append({
-                'number': match.group(1),
-                'index': match.start(),
-                'end': match.end()
-            })
-        return matches
+        tokens = tokenize(text)
+        starts = self._line_starts(tokens)
+        return [
+            dict(match, index=starts[match['line']] - 1, end=starts[match['line']] + len(tokens.lines[match['line']]))
+            for match in self._number_after_matches(tokens)
+        ]
     
     def detect_slide_markers(self, text: str) -> List[Dict]:
         """Detect explicit slide markers.
         
-        Pattern: "Slide N" or "Слайд N"
-        Example: "Slide 1", "Слайд 2"
+        Pattern: "Slide N" or "Слайд N" at the start of a line
+        Example: "Slide 1", "Слайд 2: Title"
+        
+        Returns:
+            List of {'number', 'line', 'index', 'title_on_same_line'}; index
+            is the character offset of the newline before the marker line
+            (0 on the first line)
         """
-        pattern = r'(?:^|\n)(slide|слайд)\s*(\d+)(?:\s+(.*))?'
-        matches = []
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            matches.append({
-                'number': match.group(2),
-                'index': match.start(),
-                'title_on_same_line': match.group(3).strip() if match.group(3) else None
-            })
-        return matches
+        tokens = tokenize(text)
+        starts = self._line_starts(tokens)
+        return [
+            dict(match, index=max(0, starts[match['line']] - 1))
+            for match in self._marker_matches(tokens)
+        ]
+    
+    @staticmethod
+    def _line_starts(tokens: LineTokens) -> List[int]:
+        """Character offset of every line start."""
+        return [0] + list(accumulate(len(line) + 1 for line in tokens.lines[:-1]))
+    
+    def _with_lines(self, text: str, tokens: LineTokens, matches: List[Dict]) -> List[Dict]:
+        """Matches with a 'line' key (derived from 'index' for older match lists)."""
+        if all('line' in match for match in matches):
+            return matches
+        starts = self._line_starts(tokens)
+        converted = []
+        for match in matches:
+            if 'line' not in match:
+                index = match['index']
+                # 'index' points at the newline before the line (or at offset 0)
+                offset = index + 1 if text[index:index + 1] == '\n' else index
+                match = dict(match, line=bisect_right(starts, offset) - 1)
+            converted.append(match)
+        return converted
+    
+    def _number_after_matches(self, tokens: LineTokens) -> List[Dict]:
+        return [
+            {'number': tokens.texts[idx], 'line': idx}
+            for idx in tokens.indices(NUMBER_AFTER)
+        ]
+    
+    def _marker_matches(self, tokens: LineTokens) -> List[Dict]:
+        return [
+            {'number': tokens.numbers[idx], 'line': idx, 'title_on_same_line': tokens.rests[idx]}
+            for idx in tokens.indices(MARKER)
+        ]
     
     def parse_number_after_slides(self, text: str, matches: List[Dict]) -> List[Dict]:
-        """Parse slides when numbers follow content."""
-        slides = []
+        """Parse slides when numbers follow content.
+        
+        Args:
+            text: Raw text input
+            matches: Result of detect_number_after_pattern(text)
+        """
+        tokens = tokenize(text)
+        return self._parse_number_after_slides(tokens, self._with_lines(text, tokens, matches))
+    
+    def _parse_number_after_slides(self, tokens: LineTokens, matches: List[Dict]) -> List[Dict]:
+        return list(self._iter_number_after(tokens, matches))
+    
+    def _iter_number_after(
+        self,
+        tokens: LineTokens,
+        matches: List[Dict],
+        budget: Optional[ParseBudget] = None,
+        first_number: int = 1
+    ) -> Iterator[Dict]:
+        count = first_number - 1
         previous_end = 0
         
-        for i, match in enumerate(matches):
-            content = text[previous_end:match['index']].strip()
-            if content:
-                slide = self.create_slide_from_content(content, match['number'])
-                slides.append(slide)
-            previous_end = match['end']
+        for match in matches:
+            if budget and budget.exceeded():
+                yield from plain_block_slides(tokens.lines[previous_end:], count + 1)
+                return
+            rows = self._rows(tokens, previous_end, match['line'])
+            if rows:
+                count += 1
+                yield self._slide_from_rows(rows, match['number'])
+            previous_end = match['line'] + 1
         
         # Handle remaining text
-        remaining = text[previous_end:].strip()
-        if remaining:
-            slide = self.create_slide_from_content(
-                remaining, 
-                str(len(slides) + 1)
-            )
-            slides.append(slide)
-        
-        return slides
+        if budget and budget.exceeded():
+            yield from plain_block_slides(tokens.lines[previous_end:], count + 1)
+            return
+        rows = self._rows(tokens, previous_end, len(tokens))
+        if rows:
+            yield self._slide_from_rows(rows, str(count + 1))
     
     def parse_marked_slides(self, text: str, matches: List[Dict]) -> List[Dict]:
-        """Parse slides with explicit 'Slide N' markers."""
-        slides = []
+        """Parse slides with explicit 'Slide N' markers.
+        
+        A title on the marker line ("Slide 2: Results") becomes the first
+        line of the slide; text before the first marker is ignored.
+        
+        Args:
+            text: Raw text input
+            matches: Result of detect_slide_markers(text)
+        """
+        tokens = tokenize(text)
+        return self._parse_marked_slides(tokens, self._with_lines(text, tokens, matches))
+    
+    def _parse_marked_slides(self, tokens: LineTokens, matches: List[Dict]) -> List[Dict]:
+        return list(self._iter_marked(tokens, matches))
+    
+    def _iter_marked(
+        self,
+        tokens: LineTokens,
+        matches: List[Dict],
+        budget: Optional[ParseBudget] = None,
+        first_number: int = 1
+    ) -> Iterator[Dict]:
+        # Same-line titles, classified together (blank where there is none)
+        titles = tokenize_lines([match['title_on_same_line'] or '' for match in matches])
         
         for i, match in enumerate(matches):
-            # Get content between this marker and next (or end of text)
-            content_start = match['index'] + len('слайд ' + match['number'])
-            content_end = matches[i + 1]['index'] if i + 1 < len(matches) else len(text)
+            if budget and budget.exceeded():
+                yield from plain_block_slides(tokens.lines[match['line']:], first_number + i)
+                return
             
-            content = text[content_start:content_end].strip()
+            # Lines between this marker and the next (or end of text)
+            content_end = matches[i + 1]['line'] if i + 1 < len(matches) else len(tokens)
+            rows = self._rows(tokens, match['line'] + 1, content_end)
             
             # If title was on same line, prepend it
             if match['title_on_same_line']:
-                content = match['title_on_same_line'] + '\n' + content
+                rows.insert(0, (titles.kinds[i], titles.texts[i], titles.rests[i]))
             
-            slide = self.create_slide_from_content(content, match['number'])
-            slides.append(slide)
-        
-        return slides
+            yield self._slide_from_rows(rows, match['number'])
     
     def detect_intelligent_blocks(self, text: str) -> List[Dict]:
         """Analyze text blocks separated by empty lines.
         
         Classify as titles, content, or slide breaks.
         """
-        blocks = text.split('\n\n')
-        slides = []
+        return list(self._iter_blocks(tokenize(text), text))
+    
+    def _iter_blocks(
+        self,
+        tokens: LineTokens,
+        text: str,
+        budget: Optional[ParseBudget] = None,
+        first_number: int = 1
+    ) -> Iterator[Dict]:
+        kinds = tokens.kinds
+        emitted = first_number - 1
         current_slide = None
         
-        for block in blocks:
-            block = block.strip()
-            if not block:
+        # Blocks are runs of non-blank lines
+        idx = 0
+        count = len(kinds)
+        while idx < count:
+            if kinds[idx] == BLANK:
+                idx += 1
                 continue
-            
-            lines = block.split('\n')
-            first_line = lines[0].strip()
-            word_count = self.count_words(first_line)
+            start = idx
+            while idx < count and kinds[idx] != BLANK:
+                idx += 1
             
             # Detect if this starts a new slide
             # Check for slide markers or if we don't have a current slide
-            if self.is_slide_start(first_line) or current_slide is None:
+            if start in tokens.slide_starts or current_slide is None:
                 if current_slide:
-                    slides.append(current_slide)
+                    emitted += 1
+                    yield self._block_slide(current_slide, emitted)
+                if budget and budget.exceeded():
+                    yield from plain_block_slides(tokens.lines[start:], emitted + 1)
+                    return
                 current_slide = {'title': '', 'content': []}
             
             # Classify block
-            if not current_slide['title'] and word_count <= 6:
+            first_line = tokens.texts[start]
+            if not current_slide['title'] and self.count_words(first_line) <= 6:
                 current_slide['title'] = first_line
-                if len(lines) > 1:
-                    current_slide['content'].extend(lines[1:])
             else:
-                current_slide['content'].extend(lines)
+                current_slide['content'].append(first_line)
+            current_slide['content'].extend(line.rstrip() for line in tokens.lines[start + 1:idx])
         
         # Add last slide
         if current_slide:
-            slides.append(current_slide)
-        
-        # Convert to standard format
-        result = []
-        for i, slide in enumerate(slides):
-            result.append({
-                'id': str(i + 1),
-                'title': slide['title'],
-                'mainText': '\n'.join(slide['content']),
-                'secondaryText': ''
-            })
-        
-        return result if result else [{'id': '1', 'title': '', 'mainText': text, 'secondaryText': ''}]
+            yield self._block_slide(current_slide, emitted + 1)
+        else:
+            yield {'id': str(first_number), 'title': '', 'mainText': text, 'secondaryText': ''}
+    
+    @staticmethod
+    def _block_slide(slide: Dict, number: int) -> Dict:
+        """Convert a collected block slide to the standard format."""
+        return {
+            'id': str(number),
+            'title': slide['title'],
+            'mainText': '\n'.join(slide['content']),
+            'secondaryText': ''
+        }
     
     def is_slide_start(self, line: str) -> bool:
         """Check if line indicates start of new slide."""
-        # Check for slide markers
-        if re.match(r'^(slide|слайд)\s*\d+', line, re.IGNORECASE):
-            return True
-        # Check for numbered headers
-        if re.match(r'^\d+\.', line):
-            return True
-        # Check for markdown headers
-        if re.match(r'^#{1,3}\s', line):
-            return True
-        return False
+        return 0 in tokenize_lines([line]).slide_starts
     
     def create_slide_from_content(self, content: str, slide_id: str) -> Dict:
         """Create slide dictionary from text content.
         
         Extracts title from first line(s) if they look like a title.
         """
-        lines = [l.strip() for l in content.split('\n') if l.strip()]
+        return self._slide_from_rows(self._rows(tokenize_lines(content.split('\n'))), slide_id)
+    
+    @staticmethod
+    def _rows(tokens: LineTokens, start: int = 0, end: Optional[int] = None) -> List[Row]:
+        """Non-blank lines of a token range as (kind, text, rest) rows."""
+        return [
+            row for row in zip(tokens.kinds[start:end], tokens.texts[start:end], tokens.rests[start:end])
+            if row[0] != BLANK
+        ]
+    
+    def _slide_from_rows(self, rows: List[Row], slide_id: str) -> Dict:
+        """Slide of a block, reused from the block cache when unchanged."""
+        cache = self.block_cache
+        if cache is None or not rows:
+            return self._build_slide(rows, slide_id)
         
+        key = block_key([row[1] for row in rows])
+        slide = cache.get(key)
+        if slide is None:
+            slide = self._build_slide(rows, slide_id)
+            cache.set(key, slide)
+        # Cached slides are shared: hand out a copy with this slide's ID
+        return dict(slide, id=slide_id)
+    
+    def _build_slide(self, lines: List[Row], slide_id: str) -> Dict:
         if not lines:
             return {
                 'id': slide_id,
@@ -204,42 +382,26 @@ class TextParser:
         title = ''
         content_start_idx = 0
         
-        # Check if first line looks like a title (short, no punctuation at end except question mark)
-        first_line = lines[0]
-        
         # Title heuristics:
         # - Less than 100 chars
         # - Doesn't end with common sentence endings (., :, ;)
         # - Doesn't start with bullet/number (unless it's a lesson/topic number)
-        is_title_like = (
-            len(first_line) <= 100 and
-            not first_line.endswith(('.', ':', ';', ',')) and
-            not first_line.startswith(('• ', '- ', '* ')) and
-            not re.match(r'^\d+[\.\)]\s', first_line)  # Not a list item like "1. something"
-        )
-        
-        if is_title_like:
-            title = first_line
+        first_line = lines[0]
+        if self._is_title_like(first_line, 100):
+            title = first_line[1]
             content_start_idx = 1
             
-            # Check if second line is also part of title (subtitle-like)
+            # Check if second line is also part of title (subtitle-like):
+            # if it is short and title-like, combine them
             if len(lines) > 1:
                 second_line = lines[1]
-                is_subtitle_like = (
-                    len(second_line) <= 80 and
-                    not second_line.endswith(('.', ':', ';', ',')) and
-                    not second_line.startswith(('• ', '- ', '* ')) and
-                    not re.match(r'^\d+[\.\)]\s', second_line)
-                )
-                
-                # If second line is short and title-like, combine them
-                if is_subtitle_like and len(second_line) < len(first_line):
-                    title = first_line + '\n' + second_line
+                if self._is_title_like(second_line, 80) and len(second_line[1]) < len(first_line[1]):
+                    title = first_line[1] + '\n' + second_line[1]
                     content_start_idx = 2
         
         # Remaining lines are main text
-        remaining_lines = lines[content_start_idx:]
-        main_text = self.format_content(remaining_lines) if remaining_lines else ''
+        remaining = lines[content_start_idx:]
+        main_text = self._format_rows(remaining) if remaining else ''
         
         return {
             'id': slide_id,
@@ -248,11 +410,22 @@ class TextParser:
             'secondaryText': ''
         }
     
+    @staticmethod
+    def _is_title_like(row: Row, max_length: int) -> bool:
+        kind, text, _ = row
+        return (
+            len(text) <= max_length and
+            kind not in _LIST_KINDS and
+            not text.endswith(('.', ':', ';', ','))
+        )
+    
     def format_content(self, lines: List[str]) -> str:
         """Format lines into HTML content."""
-        formatted = self.format_list_items(lines)
-        formatted = self.apply_emphasis(formatted)
-        return formatted
+        tokens = tokenize_lines(lines)
+        return self._format_rows(list(zip(tokens.kinds, tokens.texts, tokens.rests)))
+    
+    def _format_rows(self, rows: List[Row]) -> str:
+        return self._list_html(rows, inline_html)
     
     def count_words(self, text: str) -> int:
         """Count words in text."""
@@ -260,13 +433,16 @@ class TextParser:
     
     def format_list_items(self, lines: List[str]) -> str:
         """Convert lines with colons and bullets to HTML lists."""
+        tokens = tokenize_lines(lines)
+        return self._list_html(list(zip(tokens.kinds, tokens.texts, tokens.rests)))
+    
+    def _list_html(self, rows: List[Row], inline: Callable[[str], str] = str) -> str:
+        """HTML of rows; inline converts the text of each line (default: as is)."""
         html = []
         in_list = False
         
-        for line in lines:
-            stripped = line.strip()
-            
-            if not stripped:
+        for kind, stripped, rest in rows:
+            if kind == BLANK:
                 if in_list:
                     html.append('</ul>')
                     in_list = False
@@ -274,41 +450,28 @@ class TextParser:
                 continue
             
             # Line ending with colon -> bold + start list
-            if stripped.endswith(':'):
+            if kind == COLON_HEADER or (kind == MARKER and stripped[-1] == ':'):
                 if in_list:
                     html.append('</ul>')
-                    in_list = False
-                html.append(f'<strong>{stripped}</strong>')
+                html.append(f'<strong>{inline(stripped)}</strong>')
                 html.append('<ul>')
                 in_list = True
                 continue
             
-            # List item (bullets or dashes)
-            if stripped.startswith(('• ', '- ', '* ')):
-                if not in_list:
-                    html.append('<ul>')
-                    in_list = True
-                # Remove marker and add as list item
-                html.append(f'<li>{stripped[2:].strip()}</li>')
-                continue
-            
-            # Numbered list
-            if re.match(r'^\d+[\.\)]\s', stripped):
-                # For now, treat as bullet list
-                # Could enhance to use <ol> later
+            # List item (bullets, dashes or numbers; numbers are shown as bullets)
+            if kind in _LIST_KINDS:
                 if not in_list:
                     html.append('<ul>')
                     in_list = True
-                # Remove number and add as list item
-                text = re.sub(r'^\d+[\.\)]\s*', '', stripped)
-                html.append(f'<li>{text}</li>')
+                # Marker removed by the lexer
+                html.append(f'<li>{inline(rest)}</li>')
                 continue
             
             # Regular line
             if in_list:
                 html.append('</ul>')
                 in_list = False
-            html.append(f'<p>{stripped}</p>')
+            html.append(f'<p>{inline(stripped)}</p>')
         
         if in_list:
             html.append('</ul>')
@@ -318,16 +481,9 @@ class TextParser:
     def apply_emphasis(self, text: str) -> str:
         """Apply bold and italic formatting.
         
-        Patterns:
+        Patterns (see inline_markup; each line is tokenized once):
         - **text** or __text__ -> <strong>text</strong>
         - *text* or _text_ -> <em>text</em>
+        - `text` -> <code>text</code>
         """
-        # **text** -> <strong>text</strong>
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        # __text__ -> <strong>text</strong>
-        text = re.sub(r'__(.+?)__', r'<strong>\1</strong>', text)
-        # *text* -> <em>text</em> (only if not already part of **)
-        text = re.sub(r'(?<!\*)\*([^\*]+?)\*(?!\*)', r'<em>\1</em>', text)
-        # _text_ -> <em>text</em> (only if not already part of __)
-        text = re.sub(r'(?<!_)_([^_]+?)_(?!_)', r'<em>\1</em>', text)
-        return text
+        return '\n'.join(inline_html(line) for line in text.split('\n'))
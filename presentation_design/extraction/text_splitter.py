@@ -4,11 +4,15 @@ Text Splitter Module
 
 Intelligently splits raw text content into logical components:
 title, subtitle, headings, body paragraphs, lists.
+
+Lines are classified once by line_index; the splitter only walks the
+index, and the components it returns point back into it so
+ContentAnalyzer can reuse the classification.
 """
 
-import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from ..utils.logger import get_logger
+from .line_index import NUMBERED, LineIndex, index_lines
 
 logger = get_logger(__name__)
 
@@ -27,7 +31,11 @@ class TextSplitter:
     """
     
     @staticmethod
-    def split_slide_text(text: str, slide_index: int) -> List[Dict[str, Any]]:
+    def split_slide_text(
+        text: str,
+        slide_index: int,
+        index: Optional[LineIndex] = None
+    ) -> List[Dict[str, Any]]:
         """
         Split raw text into logical components.
         
@@ -40,53 +48,57 @@ class TextSplitter:
         Args:
             text: Raw text content from slide
             slide_index: Position of slide (0 = first slide)
+            index: Line index of text (built here if not given)
             
         Returns:
-            List of text components with roles and content
+            List of text components with roles and content. Each
+            component lists the index lines it was built from in 'rows'.
         """
         if not text or not text.strip():
             return []
         
-        # Split into lines
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if index is None:
+            index = index_lines(text)
+        
+        # Non-empty lines
+        rows = index.content_rows()
         
-        if not lines:
+        if not rows:
             return []
         
         components = []
         i = 0
         
         # First slide OR regular slide with short first line
-        if len(lines) > 0:
-            first_line = lines[0]
-            word_count = TextSplitter._count_words(first_line)
+        first_row = rows[0]
+        
+        # RULE 1: Title detection by word count
+        if index.words[first_row] <= 6:
+            # Short line → TITLE
+            components.append({
+                'role': 'TITLE',
+                'content': index.line(first_row),
+                'line_index': 0,
+                'rows': [first_row]
+            })
+            i = 1
             
-            # RULE 1: Title detection by word count
-            if word_count <= 6:
-                # Short line → TITLE
-                components.append({
-                    'role': 'TITLE',
-                    'content': first_line,
-                    'line_index': 0
-                })
-                i = 1
-                
-                # Second line on first slide = SUBTITLE
-                if slide_index == 0 and len(lines) > 1 and len(lines[1]) < 150:
-                    word_count_2 = TextSplitter._count_words(lines[1])
-                    if word_count_2 <= 6:
-                        components.append({
-                            'role': 'SUBTITLE',
-                            'content': lines[1],
-                            'line_index': 1
-                        })
-                        i = 2
-            # If first line is long (≥7 words), no title - goes directly to content
+            # Second line on first slide = SUBTITLE
+            if slide_index == 0 and len(rows) > 1:
+                second_row = rows[1]
+                if index.ends[second_row] - index.starts[second_row] < 150 and index.words[second_row] <= 6:
+                    components.append({
+                        'role': 'SUBTITLE',
+                        'content': index.line(second_row),
+                        'line_index': 1,
+                        'rows': [second_row]
+                    })
+                    i = 2
+        # If first line is long (≥7 words), no title - goes directly to content
         
         # Process remaining lines with smart formatting
-        if i < len(lines):
-            remaining_lines = lines[i:]
-            formatted_components = TextSplitter._format_text_with_lists(remaining_lines)
+        if i < len(rows):
+            formatted_components = TextSplitter._format_text_with_lists(index, rows[i:])
             components.extend(formatted_components)
         
         logger.info(
@@ -98,12 +110,7 @@ class TextSplitter:
         return components
     
     @staticmethod
-    def _count_words(text: str) -> int:
-        """Count words in text (ignoring extra spaces)."""
-        return len(text.strip().split())
-    
-    @staticmethod
-    def _format_text_with_lists(lines: List[str]) -> List[Dict[str, Any]]:
+    def _format_text_with_lists(index: LineIndex, rows: List[int]) -> List[Dict[str, Any]]:
         """
         Format lines with bold headers and lists.
         
@@ -111,39 +118,43 @@ class TextSplitter:
         - Line ending with ':' → HEADING (will be made bold)
         - Lines after ':' → bullet list until empty line
         - After empty line → new section
+        
+        Args:
+            index: Line index of the slide text
+            rows: Index lines to format (non-empty)
         """
         components = []
         i = 0
         
-        while i < len(lines):
-            line = lines[i]
+        while i < len(rows):
+            row = rows[i]
             
             # Check if line ends with colon → HEADING + list follows
-            if line.endswith(':'):
+            if index.ends_with_colon(row):
                 # Add heading
                 components.append({
                     'role': 'HEADING',
-                    'content': line,
+                    'content': index.line(row),
                     'line_index': i,
-                    'make_bold': True
+                    'make_bold': True,
+                    'rows': [row]
                 })
                 i += 1
                 
                 # Collect list items that follow
-                list_items = []
-                while i < len(lines) and lines[i]:
+                first_item = i
+                while i < len(rows):
                     # Stop if we hit another heading
-                    if lines[i].endswith(':'):
+                    if index.ends_with_colon(rows[i]):
                         break
                     # Stop if line is already a list item
-                    if TextSplitter._is_list_item(lines[i]):
+                    if index.is_list_item(rows[i]):
                         break
-                    
-                    list_items.append(lines[i])
                     i += 1
                 
                 # Add list as BODY with bullet markers
-                if list_items:
+                if i > first_item:
+                    list_items = [index.line(item_row) for item_row in rows[first_item:i]]
                     list_content = '\n'.join(f"• {item}" for item in list_items)
                     components.append({
                         'role': 'BODY',
@@ -151,91 +162,56 @@ class TextSplitter:
                         'content_type': 'bullet_list',
                         'is_list': True,
                         'items': list_items,
-                        'line_index': i - len(list_items)
+                        'line_index': first_item,
+                        'rows': rows[first_item:i]
                     })
                 
                 continue
             
             # Check for numbered/bulleted list
-            list_result, consumed = TextSplitter._extract_list(lines, i)
+            list_result, consumed = TextSplitter._extract_list(index, rows, i)
             if list_result:
                 components.append(list_result)
                 i += consumed
                 continue
             
             # Check if it's a heading (short, ALL CAPS, or Title Case)
-            if TextSplitter._is_heading(line):
+            if index.is_heading(row):
                 components.append({
                     'role': 'HEADING',
-                    'content': line,
-                    'line_index': i
+                    'content': index.line(row),
+                    'line_index': i,
+                    'rows': [row]
                 })
                 i += 1
                 continue
             
             # Regular paragraph - collect consecutive lines
-            paragraph_lines = [line]
+            first_line = i
             i += 1
             
-            while i < len(lines):
-                next_line = lines[i]
+            while i < len(rows):
+                next_row = rows[i]
                 
                 # Stop at headings or lists
-                if (next_line.endswith(':') or 
-                    TextSplitter._is_heading(next_line) or 
-                    TextSplitter._is_list_item(next_line)):
+                if (index.ends_with_colon(next_row) or
+                    index.is_heading(next_row) or
+                    index.is_list_item(next_row)):
                     break
                 
-                paragraph_lines.append(next_line)
                 i += 1
             
             components.append({
                 'role': 'BODY',
-                'content': '\n'.join(paragraph_lines),
-                'line_index': i - len(paragraph_lines)
+                'content': index.span(rows[first_line:i]),
+                'line_index': first_line,
+                'rows': rows[first_line:i]
             })
         
         return components
     
     @staticmethod
-    def _is_heading(line: str) -> bool:
-        """Check if line is a heading."""
-        # Short line (< 80 chars)
-        if len(line) > 80:
-            return False
-        
-        # ALL CAPS
-        if line.isupper() and len(line) > 3:
-            return True
-        
-        # Ends with colon
-        if line.endswith(':'):
-            return True
-        
-        # Mostly capitalized words
-        words = line.split()
-        if len(words) > 0:
-            capitalized = sum(1 for w in words if w and w[0].isupper())
-            if capitalized / len(words) >= 0.7 and len(line) < 60:
-                return True
-        
-        return False
-    
-    @staticmethod
-    def _is_list_item(line: str) -> bool:
-        """Check if line is a list item."""
-        # Numbered: 1. 2) 3:
-        if re.match(r'^\s*(\d+)[.):]\s+', line):
-            return True
-        
-        # Bulleted: • - * – —
-        if re.match(r'^\s*[•\-\*–—]\s+', line):
-            return True
-        
-        return False
-    
-    @staticmethod
-    def _extract_list(lines: List[str], start_idx: int) -> Tuple[Dict[str, Any], int]:
+    def _extract_list(index: LineIndex, rows: List[int], start_idx: int) -> Tuple[Dict[str, Any], int]:
         """
         Extract a list starting from start_idx.
         
@@ -243,33 +219,20 @@ class TextSplitter:
             (list_component, number_of_lines_consumed)
             or (None, 0) if not a list
         """
-        if not TextSplitter._is_list_item(lines[start_idx]):
+        if not index.is_list_item(rows[start_idx]):
             return None, 0
         
         # Determine list type
-        first_line = lines[start_idx]
-        if re.match(r'^\s*(\d+)[.):]\s+', first_line):
-            list_type = 'numbered_list'
-        else:
-            list_type = 'bullet_list'
+        kind = index.kinds[rows[start_idx]]
+        list_type = 'numbered_list' if kind == NUMBERED else 'bullet_list'
         
-        # Collect list items
+        # Collect list items (items with the other kind of marker are dropped)
         items = []
         i = start_idx
         
-        while i < len(lines) and TextSplitter._is_list_item(lines[i]):
-            # Extract item text (remove marker)
-            line = lines[i]
-            
-            if list_type == 'numbered_list':
-                match = re.match(r'^\s*\d+[.):]\s+(.+)', line)
-                if match:
-                    items.append(match.group(1))
-            else:
-                match = re.match(r'^\s*[•\-\*–—]\s+(.+)', line)
-                if match:
-                    items.append(match.group(1))
-            
+        while i < len(rows) and index.is_list_item(rows[i]):
+            if index.kinds[rows[i]] == kind:
+                items.append(index.item(rows[i]))
             i += 1
         
         # Format list content
@@ -284,7 +247,8 @@ class TextSplitter:
             'content_type': list_type,
             'is_list': True,
             'items': items,
-            'line_index': start_idx
+            'line_index': start_idx,
+            'rows': rows[start_idx:i]
         }, i - start_idx
     
     @staticmethod
@@ -0,0 +1,560 @@
+"""
+Batch Planner Module
+====================
+
+Splits Slides API batchUpdate requests into chunks and executes them.
+
+Chunks are bounded both by request count and by serialized payload size,
+so a few table- or image-heavy slides cannot push a single batchUpdate
+past the API payload limit. Chunks are executed strictly in order (later
+requests reference objects created by earlier ones), while the next chunk
+is prepared in a background thread. A chunk rejected as invalid is
+bisected to isolate the offending requests instead of aborting the deck.
+Bisection is capped per chunk (extra calls and rejected requests), and
+requests that refer to an object whose create request was rejected are
+dropped without being sent.
+"""
+
+import json
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.retry import is_transient_error
+
+logger = get_logger(__name__)
+
+# Slides API accepts at most this many requests per batchUpdate in practice
+DEFAULT_MAX_REQUESTS = 500
+
+# Conservative serialized payload budget per batchUpdate
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+
+# HTTP status returned by batchUpdate for an invalid request
+INVALID_REQUEST_STATUS = 400
+
+# Bisection budget per chunk: extra batchUpdate calls and rejected requests
+DEFAULT_MAX_ISOLATION_CALLS = 32
+DEFAULT_MAX_REJECTED = 8
+
+# Requests that create an object with a caller-chosen objectId
+CREATE_REQUEST_TYPES = ('createSlide', 'createShape', 'createImage', 'createTable', 'createLine')
+
+_DONE = object()
+
+
+class BatchPlannerError(Exception):
+    """Raised when a batch cannot be executed."""
+    pass
+
+
+def request_size(request: Dict[str, Any]) -> int:
+    """
+    Compute serialized size of a single batchUpdate request.
+
+    Args:
+        request: Slides API request dictionary
+
+    Returns:
+        Size in bytes of the compact UTF-8 JSON encoding
+    """
+    return len(json.dumps(request, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def request_type(request: Dict[str, Any]) -> str:
+    """Return the request kind (e.g. 'createShape') for logging."""
+    return next(iter(request), 'unknown')
+
+
+def created_object_ids(request: Dict[str, Any]) -> Set[str]:
+    """Return the objectIds a create request creates (placeholders included)."""
+    kind = request_type(request)
+    if kind not in CREATE_REQUEST_TYPES:
+        return set()
+    body = request[kind] or {}
+    created = {body['objectId']} if body.get('objectId') else set()
+    created.update(
+        mapping['objectId']
+        for mapping in body.get('placeholderIdMappings', [])
+        if mapping.get('objectId')
+    )
+    return created
+
+
+def referenced_object_ids(request: Dict[str, Any]) -> Set[str]:
+    """Return every objectId a request creates or refers to."""
+    found: Set[str] = set()
+
+    def collect(value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if (key == 'objectId' or key.endswith('ObjectId')) and isinstance(item, str):
+                    found.add(item)
+                elif key.endswith('ObjectIds') and isinstance(item, list):
+                    found.update(object_id for object_id in item if isinstance(object_id, str))
+                else:
+                    collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+
+    collect(request)
+    return found
+
+
+def error_status(exception: Exception) -> Optional[int]:
+    """Return HTTP status of a googleapiclient error, if any."""
+    resp = getattr(exception, 'resp', None)
+    status = getattr(resp, 'status', None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class BatchPlanner:
+    """
+    Plans and executes Slides API batchUpdate calls.
+
+    Attributes:
+        max_requests (int): Maximum requests per batchUpdate
+        max_bytes (int): Maximum serialized payload per batchUpdate
+        pipeline (bool): Prepare the next chunk while the current one executes
+        isolate_failures (bool): Bisect invalid chunks instead of failing
+        max_isolation_calls (int): Extra calls allowed to bisect one chunk
+        max_rejected (int): Rejected requests allowed in one chunk
+    """
+
+    def __init__(
+        self,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        pipeline: bool = True,
+        isolate_failures: bool = True,
+        max_pending_chunks: int = 2,
+        max_isolation_calls: int = DEFAULT_MAX_ISOLATION_CALLS,
+        max_rejected: int = DEFAULT_MAX_REJECTED
+    ):
+        """
+        Initialize batch planner.
+
+        Args:
+            max_requests: Maximum requests per batchUpdate
+            max_bytes: Maximum serialized payload bytes per batchUpdate
+            pipeline: Build upcoming chunks in a background thread
+            isolate_failures: Bisect chunks rejected with HTTP 400
+            max_pending_chunks: Prepared chunks buffered ahead of execution
+            max_isolation_calls: Extra batchUpdate calls allowed to bisect
+                one chunk before the batch fails
+            max_rejected: Rejected requests allowed in one chunk before
+                the batch fails
+        """
+        if max_requests < 1:
+            raise ValueError("max_requests must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_requests = max_requests
+        self.max_bytes = max_bytes
+        self.pipeline = pipeline
+        self.isolate_failures = isolate_failures
+        self.max_pending_chunks = max(1, max_pending_chunks)
+        self.max_isolation_calls = max_isolation_calls
+        self.max_rejected = max_rejected
+
+    def plan(self, requests: Iterable[Dict[str, Any]]) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Split requests into chunks bounded by count and payload size.
+
+        Requests keep their original order. A single request larger than
+        ``max_bytes`` is sent alone rather than rejected locally.
+
+        Args:
+            requests: Iterable of Slides API requests (may be a generator)
+
+        Yields:
+            Lists of (original_index, request) tuples
+        """
+        # Account for the {"requests":[...]} envelope and separators
+        envelope = len('{"requests":[]}')
+
+        chunk: List[Tuple[int, Dict[str, Any]]] = []
+        chunk_bytes = envelope
+
+        for index, request in enumerate(requests):
+            size = request_size(request) + 1
+            if chunk and (len(chunk) >= self.max_requests or chunk_bytes + size > self.max_bytes):
+                yield chunk
+                chunk = []
+                chunk_bytes = envelope
+
+            chunk.append((index, request))
+            chunk_bytes += size
+
+        if chunk:
+            yield chunk
+
+    def execute(
+        self,
+        service,
+        presentation_id: str,
+        requests: Iterable[Dict[str, Any]],
+        operation: str = "batch_update",
+        start_chunk: int = 0,
+        on_chunk_applied: Optional[Callable[[int], None]] = None,
+        already_applied: Optional[Callable[[List[Dict[str, Any]]], bool]] = None,
+        progress: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute requests against a presentation in planned chunks.
+
+        Planning is deterministic for the same requests and limits, so a
+        resumed run can skip the chunks a previous run already applied.
+        Bisection applies a chunk piece by piece, so progress is also
+        reported per batchUpdate call: before each call ``on_progress``
+        receives the range being sent, everything before it being applied
+        or rejected. Passing that state back as ``progress`` resumes inside
+        a partially applied chunk.
+
+        Args:
+            service: Slides API service client
+            presentation_id: Target presentation ID
+            requests: Iterable of requests; a generator is consumed lazily
+            operation: Operation name used in log records
+            start_chunk: Number of leading chunks already applied (skipped)
+            on_chunk_applied: Called with the chunk index after each chunk
+            already_applied: Called with the requests that were in flight
+                when the previous run failed (the first chunk that would be
+                sent if no progress is given); returning True marks them
+                applied without resending (used to detect a lost response)
+            progress: Last state passed to on_progress by a previous run
+            on_progress: Called before every batchUpdate call with a
+                JSON-serializable state::
+
+                    {
+                        'next': int,        # first request index not yet applied
+                        'until': int,       # end (exclusive) of the range sent
+                        'failed': [...],    # failures so far
+                        'failed_ids': [...] # objects that were not created
+                    }
+
+        Returns:
+            Dictionary with counters, per-request replies and failures::
+
+                {
+                    'requests': int,
+                    'applied': int,
+                    'chunks': int,
+                    'skipped_chunks': int,
+                    'api_calls': int,
+                    'bytes': int,
+                    'replies': [...],   # aligned with input order, None if failed
+                    'failed': [{'index', 'type', 'error'}, ...]
+                }
+
+        Raises:
+            BatchPlannerError: If bisecting a chunk exceeded its budget
+            Exception: Transient and non-request errors are re-raised so
+                callers can apply their own retry policy
+        """
+        result: Dict[str, Any] = {
+            'requests': 0,
+            'applied': 0,
+            'chunks': 0,
+            'skipped_chunks': 0,
+            'api_calls': 0,
+            'bytes': 0,
+            'replies': [],
+            'failed': []
+        }
+        started = time.perf_counter()
+        verify = already_applied
+        progress = progress or {}
+        resume_next = progress.get('next', 0)
+        resume_until = progress.get('until', 0)
+        result['failed'] = [dict(failure) for failure in progress.get('failed', [])]
+        # Objects whose create request was rejected (or dropped)
+        failed_ids: Set[str] = set(progress.get('failed_ids', []))
+
+        def sending(part: List[Tuple[int, Dict[str, Any]]]) -> None:
+            if on_progress:
+                on_progress({
+                    'next': part[0][0],
+                    'until': part[-1][0] + 1,
+                    'failed': [dict(failure) for failure in result['failed']],
+                    'failed_ids': sorted(failed_ids)
+                })
+
+        for chunk_index, chunk in enumerate(self._chunks(requests)):
+            result['chunks'] += 1
+            result['requests'] += len(chunk)
+            result['replies'].extend([None] * len(chunk))
+
+            if chunk_index < start_chunk or chunk[-1][0] < resume_next:
+                result['skipped_chunks'] += 1
+                continue
+            chunk = [(index, request) for index, request in chunk if index >= resume_next]
+
+            if verify is not None:
+                if progress:
+                    in_flight = [
+                        (index, request) for index, request in chunk
+                        if index < resume_until and not referenced_object_ids(request) & failed_ids
+                    ]
+                    rest = [(index, request) for index, request in chunk if index >= resume_until]
+                else:
+                    in_flight, rest = chunk, []
+                applied = bool(in_flight) and verify([request for _, request in in_flight])
+                verify = None
+                if applied:
+                    result['applied'] += len(in_flight)
+                    chunk = rest
+                    if not chunk:
+                        result['skipped_chunks'] += 1
+                        if on_chunk_applied:
+                            on_chunk_applied(chunk_index)
+                        continue
+
+            self._send(service, presentation_id, chunk, result, operation, failed_ids, sending)
+            if on_chunk_applied:
+                on_chunk_applied(chunk_index)
+
+        result['seconds'] = round(time.perf_counter() - started, 3)
+
+        if result['failed']:
+            logger.warning(
+                f"Skipped {len(result['failed'])} invalid request(s) out of {result['requests']}",
+                operation=operation,
+                presentation_id=presentation_id,
+                failed_types=sorted({failure['type'] for failure in result['failed']})
+            )
+
+        logger.info(
+            f"Applied {result['applied']} requests in {result['chunks']} chunk(s)",
+            operation=operation,
+            presentation_id=presentation_id,
+            api_calls=result['api_calls'],
+            skipped_chunks=result['skipped_chunks'],
+            payload_bytes=result['bytes'],
+            duration_seconds=result['seconds']
+        )
+
+        return result
+
+    def _chunks(self, requests: Iterable[Dict[str, Any]]) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Yield planned chunks, prepared in a producer thread if pipelining.
+
+        Generating requests may have side effects (image uploads), so the
+        producer checks for cancellation before pulling each request and
+        is always joined: no generation is left running after return.
+        """
+        if not self.pipeline:
+            yield from self.plan(requests)
+            return
+
+        pending: "queue.Queue" = queue.Queue(maxsize=self.max_pending_chunks)
+        stop = threading.Event()
+
+        def until_stopped() -> Iterator[Dict[str, Any]]:
+            iterator = iter(requests)
+            while not stop.is_set():
+                try:
+                    request = next(iterator)
+                except StopIteration:
+                    return
+                yield request
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for chunk in self.plan(until_stopped()):
+                    if not put(chunk):
+                        return
+                put(_DONE)
+            except BaseException as e:  # surfaced in the consumer thread
+                put(e)
+
+        producer = threading.Thread(target=produce, name="batch-planner", daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = pending.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+    def _drop_dependents(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        result: Dict[str, Any],
+        failed_ids: Set[str],
+        operation: str,
+        presentation_id: str
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Remove requests referring to objects that were never created."""
+        if not failed_ids:
+            return chunk
+
+        kept = []
+        for index, request in chunk:
+            missing = referenced_object_ids(request) & failed_ids
+            if not missing:
+                kept.append((index, request))
+                continue
+            # Whatever this request would create is missing as well
+            failed_ids.update(created_object_ids(request))
+            result['failed'].append({
+                'index': index,
+                'type': request_type(request),
+                'error': f"Skipped: refers to {', '.join(sorted(missing))}, which was not created"
+            })
+            logger.debug(
+                f"Request #{index} ({request_type(request)}) skipped, depends on a rejected request",
+                operation=operation,
+                presentation_id=presentation_id
+            )
+        return kept
+
+    def _send(
+        self,
+        service,
+        presentation_id: str,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        result: Dict[str, Any],
+        operation: str,
+        failed_ids: Set[str],
+        sending: Optional[Callable[[List[Tuple[int, Dict[str, Any]]]], None]] = None,
+        isolation: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Send one chunk, bisecting it if the API rejects it as invalid.
+
+        ``sending`` is called with each part right before it is sent;
+        ``isolation`` counts the extra calls and rejected requests of the
+        chunk being bisected (None for the first attempt).
+        """
+        chunk = self._drop_dependents(chunk, result, failed_ids, operation, presentation_id)
+        if not chunk:
+            return
+
+        if isolation is not None:
+            if isolation['calls'] >= self.max_isolation_calls:
+                raise BatchPlannerError(
+                    f"Gave up isolating invalid requests after {isolation['calls']} extra calls "
+                    f"(request #{chunk[0][0]} onwards not applied)"
+                )
+            isolation['calls'] += 1
+
+        if sending:
+            sending(chunk)
+
+        body = {'requests': [request for _, request in chunk]}
+        result['api_calls'] += 1
+        result['bytes'] += request_size(body)
+
+        try:
+            response = service.presentations().batchUpdate(
+                presentationId=presentation_id,
+                body=body
+            ).execute()
+        except Exception as e:
+            if (
+                not self.isolate_failures
+                or is_transient_error(e)
+                or error_status(e) != INVALID_REQUEST_STATUS
+            ):
+                raise
+
+            if isolation is None:
+                isolation = {'calls': 0, 'rejected': 0}
+
+            if len(chunk) == 1:
+                index, request = chunk[0]
+                result['failed'].append({
+                    'index': index,
+                    'type': request_type(request),
+                    'error': str(e)
+                })
+                failed_ids.update(created_object_ids(request))
+                logger.warning(
+                    f"Request #{index} ({request_type(request)}) rejected: {e}",
+                    operation=operation,
+                    presentation_id=presentation_id
+                )
+                isolation['rejected'] += 1
+                if isolation['rejected'] > self.max_rejected:
+                    raise BatchPlannerError(
+                        f"More than {self.max_rejected} invalid requests in one batch "
+                        f"(last: #{index} {request_type(request)})"
+                    ) from e
+                return
+
+            # batchUpdate is atomic, so nothing from this chunk was applied;
+            # resend halves in order to find the invalid request(s)
+            middle = len(chunk) // 2
+            self._send(service, presentation_id, chunk[:middle], result, operation, failed_ids, sending, isolation)
+            self._send(service, presentation_id, chunk[middle:], result, operation, failed_ids, sending, isolation)
+            return
+
+        replies = (response or {}).get('replies', [])
+        for position, (index, _) in enumerate(chunk):
+            if position < len(replies):
+                result['replies'][index] = replies[position]
+        result['applied'] += len(chunk)
+
+
+# Global planner instance
+_planner_instance: Optional[BatchPlanner] = None
+
+
+def get_batch_planner() -> BatchPlanner:
+    """
+    Get or create the global batch planner.
+
+    Limits are read from the optional ``batching`` configuration section;
+    defaults are used when it is missing.
+
+    Returns:
+        Global BatchPlanner instance
+    """
+    global _planner_instance
+
+    if _planner_instance is None:
+        settings: Dict[str, Any] = {}
+        try:
+            from ..utils.config import get_config
+            settings = get_config().get('batching', {}) or {}
+        except Exception as e:
+            logger.warning(
+                f"Using default batch planner settings: {e}",
+                operation="get_batch_planner"
+            )
+
+        _planner_instance = BatchPlanner(
+            max_requests=settings.get('max_requests', DEFAULT_MAX_REQUESTS),
+            max_bytes=settings.get('max_bytes', DEFAULT_MAX_BYTES),
+            pipeline=settings.get('pipeline', True),
+            isolate_failures=settings.get('isolate_failures', True),
+            max_isolation_calls=settings.get('max_isolation_calls', DEFAULT_MAX_ISOLATION_CALLS),
+            max_rejected=settings.get('max_rejected', DEFAULT_MAX_REJECTED)
+        )
+
+    return _planner_instance
@@ -0,0 +1,219 @@
+"""
+Generation Checkpoint Module
+============================
+
+Records progress of presentation generation so a failed job can resume.
+
+Generation is split into steps: presentation created, slides created,
+images uploaded and content chunks applied. Each completed step is
+recorded in a JSON-serializable checkpoint that callers persist with the
+job. On a transient failure the builder raises GenerationRetry carrying
+the checkpoint and a suggested delay; the caller requeues the job and the
+next attempt skips everything already done. Content progress is also
+recorded per batchUpdate call, so a chunk that was partly applied while
+bisecting an invalid request resumes where it stopped.
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..utils.logger import get_logger
+from ..utils.retry import compute_retry_delay
+
+logger = get_logger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+class GenerationRetry(Exception):
+    """
+    Raised when a generation step failed with a transient error.
+
+    Attributes:
+        step (str): Name of the step that failed
+        delay (float): Suggested delay before requeueing, in seconds
+        attempt (int): Number of the retry this delay is for (1-based)
+        checkpoint (GenerationCheckpoint): Progress to resume from
+    """
+
+    def __init__(self, step: str, delay: float, checkpoint: "GenerationCheckpoint", cause: Exception):
+        self.step = step
+        self.delay = delay
+        self.attempt = checkpoint.attempt
+        self.checkpoint = checkpoint
+        super().__init__(
+            f"Step '{step}' failed (attempt {self.attempt}), retry in {delay:.1f}s: {cause}"
+        )
+
+
+class GenerationCheckpoint:
+    """
+    Thread-safe record of completed generation steps.
+
+    Attributes:
+        data (dict): Serializable checkpoint state
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, on_update: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize checkpoint.
+
+        Args:
+            data: Previously saved checkpoint state (None to start fresh)
+            on_update: Called with a snapshot after every change (persistence hook)
+        """
+        if not data or data.get('version') != CHECKPOINT_VERSION:
+            data = {
+                'version': CHECKPOINT_VERSION,
+                'attempt': 0,
+                'presentation_id': None,
+                'steps': {},
+                'images': {},
+                'chunks_applied': 0
+            }
+        self.data = copy.deepcopy(data)
+        self.on_update = on_update
+        self._lock = threading.RLock()
+
+    @property
+    def attempt(self) -> int:
+        """Number of retries performed so far."""
+        return self.data.get('attempt', 0)
+
+    @property
+    def presentation_id(self) -> Optional[str]:
+        """ID of the presentation being generated, once created."""
+        return self.data.get('presentation_id')
+
+    @property
+    def chunks_applied(self) -> int:
+        """Number of content chunks already applied."""
+        return self.data.get('chunks_applied', 0)
+
+    def is_done(self, step: str) -> bool:
+        """Check whether a step has completed."""
+        return step in self.data['steps']
+
+    def result(self, step: str) -> Any:
+        """Return the value recorded for a completed step."""
+        return self.data['steps'].get(step, {}).get('result')
+
+    def complete(self, step: str, result: Any = None) -> None:
+        """
+        Mark a step as completed.
+
+        Args:
+            step: Step name
+            result: JSON-serializable value needed to skip the step later
+        """
+        with self._lock:
+            self.data['steps'][step] = {'result': result, 'completed_at': time.time()}
+            if step == 'create' and isinstance(result, dict):
+                self.data['presentation_id'] = result.get('presentation_id')
+            self._notify()
+
+    def image_url(self, key: str) -> Optional[str]:
+        """Return the Drive URL of an already uploaded image."""
+        return self.data['images'].get(key)
+
+    def record_image(self, key: str, url: str) -> None:
+        """Record an uploaded image so it is not uploaded again."""
+        with self._lock:
+            self.data['images'][key] = url
+            self._notify()
+
+    def record_chunk(self, chunk_index: int) -> None:
+        """Record that content chunk ``chunk_index`` was applied."""
+        with self._lock:
+            self.data['chunks_applied'] = max(self.chunks_applied, chunk_index + 1)
+            self._notify()
+
+    @property
+    def batch_progress(self) -> Optional[Dict[str, Any]]:
+        """Progress inside the content chunks (see BatchPlanner.execute)."""
+        return self.data.get('batch_progress')
+
+    def record_progress(self, progress: Dict[str, Any]) -> None:
+        """Record the content requests about to be sent (and failures so far)."""
+        with self._lock:
+            self.data['batch_progress'] = progress
+            self._notify()
+
+    def retry(self, step: str, cause: Exception) -> GenerationRetry:
+        """
+        Count a retry and build the exception that requests a requeue.
+
+        Args:
+            step: Step that failed
+            cause: Transient error that caused the failure
+
+        Returns:
+            GenerationRetry to be raised by the caller
+        """
+        with self._lock:
+            self.data['attempt'] = self.attempt + 1
+            self.data['failed_step'] = step
+            self._notify()
+
+        delay = compute_retry_delay(cause, self.attempt)
+
+        logger.warning(
+            f"Generation step '{step}' failed, will resume in {delay:.1f}s",
+            operation="generation_checkpoint",
+            presentation_id=self.presentation_id,
+            attempt=self.attempt,
+            error=str(cause)
+        )
+
+        return GenerationRetry(step, delay, self, cause)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a deep copy of the checkpoint state."""
+        with self._lock:
+            return copy.deepcopy(self.data)
+
+    def _notify(self) -> None:
+        if self.on_update is not None:
+            try:
+                self.on_update(copy.deepcopy(self.data))
+            except Exception as e:
+                logger.warning(
+                    f"Failed to persist generation checkpoint: {e}",
+                    operation="generation_checkpoint"
+                )
+
+
+def run_with_retries(
+    func: Callable[["GenerationCheckpoint"], Any],
+    checkpoint: Optional[GenerationCheckpoint] = None,
+    max_retries: int = 3,
+    sleep: Callable[[float], None] = time.sleep
+) -> Any:
+    """
+    Run a checkpointed build synchronously, resuming after transient failures.
+
+    Intended for command-line use; web jobs should requeue instead of
+    sleeping in a worker thread.
+
+    Args:
+        func: Callable taking a checkpoint (e.g. a bound builder method)
+        checkpoint: Checkpoint to resume from (default: fresh)
+        max_retries: Maximum number of resumes
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        Result of func
+
+    Raises:
+        GenerationRetry: When max_retries is exhausted
+    """
+    checkpoint = checkpoint or GenerationCheckpoint()
+    while True:
+        try:
+            return func(checkpoint)
+        except GenerationRetry as e:
+            if e.attempt > max_retries:
+                raise
+            sleep(e.delay)
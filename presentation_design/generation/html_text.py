@@ -0,0 +1,393 @@
+"""
+HTML Text Module
+================
+
+Converts slide editor HTML into text for the Slides API.
+
+The editor stores slide text as contenteditable HTML (<p>, <div>, <br>,
+<ul>/<ol>/<li>, <strong>/<b>, <em>/<i>, <code>, headings). One walk over
+the markup (a compiled tag pattern, text decoded with html.unescape)
+produces a RichText:
+
+    text        plain text, one line per paragraph
+    paragraphs  paragraph ranges with their list nesting level
+    runs        bold/italic/code ranges (inline_markup.StyleRun)
+
+rich_text_requests() turns that into exact-range updateTextStyle and
+createParagraphBullets requests, so the generated deck keeps the
+formatting and lists the editor shows.
+
+Whitespace follows HTML rules (runs collapse to one space, block
+boundaries end paragraphs), except that a newline inside text is kept as
+a paragraph break, as in the plain text the parser stores. At most one
+empty line is kept between paragraphs.
+"""
+
+import re
+from html import unescape
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from ..extraction.inline_markup import StyleRun
+
+# Tags that start and end a paragraph
+BLOCK_TAGS = frozenset((
+    'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre',
+    'section', 'article', 'header', 'footer', 'table', 'tr'
+))
+LIST_TAGS = frozenset(('ul', 'ol'))
+BOLD_TAGS = frozenset(('b', 'strong', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+ITALIC_TAGS = frozenset(('i', 'em'))
+CODE_TAGS = frozenset(('code',))
+# Tags whose content is not text
+SKIPPED_TAGS = frozenset(('script', 'style', 'template'))
+
+# Comment, doctype/processing instruction, or start/end tag with attributes.
+# Tag bodies never span a '<', so an unclosed '<a ' stays text and a run
+# of them is scanned in linear time.
+_MARKUP = re.compile(
+    r'<!--.*?(?:-->|\Z)|<[!?][^>]*>?'
+    r'|<(/?)([a-zA-Z][a-zA-Z0-9]*)((?:[^<>"\']|"[^"<]*"|\'[^\'<]*\')*)>',
+    re.DOTALL
+)
+
+# Collapsible HTML whitespace (not &nbsp;); newlines are handled separately
+_SPACES = re.compile(r'[ \t\r\f\v]+')
+_ALL_SPACES = re.compile(r'[ \t\n\r\f\v]+')
+
+CODE_FONT = 'Courier New'
+BULLET_PRESETS = {False: 'BULLET_DISC_CIRCLE_SQUARE', True: 'NUMBERED_DIGIT_ALPHA_ROMAN'}
+
+
+class Paragraph(NamedTuple):
+    """
+    Paragraph of a RichText.
+
+    Attributes:
+        start: Start offset in the text
+        end: End offset (exclusive, without the newline)
+        list_level: Nesting level of a list item (0 = top level), None
+            for a regular paragraph
+        ordered: List item of a numbered list
+    """
+    start: int
+    end: int
+    list_level: Optional[int] = None
+    ordered: bool = False
+
+
+class RichText(NamedTuple):
+    """
+    Plain text with paragraph structure and character styles.
+
+    Attributes:
+        text: Paragraphs joined with newlines
+        paragraphs: One entry per line of text
+        runs: Styled ranges, in order and non-overlapping
+    """
+    text: str
+    paragraphs: List[Paragraph]
+    runs: List[StyleRun]
+
+
+class _Converter:
+    """Collects paragraphs, list levels and style runs in one walk."""
+
+    def __init__(self):
+        # Finished paragraphs: (text, runs, list_level, ordered)
+        self.paragraphs: List[Tuple[str, List[StyleRun], Optional[int], bool]] = []
+        self._parts: List[str] = []
+        self._runs: List[StyleRun] = []
+        self._length = 0
+        self._pending_space = False
+        self._bold = 0
+        self._italic = 0
+        self._code = 0
+        self._skip = 0
+        # ordered flag per open list
+        self._lists: List[bool] = []
+        # (level, ordered) of the list item the next paragraph belongs to
+        self._item: Optional[Tuple[int, bool]] = None
+
+    def _break(self, force: bool = False) -> None:
+        """End the current paragraph (keep it even if empty when forced)."""
+        if self._length or force:
+            level, ordered = self._item if self._item else (None, False)
+            self.paragraphs.append((''.join(self._parts), self._runs, level, ordered))
+            self._item = None
+        self._parts = []
+        self._runs = []
+        self._length = 0
+        self._pending_space = False
+
+    def _add(self, text: str) -> None:
+        """Append collapsed text to the current paragraph."""
+        if text[0] == ' ':
+            self._pending_space = True
+            text = text.lstrip(' ')
+        if not text:
+            return
+        trailing = text[-1] == ' '
+        if trailing:
+            text = text.rstrip(' ')
+        if self._pending_space and self._length:
+            # The separating space takes no style of the following text
+            self._parts.append(' ')
+            self._length += 1
+
+        start = self._length
+        self._parts.append(text)
+        self._length += len(text)
+        self._pending_space = trailing
+
+        if self._bold or self._italic or self._code:
+            style = (self._bold > 0, self._italic > 0, self._code > 0)
+            runs = self._runs
+            if runs and runs[-1].end == start and runs[-1][2:] == style:
+                runs[-1] = runs[-1]._replace(end=self._length)
+            else:
+                runs.append(StyleRun(start, self._length, *style))
+
+    def feed(self, html: str) -> None:
+        """Walk the markup, dispatching tags and text in document order."""
+        pos = 0
+        for match in _MARKUP.finditer(html):
+            if match.start() > pos:
+                text = html[pos:match.start()]
+                self.handle_data(unescape(text) if '&' in text else text)
+            pos = match.end()
+            tag = match.group(2)
+            if tag is None:
+                continue
+            tag = tag.lower()
+            if match.group(1):
+                self.handle_endtag(tag)
+            elif match.group(3).rstrip().endswith('/'):
+                self.handle_startendtag(tag)
+            else:
+                self.handle_starttag(tag)
+        if pos < len(html):
+            self.handle_data(unescape(html[pos:]))
+
+    def handle_starttag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip += 1
+        elif tag == 'br':
+            self._break(force=True)
+        elif tag == 'li':
+            self._break()
+            self._item = (max(len(self._lists) - 1, 0), self._lists[-1] if self._lists else False)
+        elif tag in LIST_TAGS:
+            self._break()
+            self._lists.append(tag == 'ol')
+        elif tag in BLOCK_TAGS:
+            self._break()
+
+        if tag in BOLD_TAGS:
+            self._bold += 1
+        elif tag in ITALIC_TAGS:
+            self._italic += 1
+        elif tag in CODE_TAGS:
+            self._code += 1
+
+    def handle_startendtag(self, tag: str) -> None:
+        if tag == 'br':
+            self._break(force=True)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag == 'li' or tag in BLOCK_TAGS:
+            self._break()
+        elif tag in LIST_TAGS:
+            self._break()
+            if self._lists:
+                self._lists.pop()
+
+        if tag in BOLD_TAGS:
+            self._bold = max(self._bold - 1, 0)
+        elif tag in ITALIC_TAGS:
+            self._italic = max(self._italic - 1, 0)
+        elif tag in CODE_TAGS:
+            self._code = max(self._code - 1, 0)
+
+    def handle_data(self, data: str) -> None:
+        if self._skip or not data:
+            return
+        if '\n' not in data or not data.strip(' \t\n\r\f\v'):
+            self._add(_ALL_SPACES.sub(' ', data))
+            return
+        # Newlines inside text are line breaks
+        for index, line in enumerate(data.split('\n')):
+            if index:
+                self._break(force=True)
+            if line:
+                self._add(_SPACES.sub(' ', line))
+
+
+def _assemble(paragraphs) -> RichText:
+    """Join paragraphs, dropping leading, trailing and repeated empty lines."""
+    kept = []
+    for paragraph in paragraphs:
+        if not paragraph[0] and (not kept or not kept[-1][0]):
+            continue
+        kept.append(paragraph)
+    while kept and not kept[-1][0]:
+        kept.pop()
+
+    texts = []
+    result_paragraphs = []
+    runs = []
+    offset = 0
+    for text, paragraph_runs, level, ordered in kept:
+        texts.append(text)
+        result_paragraphs.append(Paragraph(offset, offset + len(text), level, ordered))
+        runs.extend(run._replace(start=run.start + offset, end=run.end + offset) for run in paragraph_runs)
+        offset += len(text) + 1
+
+    return RichText('\n'.join(texts), result_paragraphs, runs)
+
+
+def html_to_rich_text(html: str) -> RichText:
+    """
+    Convert editor HTML to rich text.
+
+    Args:
+        html: HTML string from the contenteditable editor
+
+    Returns:
+        RichText
+    """
+    converter = _Converter()
+    converter.feed(html)
+    converter._break()
+    return _assemble(converter.paragraphs)
+
+
+def plain_rich_text(text: str) -> RichText:
+    """
+    Wrap plain text (no HTML) as rich text without styles.
+
+    Args:
+        text: Plain text, paragraphs separated by newlines
+
+    Returns:
+        RichText
+    """
+    paragraphs = []
+    offset = 0
+    for line in text.split('\n'):
+        paragraphs.append(Paragraph(offset, offset + len(line)))
+        offset += len(line) + 1
+    return RichText(text, paragraphs, [])
+
+
+def inserted_text(rich_text: RichText) -> str:
+    """
+    Text to insert for rich text.
+
+    Nested list items get one leading tab per level, which
+    createParagraphBullets turns into the nesting level (and removes).
+
+    Args:
+        rich_text: Converted text
+
+    Returns:
+        Text for insertText
+    """
+    if not any(paragraph.list_level for paragraph in rich_text.paragraphs):
+        return rich_text.text
+    text = rich_text.text
+    return '\n'.join(
+        '\t' * (paragraph.list_level or 0) + text[paragraph.start:paragraph.end]
+        for paragraph in rich_text.paragraphs
+    )
+
+
+def _utf16_offsets(text: str):
+    """Map string offsets to UTF-16 offsets (Slides API text indexes)."""
+    if text.isascii() or max(text) <= '\uffff':
+        return None
+    offsets = [0]
+    for char in text:
+        offsets.append(offsets[-1] + (2 if char > '\uffff' else 1))
+    return offsets
+
+
+def _fixed_range(start: int, end: int, offsets) -> Dict[str, Any]:
+    if offsets is not None:
+        start, end = offsets[start], offsets[end]
+    return {'type': 'FIXED_RANGE', 'startIndex': start, 'endIndex': end}
+
+
+def rich_text_requests(object_id: str, rich_text: RichText) -> List[Dict[str, Any]]:
+    """
+    Requests applying the styles and lists of rich text after insertText.
+
+    Ranges refer to inserted_text(); character styles come first, then
+    the bullet requests from the last list to the first, so removing
+    nesting tabs never shifts a range that is still to be applied.
+
+    Args:
+        object_id: Shape holding the text
+        rich_text: Converted text
+
+    Returns:
+        List of updateTextStyle and createParagraphBullets requests
+    """
+    paragraphs = rich_text.paragraphs
+    if not rich_text.runs and all(paragraph.list_level is None for paragraph in paragraphs):
+        return []
+
+    # Offset shift of each paragraph in the inserted text (nesting tabs)
+    shifts = []
+    shift = 0
+    for paragraph in paragraphs:
+        shift += paragraph.list_level or 0
+        shifts.append(shift)
+    offsets = _utf16_offsets(inserted_text(rich_text))
+
+    requests = []
+    paragraph_index = 0
+    for run in rich_text.runs:
+        while paragraphs[paragraph_index].end < run.start:
+            paragraph_index += 1
+        shift = shifts[paragraph_index]
+
+        style = {}
+        if run.bold:
+            style['bold'] = True
+        if run.italic:
+            style['italic'] = True
+        if run.code:
+            style['fontFamily'] = CODE_FONT
+        requests.append({
+            'updateTextStyle': {
+                'objectId': object_id,
+                'textRange': _fixed_range(run.start + shift, run.end + shift, offsets),
+                'style': style,
+                'fields': ','.join(style)
+            }
+        })
+
+    # Consecutive list items form one bulleted range (preset of its first item)
+    lists = []
+    for index, paragraph in enumerate(paragraphs):
+        if paragraph.list_level is None:
+            continue
+        start = paragraph.start + shifts[index] - paragraph.list_level
+        end = paragraph.end + shifts[index]
+        if lists and lists[-1][2] == index - 1:
+            lists[-1][1:3] = [end, index]
+        else:
+            lists.append([start, end, index, paragraph.ordered])
+
+    for start, end, _, ordered in reversed(lists):
+        requests.append({
+            'createParagraphBullets': {
+                'objectId': object_id,
+                'textRange': _fixed_range(start, end, offsets),
+                'bulletPreset': BULLET_PRESETS[ordered]
+            }
+        })
+
+    return requests
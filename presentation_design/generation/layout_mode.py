@@ -0,0 +1,317 @@
+"""
+Layout Mode Module
+==================
+
+Placeholder-based slide generation for build_simple_presentation.
+
+In text box mode every slide title and body is a new TEXT_BOX followed by
+insertText and three or four styling requests. In layout mode the deck's
+common text style (font, sizes, color, alignment and box geometry) is
+installed once into the placeholders of the predefined TITLE_AND_BODY
+layout. Each slide is then created from that layout with its placeholder
+IDs mapped, and filled with insertText only. Slides that deviate from the
+common style get override requests for just the fields that differ.
+
+The Slides API cannot create new layouts, so the predefined layout of the
+new presentation is restyled instead of adding a custom one.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Predefined layout whose placeholders are restyled
+LAYOUT_NAME = 'TITLE_AND_BODY'
+PLACEHOLDER_TYPES = ('TITLE', 'BODY')
+
+# Text box geometry of text box mode, in EMU and points
+VERTICAL_POSITIONS = {'top': 635000, 'center': 3200000, 'bottom': 5715000}
+HORIZONTAL_POSITIONS = {'left': 635000, 'center': 1905000, 'right': 3175000}
+BOX_SIZES_PT = {'TITLE': (600, 80), 'BODY': (600, 300)}
+BODY_OFFSET_PT = 100
+
+ALIGNMENTS = {'left': 'START', 'center': 'CENTER', 'right': 'END'}
+CONTENT_ALIGNMENTS = {'top': 'TOP', 'center': 'MIDDLE', 'bottom': 'BOTTOM'}
+
+# Layout used by dry-run plans, where the real layout cannot be fetched
+# (placeholder sizes of the default theme at 16:9)
+NOMINAL_LAYOUT = {
+    'layout_id': f"<{LAYOUT_NAME}>",
+    'placeholders': {
+        'TITLE': {'object_id': '<TITLE>', 'width': 8520600, 'height': 572700},
+        'BODY': {'object_id': '<BODY>', 'width': 8520600, 'height': 3416400}
+    }
+}
+
+EMU_PER_PT = 12700
+
+
+class LayoutModeError(Exception):
+    """Raised when the presentation has no usable layout."""
+    pass
+
+
+def text_style(slide_data: Dict[str, Any], settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve a slide's text style with the defaults of text box mode.
+
+    Args:
+        slide_data: Editor slide
+        settings: Presentation-level settings
+
+    Returns:
+        Dictionary with font_family, title_size, text_size, text_color,
+        vertical and horizontal
+    """
+    position = slide_data.get('textPosition', settings.get('defaultTextPosition', {}))
+    return {
+        'font_family': slide_data.get('fontFamily', settings.get('defaultFont', 'Arial')),
+        'title_size': slide_data.get('titleSize', 44),
+        'text_size': slide_data.get('textSize', 18),
+        'text_color': slide_data.get('textColor', '#000000'),
+        'vertical': position.get('vertical', 'top'),
+        'horizontal': position.get('horizontal', 'left')
+    }
+
+
+def dominant_style(styles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Pick the most common value of every style field.
+
+    Fields are chosen independently, so a deck where only some slides
+    change the color still shares font and sizes. Ties go to the value
+    seen first.
+
+    Args:
+        styles: Resolved styles of all slides (see text_style)
+
+    Returns:
+        Style to install into the layout
+    """
+    if not styles:
+        return text_style({}, {})
+
+    dominant = {}
+    for field in styles[0]:
+        counts = Counter(style[field] for style in styles)
+        best = max(counts.values())
+        dominant[field] = next(style[field] for style in styles if counts[style[field]] == best)
+    return dominant
+
+
+def find_layout(layouts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Locate the TITLE_AND_BODY layout and its placeholders.
+
+    Args:
+        layouts: 'layouts' of a presentation (objectId, layoutProperties,
+            pageElements with size and shape.placeholder)
+
+    Returns:
+        Dictionary with layout_id and placeholders
+        {type: {object_id, width, height}}
+
+    Raises:
+        LayoutModeError: If the layout or a placeholder is missing
+    """
+    for layout in layouts:
+        if layout.get('layoutProperties', {}).get('name') != LAYOUT_NAME:
+            continue
+
+        placeholders = {}
+        for element in layout.get('pageElements', []):
+            placeholder_type = element.get('shape', {}).get('placeholder', {}).get('type')
+            if placeholder_type in PLACEHOLDER_TYPES and placeholder_type not in placeholders:
+                size = element.get('size', {})
+                placeholders[placeholder_type] = {
+                    'object_id': element['objectId'],
+                    'width': size.get('width', {}).get('magnitude'),
+                    'height': size.get('height', {}).get('magnitude')
+                }
+
+        missing = [name for name in PLACEHOLDER_TYPES if name not in placeholders]
+        if missing:
+            raise LayoutModeError(f"Layout {LAYOUT_NAME} has no {', '.join(missing)} placeholder")
+        return {'layout_id': layout['objectId'], 'placeholders': placeholders}
+
+    raise LayoutModeError(f"Presentation has no {LAYOUT_NAME} layout")
+
+
+def placeholder_ids(slide_id: str) -> Dict[str, str]:
+    """Deterministic objectIds of a slide's TITLE and BODY placeholders."""
+    return {'TITLE': f"{slide_id}_title", 'BODY': f"{slide_id}_body"}
+
+
+def placeholder_mappings(slide_id: str) -> List[Dict[str, Any]]:
+    """placeholderIdMappings for createSlide."""
+    return [
+        {'layoutPlaceholder': {'type': placeholder_type, 'index': 0}, 'objectId': object_id}
+        for placeholder_type, object_id in placeholder_ids(slide_id).items()
+    ]
+
+
+def box_transform(layout: Dict[str, Any], placeholder_type: str, style: Dict[str, Any], has_title: bool = True) -> Dict[str, Any]:
+    """
+    Transform placing a placeholder where text box mode puts the box.
+
+    The placeholder keeps its own size; scale factors stretch it to the
+    text box size.
+
+    Args:
+        layout: Result of find_layout
+        placeholder_type: 'TITLE' or 'BODY'
+        style: Resolved text style
+        has_title: Whether the slide has a title (the body moves up without)
+
+    Returns:
+        Absolute transform in EMU
+    """
+    placeholder = layout['placeholders'][placeholder_type]
+    width_pt, height_pt = BOX_SIZES_PT[placeholder_type]
+
+    y = VERTICAL_POSITIONS.get(style['vertical'], 635000)
+    if placeholder_type == 'BODY' and has_title:
+        y += BODY_OFFSET_PT * EMU_PER_PT
+
+    return {
+        'scaleX': round(width_pt * EMU_PER_PT / (placeholder['width'] or width_pt * EMU_PER_PT), 6),
+        'scaleY': round(height_pt * EMU_PER_PT / (placeholder['height'] or height_pt * EMU_PER_PT), 6),
+        'translateX': HORIZONTAL_POSITIONS.get(style['horizontal'], 635000),
+        'translateY': y,
+        'unit': 'EMU'
+    }
+
+
+def style_requests(
+    object_id: str,
+    placeholder_type: str,
+    style: Dict[str, Any],
+    rgb: Dict[str, float],
+    base: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Text, paragraph and shape styling of one placeholder.
+
+    Args:
+        object_id: Placeholder objectId (on the layout or a slide)
+        placeholder_type: 'TITLE' or 'BODY'
+        style: Style to apply
+        rgb: RGB color of style['text_color']
+        base: Style already in effect; only differing fields are sent
+            (None = send everything)
+
+    Returns:
+        List of update requests (empty if nothing differs)
+    """
+    size_key = 'title_size' if placeholder_type == 'TITLE' else 'text_size'
+
+    def differs(field: str) -> bool:
+        return base is None or base[field] != style[field]
+
+    text_style_values = {}
+    fields = []
+    if differs(size_key):
+        text_style_values['fontSize'] = {'magnitude': style[size_key], 'unit': 'PT'}
+        fields.append('fontSize')
+    if differs('font_family'):
+        text_style_values['fontFamily'] = style['font_family']
+        fields.append('fontFamily')
+    if differs('text_color'):
+        text_style_values['foregroundColor'] = {'opaqueColor': {'rgbColor': rgb}}
+        fields.append('foregroundColor')
+
+    requests = []
+    if fields:
+        requests.append({
+            'updateTextStyle': {
+                'objectId': object_id,
+                'textRange': {'type': 'ALL'},
+                'style': text_style_values,
+                'fields': ','.join(fields)
+            }
+        })
+    if differs('horizontal'):
+        requests.append({
+            'updateParagraphStyle': {
+                'objectId': object_id,
+                'textRange': {'type': 'ALL'},
+                'style': {'alignment': ALIGNMENTS.get(style['horizontal'], 'START')},
+                'fields': 'alignment'
+            }
+        })
+    if differs('vertical'):
+        requests.append({
+            'updateShapeProperties': {
+                'objectId': object_id,
+                'shapeProperties': {'contentAlignment': CONTENT_ALIGNMENTS.get(style['vertical'], 'TOP')},
+                'fields': 'contentAlignment'
+            }
+        })
+    return requests
+
+
+def install_requests(layout: Dict[str, Any], style: Dict[str, Any], rgb: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    Requests installing the common style into the layout placeholders.
+
+    Args:
+        layout: Result of find_layout
+        style: Common style (see dominant_style)
+        rgb: RGB color of style['text_color']
+
+    Returns:
+        List of update requests
+    """
+    requests = []
+    for placeholder_type in PLACEHOLDER_TYPES:
+        object_id = layout['placeholders'][placeholder_type]['object_id']
+        requests.append({
+            'updatePageElementTransform': {
+                'objectId': object_id,
+                'transform': box_transform(layout, placeholder_type, style),
+                'applyMode': 'ABSOLUTE'
+            }
+        })
+        requests.extend(style_requests(object_id, placeholder_type, style, rgb))
+    return requests
+
+
+def override_requests(
+    layout: Dict[str, Any],
+    slide_id: str,
+    placeholder_type: str,
+    style: Dict[str, Any],
+    installed: Dict[str, Any],
+    rgb: Dict[str, float],
+    has_title: bool
+) -> List[Dict[str, Any]]:
+    """
+    Requests making one slide placeholder match its own style.
+
+    Args:
+        layout: Result of find_layout
+        slide_id: Slide objectId
+        placeholder_type: 'TITLE' or 'BODY'
+        style: The slide's resolved style
+        installed: Style installed into the layout
+        rgb: RGB color of style['text_color']
+        has_title: Whether the slide has a title
+
+    Returns:
+        List of update requests (empty for slides matching the layout)
+    """
+    object_id = placeholder_ids(slide_id)[placeholder_type]
+    requests = []
+
+    transform = box_transform(layout, placeholder_type, style, has_title)
+    if transform != box_transform(layout, placeholder_type, installed):
+        requests.append({
+            'updatePageElementTransform': {
+                'objectId': object_id,
+                'transform': transform,
+                'applyMode': 'ABSOLUTE'
+            }
+        })
+
+    requests.extend(style_requests(object_id, placeholder_type, style, rgb, base=installed))
+    return requests
+
@@ -0,0 +1,195 @@
+"""
+Request Plan Module
+===================
+
+Describes the API calls a generation would make without making them.
+
+A plan lists every generation step (create, slides, content) with its
+ordered requests, request counts, serialized sizes and the batch
+boundaries the batch planner would use. Plans are plain JSON, so they can
+be cached, profiled and diffed between releases; ``digest`` changes
+whenever any request does.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from .batch_planner import BatchPlanner, request_size
+from .request_optimizer import RequestOptimizer, new_stats
+
+# Format version of plan dictionaries
+PLAN_VERSION = 1
+
+# A new presentation comes with one default slide; its ID is not known
+# before the API creates it, so plans use this placeholder
+DEFAULT_SLIDE_PLACEHOLDER = '<default-slide>'
+
+# Drive URL stand-in for data-URL images that a real run would upload
+DRY_RUN_IMAGE_URL = 'https://drive.google.com/uc?export=view&id=dry-run-{key}'
+
+
+def describe_batches(requests: List[Dict[str, Any]], planner: BatchPlanner) -> List[Dict[str, Any]]:
+    """
+    Compute the batch boundaries the planner would use.
+
+    Args:
+        requests: Requests in execution order
+        planner: Batch planner whose limits apply
+
+    Returns:
+        List of {'index', 'start', 'end', 'requests', 'bytes'} with
+        ``end`` exclusive and ``bytes`` the full batchUpdate body size
+    """
+    batches = []
+    for number, chunk in enumerate(planner.plan(requests)):
+        batches.append({
+            'index': number,
+            'start': chunk[0][0],
+            'end': chunk[-1][0] + 1,
+            'requests': len(chunk),
+            'bytes': request_size({'requests': [request for _, request in chunk]})
+        })
+    return batches
+
+
+def describe_step(
+    step: str,
+    requests: Iterable[Dict[str, Any]],
+    planner: BatchPlanner,
+    optimizer: Optional[RequestOptimizer] = None,
+    include_requests: bool = True
+) -> Dict[str, Any]:
+    """
+    Describe one batchUpdate step of a generation.
+
+    Args:
+        step: Step name ('slides', 'content')
+        requests: Requests as the builder produces them
+        planner: Batch planner whose limits apply
+        optimizer: Request optimizer applied before planning (None = none)
+        include_requests: Include the request list itself
+
+    Returns:
+        Step description with counts, sizes, batches and optimizer stats
+    """
+    stats = new_stats()
+    if optimizer is not None:
+        planned = list(optimizer.optimize(requests, stats))
+    else:
+        planned = list(requests)
+        stats['requests_in'] = stats['requests_out'] = len(planned)
+        stats['bytes_in'] = stats['bytes_out'] = sum(request_size(request) for request in planned)
+
+    batches = describe_batches(planned, planner)
+    counts: Dict[str, int] = {}
+    for request in planned:
+        kind = next(iter(request), 'unknown')
+        counts[kind] = counts.get(kind, 0) + 1
+
+    description = {
+        'step': step,
+        'requests_count': len(planned),
+        'bytes': stats['bytes_out'],
+        'api_calls': len(batches),
+        'request_types': dict(sorted(counts.items())),
+        'batches': batches,
+        'optimizer': stats,
+        'digest': _digest(planned)
+    }
+    if include_requests:
+        description['requests'] = planned
+    return description
+
+
+def describe_create(body: Dict[str, Any], source_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Describe the create step.
+
+    Args:
+        body: presentations.create body, or the files.copy body when
+            copying a master deck
+        source_id: Master deck copied with files.copy (None = create blank)
+
+    Returns:
+        Step description
+    """
+    description = {
+        'step': 'create',
+        'body': body,
+        'requests_count': 0,
+        'bytes': request_size(body),
+        # A copy's slide IDs are unknown, so the slides step fetches them
+        'api_calls': 1 if source_id is None else 2,
+        'digest': _digest(body if source_id is None else {'source': source_id, 'body': body})
+    }
+    if source_id is not None:
+        description['source'] = source_id
+    return description
+
+
+def finalize_plan(
+    operation: str,
+    title: str,
+    steps: List[Dict[str, Any]],
+    planner: BatchPlanner,
+    uploads: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Assemble a plan from step descriptions and compute totals.
+
+    Args:
+        operation: Builder operation the plan describes
+        title: Presentation title
+        steps: Step descriptions in execution order
+        planner: Batch planner whose limits apply
+        uploads: Images a real run would upload to Drive
+
+    Returns:
+        Plan dictionary
+    """
+    uploads = uploads or []
+    plan = {
+        'plan_version': PLAN_VERSION,
+        'operation': operation,
+        'title': title,
+        'limits': {'max_requests': planner.max_requests, 'max_bytes': planner.max_bytes},
+        'steps': steps,
+        'uploads': uploads,
+        'totals': {
+            'requests': sum(step['requests_count'] for step in steps),
+            'bytes': sum(step['bytes'] for step in steps),
+            # Each upload is a files.create plus a permissions.create call
+            'api_calls': sum(step['api_calls'] for step in steps) + 2 * len(uploads),
+            'batches': sum(len(step.get('batches', [])) for step in steps),
+            'uploads': len(uploads)
+        }
+    }
+    plan['digest'] = plan_digest(plan)
+    return plan
+
+
+def plan_digest(plan: Dict[str, Any]) -> str:
+    """
+    Return a stable digest of a plan's steps and uploads.
+
+    Steps are identified by their own digests, so plans built with or
+    without the request lists have the same digest.
+
+    Args:
+        plan: Plan dictionary
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of the plan content
+    """
+    return _digest({
+        'plan_version': plan.get('plan_version'),
+        'limits': plan.get('limits'),
+        'steps': [(step.get('step'), step.get('digest')) for step in plan.get('steps', [])],
+        'uploads': plan.get('uploads')
+    })
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
@@ -5,12 +5,31 @@ Presentation Builder Module
 Creates new Google Slides presentations with applied design.
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 import base64
+import hashlib
 import io
 from ..auth.oauth_manager import OAuthManager
 from ..utils.logger import get_logger
-from ..utils.retry import retry_on_network_error
+from ..utils.retry import is_transient_error_chain
+from .batch_planner import CREATE_REQUEST_TYPES, BatchPlanner, get_batch_planner
+from .checkpoint import GenerationCheckpoint, GenerationRetry
+from .html_text import RichText, html_to_rich_text, inserted_text, plain_rich_text, rich_text_requests
+from .plan import DEFAULT_SLIDE_PLACEHOLDER, DRY_RUN_IMAGE_URL, describe_create, describe_step, finalize_plan
+from .layout_mode import (
+    HORIZONTAL_POSITIONS,
+    NOMINAL_LAYOUT,
+    VERTICAL_POSITIONS,
+    dominant_style,
+    find_layout,
+    install_requests,
+    override_requests,
+    placeholder_ids,
+    placeholder_mappings,
+    text_style
+)
+from .request_optimizer import RequestOptimizer, get_request_optimizer, new_stats
 
 logger = get_logger(__name__)
 
@@ -20,6 +39,16 @@ class BuilderError(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
+def _rgb_components(hex_color: str) -> Tuple[float, float, float]:
+    hex_color = hex_color.lstrip('#')
+    return (
+        int(hex_color[0:2], 16) / 255.0,
+        int(hex_color[2:4], 16) / 255.0,
+        int(hex_color[4:6], 16) / 255.0
+    )
+
+
 class PresentationBuilder:
     """
     Builds Google Slides presentations from designed specification.
@@ -28,11 +57,28 @@ class PresentationBuilder:
     formatted text, colors, and layouts.
     """
     
-    def __init__(self, oauth_manager: OAuthManager):
-        """Initialize presentation builder."""
+    def __init__(
+        self,
+        oauth_manager: OAuthManager,
+        batch_planner: Optional[BatchPlanner] = None,
+        request_optimizer: Optional[RequestOptimizer] = None
+    ):
+        """
+        Initialize presentation builder.
+        
+        Args:
+            oauth_manager: Object providing build_service()
+            batch_planner: batchUpdate planner (default: global planner)
+            request_optimizer: Request rewriting pass (default: global optimizer)
+        """
         self.oauth_manager = oauth_manager
+        self.batch_planner = batch_planner or get_batch_planner()
+        self.request_optimizer = request_optimizer or get_request_optimizer()
         self.slides_service = None
         self.drive_service = None
+        self._checkpoint: Optional[GenerationCheckpoint] = None
+        # Set while planning: data-URL images recorded here, not uploaded
+        self._dry_run_uploads: Optional[list] = None
     
     def _ensure_service(self) -> None:
         """Ensure Slides API service is initialized."""
@@ -44,20 +90,618 @@ class PresentationBuilder:
         if self.drive_service is None:
             self.drive_service = self.oauth_manager.build_service('drive', 'v3')
     
-    @retry_on_network_error()
-    def build_simple_presentation(self, slides_data: list, title: str = "New Presentation", settings: dict = None) -> Dict[str, Any]:
+    def _optimized(self, requests: Iterable[Dict[str, Any]], presentation_id: str, operation: str) -> Iterator[Dict[str, Any]]:
+        """
+        Run requests through the request optimizer, logging the reduction.
+        
+        Args:
+            requests: Requests (list or generator) in execution order
+            presentation_id: Target presentation ID (for logging)
+            operation: Operation name for logging
+            
+        Yields:
+            Optimized requests in execution order
+        """
+        stats = new_stats()
+        yield from self.request_optimizer.optimize(requests, stats)
+        
+        if stats['requests_in']:
+            logger.info(
+                f"Optimized {stats['requests_in']} requests to {stats['requests_out']}",
+                operation=operation,
+                presentation_id=presentation_id,
+                bytes_in=stats['bytes_in'],
+                bytes_out=stats['bytes_out'],
+                dropped=stats['dropped'],
+                merged=stats['merged'],
+                fields_pruned=stats['fields_pruned'],
+                interned=stats['interned']
+            )
+    
+    def _batch_update(self, presentation_id: str, requests: Iterable[Dict[str, Any]], operation: str) -> Dict[str, Any]:
+        """
+        Apply requests through the request optimizer and batch planner.
+        
+        Args:
+            presentation_id: Target presentation ID
+            requests: Requests (list or generator) in execution order
+            operation: Operation name for logging
+            
+        Returns:
+            Batch planner result (counters, replies, failed requests)
+        """
+        return self.batch_planner.execute(
+            self.slides_service,
+            presentation_id,
+            self._optimized(requests, presentation_id, operation),
+            operation=operation
+        )
+    
+    def _run_step(self, checkpoint: GenerationCheckpoint, step: str, func: Callable[[], Any]) -> Any:
+        """
+        Run a generation step once, recording its result in the checkpoint.
+        
+        Completed steps are skipped and return their recorded result.
+        Transient failures are turned into GenerationRetry so the caller can
+        requeue the job and resume from this step.
+        
+        Args:
+            checkpoint: Generation checkpoint
+            step: Step name
+            func: Zero-argument callable performing the step
+            
+        Returns:
+            Step result (JSON-serializable)
+            
+        Raises:
+            GenerationRetry: If the step failed with a transient error
+        """
+        if checkpoint.is_done(step):
+            logger.debug(
+                f"Skipping completed step '{step}'",
+                operation="generation_step",
+                presentation_id=checkpoint.presentation_id
+            )
+            return checkpoint.result(step)
+        
+        try:
+            result = func()
+        except GenerationRetry:
+            raise
+        except Exception as e:
+            if is_transient_error_chain(e):
+                raise checkpoint.retry(step, e) from e
+            raise
+        
+        checkpoint.complete(step, result)
+        return result
+    
+    def _create_presentation(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a presentation (checkpoint step 'create').
+        
+        Returns:
+            Dictionary with presentation_id and the default slide IDs
+        """
+        presentation = self.slides_service.presentations().create(body=body).execute()
+        return {
+            'presentation_id': presentation['presentationId'],
+            'slide_ids': [slide['objectId'] for slide in presentation.get('slides', [])]
+        }
+    
+    def _copy_master_deck(self, master_deck_id: str, title: str) -> Dict[str, Any]:
+        """
+        Copy a template master deck with Drive (checkpoint step 'create').
+        
+        The copy inherits the deck's master and layouts. Its slide IDs are
+        not returned by files.copy, so the slides step fetches them.
+        
+        Args:
+            master_deck_id: Presentation ID of the master deck
+            title: Title of the new presentation
+            
+        Returns:
+            Dictionary with presentation_id and slide_ids (None = unknown)
+        """
+        self._ensure_drive_service()
+        copied = self.drive_service.files().copy(
+            fileId=master_deck_id,
+            body={'name': title},
+            fields='id'
+        ).execute()
+        return {'presentation_id': copied['id'], 'slide_ids': None}
+    
+    def _slide_object_id(self, index: int) -> str:
+        """Deterministic objectId of the slide at ``index``."""
+        return f"pd_slide_{index:03d}"
+    
+    def _prepare_slides(
+        self,
+        presentation_id: str,
+        slide_count: int,
+        operation: str,
+        existing_slides: Optional[list] = None,
+        layout: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make the presentation contain exactly ``slide_count`` empty slides.
+        
+        Slides get deterministic objectIds and the BLANK layout, so the step
+        is idempotent: slides that already exist are cleared and kept,
+        missing ones are created and anything else is deleted, all in one
+        atomic batchUpdate.
+        
+        Args:
+            presentation_id: Target presentation ID
+            slide_count: Number of slides needed
+            operation: Operation name for logging
+            existing_slides: Known slides (skips fetching the presentation)
+            layout: Layout mode layout (see layout_mode.find_layout); slides
+                are created from it with mapped placeholder IDs
+            
+        Returns:
+            Dictionary with slide_ids (in order) and the presentation title
+        """
+        title = None
+        if existing_slides is None:
+            presentation = self.slides_service.presentations().get(
+                presentationId=presentation_id,
+                fields='title,slides(objectId,pageElements(objectId))'
+            ).execute()
+            existing_slides = presentation.get('slides', [])
+            title = presentation.get('title')
+        
+        target_ids, requests = self._slide_requests(slide_count, existing_slides, layout)
+        if requests:
+            self._batch_update(presentation_id, requests, operation)
+        
+        return {'slide_ids': target_ids, 'title': title}
+    
+    def _slide_requests(
+        self,
+        slide_count: int,
+        existing_slides: list,
+        layout: Optional[Dict[str, Any]] = None
+    ) -> Tuple[list, list]:
+        """
+        Compute the requests leaving exactly ``slide_count`` empty slides.
+        
+        Args:
+            slide_count: Number of slides needed
+            existing_slides: Slides currently in the presentation
+            layout: Layout mode layout; None creates BLANK slides
+            
+        Returns:
+            Tuple of (target slide IDs in order, requests)
+        """
+        target_ids = [self._slide_object_id(idx) for idx in range(slide_count)]
+        if not target_ids:
+            return [], []
+        
+        existing_ids = [slide['objectId'] for slide in existing_slides]
+        requests = []
+        
+        # Create missing slides first; a presentation may not end up empty
+        for slide_id in target_ids:
+            if slide_id not in existing_ids:
+                if layout is None:
+                    requests.append({
+                        'createSlide': {
+                            'objectId': slide_id,
+                            'slideLayoutReference': {'predefinedLayout': 'BLANK'}
+                        }
+                    })
+                else:
+                    requests.append({
+                        'createSlide': {
+                            'objectId': slide_id,
+                            'slideLayoutReference': {'layoutId': layout['layout_id']},
+                            'placeholderIdMappings': placeholder_mappings(slide_id)
+                        }
+                    })
+        
+        # Clear reused slides, delete foreign ones (e.g. the default title slide)
+        for slide in existing_slides:
+            if slide['objectId'] in target_ids:
+                keep = set(placeholder_ids(slide['objectId']).values()) if layout else set()
+                for element in slide.get('pageElements', []):
+                    if element['objectId'] not in keep:
+                        requests.append({'deleteObject': {'objectId': element['objectId']}})
+            else:
+                requests.append({'deleteObject': {'objectId': slide['objectId']}})
+        
+        # Reorder if reused slides are out of place
+        order = [slide_id for slide_id in existing_ids if slide_id in target_ids]
+        order += [slide_id for slide_id in target_ids if slide_id not in order]
+        for position, slide_id in enumerate(target_ids):
+            if order[position] != slide_id:
+                requests.append({
+                    'updateSlidesPosition': {
+                        'slideObjectIds': [slide_id],
+                        'insertionIndex': position
+                    }
+                })
+                order.remove(slide_id)
+                order.insert(position, slide_id)
+        
+        return target_ids, requests
+    
+    def _chunk_already_applied(self, presentation_id: str, requests: list) -> bool:
+        """
+        Check whether requests in flight were applied by a previous attempt.
+        
+        The requests were sent in one atomic batchUpdate (a chunk or, after
+        bisection, part of one), so they were applied only if every object
+        they create exists (the response was lost).
+        
+        Args:
+            presentation_id: Target presentation ID
+            requests: Requests that were in flight
+            
+        Returns:
+            True if all objects the requests create already exist
+        """
+        created = [
+            body.get('objectId')
+            for request in requests
+            for kind, body in request.items()
+            if kind in CREATE_REQUEST_TYPES and body.get('objectId')
+        ]
+        if not created:
+            return False
+        
+        presentation = self.slides_service.presentations().get(
+            presentationId=presentation_id,
+            fields='slides(objectId,pageElements(objectId))'
+        ).execute()
+        existing = set()
+        for slide in presentation.get('slides', []):
+            existing.add(slide['objectId'])
+            existing.update(element['objectId'] for element in slide.get('pageElements', []))
+        
+        return all(object_id in existing for object_id in created)
+    
+    def _apply_content(
+        self,
+        presentation_id: str,
+        make_requests: Callable[[], Iterable[Dict[str, Any]]],
+        checkpoint: GenerationCheckpoint,
+        operation: str
+    ) -> Dict[str, Any]:
+        """
+        Apply content requests chunk by chunk (checkpoint step 'content').
+        
+        Args:
+            presentation_id: Target presentation ID
+            make_requests: Callable returning the (possibly lazy) requests
+            checkpoint: Generation checkpoint
+            operation: Operation name for logging
+            
+        Returns:
+            Dictionary with the list of failed (skipped) requests
+        """
+        def apply():
+            resuming = checkpoint.attempt > 0
+            result = self.batch_planner.execute(
+                self.slides_service,
+                presentation_id,
+                self._optimized(make_requests(), presentation_id, operation),
+                operation=operation,
+                start_chunk=checkpoint.chunks_applied,
+                on_chunk_applied=checkpoint.record_chunk,
+                progress=checkpoint.batch_progress,
+                on_progress=checkpoint.record_progress,
+                already_applied=(
+                    (lambda chunk: self._chunk_already_applied(presentation_id, chunk))
+                    if resuming else None
+                )
+            )
+            return {'failed': result['failed']}
+        
+        return self._run_step(checkpoint, 'content', apply)
+    
+    def _simple_create_body(self, title: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the presentations.create body for build_simple_presentation.
+        
+        Args:
+            title: Presentation title
+            settings: Presentation-level settings (pageOrientation)
+            
+        Returns:
+            Request body with title and page size
+        """
+        page_orientation = settings.get('pageOrientation', '16:9')
+        
+        # Define page size based on aspect ratio
+        # Google Slides uses EMU (English Metric Units)
+        # 1 inch = 914400 EMU, standard slide is 10" x 7.5" for 4:3
+        page_sizes = {
+            '16:9': {'width': 9144000, 'height': 5143500},  # 10" x 5.625"
+            '4:3': {'width': 9144000, 'height': 6858000},   # 10" x 7.5"
+            '1:1': {'width': 6858000, 'height': 6858000},   # 7.5" x 7.5"
+            '9:16': {'width': 5143500, 'height': 9144000},  # 5.625" x 10"
+            # Legacy support
+            'horizontal': {'width': 9144000, 'height': 5143500},
+            'vertical': {'width': 5143500, 'height': 9144000}
+        }
+        
+        size = page_sizes.get(page_orientation, page_sizes['16:9'])
+        return {
+            'title': title,
+            'pageSize': {
+                'width': {'magnitude': size['width'], 'unit': 'EMU'},
+                'height': {'magnitude': size['height'], 'unit': 'EMU'}
+            }
+        }
+    
+    def _simple_content_requests(
+        self,
+        slides_data: list,
+        slide_ids: list,
+        settings: Dict[str, Any],
+        layout_state: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily generate content requests of build_simple_presentation."""
+        for idx, slide_data in enumerate(slides_data):
+            if layout_state is None:
+                yield from self._build_advanced_slide_content(slide_data, slide_ids[idx], idx, settings)
+            else:
+                yield from self._build_layout_slide_content(slide_data, slide_ids[idx], settings, layout_state)
+    
+    def _use_layout_mode(self, layout_mode: Optional[bool], settings: Dict[str, Any]) -> bool:
+        """
+        Decide whether build_simple_presentation uses layout mode.
+        
+        An explicit argument wins over the 'layoutMode' presentation
+        setting, which wins over ``generation.layout_mode`` in the config.
+        """
+        if layout_mode is not None:
+            return bool(layout_mode)
+        if settings.get('layoutMode') is not None:
+            return bool(settings['layoutMode'])
+        try:
+            from ..utils.config import get_config
+            return bool(get_config().get('generation.layout_mode', False))
+        except Exception:
+            return False
+    
+    def _layout_install_requests(self, layout_state: Dict[str, Any]) -> list:
+        """Requests installing the common text style into the layout."""
+        style = layout_state['style']
+        return install_requests(layout_state['layout'], style, self._hex_to_rgb(style['text_color']))
+    
+    def _install_layout(
+        self,
+        presentation_id: str,
+        slides_data: list,
+        settings: Dict[str, Any],
+        operation: str
+    ) -> Dict[str, Any]:
+        """
+        Install the deck's common text style into the layout (step 'layout').
+        
+        Restyling is idempotent, so a retried step simply reapplies it.
+        
+        Args:
+            presentation_id: Target presentation ID
+            slides_data: Editor slides (to find the common style)
+            settings: Presentation-level settings
+            operation: Operation name for logging
+            
+        Returns:
+            Dictionary with the layout (see layout_mode.find_layout) and the
+            installed style
+        """
+        presentation = self.slides_service.presentations().get(
+            presentationId=presentation_id,
+            fields='layouts(objectId,layoutProperties,pageElements(objectId,size,shape(placeholder)))'
+        ).execute()
+        
+        layout_state = {
+            'layout': find_layout(presentation.get('layouts', [])),
+            'style': dominant_style([
+                text_style(slide_data, settings) for slide_data in slides_data
+            ])
+        }
+        self._batch_update(presentation_id, self._layout_install_requests(layout_state), operation)
+        
+        logger.info(
+            f"Installed text style into layout {layout_state['layout']['layout_id']}",
+            operation=operation,
+            presentation_id=presentation_id,
+            style=layout_state['style']
+        )
+        return layout_state
+    
+    def _designed_content_requests(
+        self,
+        slides: list,
+        slide_ids: list,
+        inherited_background: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily generate content requests of build/update_presentation."""
+        for idx, slide_data in enumerate(slides):
+            yield from self._build_slide_content(slide_data, slide_ids[idx], idx, inherited_background)
+    
+    def _designed_title(self, designed_data: Dict[str, Any]) -> str:
+        """Title of the presentation created by build_presentation."""
+        return f"{designed_data.get('title', 'Untitled')} (Designed)"
+    
+    def _plan(
+        self,
+        operation: str,
+        title: str,
+        create_body: Dict[str, Any],
+        slide_count: int,
+        make_content: Callable[[list], Iterable[Dict[str, Any]]],
+        include_requests: bool,
+        layout_state: Optional[Dict[str, Any]] = None,
+        copy_source: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Describe a new-presentation generation without calling the API.
+        
+        Args:
+            operation: Builder operation the plan describes
+            title: Presentation title
+            create_body: presentations.create request body
+            slide_count: Number of slides
+            make_content: Callable taking slide IDs and returning content requests
+            include_requests: Include the request lists in the plan
+            layout_state: Layout mode layout and style (None = text box mode)
+            copy_source: Master deck copied instead of creating (create_body
+                is then the files.copy body)
+            
+        Returns:
+            Plan dictionary (see presentation_design.generation.plan)
+        """
+        self._dry_run_uploads = []
+        try:
+            steps = [describe_create(create_body, copy_source)]
+            if layout_state is not None:
+                steps.append(describe_step('layout', self._layout_install_requests(layout_state),
+                                           self.batch_planner, self.request_optimizer, include_requests))
+            
+            slide_ids, slide_requests = self._slide_requests(
+                slide_count,
+                [{'objectId': DEFAULT_SLIDE_PLACEHOLDER}],
+                layout_state['layout'] if layout_state else None
+            )
+            steps += [
+                describe_step('slides', slide_requests, self.batch_planner,
+                              self.request_optimizer, include_requests),
+                describe_step('content', make_content(slide_ids), self.batch_planner,
+                              self.request_optimizer, include_requests)
+            ]
+            uploads = self._dry_run_uploads
+        finally:
+            self._dry_run_uploads = None
+        
+        plan = finalize_plan(operation, title, steps, self.batch_planner, uploads)
+        
+        logger.info(
+            f"Planned {plan['totals']['requests']} requests in {plan['totals']['batches']} batch(es)",
+            operation=operation,
+            payload_bytes=plan['totals']['bytes'],
+            api_calls=plan['totals']['api_calls'],
+            digest=plan['digest']
+        )
+        return plan
+    
+    def plan_simple_presentation(
+        self,
+        slides_data: list,
+        title: str = "New Presentation",
+        settings: dict = None,
+        include_requests: bool = True,
+        layout_mode: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Dry run of build_simple_presentation: plan requests, call no API.
+        
+        Data-URL images are not uploaded; their requests reference a
+        placeholder Drive URL and the plan lists them under 'uploads'. In
+        layout mode the layout's IDs and placeholder sizes are not known
+        before the presentation exists; the plan uses nominal ones.
+        
+        Args:
+            slides_data: Slides as passed to build_simple_presentation
+            title: Presentation title
+            settings: Presentation-level settings
+            include_requests: Include the request lists in the plan
+            layout_mode: As for build_simple_presentation
+            
+        Returns:
+            Plan dictionary with ordered requests, counts, byte sizes and
+            batch boundaries per step
+        """
+        settings = settings or {}
+        layout_state = None
+        if self._use_layout_mode(layout_mode, settings):
+            layout_state = {
+                'layout': NOMINAL_LAYOUT,
+                'style': dominant_style([
+                    text_style(slide_data, settings) for slide_data in slides_data
+                ])
+            }
+        
+        return self._plan(
+            "build_simple_presentation",
+            title,
+            self._simple_create_body(title, settings),
+            len(slides_data),
+            lambda slide_ids: self._simple_content_requests(slides_data, slide_ids, settings, layout_state),
+            include_requests,
+            layout_state
+        )
+    
+    def plan_presentation(self, designed_data: Dict[str, Any], include_requests: bool = True) -> Dict[str, Any]:
+        """
+        Dry run of build_presentation: plan requests, call no API.
+        
+        Args:
+            designed_data: Designed presentation specification
+            include_requests: Include the request lists in the plan
+            
+        Returns:
+            Plan dictionary with ordered requests, counts, byte sizes and
+            batch boundaries per step
+        """
+        title = self._designed_title(designed_data)
+        slides = designed_data.get('slides', [])
+        master_deck = designed_data.get('master_deck') or {}
+        return self._plan(
+            "build_presentation",
+            title,
+            {'name': title} if master_deck else {'title': title},
+            len(slides),
+            lambda slide_ids: self._designed_content_requests(
+                slides, slide_ids, master_deck.get('background_color')
+            ),
+            include_requests,
+            copy_source=master_deck.get('presentation_id')
+        )
+    
+    def build_simple_presentation(
+        self,
+        slides_data: list,
+        title: str = "New Presentation",
+        settings: dict = None,
+        checkpoint: Optional[GenerationCheckpoint] = None,
+        layout_mode: Optional[bool] = None
+    ) -> Dict[str, Any]:
         """
         Build new presentation with advanced formatting options.
         Supports custom fonts, text positioning, images, tables, and arrows.
         
+        Generation is checkpointed: pass the checkpoint from a previous
+        GenerationRetry to resume where that attempt stopped.
+        
+        In layout mode the common text style is installed once into the
+        TITLE_AND_BODY layout and slides are created from it, so titles and
+        bodies need a single insertText each instead of a text box plus
+        styling requests.
+        
         Args:
             slides_data: List of slides with 'title', 'mainText', and optional advanced features
             title: Presentation title
             settings: Presentation-level settings (orientation, default font, etc.)
+            checkpoint: Progress of a previous attempt (default: start fresh)
+            layout_mode: Use layout mode (None = 'layoutMode' setting, then
+                ``generation.layout_mode`` in the config)
             
         Returns:
             Dictionary with presentation_id and presentation_url
+            
+        Raises:
+            GenerationRetry: If a step failed with a transient error
+            BuilderError: If building failed permanently
         """
+        operation = "build_simple_presentation"
+        checkpoint = checkpoint or GenerationCheckpoint()
+        self._checkpoint = checkpoint
+        
         try:
             self._ensure_service()
             
@@ -67,136 +711,72 @@ class PresentationBuilder:
             
             page_orientation = settings.get('pageOrientation', '16:9')
             
-            # Define page size based on aspect ratio
-            # Google Slides uses EMU (English Metric Units)
-            # 1 inch = 914400 EMU, standard slide is 10" x 7.5" for 4:3
-            page_sizes = {
-                '16:9': {'width': 9144000, 'height': 5143500},  # 10" x 5.625"
-                '4:3': {'width': 9144000, 'height': 6858000},   # 10" x 7.5"
-                '1:1': {'width': 6858000, 'height': 6858000},   # 7.5" x 7.5"
-                '9:16': {'width': 5143500, 'height': 9144000},  # 5.625" x 10"
-                # Legacy support
-                'horizontal': {'width': 9144000, 'height': 5143500},
-                'vertical': {'width': 5143500, 'height': 9144000}
-            }
-            
-            size = page_sizes.get(page_orientation, page_sizes['16:9'])
-            page_size = {
-                'width': {'magnitude': size['width'], 'unit': 'EMU'},
-                'height': {'magnitude': size['height'], 'unit': 'EMU'}
-            }
+            # Step 1: create blank presentation with custom page size
+            fresh = not checkpoint.is_done('create')
+            created = self._run_step(checkpoint, 'create', lambda: self._create_presentation(
+                self._simple_create_body(title, settings)
+            ))
+            presentation_id = created['presentation_id']
             
-            # Create blank presentation with custom page size
-            presentation = self.slides_service.presentations().create(
-                body={
-                    'title': title,
-                    'pageSize': page_size
-                }
-            ).execute()
-            
-            presentation_id = presentation['presentationId']
+            if fresh:
+                logger.info(
+                    f"Created presentation: {title} ({page_orientation})",
+                    operation=operation,
+                    presentation_id=presentation_id
+                )
             
-            logger.info(
-                f"Created presentation: {title} ({page_orientation})",
-                operation="build_simple_presentation",
-                presentation_id=presentation_id
+            # Layout mode: install the common text style into the layout once
+            layout_state = None
+            if self._use_layout_mode(layout_mode, settings):
+                layout_state = self._run_step(checkpoint, 'layout', lambda: self._install_layout(
+                    presentation_id, slides_data, settings, operation
+                ))
+            
+            # Step 2: slides with deterministic IDs (replaces the default slide)
+            known_slides = [{'objectId': slide_id} for slide_id in created['slide_ids']] if fresh else None
+            slide_ids = self._run_step(checkpoint, 'slides', lambda: self._prepare_slides(
+                presentation_id, len(slides_data), operation, existing_slides=known_slides,
+                layout=layout_state['layout'] if layout_state else None
+            ))['slide_ids']
+            
+            # Step 3: content with advanced features, applied chunk by chunk.
+            # Requests are generated lazily so image uploads (each recorded in
+            # the checkpoint) overlap with the batchUpdate calls.
+            content = self._apply_content(
+                presentation_id,
+                lambda: self._simple_content_requests(slides_data, slide_ids, settings, layout_state),
+                checkpoint,
+                operation
             )
             
-            # Get the created presentation to get actual slide IDs
-            presentation = self.slides_service.presentations().get(
-                presentationId=presentation_id
-            ).execute()
-            
-            # Create additional slides if needed
-            requests = []
-            slide_count = len(slides_data)
-            
-            for idx in range(1, slide_count):
-                requests.append({
-                    'createSlide': {
-                        'insertionIndex': idx
-                    }
-                })
-            
-            # Execute slide creation first
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-                
-                # Refresh presentation to get new slide IDs
-                presentation = self.slides_service.presentations().get(
-                    presentationId=presentation_id
-                ).execute()
-            
-            # Now add content to each slide
-            requests = []
-            actual_slides = presentation.get('slides', [])
-            
-            for idx, slide_data in enumerate(slides_data):
-                if idx < len(actual_slides):
-                    actual_slide_id = actual_slides[idx]['objectId']
-                    
-                    # Delete default layout elements (title/body placeholders)
-                    slide = actual_slides[idx]
-                    for element in slide.get('pageElements', []):
-                        requests.append({
-                            'deleteObject': {
-                                'objectId': element['objectId']
-                            }
-                        })
-            
-            # Execute deletions
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-                requests = []
-            
-            # Add content with advanced features
-            for idx, slide_data in enumerate(slides_data):
-                if idx < len(actual_slides):
-                    actual_slide_id = actual_slides[idx]['objectId']
-                    slide_requests = self._build_advanced_slide_content(
-                        slide_data, actual_slide_id, idx, settings
-                    )
-                    requests.extend(slide_requests)
-            
-            # Apply all content updates in batch
-            if requests:
-                # Split into batches if too large (max 500 requests per batch)
-                batch_size = 500
-                for i in range(0, len(requests), batch_size):
-                    batch = requests[i:i + batch_size]
-                    self.slides_service.presentations().batchUpdate(
-                        presentationId=presentation_id,
-                        body={'requests': batch}
-                    ).execute()
-            
             presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
             
             logger.info(
                 f"Presentation built successfully",
-                operation="build_simple_presentation",
+                operation=operation,
                 presentation_id=presentation_id,
-                url=presentation_url
+                url=presentation_url,
+                attempts=checkpoint.attempt + 1
             )
             
             return {
                 'presentation_id': presentation_id,
                 'presentation_url': presentation_url,
-                'title': title
+                'title': title,
+                'failed_requests': content['failed']
             }
             
+        except GenerationRetry:
+            raise
         except Exception as e:
             logger.error(
                 f"Failed to build presentation: {e}",
-                operation="build_simple_presentation",
+                operation=operation,
                 exc_info=True
             )
             raise BuilderError(f"Failed to build presentation: {e}") from e
+        finally:
+            self._checkpoint = None
     
     def _build_plain_slide_content(self, slide_data: Dict[str, Any], slide_id: str, index: int) -> list:
         """
@@ -295,87 +875,76 @@ class PresentationBuilder:
         
         return requests
     
-    @retry_on_network_error()
-    def build_presentation(self, designed_data: Dict[str, Any]) -> Dict[str, Any]:
+    def build_presentation(self, designed_data: Dict[str, Any], checkpoint: Optional[GenerationCheckpoint] = None) -> Dict[str, Any]:
         """
         Build new presentation from designed specification.
         
+        If the designed data names a template master deck, the deck is
+        copied with Drive instead of creating a blank presentation, and
+        slides whose background matches the deck's inherit it.
+        
         Args:
             designed_data: Designed presentation specification
+            checkpoint: Progress of a previous attempt (default: start fresh)
             
         Returns:
             Dictionary with presentation_id and presentation_url
+            
+        Raises:
+            GenerationRetry: If a step failed with a transient error
+            BuilderError: If building failed permanently
         """
+        operation = "build_presentation"
+        checkpoint = checkpoint or GenerationCheckpoint()
+        self._checkpoint = checkpoint
+        
         try:
             self._ensure_service()
             
-            # Create blank presentation
-            title = f"{designed_data.get('title', 'Untitled')} (Designed)"
-            presentation = self.slides_service.presentations().create(
-                body={'title': title}
-            ).execute()
-            
-            presentation_id = presentation['presentationId']
+            # Step 1: copy the template master deck, or create a blank presentation
+            title = self._designed_title(designed_data)
+            master_deck = designed_data.get('master_deck') or {}
+            fresh = not checkpoint.is_done('create')
+            if master_deck:
+                created = self._run_step(checkpoint, 'create', lambda: self._copy_master_deck(
+                    master_deck['presentation_id'], title
+                ))
+            else:
+                created = self._run_step(checkpoint, 'create', lambda: self._create_presentation({'title': title}))
+            presentation_id = created['presentation_id']
+            
+            if fresh:
+                logger.info(
+                    f"Created presentation: {title}",
+                    operation=operation,
+                    presentation_id=presentation_id,
+                    master_deck_id=master_deck.get('presentation_id')
+                )
             
-            logger.info(
-                f"Created presentation: {title}",
-                operation="build_presentation",
-                presentation_id=presentation_id
+            # Step 2: slides with deterministic IDs
+            slides = designed_data.get('slides', [])
+            known_slides = None
+            if fresh and created['slide_ids'] is not None:
+                known_slides = [{'objectId': slide_id} for slide_id in created['slide_ids']]
+            slide_ids = self._run_step(checkpoint, 'slides', lambda: self._prepare_slides(
+                presentation_id, len(slides), operation, existing_slides=known_slides
+            ))['slide_ids']
+            
+            # Step 3: content, applied chunk by chunk
+            content = self._apply_content(
+                presentation_id,
+                lambda: self._designed_content_requests(
+                    slides, slide_ids, master_deck.get('background_color')
+                ),
+                checkpoint,
+                operation
             )
             
-            # Get the created presentation to get actual slide IDs
-            presentation = self.slides_service.presentations().get(
-                presentationId=presentation_id
-            ).execute()
-            
-            # Build slides
-            requests = []
-            slide_count = len(designed_data.get('slides', []))
-            
-            # Create additional slides if needed
-            for idx in range(1, slide_count):
-                requests.append({
-                    'createSlide': {
-                        'insertionIndex': idx
-                    }
-                })
-            
-            # Execute slide creation first
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-                
-                # Refresh presentation to get new slide IDs
-                presentation = self.slides_service.presentations().get(
-                    presentationId=presentation_id
-                ).execute()
-            
-            # Now build content for each slide
-            requests = []
-            actual_slides = presentation.get('slides', [])
-            
-            for idx, slide_data in enumerate(designed_data.get('slides', [])):
-                if idx < len(actual_slides):
-                    actual_slide_id = actual_slides[idx]['objectId']
-                    slide_requests = self._build_slide_content(
-                        slide_data, actual_slide_id, idx
-                    )
-                    requests.extend(slide_requests)
-            
-            # Apply all content updates in batch
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-            
             presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
             
             logger.info(
                 f"Presentation built successfully",
-                operation="build_presentation",
+                operation=operation,
                 presentation_id=presentation_id,
                 url=presentation_url
             )
@@ -383,126 +952,80 @@ class PresentationBuilder:
             return {
                 'presentation_id': presentation_id,
                 'presentation_url': presentation_url,
-                'title': title
+                'title': title,
+                'failed_requests': content['failed']
             }
             
+        except GenerationRetry:
+            raise
         except Exception as e:
             logger.error(
                 f"Failed to build presentation: {e}",
-                operation="build_presentation",
+                operation=operation,
                 exc_info=True
             )
             raise BuilderError(f"Failed to build presentation: {e}") from e
+        finally:
+            self._checkpoint = None
     
-    @retry_on_network_error()
-    def update_presentation(self, presentation_id: str, designed_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update_presentation(
+        self,
+        presentation_id: str,
+        designed_data: Dict[str, Any],
+        checkpoint: Optional[GenerationCheckpoint] = None
+    ) -> Dict[str, Any]:
         """
         Update existing presentation with new designed content.
         
         Args:
             presentation_id: ID of existing presentation to update
             designed_data: Designed presentation specification
+            checkpoint: Progress of a previous attempt (default: start fresh)
             
         Returns:
             Dictionary with presentation_id and presentation_url
+            
+        Raises:
+            GenerationRetry: If a step failed with a transient error
+            BuilderError: If updating failed permanently
         """
+        operation = "update_presentation"
+        checkpoint = checkpoint or GenerationCheckpoint()
+        self._checkpoint = checkpoint
+        
         try:
             self._ensure_service()
             
             logger.info(
                 f"Updating presentation: {presentation_id}",
-                operation="update_presentation",
+                operation=operation,
                 presentation_id=presentation_id
             )
             
-            # Get current presentation
-            presentation = self.slides_service.presentations().get(
-                presentationId=presentation_id
-            ).execute()
-            
-            existing_slides = presentation.get('slides', [])
-            needed_slides = len(designed_data.get('slides', []))
-            
-            requests = []
-            
-            # Delete all existing slides except the first one
-            for idx in range(len(existing_slides) - 1, 0, -1):
-                requests.append({
-                    'deleteObject': {
-                        'objectId': existing_slides[idx]['objectId']
-                    }
-                })
-            
-            # Execute deletions
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-                requests = []
-            
-            # Create new slides if needed
-            for idx in range(1, needed_slides):
-                requests.append({
-                    'createSlide': {
-                        'insertionIndex': idx
-                    }
-                })
-            
-            # Execute slide creation
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-                requests = []
-                
-                # Refresh to get new slide IDs
-                presentation = self.slides_service.presentations().get(
-                    presentationId=presentation_id
-                ).execute()
-            
-            # Clear all content from first slide and rebuild
-            actual_slides = presentation.get('slides', [])
-            
-            # Delete all page elements from all slides
-            for slide in actual_slides:
-                for element in slide.get('pageElements', []):
-                    requests.append({
-                        'deleteObject': {
-                            'objectId': element['objectId']
-                        }
-                    })
-            
-            # Execute deletions
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
-                requests = []
-            
-            # Now build content for each slide
-            for idx, slide_data in enumerate(designed_data.get('slides', [])):
-                if idx < len(actual_slides):
-                    actual_slide_id = actual_slides[idx]['objectId']
-                    slide_requests = self._build_slide_content(
-                        slide_data, actual_slide_id, idx
-                    )
-                    requests.extend(slide_requests)
-            
-            # Apply all content updates in batch
-            if requests:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests}
-                ).execute()
+            # The presentation already exists; record it as the 'create' step
+            if not checkpoint.is_done('create'):
+                checkpoint.complete('create', {'presentation_id': presentation_id, 'slide_ids': []})
+            
+            # Step 2: reuse/create/delete slides so exactly the needed ones remain
+            slides = designed_data.get('slides', [])
+            prepared = self._run_step(checkpoint, 'slides', lambda: self._prepare_slides(
+                presentation_id, len(slides), operation
+            ))
+            slide_ids = prepared['slide_ids']
+            
+            # Step 3: content, applied chunk by chunk
+            content = self._apply_content(
+                presentation_id,
+                lambda: self._designed_content_requests(slides, slide_ids),
+                checkpoint,
+                operation
+            )
             
             presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}/edit"
             
             logger.info(
                 f"Presentation updated successfully",
-                operation="update_presentation",
+                operation=operation,
                 presentation_id=presentation_id,
                 url=presentation_url
             )
@@ -510,18 +1033,29 @@ class PresentationBuilder:
             return {
                 'presentation_id': presentation_id,
                 'presentation_url': presentation_url,
-                'title': presentation.get('title', 'Updated Presentation')
+                'title': prepared.get('title') or 'Updated Presentation',
+                'failed_requests': content['failed']
             }
             
+        except GenerationRetry:
+            raise
         except Exception as e:
             logger.error(
                 f"Failed to update presentation: {e}",
-                operation="update_presentation",
+                operation=operation,
                 exc_info=True
             )
             raise BuilderError(f"Failed to update presentation: {e}") from e
+        finally:
+            self._checkpoint = None
     
-    def _build_slide_content(self, slide_data: Dict[str, Any], slide_id: str, index: int) -> list:
+    def _build_slide_content(
+        self,
+        slide_data: Dict[str, Any],
+        slide_id: str,
+        index: int,
+        inherited_background: Optional[str] = None
+    ) -> list:
         """
         Generate batch update requests for slide content.
         
@@ -529,6 +1063,8 @@ class PresentationBuilder:
             slide_data: Designed slide specification
             slide_id: Actual slide ID in the new presentation
             index: Slide index
+            inherited_background: Background the slide inherits from a
+                master deck (a matching background is not set again)
             
         Returns:
             List of batch update requests
@@ -537,21 +1073,22 @@ class PresentationBuilder:
         
         # Apply slide background color
         background_color = slide_data.get('background_color', '#FFFFFF')
-        requests.append({
-            'updatePageProperties': {
-                'objectId': slide_id,
-                'pageProperties': {
-                    'pageBackgroundFill': {
-                        'solidFill': {
-                            'color': {
-                                'rgbColor': self._hex_to_rgb(background_color)
+        if inherited_background is None or background_color.upper() != inherited_background.upper():
+            requests.append({
+                'updatePageProperties': {
+                    'objectId': slide_id,
+                    'pageProperties': {
+                        'pageBackgroundFill': {
+                            'solidFill': {
+                                'color': {
+                                    'rgbColor': self._hex_to_rgb(background_color)
+                                }
                             }
                         }
-                    }
-                },
-                'fields': 'pageBackgroundFill'
-            }
-        })
+                    },
+                    'fields': 'pageBackgroundFill'
+                }
+            })
         
         # Add text elements to the slide
         element_count = 0
@@ -747,10 +1284,7 @@ class PresentationBuilder:
         Returns:
             RGB color dict with values 0-1
         """
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
+        r, g, b = _rgb_components(hex_color)
         return {'red': r, 'green': g, 'blue': b}
     
     def _pt_to_emu(self, pt: float) -> int:
@@ -765,46 +1299,6 @@ class PresentationBuilder:
         """
         return int(pt * 12700)
     
-    def _html_to_plain_text(self, html_text: str) -> str:
-        """
-        Convert HTML from contenteditable to plain text.
-        Removes HTML tags while preserving text content and line breaks.
-        
-        Args:
-            html_text: HTML string from contenteditable editor
-            
-        Returns:
-            Plain text without HTML tags
-        """
-        import re
-        from html import unescape
-        
-        # Replace <br> and </div><div> with newlines before removing tags
-        text = re.sub(r'<br\s*/?>', '\n', html_text)
-        text = re.sub(r'</div><div>', '\n', text)
-        text = re.sub(r'</p><p>', '\n\n', text)
-        
-        # Convert list items to bullet points (handle </li> before <li>)
-        text = re.sub(r'</li>\s*<li[^>]*>', '\n• ', text)  # Between items
-        text = re.sub(r'<li[^>]*>', '• ', text)  # First item
-        text = re.sub(r'</li>', '', text)  # Remove closing tags
-        
-        # Remove all remaining HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Decode HTML entities
-        text = unescape(text)
-        
-        # Clean up multiple newlines and spaces
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Max 2 newlines
-        text = re.sub(r' +', ' ', text)  # Multiple spaces to single
-        
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-        
-        return text.strip()
-    
     def _build_advanced_slide_content(self, slide_data: Dict[str, Any], slide_id: str, index: int, settings: dict) -> list:
         """
         Generate batch update requests for slide with plain text content.
@@ -819,51 +1313,24 @@ class PresentationBuilder:
         Returns:
             List of batch update requests
         """
-        requests = []
-        
-        # Apply background if specified
-        background = slide_data.get('background', {})
-        bg_type = background.get('type', 'none')
-        
-        if bg_type == 'solid' or bg_type == 'gradient':
-            # Use solid color for both solid and gradient (Google Slides doesn't support gradients)
-            color = background.get('color', '#FFFFFF')
-            requests.append({
-                'updatePageProperties': {
-                    'objectId': slide_id,
-                    'pageProperties': {
-                        'pageBackgroundFill': {
-                            'solidFill': {
-                                'color': {
-                                    'rgbColor': self._hex_to_rgb(color)
-                                }
-                            }
-                        }
-                    },
-                    'fields': 'pageBackgroundFill'
-                }
-            })
-        
-        title = slide_data.get('title', '').strip()
-        main_text = slide_data.get('mainText', '').strip()
+        requests = self._slide_background_requests(slide_data, slide_id)
         
-        # Parse HTML from contenteditable if present
-        if main_text and ('<' in main_text):
-            main_text = self._html_to_plain_text(main_text)
+        title, body = self._slide_text(slide_data)
+        main_text = inserted_text(body)
         
-        font_family = slide_data.get('fontFamily', settings.get('defaultFont', 'Arial'))
-        title_size = slide_data.get('titleSize', 44)
-        text_size = slide_data.get('textSize', 18)
-        text_color = slide_data.get('textColor', '#000000')
+        style = text_style(slide_data, settings)
+        font_family = style['font_family']
+        title_size = style['title_size']
+        text_size = style['text_size']
+        text_color = style['text_color']
         
         # Get text positioning
-        text_position = slide_data.get('textPosition', settings.get('defaultTextPosition', {}))
-        vertical = text_position.get('vertical', 'top')
-        horizontal = text_position.get('horizontal', 'left')
+        vertical = style['vertical']
+        horizontal = style['horizontal']
         
         # Calculate positions
-        vertical_positions = {'top': 635000, 'center': 3200000, 'bottom': 5715000}
-        horizontal_positions = {'left': 635000, 'center': 1905000, 'right': 3175000}
+        vertical_positions = VERTICAL_POSITIONS
+        horizontal_positions = HORIZONTAL_POSITIONS
         
         y_title = vertical_positions.get(vertical, 635000)
         x_pos = horizontal_positions.get(horizontal, 635000)
@@ -1036,6 +1503,110 @@ class PresentationBuilder:
                     'fields': 'contentAlignment'
                 }
             })
+            
+            # Bold/italic ranges and lists from the editor HTML
+            requests.extend(rich_text_requests(element_id, body))
+        
+        requests.extend(self._slide_extras(slide_data, slide_id))
+        
+        return requests
+    
+    def _slide_background_requests(self, slide_data: Dict[str, Any], slide_id: str) -> list:
+        """Requests applying an editor slide's background color."""
+        requests = []
+        
+        # Apply background if specified
+        background = slide_data.get('background', {})
+        bg_type = background.get('type', 'none')
+        
+        if bg_type == 'solid' or bg_type == 'gradient':
+            # Use solid color for both solid and gradient (Google Slides doesn't support gradients)
+            color = background.get('color', '#FFFFFF')
+            requests.append({
+                'updatePageProperties': {
+                    'objectId': slide_id,
+                    'pageProperties': {
+                        'pageBackgroundFill': {
+                            'solidFill': {
+                                'color': {
+                                    'rgbColor': self._hex_to_rgb(color)
+                                }
+                            }
+                        }
+                    },
+                    'fields': 'pageBackgroundFill'
+                }
+            })
+        
+        return requests
+    
+    def _slide_text(self, slide_data: Dict[str, Any]) -> Tuple[str, RichText]:
+        """Return an editor slide's title (plain text) and main text (rich text)."""
+        title = slide_data.get('title', '').strip()
+        main_text = slide_data.get('mainText', '').strip()
+        
+        # Parse HTML from contenteditable if present
+        if '<' in main_text:
+            return title, html_to_rich_text(main_text)
+        
+        return title, plain_rich_text(main_text)
+    
+    def _build_layout_slide_content(
+        self,
+        slide_data: Dict[str, Any],
+        slide_id: str,
+        settings: dict,
+        layout_state: Dict[str, Any]
+    ) -> list:
+        """
+        Generate layout mode requests for a slide created from the layout.
+        
+        Title and body go into the slide's placeholders; unused placeholders
+        are deleted and only style fields differing from the installed
+        layout style are sent.
+        
+        Args:
+            slide_data: Slide with title, mainText, and optional images/tables/arrows
+            slide_id: Actual slide ID in the presentation
+            settings: Presentation-level settings
+            layout_state: Installed layout and style (step 'layout')
+            
+        Returns:
+            List of batch update requests
+        """
+        requests = self._slide_background_requests(slide_data, slide_id)
+        
+        title, body = self._slide_text(slide_data)
+        style = text_style(slide_data, settings)
+        rgb = self._hex_to_rgb(style['text_color'])
+        ids = placeholder_ids(slide_id)
+        
+        for placeholder_type, text in (('TITLE', title), ('BODY', inserted_text(body))):
+            if not text:
+                requests.append({'deleteObject': {'objectId': ids[placeholder_type]}})
+                continue
+            
+            requests.append({
+                'insertText': {
+                    'objectId': ids[placeholder_type],
+                    'text': text,
+                    'insertionIndex': 0
+                }
+            })
+            requests.extend(override_requests(
+                layout_state['layout'], slide_id, placeholder_type, style,
+                layout_state['style'], rgb, has_title=bool(title)
+            ))
+            if placeholder_type == 'BODY':
+                requests.extend(rich_text_requests(ids['BODY'], body))
+        
+        requests.extend(self._slide_extras(slide_data, slide_id))
+        
+        return requests
+    
+    def _slide_extras(self, slide_data: Dict[str, Any], slide_id: str) -> list:
+        """Requests adding an editor slide's images, tables, arrows and accent boxes."""
+        requests = []
         
         # Separate images by layer
         all_images = slide_data.get('images', [])
@@ -1191,9 +1762,21 @@ class PresentationBuilder:
                 data_url_length=len(url)
             )
             
-            # Generate unique file name
-            file_name = f"slide_{slide_id}_image_{index}"
-            url = self._upload_image_to_drive(url, file_name)
+            # Reuse an upload recorded by a previous attempt of this job
+            image_key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+            uploaded_url = self._checkpoint.image_url(image_key) if self._checkpoint else None
+            
+            if self._dry_run_uploads is not None:
+                self._dry_run_uploads.append({'image_id': image_id, 'key': image_key, 'data_url_bytes': len(url)})
+                url = DRY_RUN_IMAGE_URL.format(key=image_key)
+            elif uploaded_url:
+                url = uploaded_url
+            else:
+                # Generate unique file name
+                file_name = f"slide_{slide_id}_image_{index}"
+                url = self._upload_image_to_drive(url, file_name)
+                if self._checkpoint:
+                    self._checkpoint.record_image(image_key, url)
             
             logger.info(
                 f"Image uploaded, using Drive URL",
@@ -0,0 +1,435 @@
+"""
+Request Optimizer Module
+========================
+
+Rewrites Slides API batchUpdate request lists before they are planned
+into chunks and sent.
+
+Builders emit one createShape, insertText and three styling requests per
+text box, repeating the same style payload on every slide. The optimizer
+is a streaming pass (it accepts the same lazy generators as the batch
+planner) that:
+
+    - drops styling that cannot change anything: updates with an empty
+      field mask, and fields set to the value a freshly created text box
+      already has (see NEW_TEXT_BOX_DEFAULTS)
+    - merges compatible style updates to the same object that are only
+      separated by other style updates (same range: masks are unioned;
+      touching fixed ranges with an identical style: ranges are joined)
+    - interns identical style subtrees so repeated payloads share one
+      object in memory
+
+Only style updates are rewritten, and they are never moved across a
+request of another kind, so object creation and text edits keep their
+order. The output is deterministic for the same input, which keeps
+checkpointed chunk resume valid.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+from .batch_planner import request_size
+
+logger = get_logger(__name__)
+
+# Style update kind -> key holding its property payload
+STYLE_UPDATE_TYPES = {
+    'updateTextStyle': 'style',
+    'updateParagraphStyle': 'style',
+    'updateShapeProperties': 'shapeProperties',
+    'updatePageProperties': 'pageProperties'
+}
+
+# Values a TEXT_BOX created by createShape already has; setting them again
+# before any other update touched the field is a no-op
+NEW_TEXT_BOX_DEFAULTS = {
+    'updateParagraphStyle': {'alignment': 'START'},
+    'updateShapeProperties': {'contentAlignment': 'TOP'}
+}
+
+# Fixed ranges may be joined when they touch; paragraph styles apply to
+# whole paragraphs, so a gap of one character (the newline) is allowed
+RANGE_JOIN_GAP = {
+    'updateTextStyle': 0,
+    'updateParagraphStyle': 1
+}
+
+
+def new_stats() -> Dict[str, int]:
+    """Return an empty optimizer statistics dictionary."""
+    return {
+        'requests_in': 0,
+        'requests_out': 0,
+        'bytes_in': 0,
+        'bytes_out': 0,
+        'dropped': 0,
+        'merged': 0,
+        'fields_pruned': 0,
+        'interned': 0
+    }
+
+
+def _mask_fields(mask: str) -> List[str]:
+    return [field.strip() for field in mask.split(',') if field.strip()]
+
+
+def _range_key(body: Dict[str, Any]) -> Optional[Tuple]:
+    text_range = body.get('textRange')
+    if text_range is None:
+        return None
+    return (text_range.get('type'), text_range.get('startIndex'), text_range.get('endIndex'))
+
+
+class RequestOptimizer:
+    """
+    Streaming optimizer for batchUpdate request lists.
+
+    Attributes:
+        enabled (bool): When False requests pass through unchanged (still counted)
+        drop_defaults (bool): Prune fields equal to new text box defaults
+        merge (bool): Merge compatible style updates
+        intern (bool): Share identical style subtrees
+        window (int): Maximum style updates held back for merging
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        drop_defaults: bool = True,
+        merge: bool = True,
+        intern: bool = True,
+        window: int = 64
+    ):
+        """
+        Initialize request optimizer.
+
+        Args:
+            enabled: Apply the optimization passes
+            drop_defaults: Prune fields equal to new text box defaults
+            merge: Merge compatible style updates to the same object
+            intern: Share identical style subtrees between requests
+            window: Maximum style updates held back while looking for merges
+        """
+        self.enabled = enabled
+        self.drop_defaults = drop_defaults
+        self.merge = merge
+        self.intern = intern
+        self.window = max(1, window)
+
+    def optimize(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        stats: Optional[Dict[str, int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Optimize requests lazily.
+
+        Input requests are not modified; rewritten requests are new
+        dictionaries.
+
+        Args:
+            requests: Slides API requests in execution order (may be a generator)
+            stats: Dictionary from new_stats() updated while iterating
+
+        Yields:
+            Optimized requests in execution order
+        """
+        if stats is None:
+            stats = new_stats()
+
+        if not self.enabled:
+            for request in requests:
+                size = request_size(request)
+                stats['requests_in'] += 1
+                stats['requests_out'] += 1
+                stats['bytes_in'] += size
+                stats['bytes_out'] += size
+                yield request
+            return
+
+        state = _PassState()
+        pending: List[Dict[str, Any]] = []
+
+        def emit(request: Dict[str, Any]) -> Dict[str, Any]:
+            kind = next(iter(request), None)
+            if self.intern and kind in STYLE_UPDATE_TYPES:
+                request = {kind: self._intern_payload(kind, request[kind], state, stats)}
+            stats['requests_out'] += 1
+            stats['bytes_out'] += request_size(request)
+            return request
+
+        for request in requests:
+            stats['requests_in'] += 1
+            stats['bytes_in'] += request_size(request)
+
+            kind = next(iter(request), None)
+            if kind not in STYLE_UPDATE_TYPES:
+                for held in pending:
+                    yield emit(held)
+                pending = []
+                state.observe(kind, request.get(kind) or {})
+                yield emit(request)
+                continue
+
+            rewritten = self._prune(kind, request[kind], state, stats)
+            if rewritten is None:
+                stats['dropped'] += 1
+                continue
+
+            if self.merge and self._merge_into(pending, kind, rewritten):
+                stats['merged'] += 1
+                continue
+
+            pending.append({kind: rewritten})
+            if len(pending) > self.window:
+                yield emit(pending.pop(0))
+
+        for held in pending:
+            yield emit(held)
+
+    def optimize_list(self, requests: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Optimize requests eagerly.
+
+        Args:
+            requests: Slides API requests in execution order
+
+        Returns:
+            Tuple of (optimized requests, statistics)
+        """
+        stats = new_stats()
+        optimized = list(self.optimize(requests, stats))
+        return optimized, stats
+
+    def _prune(
+        self,
+        kind: str,
+        body: Dict[str, Any],
+        state: "_PassState",
+        stats: Dict[str, int]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the update without no-op fields, or None if nothing is left."""
+        mask = body.get('fields', '')
+        fields = _mask_fields(mask)
+        if not fields:
+            return None
+
+        payload_key = STYLE_UPDATE_TYPES[kind]
+        payload = body.get(payload_key) or {}
+        object_id = body.get('objectId')
+        touched = state.touched.setdefault((object_id, kind), set())
+
+        if mask.strip() == '*':
+            touched.add('*')
+            return body
+
+        defaults = NEW_TEXT_BOX_DEFAULTS.get(kind, {}) if self.drop_defaults else {}
+        fresh = object_id in state.new_text_boxes and '*' not in touched
+
+        kept = []
+        for field in fields:
+            top = field.split('.')[0]
+            if (
+                fresh
+                and field == top
+                and top not in touched
+                and top in defaults
+                and payload.get(top) == defaults[top]
+            ):
+                stats['fields_pruned'] += 1
+                continue
+            kept.append(field)
+            touched.add(top)
+
+        if not kept:
+            return None
+        if len(kept) == len(fields):
+            return body
+
+        kept_tops = {field.split('.')[0] for field in kept}
+        rewritten = dict(body)
+        rewritten[payload_key] = {key: value for key, value in payload.items() if key in kept_tops}
+        rewritten['fields'] = ','.join(kept)
+        return rewritten
+
+    def _merge_into(self, pending: List[Dict[str, Any]], kind: str, body: Dict[str, Any]) -> bool:
+        """Merge an update into a held one, returning True on success."""
+        object_id = body.get('objectId')
+
+        # Updates of another kind or object commute with this one; the
+        # nearest same-kind update to the object is the only merge target
+        for position in range(len(pending) - 1, -1, -1):
+            held_kind = next(iter(pending[position]))
+            held = pending[position][held_kind]
+            if held_kind != kind or held.get('objectId') != object_id:
+                continue
+
+            merged = _merge_same_range(kind, held, body)
+            if merged is None:
+                merged = _merge_touching_ranges(kind, held, body)
+            if merged is None:
+                return False
+            pending[position] = {kind: merged}
+            return True
+
+        return False
+
+    def _intern_payload(
+        self,
+        kind: str,
+        body: Dict[str, Any],
+        state: "_PassState",
+        stats: Dict[str, int]
+    ) -> Dict[str, Any]:
+        payload_key = STYLE_UPDATE_TYPES[kind]
+        payload = body.get(payload_key)
+        if not isinstance(payload, dict):
+            return body
+        shared = state.intern(payload, stats)
+        if shared is payload:
+            return body
+        rewritten = dict(body)
+        rewritten[payload_key] = shared
+        return rewritten
+
+
+class _PassState:
+    """Per-call bookkeeping of one optimize() run."""
+
+    def __init__(self):
+        self.new_text_boxes = set()
+        self.touched: Dict[Tuple[Any, str], set] = {}
+        self._interned: Dict[Tuple, Any] = {}
+
+    def observe(self, kind: Optional[str], body: Dict[str, Any]) -> None:
+        """Track objects whose defaults are known."""
+        object_id = body.get('objectId') if isinstance(body, dict) else None
+        if kind == 'createShape' and body.get('shapeType') == 'TEXT_BOX' and object_id:
+            self.new_text_boxes.add(object_id)
+            for style_kind in STYLE_UPDATE_TYPES:
+                self.touched.pop((object_id, style_kind), None)
+        elif kind == 'deleteObject' and object_id:
+            self.new_text_boxes.discard(object_id)
+
+    def intern(self, value: Any, stats: Dict[str, int]) -> Any:
+        """Return a canonical object equal to value (containers are rebuilt)."""
+        if isinstance(value, dict):
+            value = {key: self.intern(item, stats) for key, item in value.items()}
+            key = ('dict', tuple((name, self._identity(item)) for name, item in value.items()))
+        elif isinstance(value, list):
+            value = [self.intern(item, stats) for item in value]
+            key = ('list', tuple(self._identity(item) for item in value))
+        else:
+            return value
+
+        shared = self._interned.get(key)
+        if shared is not None:
+            stats['interned'] += 1
+            return shared
+        self._interned[key] = value
+        return value
+
+    @staticmethod
+    def _identity(value: Any) -> Tuple:
+        # Interned children are canonical, so their id identifies them;
+        # scalars keep their type so 1, 1.0 and True stay distinct
+        if isinstance(value, (dict, list)):
+            return ('ref', id(value))
+        return (type(value).__name__, value)
+
+
+def _merge_same_range(kind: str, first: Dict[str, Any], second: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Union two updates of the same range, the second one winning."""
+    if _range_key(first) != _range_key(second):
+        return None
+
+    first_fields = _mask_fields(first.get('fields', ''))
+    second_fields = _mask_fields(second.get('fields', ''))
+    if any('.' in field for field in first_fields + second_fields):
+        return None
+    if second_fields == ['*']:
+        return second
+
+    payload_key = STYLE_UPDATE_TYPES[kind]
+    payload = dict(first.get(payload_key) or {})
+    second_payload = second.get(payload_key) or {}
+    for field in second_fields:
+        # A field in the mask but missing from the payload resets it
+        if field in second_payload:
+            payload[field] = second_payload[field]
+        else:
+            payload.pop(field, None)
+
+    if first_fields == ['*']:
+        fields = first_fields
+    else:
+        fields = first_fields + [field for field in second_fields if field not in first_fields]
+
+    merged = dict(first)
+    merged[payload_key] = payload
+    merged['fields'] = ','.join(fields)
+    return merged
+
+
+def _merge_touching_ranges(kind: str, first: Dict[str, Any], second: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Join two fixed ranges carrying the identical style."""
+    gap = RANGE_JOIN_GAP.get(kind)
+    if gap is None:
+        return None
+    if first.get('fields') != second.get('fields'):
+        return None
+    payload_key = STYLE_UPDATE_TYPES[kind]
+    if first.get(payload_key) != second.get(payload_key):
+        return None
+
+    first_range = first.get('textRange') or {}
+    second_range = second.get('textRange') or {}
+    if first_range.get('type') != 'FIXED_RANGE' or second_range.get('type') != 'FIXED_RANGE':
+        return None
+
+    start_a, end_a = first_range.get('startIndex'), first_range.get('endIndex')
+    start_b, end_b = second_range.get('startIndex'), second_range.get('endIndex')
+    if None in (start_a, end_a, start_b, end_b):
+        return None
+    if start_b > end_a + gap or start_a > end_b + gap:
+        return None
+
+    merged = dict(first)
+    merged['textRange'] = {
+        'type': 'FIXED_RANGE',
+        'startIndex': min(start_a, start_b),
+        'endIndex': max(end_a, end_b)
+    }
+    return merged
+
+
+# Global optimizer instance
+_optimizer_instance: Optional[RequestOptimizer] = None
+
+
+def get_request_optimizer() -> RequestOptimizer:
+    """
+    Get or create the global request optimizer.
+
+    The ``optimize_requests`` flag of the optional ``batching``
+    configuration section enables it (default: enabled).
+
+    Returns:
+        Global RequestOptimizer instance
+    """
+    global _optimizer_instance
+
+    if _optimizer_instance is None:
+        settings: Dict[str, Any] = {}
+        try:
+            from ..utils.config import get_config
+            settings = get_config().get('batching', {}) or {}
+        except Exception as e:
+            logger.warning(
+                f"Using default request optimizer settings: {e}",
+                operation="get_request_optimizer"
+            )
+
+        _optimizer_instance = RequestOptimizer(enabled=settings.get('optimize_requests', True))
+
+    return _optimizer_instance
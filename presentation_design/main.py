@@ -8,6 +8,7 @@ This module provides the main interface for processing presentations.
 """
 
 import sys
+import json
 import argparse
 from pathlib import Path
 
@@ -16,8 +17,10 @@ from presentation_design.utils.logger import get_logger, setup_logging_from_conf
 from presentation_design.auth.oauth_manager import OAuthManager
 from presentation_design.extraction.slides_extractor import SlidesExtractor
 from presentation_design.templates.template_loader import TemplateLoader
+from presentation_design.templates.master_deck import MasterDeckGenerator
 from presentation_design.design.design_applicator import DesignApplicator
 from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.generation.checkpoint import run_with_retries
 
 logger = get_logger(__name__)
 
@@ -25,7 +28,8 @@ logger = get_logger(__name__)
 def process_presentation(
     presentation_url: str,
     template_name: str = "default",
-    config_path: str = None
+    config_path: str = None,
+    plan_only: bool = False
 ) -> dict:
     """
     Process a presentation with design template.
@@ -34,9 +38,12 @@ def process_presentation(
         presentation_url: Google Slides URL or presentation ID
         template_name: Name of template to apply
         config_path: Optional path to configuration file
+        plan_only: Return the generation request plan instead of building
+            (the source presentation is still extracted)
         
     Returns:
-        Dictionary with presentation_id, presentation_url, and title
+        Dictionary with presentation_id, presentation_url, and title,
+        or the request plan if plan_only is set
     """
     try:
         logger.info(
@@ -80,10 +87,18 @@ def process_presentation(
         applicator = DesignApplicator(template)
         designed_data = applicator.apply_design(extracted_data)
         
+        builder = PresentationBuilder(oauth_manager)
+        
+        if plan_only:
+            logger.info("Planning new presentation (dry run)")
+            return builder.plan_presentation(designed_data)
+        
         # Build new presentation
         logger.info("Building new presentation")
-        builder = PresentationBuilder(oauth_manager)
-        result = builder.build_presentation(designed_data)
+        result = run_with_retries(
+            lambda checkpoint: builder.build_presentation(designed_data, checkpoint=checkpoint),
+            max_retries=config.get('processing.retry_count', 3)
+        )
         
         logger.info(
             f"Presentation processing completed successfully",
@@ -103,6 +118,79 @@ def process_presentation(
         raise
 
 
+def build_master_deck(template_name: str = "default", config_path: str = None) -> dict:
+    """
+    Generate a template's master deck and record it in the template JSON.
+    
+    Run once per template (and again after changing its theme); later
+    generations copy the deck instead of building from a blank presentation.
+    
+    Args:
+        template_name: Name of template
+        config_path: Optional path to configuration file
+        
+    Returns:
+        The template's new 'master_deck' entry
+    """
+    config = get_config(config_path)
+    setup_logging_from_config(config)
+    
+    auth_config = config.get_section('authentication')
+    oauth_manager = OAuthManager(
+        client_secrets_path=str(config.get_absolute_path(auth_config.get('client_secrets_path', 'credentials/client_secret.json'))),
+        token_path=str(config.get_absolute_path(auth_config['token_path'])),
+        scopes=auth_config['scopes']
+    )
+    oauth_manager.authenticate()
+    
+    template_config = config.get_section('templates')
+    template_loader = TemplateLoader(
+        str(config.get_absolute_path(template_config['template_directory']))
+    )
+    template = template_loader.load_template(template_name, use_cache=False)
+    
+    master_deck = MasterDeckGenerator(oauth_manager).generate(template)
+    template_loader.save_master_deck(template_name, master_deck)
+    return master_deck
+
+
+def plan_from_file(input_path: str, config_path: str = None) -> dict:
+    """
+    Plan generation for slides stored in a JSON file, without any API call.
+    
+    The file holds either a designed presentation (slides with 'elements',
+    as produced by DesignApplicator) or editor slides (a list of slides with
+    'title'/'mainText', or {'slides': [...], 'settings': {...}, 'title': ...}).
+    
+    Args:
+        input_path: Path to the JSON file
+        config_path: Optional path to configuration file
+        
+    Returns:
+        Request plan dictionary
+    """
+    config = get_config(config_path)
+    setup_logging_from_config(config)
+    
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if isinstance(data, list):
+        data = {'slides': data}
+    
+    slides = data.get('slides', [])
+    builder = PresentationBuilder(oauth_manager=None)
+    
+    if any('elements' in slide for slide in slides):
+        return builder.plan_presentation(data)
+    
+    return builder.plan_simple_presentation(
+        slides,
+        title=data.get('title', "New Presentation"),
+        settings=data.get('settings')
+    )
+
+
 def main():
     """Command-line interface for presentation design system."""
     parser = argparse.ArgumentParser(
@@ -132,6 +220,30 @@ def main():
         help="List available templates"
     )
     
+    parser.add_argument(
+        "--build-master-deck",
+        action="store_true",
+        help="Generate the master deck of the template (-t) and record it in the template JSON"
+    )
+    
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Dry run: print the generation request plan as JSON instead of building"
+    )
+    
+    parser.add_argument(
+        "--from-json",
+        metavar="PATH",
+        help="With --plan: plan slides from a JSON file (no API calls at all)"
+    )
+    
+    parser.add_argument(
+        "-o", "--output",
+        metavar="PATH",
+        help="With --plan: write the plan to a file instead of stdout"
+    )
+    
     args = parser.parse_args()
     
     # List templates if requested
@@ -147,6 +259,49 @@ def main():
             print(f"  - {template}")
         return
     
+    # Generate a template master deck
+    if args.build_master_deck:
+        try:
+            master_deck = build_master_deck(args.template, args.config)
+            print(f"\n✓ Master deck generated for template '{args.template}'")
+            print(f"  Presentation ID: {master_deck['presentation_id']}")
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+            sys.exit(1)
+        return
+    
+    # Dry run: output the request plan
+    if args.plan:
+        try:
+            if args.from_json:
+                plan = plan_from_file(args.from_json, args.config)
+            elif args.presentation_url:
+                plan = process_presentation(
+                    args.presentation_url,
+                    args.template,
+                    args.config,
+                    plan_only=True
+                )
+            else:
+                parser.error("--plan needs a presentation URL or --from-json")
+            
+            output = json.dumps(plan, ensure_ascii=False, indent=2)
+            if args.output:
+                Path(args.output).write_text(output, encoding='utf-8')
+                totals = plan['totals']
+                print(f"✓ Plan written to {args.output}: {totals['requests']} requests, "
+                      f"{totals['batches']} batch(es), {totals['bytes']} bytes")
+            else:
+                print(output)
+            
+        except Exception as e:
+            print(f"\n✗ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    if args.from_json:
+        parser.error("--from-json requires --plan")
+    
     # Process presentation
     try:
         result = process_presentation(
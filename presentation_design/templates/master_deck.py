@@ -0,0 +1,185 @@
+"""
+Master Deck Module
+==================
+
+Prebuilt Google Slides "master decks" for design templates.
+
+A template may name a master deck in its JSON:
+
+    "master_deck": {"presentation_id": "...", "theme_digest": "..."}
+
+build_presentation then copies that deck with one Drive files.copy call
+instead of creating a blank presentation, and the slides inherit the
+deck's master (background, and anything added to it in the Slides UI such
+as logos or theme fonts) instead of getting it request by request.
+
+The deck is generated once per template by MasterDeckGenerator. The theme
+digest records which typography/colors/layouts it was built from; a deck
+whose digest no longer matches its template is ignored until regenerated.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Template sections a master deck is built from
+THEME_SECTIONS = ('typography', 'colors', 'layouts')
+
+
+class MasterDeckError(Exception):
+    """Raised when a master deck cannot be generated."""
+    pass
+
+
+def theme_digest(template: Dict[str, Any]) -> str:
+    """
+    Return a stable digest of the template sections a master deck reflects.
+
+    Args:
+        template: Design template dictionary
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of the theme sections
+    """
+    theme = {section: template.get(section) for section in THEME_SECTIONS}
+    encoded = json.dumps(theme, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def master_deck_info(template: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Resolve the usable master deck of a template.
+
+    Args:
+        template: Design template dictionary
+
+    Returns:
+        Dictionary with presentation_id and background_color (the color
+        slides inherit from the deck master), or None if the template has
+        no master deck or the deck is stale
+    """
+    master_deck = template.get('master_deck')
+    if not master_deck:
+        return None
+
+    recorded = master_deck.get('theme_digest')
+    if recorded and recorded != theme_digest(template):
+        logger.warning(
+            "Master deck is stale (template theme changed); building from blank",
+            operation="master_deck",
+            template=template.get('metadata', {}).get('name'),
+            master_deck_id=master_deck['presentation_id']
+        )
+        return None
+
+    return {
+        'presentation_id': master_deck['presentation_id'],
+        'background_color': template['colors']['background']
+    }
+
+
+class MasterDeckGenerator:
+    """
+    Builds the master deck of a design template.
+
+    The deck is a new presentation whose master page carries the
+    template background. Its default slide is kept (generation replaces
+    it), so copies are never empty.
+    """
+
+    def __init__(self, oauth_manager):
+        """
+        Initialize master deck generator.
+
+        Args:
+            oauth_manager: Object providing build_service()
+        """
+        self.oauth_manager = oauth_manager
+        self.slides_service = None
+
+    def _ensure_service(self) -> None:
+        """Ensure Slides API service is initialized."""
+        if self.slides_service is None:
+            self.slides_service = self.oauth_manager.build_service('slides', 'v1')
+
+    def generate(self, template: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a master deck from a template.
+
+        Args:
+            template: Design template dictionary
+
+        Returns:
+            'master_deck' entry for the template JSON (presentation_id,
+            theme_digest, template_version)
+
+        Raises:
+            MasterDeckError: If the deck cannot be created
+        """
+        operation = "generate_master_deck"
+        name = template['metadata']['name']
+
+        try:
+            self._ensure_service()
+
+            presentation = self.slides_service.presentations().create(
+                body={'title': f"{name} (Master Deck)"}
+            ).execute()
+            presentation_id = presentation['presentationId']
+
+            masters = presentation.get('masters', [])
+            if not masters:
+                raise MasterDeckError("New presentation has no master page")
+
+            self.slides_service.presentations().batchUpdate(
+                presentationId=presentation_id,
+                body={'requests': self.master_requests(masters[0]['objectId'], template)}
+            ).execute()
+        except MasterDeckError:
+            raise
+        except Exception as e:
+            raise MasterDeckError(f"Failed to generate master deck for {name}: {e}") from e
+
+        logger.info(
+            f"Generated master deck for template: {name}",
+            operation=operation,
+            presentation_id=presentation_id
+        )
+
+        return {
+            'presentation_id': presentation_id,
+            'theme_digest': theme_digest(template),
+            'template_version': template['metadata'].get('version')
+        }
+
+    @staticmethod
+    def master_requests(master_id: str, template: Dict[str, Any]) -> list:
+        """
+        Requests applying the template theme to the master page.
+
+        Args:
+            master_id: objectId of the master page
+            template: Design template dictionary
+
+        Returns:
+            List of batch update requests
+        """
+        hex_color = template['colors']['background'].lstrip('#')
+        rgb = {
+            'red': int(hex_color[0:2], 16) / 255.0,
+            'green': int(hex_color[2:4], 16) / 255.0,
+            'blue': int(hex_color[4:6], 16) / 255.0
+        }
+        return [{
+            'updatePageProperties': {
+                'objectId': master_id,
+                'pageProperties': {
+                    'pageBackgroundFill': {'solidFill': {'color': {'rgbColor': rgb}}}
+                },
+                'fields': 'pageBackgroundFill'
+            }
+        }]
@@ -85,6 +85,36 @@ class TemplateLoader:
         except Exception as e:
             raise TemplateError(f"Failed to load template {template_name}: {e}")
     
+    def save_master_deck(self, template_name: str, master_deck: Dict[str, Any]) -> None:
+        """
+        Record a template's master deck in its JSON file.
+        
+        Args:
+            template_name: Name of template (without .json extension)
+            master_deck: 'master_deck' entry (see MasterDeckGenerator.generate)
+            
+        Raises:
+            TemplateError: If template not found or cannot be written
+        """
+        template_path = self.template_directory / "designs" / f"{template_name}.json"
+        template_data = self.load_template(template_name, use_cache=False)
+        template_data["master_deck"] = master_deck
+        
+        try:
+            TemplateValidator.validate_template(template_data)
+            with open(template_path, 'w', encoding='utf-8') as f:
+                json.dump(template_data, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+        except Exception as e:
+            raise TemplateError(f"Failed to save master deck of {template_name}: {e}")
+        
+        self.templates_cache[template_name] = template_data
+        logger.info(
+            f"Saved master deck of template: {template_name}",
+            operation="save_master_deck",
+            master_deck_id=master_deck.get("presentation_id")
+        )
+    
     def list_templates(self) -> list:
         """
         List available template names.
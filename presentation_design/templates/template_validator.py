@@ -46,3 +46,15 @@ class TemplateValidator:
         for color in required_colors:
             if color not in colors:
                 raise TemplateValidationError(f"Missing color: {color}")
+        
+        # Validate optional master deck
+        if "master_deck" in template:
+            master_deck = template["master_deck"]
+            if not isinstance(master_deck, dict):
+                raise TemplateValidationError("master_deck must be an object")
+            presentation_id = master_deck.get("presentation_id")
+            if not isinstance(presentation_id, str) or not presentation_id.strip():
+                raise TemplateValidationError("master_deck requires a presentation_id")
+            digest = master_deck.get("theme_digest")
+            if digest is not None and not isinstance(digest, str):
+                raise TemplateValidationError("master_deck theme_digest must be a string")
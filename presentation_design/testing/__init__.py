@@ -0,0 +1 @@
+"""Offline test and benchmark support modules."""
@@ -0,0 +1,898 @@
+"""
+Fake Google Slides/Drive Backend
+================================
+
+In-process, stateful stand-in for the Google Slides and Drive APIs.
+
+FakeGoogleHttp implements the httplib2 interface, so real
+google-api-python-client service objects (built by ServiceFactory) talk
+to FakeGoogleBackend instead of the network. The backend keeps
+presentations and Drive files in memory, applies batchUpdate requests
+atomically, honors field masks, and records per-method round trips,
+bytes and wall time. Latency, quota (429) errors and arbitrary failures
+can be injected to exercise retry and resume paths.
+
+Supported methods:
+    slides.presentations.create / get / batchUpdate / pages.get
+    drive.files.create (simple, multipart, resumable) / get / copy
+    drive.permissions.create
+"""
+
+import copy
+import json
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from email.parser import BytesParser
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httplib2
+
+from ..auth.service_factory import ServiceFactory, CredentialServiceProvider
+
+# Slides objectId rules: 5-50 chars, starting with a word character
+OBJECT_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_][a-zA-Z0-9_\-:]{4,49}$')
+
+CREATE_ELEMENT_TYPES = ('createShape', 'createImage', 'createTable', 'createLine')
+
+# Requests that only modify an existing object (validated by objectId)
+UPDATE_REQUEST_TYPES = (
+    'updateTextStyle', 'updateParagraphStyle', 'updateShapeProperties',
+    'updateImageProperties', 'updateLineProperties', 'updatePageProperties',
+    'updateTableCellProperties', 'updateTableBorderProperties',
+    'updateTableColumnProperties', 'updateTableRowProperties',
+    'createParagraphBullets', 'deleteParagraphBullets', 'updatePageElementTransform',
+    'updatePageElementAltText', 'updateSlideProperties'
+)
+
+# Update requests checked against the text of their shape (FIXED_RANGE)
+TEXT_RANGE_REQUEST_TYPES = ('updateTextStyle', 'updateParagraphStyle', 'createParagraphBullets')
+
+# Predefined layouts of a new presentation: name -> placeholders as
+# (type, translateX, translateY, width, height) in EMU (16:9 Simple Light)
+FAKE_LAYOUTS = {
+    'TITLE': [
+        ('CENTERED_TITLE', 311700, 744575, 8520600, 2052600),
+        ('SUBTITLE', 311700, 2834125, 8520600, 792600)
+    ],
+    'TITLE_AND_BODY': [
+        ('TITLE', 311700, 445025, 8520600, 572700),
+        ('BODY', 311700, 1152475, 8520600, 3416400)
+    ],
+    'BLANK': []
+}
+
+
+class FakeApiError(Exception):
+    """Internal error carrying an HTTP status for the fake transport."""
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def parse_field_mask(mask: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a Google partial-response field mask into a tree.
+
+    ``'title,slides(objectId,pageElements(objectId))'`` becomes
+    ``{'title': None, 'slides': {'objectId': None, 'pageElements': {...}}}``
+    where None means "the whole value".
+
+    Args:
+        mask: Field mask string (empty or '*' selects everything)
+
+    Returns:
+        Field tree, or None to select everything
+    """
+    if not mask or mask.strip() == '*':
+        return None
+
+    def add(tree, path, sub):
+        path = path.strip()
+        if not path:
+            return
+        parts = path.split('.')
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                return
+            node = node.setdefault(part, {})
+        last = parts[-1]
+        if sub is None or node.get(last, {}) is None:
+            node[last] = None
+        else:
+            node.setdefault(last, {}).update(sub)
+
+    def parse(index):
+        tree: Dict[str, Any] = {}
+        current = ''
+        while index < len(mask):
+            char = mask[index]
+            if char == ',':
+                add(tree, current, None)
+                current = ''
+                index += 1
+            elif char == '(':
+                sub, index = parse(index + 1)
+                add(tree, current, sub)
+                current = ''
+            elif char == ')':
+                add(tree, current, None)
+                return tree, index + 1
+            else:
+                current += char
+                index += 1
+        add(tree, current, None)
+        return tree, index
+
+    return parse(0)[0]
+
+
+def apply_field_mask(data: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """Return a copy of data restricted to the fields in tree."""
+    if tree is None:
+        return copy.deepcopy(data)
+    if isinstance(data, list):
+        return [apply_field_mask(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return copy.deepcopy(data)
+    if '*' in tree:
+        return copy.deepcopy(data)
+    return {key: apply_field_mask(data[key], sub) for key, sub in tree.items() if key in data}
+
+
+class FakeGoogleBackend:
+    """
+    In-memory state and behavior of the fake Slides and Drive APIs.
+
+    Attributes:
+        presentations (dict): Presentations by ID
+        files (dict): Drive file metadata by ID
+        latency (float or callable): Seconds added per request, or
+            callable(method_name) -> seconds
+    """
+
+    def __init__(
+        self,
+        latency: Any = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            latency: Fixed per-request latency in seconds, or callable(method) -> seconds
+            sleep: Sleep function used to simulate latency
+            clock: Monotonic clock used for quota windows
+        """
+        self.presentations: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.latency = latency
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._failures: List[Dict[str, Any]] = []
+        self._quota: Optional[Dict[str, Any]] = None
+        self._uploads: Dict[str, Dict[str, Any]] = {}
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def inject_failure(
+        self,
+        method: str,
+        status: Optional[int] = 503,
+        count: int = 1,
+        after_apply: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        exception: Optional[Exception] = None,
+        skip: int = 0
+    ) -> None:
+        """
+        Make upcoming calls of a method fail.
+
+        Args:
+            method: Method name (e.g. 'slides.presentations.batchUpdate') or '*'
+            status: HTTP status to return (ignored if exception is given)
+            count: Number of calls that fail
+            after_apply: Apply the call's effects before failing (lost response)
+            headers: Extra response headers (e.g. {'retry-after': '2'})
+            exception: Raise this transport exception instead (e.g. TimeoutError)
+            skip: Number of matching calls to let through first
+        """
+        with self._lock:
+            self._failures.append({
+                'method': method,
+                'status': status,
+                'count': count,
+                'after_apply': after_apply,
+                'headers': headers or {},
+                'exception': exception,
+                'skip': skip
+            })
+
+    def set_quota(self, limit: int, window_seconds: float = 60.0, retry_after: Optional[float] = None) -> None:
+        """
+        Limit requests per sliding window; excess requests get HTTP 429.
+
+        Args:
+            limit: Requests allowed per window
+            window_seconds: Window length in seconds
+            retry_after: Retry-After value to send (default: time until a slot frees)
+        """
+        with self._lock:
+            self._quota = {
+                'limit': limit,
+                'window': window_seconds,
+                'retry_after': retry_after,
+                'calls': deque()
+            }
+
+    def reset_stats(self) -> None:
+        """Reset request counters."""
+        with getattr(self, '_lock', threading.RLock()):
+            self.counters = {
+                'requests': 0,
+                'errors': 0,
+                'bytes_sent': 0,
+                'bytes_received': 0,
+                'wall_seconds': 0.0,
+                'batch_requests': 0,
+                'by_method': {}
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of request counters."""
+        with self._lock:
+            stats = copy.deepcopy(self.counters)
+        stats['wall_seconds'] = round(stats['wall_seconds'], 6)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def handle(self, method: str, uri: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Handle one HTTP request.
+
+        Returns:
+            Tuple of (status, response headers, response body)
+        """
+        started = time.perf_counter()
+        parts = urlsplit(uri)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        name, handler, args = self._route(method, parts.path, query)
+
+        delay = self.latency(name) if callable(self.latency) else self.latency
+        if delay:
+            self._sleep(delay)
+
+        status, response_headers, payload = 200, {}, b''
+        try:
+            self._check_quota(name)
+            failure = self._take_failure(name)
+            if failure and not failure['after_apply']:
+                self._raise_failure(failure)
+
+            result = handler(body, headers, query, *args)
+            if isinstance(result, tuple):
+                status, response_headers, result = result
+
+            if failure:
+                self._raise_failure(failure)
+
+            if result is not None:
+                result = apply_field_mask(result, parse_field_mask(query.get('fields', '')))
+                payload = json.dumps(result).encode('utf-8')
+                response_headers.setdefault('content-type', 'application/json; charset=UTF-8')
+        except FakeApiError as e:
+            status = e.status
+            response_headers = dict(e.headers)
+            response_headers['content-type'] = 'application/json; charset=UTF-8'
+            payload = json.dumps({
+                'error': {'code': e.status, 'message': str(e), 'status': 'FAKE_ERROR'}
+            }).encode('utf-8')
+        finally:
+            self._record(name, body, payload, status, time.perf_counter() - started + (delay or 0))
+
+        return status, response_headers, payload
+
+    def _record(self, name: str, body: bytes, payload: bytes, status: int, seconds: float) -> None:
+        with self._lock:
+            counters = self.counters
+            counters['requests'] += 1
+            counters['bytes_sent'] += len(body or b'')
+            counters['bytes_received'] += len(payload)
+            counters['wall_seconds'] += seconds
+            if status >= 400:
+                counters['errors'] += 1
+            method = counters['by_method'].setdefault(name, {'calls': 0, 'errors': 0})
+            method['calls'] += 1
+            if status >= 400:
+                method['errors'] += 1
+
+    def _route(self, method: str, path: str, query: Dict[str, str]):
+        routes = [
+            ('POST', r'^/v1/presentations$', 'slides.presentations.create', self._create_presentation),
+            ('GET', r'^/v1/presentations/([^/:]+)/pages/([^/]+)$', 'slides.presentations.pages.get', self._get_page),
+            ('GET', r'^/v1/presentations/([^/:]+)$', 'slides.presentations.get', self._get_presentation),
+            ('POST', r'^/v1/presentations/([^/:]+):batchUpdate$', 'slides.presentations.batchUpdate', self._batch_update),
+            ('POST', r'^(?:/resumable)?/upload/drive/v3/files$', 'drive.files.create', self._upload_file),
+            ('PUT', r'^/upload/fake-session/([^/]+)$', 'drive.files.create', self._upload_chunk),
+            ('POST', r'^/drive/v3/files$', 'drive.files.create', self._create_file_metadata),
+            ('POST', r'^/drive/v3/files/([^/]+)/copy$', 'drive.files.copy', self._copy_file),
+            ('POST', r'^/drive/v3/files/([^/]+)/permissions$', 'drive.permissions.create', self._create_permission),
+            ('GET', r'^/drive/v3/files/([^/]+)$', 'drive.files.get', self._get_file),
+            ('POST', r'^/token$', 'oauth2.token', self._token),
+        ]
+        for route_method, pattern, name, handler in routes:
+            match = re.match(pattern, path)
+            if match and method == route_method:
+                return name, handler, match.groups()
+
+        def not_found(*_):
+            raise FakeApiError(404, f"No fake route for {method} {path}")
+        return f"unknown:{method} {path}", not_found, ()
+
+    def _check_quota(self, name: str) -> None:
+        with self._lock:
+            quota = self._quota
+            if quota is None or name.startswith('oauth2'):
+                return
+            now = self._clock()
+            calls = quota['calls']
+            while calls and now - calls[0] >= quota['window']:
+                calls.popleft()
+            if len(calls) >= quota['limit']:
+                retry_after = quota['retry_after']
+                if retry_after is None:
+                    retry_after = max(0.0, quota['window'] - (now - calls[0]))
+                raise FakeApiError(429, "Quota exceeded (fake)", {'retry-after': f"{retry_after:g}"})
+            calls.append(now)
+
+    def _take_failure(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for failure in self._failures:
+                if failure['method'] not in ('*', name):
+                    continue
+                if failure['skip'] > 0:
+                    failure['skip'] -= 1
+                    return None
+                failure['count'] -= 1
+                if failure['count'] <= 0:
+                    self._failures.remove(failure)
+                return failure
+        return None
+
+    @staticmethod
+    def _raise_failure(failure: Dict[str, Any]) -> None:
+        if failure['exception'] is not None:
+            raise failure['exception']
+        raise FakeApiError(failure['status'], f"Injected failure (HTTP {failure['status']})", failure['headers'])
+
+    @staticmethod
+    def _json(body: bytes) -> Dict[str, Any]:
+        if not body:
+            return {}
+        try:
+            return json.loads(body.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError):
+            raise FakeApiError(400, "Invalid JSON body")
+
+    # ------------------------------------------------------------------
+    # Slides
+    # ------------------------------------------------------------------
+
+    def _presentation(self, presentation_id: str) -> Dict[str, Any]:
+        presentation = self.presentations.get(presentation_id)
+        if presentation is None:
+            raise FakeApiError(404, f"Requested entity was not found: {presentation_id}")
+        return presentation
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}_{uuid.uuid4().hex[:12]}"
+
+    def _create_presentation(self, body, headers, query):
+        request = self._json(body)
+        with self._lock:
+            presentation_id = self._new_id('fakepres')
+            slide_id = self._new_id('p')
+            presentation = {
+                'presentationId': presentation_id,
+                'title': request.get('title', 'Untitled presentation'),
+                'pageSize': request.get('pageSize') or {
+                    'width': {'magnitude': 9144000, 'unit': 'EMU'},
+                    'height': {'magnitude': 5143500, 'unit': 'EMU'}
+                },
+                'revisionId': uuid.uuid4().hex,
+                'masters': [{'objectId': 'master_default', 'pageType': 'MASTER', 'pageElements': []}],
+                'layouts': self._layouts(),
+                'slides': [{
+                    'objectId': slide_id,
+                    'slideProperties': {'layoutObjectId': 'TITLE'},
+                    'pageElements': [
+                        self._placeholder(f"{slide_id}_title", 'CENTERED_TITLE'),
+                        self._placeholder(f"{slide_id}_subtitle", 'SUBTITLE')
+                    ]
+                }]
+            }
+            self.presentations[presentation_id] = presentation
+            self.files[presentation_id] = {
+                'id': presentation_id,
+                'name': presentation['title'],
+                'mimeType': 'application/vnd.google-apps.presentation',
+                'modifiedTime': self._timestamp()
+            }
+            return copy.deepcopy(presentation)
+
+    @staticmethod
+    def _placeholder(object_id: str, placeholder_type: str) -> Dict[str, Any]:
+        return {
+            'objectId': object_id,
+            'shape': {'shapeType': 'TEXT_BOX', 'placeholder': {'type': placeholder_type}}
+        }
+
+    def _layouts(self) -> List[Dict[str, Any]]:
+        layouts = []
+        for name, placeholders in FAKE_LAYOUTS.items():
+            layout_id = f"layout_{name.lower()}"
+            elements = []
+            for placeholder_type, x, y, width, height in placeholders:
+                element = self._placeholder(f"{layout_id}_{placeholder_type.lower()}", placeholder_type)
+                element['size'] = {
+                    'width': {'magnitude': width, 'unit': 'EMU'},
+                    'height': {'magnitude': height, 'unit': 'EMU'}
+                }
+                element['transform'] = {'scaleX': 1, 'scaleY': 1, 'translateX': x, 'translateY': y, 'unit': 'EMU'}
+                elements.append(element)
+            layouts.append({
+                'objectId': layout_id,
+                'layoutProperties': {'name': name, 'displayName': name.replace('_', ' ').title()},
+                'pageElements': elements
+            })
+        return layouts
+
+    @staticmethod
+    def _layout(presentation: Dict[str, Any], reference: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        for layout in presentation.get('layouts', []):
+            if reference.get('layoutId') == layout['objectId']:
+                return layout
+            if reference.get('predefinedLayout') == layout['layoutProperties']['name']:
+                return layout
+        return None
+
+    def _get_presentation(self, body, headers, query, presentation_id):
+        with self._lock:
+            return copy.deepcopy(self._presentation(presentation_id))
+
+    def _get_page(self, body, headers, query, presentation_id, page_id):
+        with self._lock:
+            presentation = self._presentation(presentation_id)
+            for slide in presentation['slides']:
+                if slide['objectId'] == page_id:
+                    page = copy.deepcopy(slide)
+                    page['revisionId'] = presentation['revisionId']
+                    return page
+        raise FakeApiError(404, f"Page {page_id} not found")
+
+    def _batch_update(self, body, headers, query, presentation_id):
+        request = self._json(body)
+        requests = request.get('requests', [])
+        with self._lock:
+            presentation = self._presentation(presentation_id)
+            working = copy.deepcopy(presentation)
+            replies = []
+            for position, item in enumerate(requests):
+                try:
+                    replies.append(self._apply(working, item))
+                except FakeApiError as e:
+                    raise FakeApiError(400, f"Invalid requests[{position}]: {e}")
+
+            # Atomic: commit only when every request succeeded
+            working['revisionId'] = uuid.uuid4().hex
+            self.presentations[presentation_id] = working
+            if presentation_id in self.files:
+                self.files[presentation_id]['modifiedTime'] = self._timestamp()
+            self.counters['batch_requests'] += len(requests)
+
+        return {'presentationId': presentation_id, 'replies': replies}
+
+    @staticmethod
+    def _object_ids(presentation: Dict[str, Any]) -> set:
+        ids = set()
+        for slide in presentation['slides'] + presentation.get('layouts', []) + presentation.get('masters', []):
+            ids.add(slide['objectId'])
+            for element in slide.get('pageElements', []):
+                ids.add(element['objectId'])
+        return ids
+
+    def _find_element(self, presentation: Dict[str, Any], object_id: str) -> Optional[Dict[str, Any]]:
+        for slide in presentation['slides']:
+            for element in slide.get('pageElements', []):
+                if element['objectId'] == object_id:
+                    return element
+        return None
+
+    def _check_new_id(self, presentation: Dict[str, Any], object_id: Optional[str], prefix: str) -> str:
+        if object_id is None:
+            return self._new_id(prefix)
+        if not OBJECT_ID_PATTERN.match(object_id):
+            raise FakeApiError(400, f"Invalid objectId '{object_id}'")
+        if object_id in self._object_ids(presentation):
+            raise FakeApiError(400, f"The object ({object_id}) could not be created, since the ID is already in use")
+        return object_id
+
+    def _apply(self, presentation: Dict[str, Any], request: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply one batchUpdate request to a working copy; return its reply."""
+        if len(request) != 1:
+            raise FakeApiError(400, "Each request must contain exactly one operation")
+        kind, spec = next(iter(request.items()))
+
+        if kind == 'createSlide':
+            slide_id = self._check_new_id(presentation, spec.get('objectId'), 'slide')
+            reference = spec.get('slideLayoutReference', {'predefinedLayout': 'BLANK'})
+            layout = self._layout(presentation, reference)
+            if layout is None:
+                raise FakeApiError(400, f"Layout {reference} not found")
+            slide = {'objectId': slide_id, 'slideProperties': {'layoutObjectId': layout['objectId']}, 'pageElements': []}
+            mapped = {
+                mapping.get('layoutPlaceholder', {}).get('type'): mapping.get('objectId')
+                for mapping in spec.get('placeholderIdMappings', [])
+            }
+            layout_types = [
+                element['shape']['placeholder']['type'] for element in layout['pageElements']
+            ]
+            for placeholder_type in mapped:
+                if placeholder_type not in layout_types:
+                    raise FakeApiError(400, f"Layout has no {placeholder_type} placeholder")
+            # Every layout placeholder is copied; mappings only choose IDs
+            for element in layout['pageElements']:
+                placeholder_type = element['shape']['placeholder']['type']
+                placeholder_id = self._check_new_id(presentation, mapped.get(placeholder_type), 'ph')
+                placeholder = self._placeholder(placeholder_id, placeholder_type)
+                placeholder['shape']['placeholder']['parentObjectId'] = element['objectId']
+                placeholder['size'] = copy.deepcopy(element['size'])
+                placeholder['transform'] = copy.deepcopy(element['transform'])
+                slide['pageElements'].append(placeholder)
+            index = spec.get('insertionIndex', len(presentation['slides']))
+            if not 0 <= index <= len(presentation['slides']):
+                raise FakeApiError(400, f"insertionIndex {index} out of range")
+            presentation['slides'].insert(index, slide)
+            return {'createSlide': {'objectId': slide_id}}
+
+        if kind in CREATE_ELEMENT_TYPES:
+            properties = spec.get('elementProperties', {})
+            page_id = properties.get('pageObjectId')
+            page = next((s for s in presentation['slides'] if s['objectId'] == page_id), None)
+            if page is None:
+                raise FakeApiError(400, f"Page ({page_id}) not found")
+            object_id = self._check_new_id(presentation, spec.get('objectId'), 'obj')
+            element = {
+                'objectId': object_id,
+                'size': properties.get('size', {}),
+                'transform': properties.get('transform', {})
+            }
+            if kind == 'createShape':
+                element['shape'] = {'shapeType': spec.get('shapeType', 'RECTANGLE')}
+            elif kind == 'createImage':
+                url = spec.get('url', '')
+                if len(url) > 2000:
+                    raise FakeApiError(400, "Image URL exceeds 2 kB")
+                element['image'] = {'sourceUrl': url, 'contentUrl': url}
+            elif kind == 'createTable':
+                element['table'] = {'rows': spec.get('rows', 1), 'columns': spec.get('columns', 1)}
+            else:
+                element['line'] = {'lineCategory': spec.get('category', 'STRAIGHT')}
+            page['pageElements'].append(element)
+            return {kind: {'objectId': object_id}}
+
+        if kind == 'deleteObject':
+            object_id = spec.get('objectId')
+            before = len(presentation['slides'])
+            presentation['slides'] = [s for s in presentation['slides'] if s['objectId'] != object_id]
+            if len(presentation['slides']) != before:
+                return {}
+            for slide in presentation['slides']:
+                elements = slide.get('pageElements', [])
+                kept = [e for e in elements if e['objectId'] != object_id]
+                if len(kept) != len(elements):
+                    slide['pageElements'] = kept
+                    return {}
+            raise FakeApiError(400, f"The object ({object_id}) could not be deleted, since it was not found")
+
+        if kind == 'insertText':
+            element = self._find_element(presentation, spec.get('objectId'))
+            if element is not None and 'table' in element and 'cellLocation' in spec:
+                cell = spec['cellLocation']
+                table = element['table']
+                if cell.get('rowIndex', 0) >= table['rows'] or cell.get('columnIndex', 0) >= table['columns']:
+                    raise FakeApiError(400, "cellLocation outside of table")
+                cells = table.setdefault('cells', {})
+                key = f"{cell.get('rowIndex', 0)}:{cell.get('columnIndex', 0)}"
+                cells[key] = cells.get(key, '') + spec.get('text', '')
+                return {}
+            if element is None or 'shape' not in element:
+                raise FakeApiError(400, f"Shape ({spec.get('objectId')}) not found")
+            text = self._element_text(element)
+            index = spec.get('insertionIndex', 0)
+            if index > len(text):
+                raise FakeApiError(400, "insertionIndex beyond end of text")
+            self._set_element_text(element, text[:index] + spec.get('text', '') + text[index:])
+            return {}
+
+        if kind == 'deleteText':
+            element = self._find_element(presentation, spec.get('objectId'))
+            if element is None:
+                raise FakeApiError(400, f"Shape ({spec.get('objectId')}) not found")
+            self._set_element_text(element, '')
+            return {}
+
+        if kind == 'updateSlidesPosition':
+            ids = spec.get('slideObjectIds', [])
+            moving = [s for s in presentation['slides'] if s['objectId'] in ids]
+            if len(moving) != len(ids):
+                raise FakeApiError(400, "Unknown slide in slideObjectIds")
+            remaining = [s for s in presentation['slides'] if s['objectId'] not in ids]
+            index = min(spec.get('insertionIndex', 0), len(remaining))
+            presentation['slides'] = remaining[:index] + moving + remaining[index:]
+            return {}
+
+        if kind in TEXT_RANGE_REQUEST_TYPES and spec.get('textRange', {}).get('type') == 'FIXED_RANGE':
+            element = self._find_element(presentation, spec.get('objectId'))
+            if element is None or 'shape' not in element:
+                raise FakeApiError(400, f"Shape ({spec.get('objectId')}) not found")
+            text_range = spec['textRange']
+            start, end = text_range.get('startIndex', 0), text_range.get('endIndex')
+            if end is None or not 0 <= start < end <= len(self._element_text(element)):
+                raise FakeApiError(400, f"Text range {start}-{end} is outside of the text")
+            if kind == 'createParagraphBullets':
+                self._create_bullets(element, start, end, spec.get('bulletPreset', 'BULLET_DISC_CIRCLE_SQUARE'))
+            return {}
+
+        if kind in UPDATE_REQUEST_TYPES:
+            object_id = spec.get('objectId') or spec.get('pageObjectId')
+            if object_id is None and 'objectIds' in spec:
+                object_id = spec['objectIds'][0] if spec['objectIds'] else None
+            if object_id is not None and object_id not in self._object_ids(presentation):
+                raise FakeApiError(400, f"The object ({object_id}) could not be found")
+            return {}
+
+        raise FakeApiError(400, f"Unsupported request type: {kind}")
+
+    @staticmethod
+    def _element_text(element: Dict[str, Any]) -> str:
+        text = element.get('shape', {}).get('text', {})
+        return ''.join(
+            item.get('textRun', {}).get('content', '')
+            for item in text.get('textElements', [])
+        )
+
+    @classmethod
+    def _create_bullets(cls, element: Dict[str, Any], start: int, end: int, preset: str) -> None:
+        """Bullet the paragraphs in a range; leading tabs become the nesting level."""
+        paragraphs = cls._element_text(element).splitlines(keepends=True)
+        levels = {}
+        kept = []
+        offset = 0
+        for index, paragraph in enumerate(paragraphs):
+            paragraph_end = offset + len(paragraph)
+            if offset < end and paragraph_end > start:
+                stripped = paragraph.lstrip('\t')
+                levels[index] = len(paragraph) - len(stripped)
+                paragraph = stripped
+            kept.append(paragraph)
+            offset = paragraph_end
+
+        cls._set_element_text(element, ''.join(kept))
+        markers = [item for item in element['shape']['text']['textElements'] if 'paragraphMarker' in item]
+        for index, level in levels.items():
+            markers[index]['paragraphMarker']['bullet'] = {'listId': f"list_{preset}", 'nestingLevel': level}
+
+    @staticmethod
+    def _set_element_text(element: Dict[str, Any], text: str) -> None:
+        elements = []
+        offset = 0
+        for paragraph in text.splitlines(keepends=True):
+            elements.append({'startIndex': offset, 'endIndex': offset + len(paragraph), 'paragraphMarker': {}})
+            elements.append({
+                'startIndex': offset,
+                'endIndex': offset + len(paragraph),
+                'textRun': {'content': paragraph, 'style': {}}
+            })
+            offset += len(paragraph)
+        element['shape']['text'] = {'textElements': elements}
+
+    # ------------------------------------------------------------------
+    # Drive
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _timestamp() -> str:
+        return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime()) + f".{int(time.time() * 1000) % 1000:03d}Z"
+
+    def _store_file(self, metadata: Dict[str, Any], content: bytes) -> Dict[str, Any]:
+        with self._lock:
+            file_id = self._new_id('fakefile')
+            record = {
+                'id': file_id,
+                'name': metadata.get('name', 'Untitled'),
+                'mimeType': metadata.get('mimeType', 'application/octet-stream'),
+                'size': str(len(content)),
+                'modifiedTime': self._timestamp(),
+                'webViewLink': f"https://drive.google.com/file/d/{file_id}/view",
+                'webContentLink': f"https://drive.google.com/uc?id={file_id}&export=download",
+                'permissions': []
+            }
+            self.files[file_id] = record
+            return copy.deepcopy(record)
+
+    def _upload_file(self, body, headers, query):
+        upload_type = query.get('uploadType', 'media')
+        lowered = {key.lower(): value for key, value in (headers or {}).items()}
+
+        if upload_type == 'resumable':
+            metadata = self._json(body)
+            session_id = uuid.uuid4().hex
+            with self._lock:
+                self._uploads[session_id] = {
+                    'metadata': metadata,
+                    'content': b'',
+                    'total': int(lowered.get('x-upload-content-length', 0) or 0)
+                }
+            location = f"https://www.googleapis.com/upload/fake-session/{session_id}"
+            return 200, {'location': location}, None
+
+        if upload_type == 'multipart':
+            content_type = lowered.get('content-type', '')
+            message = BytesParser().parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode('utf-8') + (body or b'')
+            )
+            parts = message.get_payload()
+            metadata = json.loads(parts[0].get_payload(decode=True) or b'{}')
+            content = parts[1].get_payload(decode=True) if len(parts) > 1 else b''
+            return self._store_file(metadata, content or b'')
+
+        return self._store_file({}, body or b'')
+
+    def _upload_chunk(self, body, headers, query, session_id):
+        lowered = {key.lower(): value for key, value in (headers or {}).items()}
+        with self._lock:
+            upload = self._uploads.get(session_id)
+            if upload is None:
+                raise FakeApiError(404, "Upload session not found")
+            upload['content'] += body or b''
+            total = upload['total']
+            content_range = lowered.get('content-range', '')
+            match = re.match(r'bytes (?:\d+-\d+|\*)/(\d+|\*)', content_range)
+            if match and match.group(1) != '*':
+                total = int(match.group(1))
+            received = len(upload['content'])
+            if total and received < total:
+                return 308, {'range': f"bytes=0-{received - 1}"}, None
+            del self._uploads[session_id]
+        return self._store_file(upload['metadata'], upload['content'])
+
+    def _create_file_metadata(self, body, headers, query):
+        return self._store_file(self._json(body), b'')
+
+    def _get_file(self, body, headers, query, file_id):
+        with self._lock:
+            record = self.files.get(file_id)
+            if record is None:
+                raise FakeApiError(404, f"File not found: {file_id}")
+            return copy.deepcopy(record)
+
+    def _copy_file(self, body, headers, query, file_id):
+        metadata = self._json(body)
+        with self._lock:
+            source = self.files.get(file_id)
+            if source is None:
+                raise FakeApiError(404, f"File not found: {file_id}")
+            if file_id not in self.presentations:
+                return self._store_file({'name': metadata.get('name', source['name']), 'mimeType': source['mimeType']}, b'')
+
+            copy_id = self._new_id('fakepres')
+            presentation = copy.deepcopy(self.presentations[file_id])
+            presentation['presentationId'] = copy_id
+            presentation['title'] = metadata.get('name', f"Copy of {source['name']}")
+            presentation['revisionId'] = uuid.uuid4().hex
+            self.presentations[copy_id] = presentation
+            record = dict(source, id=copy_id, name=presentation['title'], modifiedTime=self._timestamp(), permissions=[])
+            self.files[copy_id] = record
+            return copy.deepcopy(record)
+
+    def _create_permission(self, body, headers, query, file_id):
+        permission = self._json(body)
+        with self._lock:
+            record = self.files.get(file_id)
+            if record is None:
+                raise FakeApiError(404, f"File not found: {file_id}")
+            permission = dict(permission, id=self._new_id('perm'))
+            record['permissions'].append(permission)
+            return copy.deepcopy(permission)
+
+    def _token(self, body, headers, query):
+        return {'access_token': uuid.uuid4().hex, 'expires_in': 3600, 'token_type': 'Bearer'}
+
+
+class FakeGoogleHttp:
+    """
+    httplib2-compatible transport that serves requests from a FakeGoogleBackend.
+
+    Plug into ServiceFactory(transport=FakeGoogleHttp(backend)).
+    """
+
+    def __init__(self, backend: FakeGoogleBackend):
+        self.backend = backend
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None, **kwargs):
+        """Implementation of httplib2's Http.request."""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif body is not None and not isinstance(body, (bytes, bytearray)):
+            body = body.read()
+
+        status, response_headers, payload = self.backend.handle(method, uri, body or b'', headers or {})
+
+        info = {key.lower(): value for key, value in response_headers.items()}
+        info['status'] = str(status)
+        info['content-location'] = uri
+        return httplib2.Response(info), payload
+
+    def close(self) -> None:
+        """Nothing to close."""
+        pass
+
+
+def fake_service_factory(backend: FakeGoogleBackend) -> ServiceFactory:
+    """
+    Build a ServiceFactory whose clients talk to the fake backend.
+
+    Args:
+        backend: Fake backend instance
+
+    Returns:
+        ServiceFactory using FakeGoogleHttp as transport
+    """
+    return ServiceFactory(transport=FakeGoogleHttp(backend))
+
+
+def fake_credentials(name: str = 'fake-user'):
+    """
+    Create non-expiring OAuth credentials for use with the fake backend.
+
+    Args:
+        name: Distinguishes identities in pooled client keys
+
+    Returns:
+        google.oauth2.credentials.Credentials
+    """
+    from google.oauth2.credentials import Credentials
+    return Credentials(token=f"token-{name}", refresh_token=f"refresh-{name}", client_id='fake-client')
+
+
+def fake_provider(backend: FakeGoogleBackend, credentials=None, factory: Optional[ServiceFactory] = None) -> CredentialServiceProvider:
+    """
+    Create a provider (build_service) bound to the fake backend.
+
+    Args:
+        backend: Fake backend instance
+        credentials: Credentials to use (default: fake_credentials())
+        factory: Existing fake factory to share pooled clients
+
+    Returns:
+        CredentialServiceProvider usable by PresentationBuilder/SlidesExtractor
+    """
+    return CredentialServiceProvider(
+        credentials or fake_credentials(),
+        factory=factory or fake_service_factory(backend)
+    )
@@ -0,0 +1,145 @@
+"""
+LRU Cache Module
+================
+
+Small thread-safe LRU cache with optional time-to-live expiry.
+Used for pooled API clients and other per-process caches.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with optional TTL.
+
+    Entries are evicted when the cache grows past ``maxsize`` or when
+    they are older than ``ttl`` seconds.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept
+        ttl (Optional[float]): Entry lifetime in seconds (None = no expiry)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry lifetime in seconds, or None to keep entries until evicted
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self._clock() - stored_at >= self.ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value for key, refreshing its recency.
+
+        Args:
+            key: Cache key
+            default: Value returned when key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            stored_at, value = entry
+            if self._is_expired(stored_at):
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting the oldest entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (self._clock(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Get value for key or create it with factory under the cache lock.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable producing the value on a miss
+
+        Returns:
+            Cached or newly created value
+        """
+        missing = object()
+        with self._lock:
+            value = self.get(key, missing)
+            if value is missing:
+                value = factory()
+                self.set(key, value)
+            return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (or default)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def keys(self) -> list:
+        """Return a snapshot of current keys (oldest first)."""
+        with self._lock:
+            return list(self._data.keys())
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and not self._is_expired(entry[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -7,7 +7,10 @@ Handles transient failures in API calls and network operations.
 """
 
 import time
+import random
 import functools
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Callable, Tuple, Type, Optional, Any
 from .logger import get_logger
 
@@ -273,6 +276,111 @@ def is_transient_error(exception: Exception) -> bool:
     return any(keyword in error_msg for keyword in transient_keywords)
 
 
+def get_retry_after(exception: Exception) -> Optional[float]:
+    """
+    Extract the server-requested delay from a Retry-After header.
+    
+    Supports both the delta-seconds and HTTP-date forms. The exception's
+    cause chain is searched, so wrapped API errors are recognized too.
+    
+    Args:
+        exception: Exception to inspect
+        
+    Returns:
+        Delay in seconds, or None if no Retry-After header is present
+    """
+    current = exception
+    while current is not None:
+        resp = getattr(current, 'resp', None)
+        value = resp.get('retry-after') if hasattr(resp, 'get') else None
+        if value is None and hasattr(current, 'response'):
+            headers = getattr(current.response, 'headers', None) or {}
+            value = headers.get('Retry-After')
+        
+        if value is not None:
+            value = str(value).strip()
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(value)
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                return None
+        
+        current = current.__cause__
+    
+    return None
+
+
+def compute_retry_delay(
+    exception: Exception,
+    attempt: int,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    max_delay: float = 60.0,
+    rng: Callable[[float, float], float] = random.uniform
+) -> float:
+    """
+    Compute how long to wait before retry number ``attempt``.
+    
+    Honors Retry-After when the server sends it (plus up to 20% jitter so
+    parallel jobs do not return in lockstep); otherwise uses exponential
+    backoff with full jitter.
+    
+    Args:
+        exception: Exception that caused the retry
+        attempt: Retry number, starting at 1
+        initial_delay: Backoff base delay in seconds
+        backoff_factor: Multiplier for each further attempt
+        max_delay: Upper bound for the backoff delay
+        rng: Random source taking (low, high) (injectable for tests)
+        
+    Returns:
+        Delay in seconds
+    """
+    retry_after = get_retry_after(exception)
+    if retry_after is not None:
+        return retry_after + rng(0.0, retry_after * 0.2)
+    
+    ceiling = min(max_delay, initial_delay * (backoff_factor ** max(0, attempt - 1)))
+    return rng(0.0, ceiling)
+
+
+def is_transient_error_chain(exception: Exception) -> bool:
+    """
+    Check whether an exception or its cause chain is a transient error.
+    
+    An HTTP status anywhere in the chain decides on its own; otherwise
+    network exceptions and transient error messages are detected.
+    
+    Args:
+        exception: Exception to check (may wrap the original API error)
+        
+    Returns:
+        True if the failure is transient and worth retrying
+    """
+    chain = []
+    current = exception
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__
+    
+    for error in chain:
+        if hasattr(getattr(error, 'resp', None), 'status') or \
+                hasattr(getattr(error, 'response', None), 'status_code'):
+            return is_transient_error(error)
+    
+    for error in chain:
+        if isinstance(error, (ConnectionError, TimeoutError)) or is_transient_error(error):
+            return True
+    
+    return False
+
+
 # Pre-configured decorators for common use cases
 retry_on_network_error = functools.partial(
     retry_on_condition,
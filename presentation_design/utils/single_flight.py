@@ -0,0 +1,102 @@
+"""
+Single-Flight Module
+====================
+
+Coalesces concurrent calls that would do the same work.
+
+The first caller for a key runs the function; callers arriving while it
+is in flight wait for the same result instead of repeating the work.
+Every caller receives its own deep copy, so no two share mutable state. Once
+the call finishes the key is released, so later calls run again (caching
+is a separate concern).
+"""
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Per-key in-flight call deduplication.
+
+    Attributes:
+        copy_result (Callable): Applied to the result handed to each caller
+    """
+
+    def __init__(self, copy_result: Callable[[Any], Any] = copy.deepcopy):
+        """
+        Initialize single-flight group.
+
+        Args:
+            copy_result: Function producing a caller's private copy of the result
+        """
+        self.copy_result = copy_result
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.counters = {'leaders': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, func: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        Run func once per key among concurrent callers.
+
+        Args:
+            key: Identifies equivalent work
+            func: Work to perform (run in the first caller's thread)
+            timeout: Maximum seconds a waiter blocks (None = no limit)
+
+        Returns:
+            Tuple of (result, shared) where shared is True for waiters
+
+        Raises:
+            Exception: Whatever func raised, re-raised in every caller
+            concurrent.futures.TimeoutError: If a waiter's timeout expires
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.counters['leaders'] += 1
+            else:
+                self.counters['coalesced'] += 1
+
+        if not leader:
+            logger.debug(
+                "Joining in-flight call",
+                operation="single_flight",
+                key=str(key)
+            )
+            return self.copy_result(future.result(timeout=timeout)), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            with self._lock:
+                self._calls.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._calls.pop(key, None)
+        future.set_result(result)
+        # The stored result stays pristine for waiters still copying it
+        return self.copy_result(result), False
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being computed."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """Return leader/coalesced counters."""
+        with self._lock:
+            stats = dict(self.counters)
+            stats['in_flight'] = len(self._calls)
+        return stats
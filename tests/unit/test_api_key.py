@@ -1,7 +1,14 @@
 """
 Test API Key access to Google Slides API
 """
+import os
 import json
+
+if __name__ != "__main__" and not os.environ.get("GOOGLE_LIVE_TESTS"):
+    # Live Google API check; offline coverage lives in test_fake_google.py
+    import pytest
+    pytest.skip("Live Google API test; set GOOGLE_LIVE_TESTS=1 to run", allow_module_level=True)
+
 from googleapiclient.discovery import build
 
 # Load API Key from config
@@ -0,0 +1,218 @@
+"""
+Tests for batchUpdate chunk planning and partial-failure recovery.
+"""
+
+import threading
+import time
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from presentation_design.generation.batch_planner import BatchPlanner, BatchPlannerError, request_size
+
+
+class FakeSlidesService:
+    """Minimal Slides service; batches containing a 'bad' request fail atomically."""
+
+    def __init__(self, status=400, invalid=()):
+        self.calls = []
+        self.applied = []
+        self.status = status
+        # objectIds whose requests are rejected
+        self.invalid = set(invalid)
+
+    def presentations(self):
+        return self
+
+    def batchUpdate(self, presentationId, body):
+        self.calls.append(list(body['requests']))
+        return _Call(self, body['requests'])
+
+
+class _Call:
+    def __init__(self, service, requests):
+        self.service = service
+        self.requests = requests
+
+    def execute(self):
+        if any(
+            'bad' in request or next(iter(request.values())).get('objectId') in self.service.invalid
+            for request in self.requests
+        ):
+            resp = httplib2.Response({'status': self.service.status})
+            raise HttpError(resp, b'{"error": {"message": "Invalid requests"}}')
+        self.service.applied.extend(self.requests)
+        return {'replies': [{} for _ in self.requests]}
+
+
+def make_requests(count, text='x'):
+    return [{'insertText': {'objectId': f"obj_{i}", 'text': text}} for i in range(count)]
+
+
+def test_chunks_bounded_by_count():
+    """No chunk exceeds max_requests and order is preserved."""
+    planner = BatchPlanner(max_requests=10, pipeline=False)
+    chunks = list(planner.plan(make_requests(25)))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [index for chunk in chunks for index, _ in chunk] == list(range(25))
+
+
+def test_chunks_bounded_by_bytes():
+    """Large requests are split by payload size, oversize requests go alone."""
+    requests = make_requests(6, text='y' * 1000)
+    one = request_size(requests[0])
+    planner = BatchPlanner(max_bytes=one * 2 + 100, pipeline=False)
+    chunks = list(planner.plan(requests))
+
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == 6
+
+    tiny = BatchPlanner(max_bytes=10, pipeline=False)
+    assert [len(chunk) for chunk in tiny.plan(requests)] == [1] * 6
+
+
+def test_pipelined_execution_applies_in_order():
+    """Pipelined chunks are sent in original order from a generator."""
+    service = FakeSlidesService()
+    planner = BatchPlanner(max_requests=7)
+    requests = make_requests(30)
+    result = planner.execute(service, 'pres', (request for request in requests))
+
+    assert service.applied == requests
+    assert result['chunks'] == 5
+    assert result['applied'] == 30
+    assert result['failed'] == []
+    assert len(result['replies']) == 30
+
+
+def test_bisection_isolates_bad_request():
+    """An invalid request is skipped while the rest of the chunk is applied."""
+    service = FakeSlidesService()
+    planner = BatchPlanner(max_requests=16)
+    requests = make_requests(16)
+    requests[11] = {'bad': {'objectId': 'broken'}}
+
+    result = planner.execute(service, 'pres', requests)
+
+    assert [failure['index'] for failure in result['failed']] == [11]
+    assert result['applied'] == 15
+    assert service.applied == requests[:11] + requests[12:]
+    assert result['replies'][11] is None
+    # 1 failed chunk + log2(16) levels of bisection, far fewer than 16 calls
+    assert result['api_calls'] <= 1 + 2 * 4
+
+
+def test_bisection_budget_fails_batch():
+    """A chunk full of invalid requests fails instead of costing ~2n calls."""
+    service = FakeSlidesService()
+    planner = BatchPlanner(max_requests=64, max_isolation_calls=10, max_rejected=100)
+    requests = [{'bad': {'objectId': f"broken_{i}"}} for i in range(64)]
+
+    try:
+        planner.execute(service, 'pres', requests)
+        assert False, "expected BatchPlannerError"
+    except BatchPlannerError:
+        pass
+    assert len(service.calls) == 1 + 10
+
+    service = FakeSlidesService()
+    planner = BatchPlanner(max_requests=16, max_rejected=2)
+    requests = make_requests(16)
+    for i in (1, 5, 9):
+        requests[i] = {'bad': {'objectId': f"broken_{i}"}}
+    try:
+        planner.execute(service, 'pres', requests)
+        assert False, "expected BatchPlannerError"
+    except BatchPlannerError as e:
+        assert "#9" in str(e)
+
+
+def test_dependents_of_rejected_create_are_not_sent():
+    """Requests on an object whose create was rejected are dropped unsent."""
+    service = FakeSlidesService(invalid={'box'})
+    planner = BatchPlanner(max_requests=4)
+    requests = [
+        {'createShape': {'objectId': 'box', 'shapeType': 'TEXT_BOX', 'elementProperties': {'pageObjectId': 'p1'}}},
+        {'insertText': {'objectId': 'ok', 'text': 'a'}},
+        {'insertText': {'objectId': 'box', 'text': 'b'}},
+        {'createParagraphBullets': {'objectId': 'ok'}},
+        # Next chunk: still refers to the missing shape
+        {'updateShapeProperties': {'objectId': 'box', 'fields': 'outline'}},
+        {'groupObjects': {'childrenObjectIds': ['ok', 'box']}},
+        {'insertText': {'objectId': 'other', 'text': 'c'}}
+    ]
+
+    result = planner.execute(service, 'pres', requests)
+
+    assert [failure['index'] for failure in result['failed']] == [0, 2, 4, 5]
+    assert service.applied == [requests[1], requests[3], requests[6]]
+    # Only the first (atomic) chunk carried them; nothing after the rejection
+    sent = [request for call in service.calls[1:] for request in call]
+    assert all(requests[index] not in sent for index in (2, 4, 5))
+    assert result['failed'][1]['error'].startswith('Skipped')
+
+
+def test_failed_batch_stops_request_generation():
+    """After a failure the producer stops pulling requests and is joined."""
+    generated = []
+
+    def requests():
+        for request in [{'bad': {}}] + make_requests(200):
+            generated.append(request)
+            time.sleep(0.001)
+            yield request
+
+    planner = BatchPlanner(max_requests=5, max_pending_chunks=1)
+    try:
+        planner.execute(FakeSlidesService(status=503), 'pres', requests())
+        assert False, "expected HttpError"
+    except HttpError:
+        pass
+
+    count = len(generated)
+    assert count < 200
+    assert not any(thread.name == 'batch-planner' for thread in threading.enumerate())
+    time.sleep(0.05)
+    assert len(generated) == count
+
+
+def test_non_request_errors_are_raised():
+    """Server errors are not bisected; they propagate to the retry layer."""
+    service = FakeSlidesService(status=503)
+    planner = BatchPlanner(max_requests=8)
+    requests = make_requests(4) + [{'bad': {}}]
+
+    try:
+        planner.execute(service, 'pres', requests)
+        assert False, "expected HttpError"
+    except HttpError as e:
+        assert e.resp.status == 503
+    assert len(service.calls) == 1
+
+
+def test_generator_errors_propagate():
+    """Errors raised while preparing requests surface to the caller."""
+    def broken():
+        yield make_requests(1)[0]
+        raise ValueError("image upload failed")
+
+    try:
+        BatchPlanner().execute(FakeSlidesService(), 'pres', broken())
+        assert False, "expected ValueError"
+    except ValueError as e:
+        assert "image upload failed" in str(e)
+
+
+if __name__ == "__main__":
+    test_chunks_bounded_by_count()
+    test_chunks_bounded_by_bytes()
+    test_pipelined_execution_applies_in_order()
+    test_bisection_isolates_bad_request()
+    test_bisection_budget_fails_batch()
+    test_dependents_of_rejected_create_are_not_sent()
+    test_failed_batch_stops_request_generation()
+    test_non_request_errors_are_raised()
+    test_generator_errors_propagate()
+
+    print("✅ All tests completed!")
@@ -0,0 +1,184 @@
+"""
+Tests for the benchmark corpus (record/replay) tooling.
+"""
+
+import tempfile
+from pathlib import Path
+
+from presentation_design.bench.corpus import (
+    CorpusError,
+    TextScrambler,
+    list_fixtures,
+    load_fixture,
+    load_manifest,
+    sanitize_presentation,
+    save_fixture
+)
+from presentation_design.bench.harness import measure, replay_presentation
+from presentation_design.extraction.editor_format import raw_data_to_editor_slides, format_slide_content
+
+
+def text_shape(object_id, text, y=0):
+    return {
+        'objectId': object_id,
+        'transform': {'translateY': y},
+        'shape': {
+            'shapeType': 'TEXT_BOX',
+            'text': {'textElements': [
+                {'paragraphMarker': {}},
+                {'textRun': {'content': text, 'style': {}}}
+            ]}
+        }
+    }
+
+
+def sample_presentation(slide_count=4):
+    slides = []
+    for idx in range(slide_count):
+        slides.append({
+            'objectId': f"slide_{idx:03d}",
+            'pageElements': [
+                text_shape(f"title_{idx}", f"Слайд {idx + 1}. Введение в тему\n"),
+                text_shape(f"body_{idx}", "1. Первый пункт списка\n2. Second item, 42%\n(макроуровень)\n", y=100),
+                {'objectId': f"image_{idx}", 'image': {'contentUrl': 'https://lh3.googleusercontent.com/private-token'}}
+            ]
+        })
+    return {
+        'presentationId': 'real_deck_id',
+        'title': 'Курс: Секретное название',
+        'revisionId': 'rev123',
+        'slides': slides
+    }
+
+
+def is_cyrillic(char):
+    return 'а' <= char.lower() <= 'я' or char.lower() == 'ё'
+
+
+def test_scrambler_preserves_shape():
+    scrambler = TextScrambler(secret=b'fixed-secret')
+    text = "Слайд 3. Привет, World! 2024\n(макроуровень)"
+    scrambled = scrambler.scramble(text)
+
+    assert len(scrambled) == len(text)
+    assert scrambled != text
+    assert scrambled.startswith("Слайд ")
+    assert scrambled.endswith("(макроуровень)")
+    for original, new in zip(text, scrambled):
+        assert original.isspace() == new.isspace()
+        assert original.isdigit() == new.isdigit()
+        assert original.isupper() == new.isupper()
+        assert is_cyrillic(original) == is_cyrillic(new)
+        if not original.isalnum():
+            assert original == new
+
+    # Same word maps to the same scrambled word
+    assert scrambler.scramble_word("Привет") == scrambler.scramble_word("Привет")
+
+
+def test_scrambler_replaces_every_letter():
+    text = 'Ёлка ёжик Müller café Straße Ελλάδα'
+    scrambled = TextScrambler(secret=b'k').scramble(text)
+
+    assert len(scrambled) == len(text)
+    for original, new in zip(text, scrambled):
+        if original.isalpha():
+            assert new.isupper() == original.isupper()
+            assert new.isascii() or is_cyrillic(new)
+    # Letters outside the basic alphabets never survive
+    assert not set('üéßΕλάδ') & set(scrambled)
+    assert is_cyrillic(scrambled[0]) and scrambled[0].isupper()
+
+
+def test_sanitize_removes_private_data():
+    presentation = sample_presentation()
+    sanitized = sanitize_presentation(presentation, 'sample', TextScrambler(secret=b'k'))
+
+    assert sanitized['presentationId'] == 'corpus_sample'
+    assert 'revisionId' not in sanitized
+    assert 'Секретное' not in sanitized['title']
+    assert len(sanitized['title']) == len(presentation['title'])
+
+    image = sanitized['slides'][0]['pageElements'][2]['image']
+    assert 'googleusercontent' not in image['contentUrl']
+    assert len(image['contentUrl']) == len(presentation['slides'][0]['pageElements'][2]['image']['contentUrl'])
+
+    # Structure is untouched
+    assert [slide['objectId'] for slide in sanitized['slides']] == [
+        slide['objectId'] for slide in presentation['slides']
+    ]
+    assert presentation['revisionId'] == 'rev123'
+
+
+def test_save_and_load_fixture():
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = Path(tmp) / 'v1'
+        sanitized = sanitize_presentation(sample_presentation(3), 'deck_a')
+        save_fixture(sanitized, 'deck_a', corpus_dir, note='three slides')
+
+        assert list_fixtures(corpus_dir) == ['deck_a']
+        entry = load_manifest(corpus_dir)['fixtures']['deck_a']
+        assert entry['slides'] == 3
+        assert entry['page_elements'] == 9
+        assert entry['cyrillic_chars'] > 0
+        assert load_fixture('deck_a', corpus_dir) == sanitized
+
+        # Corrupted fixtures are detected
+        (corpus_dir / 'deck_a.json.gz').write_bytes(b'')
+        try:
+            load_fixture('deck_a', corpus_dir)
+            assert False, "Expected CorpusError"
+        except (CorpusError, EOFError, ValueError):
+            pass
+
+        try:
+            save_fixture(sanitized, '../escape', corpus_dir)
+            assert False, "Expected CorpusError"
+        except CorpusError:
+            pass
+
+
+def test_editor_conversion_filters_metadata():
+    raw_data = {'slides': [
+        {'raw_elements': [{'objectId': 'a', 'content': 'Заголовок\n'}, {'objectId': 'b', 'content': '(макроуровень)'}]},
+        {'raw_elements': [{'objectId': 'c', 'content': '   '}]}
+    ]}
+    slides = raw_data_to_editor_slides(raw_data)
+
+    assert len(slides) == 1
+    assert slides[0]['original_objectIds'] == ['a', 'b']
+    assert 'макроуровень' not in slides[0]['content']
+    assert format_slide_content({'title': 'T', 'mainText': '<p>x</p>'}) == "<h1>T</h1>\n<p>x</p>"
+
+
+def test_replay_reports_stage_stats():
+    sanitized = sanitize_presentation(sample_presentation(5), 'replay')
+    report = replay_presentation(sanitized, repeat=2)
+
+    assert report['slides'] == 5
+    assert report['editor_slides'] == 5
+    assert set(report['stages']) == {'extract', 'parse', 'editor'}
+    for stats in report['stages'].values():
+        assert stats['runs'] == 2
+        assert 0 <= stats['min_seconds'] <= stats['max_seconds']
+        assert stats['peak_bytes'] > 0
+
+
+def test_measure_without_memory():
+    stats = measure(lambda: sum(range(1000)), repeat=3, trace_memory=False)
+    assert stats['runs'] == 3
+    assert stats['peak_bytes'] is None
+
+
+if __name__ == "__main__":
+    print("Running benchmark corpus tests...\n")
+
+    test_scrambler_preserves_shape()
+    test_scrambler_replaces_every_letter()
+    test_sanitize_removes_private_data()
+    test_save_and_load_fixture()
+    test_editor_conversion_filters_metadata()
+    test_replay_reports_stage_stats()
+    test_measure_without_memory()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,91 @@
+"""
+Tests for the parser benchmark (synthetic corpora and baseline comparison).
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from presentation_design.bench.__main__ import main
+from presentation_design.bench.parsing import (
+    compare_results,
+    fixture_corpus,
+    run_parse_benchmark,
+    synthetic_corpus
+)
+from presentation_design.extraction.text_parser import TextParser
+
+
+def test_corpora_select_their_strategy():
+    parser = TextParser()
+
+    for language in ('en', 'ru'):
+        text, slide_texts = synthetic_corpus('number_after', language, 300)
+        assert text.count('\n') == 299
+        assert parser.detect_number_after_pattern(text)
+
+        text, _ = synthetic_corpus('markers', language, 300)
+        assert not parser.detect_number_after_pattern(text)
+        assert len(parser.detect_slide_markers(text)) > 10
+
+        text, _ = synthetic_corpus('blocks', language, 300)
+        assert not parser.detect_number_after_pattern(text)
+        assert not parser.detect_slide_markers(text)
+
+    assert synthetic_corpus('markers', 'ru', 200)[0].startswith('Слайд 1: ')
+    assert synthetic_corpus('blocks', 'en', 500, seed=3) == synthetic_corpus('blocks', 'en', 500, seed=3)
+
+
+def test_run_and_compare_with_baseline():
+    results = run_parse_benchmark(sizes=[200], strategies=['markers'], languages=['en'], repeat=1)
+
+    assert sorted(results['cases']) == [
+        'analyzer/markers/en/200', 'text_parser/markers/en/200', 'text_splitter/markers/en/200'
+    ]
+    case = results['cases']['text_parser/markers/en/200']
+    assert case['lines'] == 200 and case['strategy'] == 'markers' and case['peak_bytes'] > 0
+
+    assert compare_results(results, results) == []
+
+    baseline = json.loads(json.dumps(results))
+    baseline['cases']['analyzer/markers/en/200']['median_seconds'] /= 10
+    regressions = compare_results(results, baseline, threshold=3.0)
+    assert [(item['case'], item['metric']) for item in regressions] == [('analyzer/markers/en/200', 'median_seconds')]
+
+
+def test_fixture_corpus_uses_markers():
+    presentation = {'slides': [
+        {'pageElements': [{'shape': {'text': {'textElements': [{'textRun': {'content': 'Intro\nText\n'}}]}}}]},
+        {'pageElements': []}
+    ]}
+
+    text, slide_texts = fixture_corpus(presentation)
+
+    assert slide_texts == ['Intro\nText', '']
+    assert len(TextParser().parse_slides(text)) == 2
+
+
+def test_cli_exit_code_on_regression():
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_path = Path(tmp) / 'baseline.json'
+        args = ['parse', '--size', '100', '--strategy', 'blocks', '--language', 'ru', '--target', 'analyzer',
+                '--repeat', '1', '--no-memory']
+
+        assert main(args + ['--json', str(baseline_path)]) == 0
+
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        baseline['cases']['analyzer/blocks/ru/100']['median_seconds'] /= 1000
+        baseline_path.write_text(json.dumps(baseline), encoding='utf-8')
+
+        assert main(args + ['--baseline', str(baseline_path)]) == 2
+
+
+if __name__ == "__main__":
+    print("Running parser benchmark tests...\n")
+
+    test_corpora_select_their_strategy()
+    test_run_and_compare_with_baseline()
+    test_fixture_corpus_uses_markers()
+    test_cli_exit_code_on_regression()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,69 @@
+"""
+Tests for block-level memoization of parsed slides.
+"""
+
+from presentation_design.extraction.block_cache import block_key, get_block_cache, set_block_cache
+from presentation_design.extraction.text_parser import TextParser
+from presentation_design.utils.lru import LRUCache
+
+
+def course_text(count, changed=None):
+    parts = []
+    for idx in range(count):
+        body = "Changed line." if idx == changed else "Intro with **bold** text."
+        parts.append(f"Slide {idx + 1} Topic {idx}\n{body}\n- point\n\n")
+    return ''.join(parts)
+
+
+def test_reparse_formats_only_changed_blocks():
+    cache = LRUCache(maxsize=100)
+    parser = TextParser(block_cache=cache)
+
+    parser.parse_slides(course_text(20))
+    assert cache.stats()['misses'] == 20
+
+    slides = parser.parse_slides(course_text(20, changed=7))
+    stats = cache.stats()
+    assert stats['hits'] == 19
+    assert stats['misses'] == 21
+
+    uncached = TextParser(block_cache=LRUCache(maxsize=100)).parse_slides(course_text(20, changed=7))
+    assert slides == uncached
+    assert slides[7]['mainText'].startswith('<p>Changed line.</p>')
+
+
+def test_cached_slides_are_not_shared():
+    parser = TextParser(block_cache=LRUCache(maxsize=10))
+
+    first = parser.create_slide_from_content("Results\nIt worked.", '1')
+    first['title'] = 'Edited'
+    second = parser.create_slide_from_content("Results\nIt worked.", '5')
+
+    assert second == {'id': '5', 'title': 'Results', 'mainText': '<p>It worked.</p>', 'secondaryText': ''}
+
+
+def test_block_key_depends_on_line_boundaries():
+    assert block_key(['a', 'b']) != block_key(['a b'])
+    assert block_key(['a', 'b']) == block_key(['a', 'b'])
+    assert len(block_key([])) == 16
+
+
+def test_zero_size_disables_cache():
+    set_block_cache(LRUCache(maxsize=0))
+    try:
+        assert get_block_cache() is None
+        assert TextParser().block_cache is None
+        assert TextParser().parse_slides("Slide 1 Intro\nText.")[0]['title'] == 'Intro'
+    finally:
+        set_block_cache(None)
+
+
+if __name__ == "__main__":
+    print("Running block cache tests...\n")
+
+    test_reparse_formats_only_changed_blocks()
+    test_cached_slides_are_not_shared()
+    test_block_key_depends_on_line_boundaries()
+    test_zero_size_disables_cache()
+
+    print("\n✅ All tests completed!")
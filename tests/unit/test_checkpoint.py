@@ -0,0 +1,252 @@
+"""
+Tests for checkpointed, resumable presentation generation.
+"""
+
+import copy
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.checkpoint import (
+    GenerationCheckpoint,
+    GenerationRetry,
+    run_with_retries
+)
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.utils.retry import compute_retry_delay, get_retry_after
+
+
+def http_error(status, headers=None):
+    info = {'status': status}
+    info.update(headers or {})
+    return HttpError(httplib2.Response(info), b'{"error": {"message": "injected"}}')
+
+
+class FakeSlides:
+    """Stateful Slides service with atomic batchUpdate and failure injection."""
+
+    CREATES = ('createShape', 'createImage', 'createTable', 'createLine')
+
+    def __init__(self):
+        self.presentations_created = 0
+        self.slides = []
+        self.batch_calls = 0
+        # batch call number -> (exception, apply_before_raising)
+        self.failures = {}
+
+    def presentations(self):
+        return self
+
+    def create(self, body):
+        def run():
+            self.presentations_created += 1
+            self.slides = [{'objectId': 'default_slide', 'pageElements': [{'objectId': 'default_title'}]}]
+            return {'presentationId': f"pres-{self.presentations_created}", 'slides': copy.deepcopy(self.slides)}
+        return _Call(run)
+
+    def get(self, presentationId, fields=None):
+        return _Call(lambda: {'title': 'Deck', 'slides': copy.deepcopy(self.slides)})
+
+    def batchUpdate(self, presentationId, body):
+        def run():
+            self.batch_calls += 1
+            failure = self.failures.pop(self.batch_calls, None)
+            if failure and not failure[1]:
+                raise failure[0]
+            slides = copy.deepcopy(self.slides)
+            for request in body['requests']:
+                self._apply(slides, request)
+            self.slides = slides
+            if failure:
+                raise failure[0]
+            return {'replies': [{} for _ in body['requests']]}
+        return _Call(run)
+
+    def object_ids(self, slides=None):
+        ids = []
+        for slide in (self.slides if slides is None else slides):
+            ids.append(slide['objectId'])
+            ids.extend(element['objectId'] for element in slide['pageElements'])
+        return ids
+
+    def _apply(self, slides, request):
+        kind, spec = next(iter(request.items()))
+        existing = self.object_ids(slides)
+        if kind == 'createSlide':
+            if spec['objectId'] in existing:
+                raise http_error(400)
+            slides.append({'objectId': spec['objectId'], 'pageElements': []})
+        elif kind in self.CREATES:
+            page = next((s for s in slides if s['objectId'] == spec['elementProperties']['pageObjectId']), None)
+            if page is None or spec['objectId'] in existing:
+                raise http_error(400)
+            page['pageElements'].append({'objectId': spec['objectId']})
+        elif kind == 'deleteObject':
+            if spec['objectId'] not in existing:
+                raise http_error(400)
+            slides[:] = [s for s in slides if s['objectId'] != spec['objectId']]
+            for slide in slides:
+                slide['pageElements'] = [e for e in slide['pageElements'] if e['objectId'] != spec['objectId']]
+        elif kind == 'updateSlidesPosition':
+            moving = [s for s in slides if s['objectId'] in spec['slideObjectIds']]
+            slides[:] = [s for s in slides if s['objectId'] not in spec['slideObjectIds']]
+            slides[spec['insertionIndex']:spec['insertionIndex']] = moving
+        elif 'objectId' in spec and spec['objectId'] not in existing:
+            raise http_error(400)
+
+
+class _Call:
+    def __init__(self, run):
+        self.run = run
+
+    def execute(self):
+        return self.run()
+
+
+class FakeProvider:
+    def __init__(self, service):
+        self.service = service
+
+    def build_service(self, name, version):
+        return self.service
+
+
+SLIDES = [
+    {'title': f"Slide {idx}", 'mainText': f"Body text {idx}"}
+    for idx in range(6)
+]
+
+
+def make_builder(service):
+    return PresentationBuilder(FakeProvider(service), batch_planner=BatchPlanner(max_requests=10))
+
+
+def test_resume_after_transient_failure_reuses_presentation():
+    """A 503 on a late chunk resumes without creating a second deck."""
+    service = FakeSlides()
+    builder = make_builder(service)
+    service.failures[3] = (http_error(503), False)
+
+    checkpoint = GenerationCheckpoint()
+    try:
+        builder.build_simple_presentation(SLIDES, checkpoint=checkpoint)
+        assert False, "expected GenerationRetry"
+    except GenerationRetry as e:
+        assert e.step == 'content'
+        assert e.attempt == 1
+        assert checkpoint.chunks_applied == 1
+
+    result = builder.build_simple_presentation(SLIDES, checkpoint=GenerationCheckpoint(checkpoint.to_dict()))
+
+    assert service.presentations_created == 1
+    assert result['presentation_id'] == 'pres-1'
+    assert result['failed_requests'] == []
+    assert [s['objectId'] for s in service.slides] == [f"pd_slide_{idx:03d}" for idx in range(6)]
+    ids = service.object_ids()
+    assert len(ids) == len(set(ids))
+
+
+def test_lost_response_is_not_applied_twice():
+    """A chunk applied server-side but reported as failed is detected on resume."""
+    service = FakeSlides()
+    builder = make_builder(service)
+    service.failures[2] = (TimeoutError("read timed out"), True)
+
+    checkpoint = GenerationCheckpoint()
+    try:
+        builder.build_simple_presentation(SLIDES, checkpoint=checkpoint)
+        assert False, "expected GenerationRetry"
+    except GenerationRetry:
+        pass
+
+    applied_before = service.object_ids()
+    result = builder.build_simple_presentation(SLIDES, checkpoint=checkpoint)
+
+    assert result['failed_requests'] == []
+    ids = service.object_ids()
+    assert len(ids) == len(set(ids))
+    assert set(applied_before) <= set(ids)
+
+
+def test_timeout_during_bisection_resumes_inside_chunk():
+    """A 400 then a lost response in the same chunk neither loses nor repeats requests."""
+    clean = FakeSlides()
+    make_builder(clean).build_simple_presentation(SLIDES)
+    expected = sorted(clean.object_ids())
+
+    for applied in (True, False):
+        service = FakeSlides()
+        builder = make_builder(service)
+        # Call 2 is the first content chunk: rejected, then its first half times out
+        service.failures[2] = (http_error(400), False)
+        service.failures[3] = (TimeoutError("read timed out"), applied)
+
+        checkpoint = GenerationCheckpoint()
+        try:
+            builder.build_simple_presentation(SLIDES, checkpoint=checkpoint)
+            assert False, "expected GenerationRetry"
+        except GenerationRetry:
+            pass
+        assert checkpoint.chunks_applied == 0
+        assert checkpoint.batch_progress['until'] - checkpoint.batch_progress['next'] == 5
+
+        result = builder.build_simple_presentation(SLIDES, checkpoint=GenerationCheckpoint(checkpoint.to_dict()))
+
+        assert result['failed_requests'] == []
+        assert sorted(service.object_ids()) == expected
+
+
+def test_permanent_errors_are_not_retried():
+    """Non-transient errors still fail the build."""
+    service = FakeSlides()
+    builder = make_builder(service)
+    service.failures[1] = (http_error(403), False)
+
+    try:
+        builder.build_simple_presentation(SLIDES)
+        assert False, "expected BuilderError"
+    except GenerationRetry:
+        assert False, "403 must not be retried"
+    except Exception as e:
+        assert type(e).__name__ == 'BuilderError'
+
+
+def test_retry_after_is_honored_with_jitter():
+    """Retry-After sets the delay floor; jitter stays within 20%."""
+    error = http_error(429, {'retry-after': '7'})
+    assert get_retry_after(error) == 7.0
+
+    delays = [compute_retry_delay(error, attempt=1) for _ in range(50)]
+    assert all(7.0 <= delay <= 8.4 for delay in delays)
+
+    backoff = [compute_retry_delay(http_error(503), attempt=3, initial_delay=1.0) for _ in range(50)]
+    assert all(0.0 <= delay <= 4.0 for delay in backoff)
+
+
+def test_run_with_retries_resumes_without_real_sleep():
+    """Synchronous runner resumes from the checkpoint using the given sleep."""
+    service = FakeSlides()
+    builder = make_builder(service)
+    service.failures[2] = (http_error(500), False)
+    sleeps = []
+
+    result = run_with_retries(
+        lambda checkpoint: builder.build_simple_presentation(SLIDES, checkpoint=checkpoint),
+        sleep=sleeps.append
+    )
+
+    assert result['presentation_id'] == 'pres-1'
+    assert len(sleeps) == 1
+    assert service.presentations_created == 1
+
+
+if __name__ == "__main__":
+    test_resume_after_transient_failure_reuses_presentation()
+    test_lost_response_is_not_applied_twice()
+    test_timeout_during_bisection_resumes_inside_chunk()
+    test_permanent_errors_are_not_retried()
+    test_retry_after_is_honored_with_jitter()
+    test_run_with_retries_resumes_without_real_sleep()
+
+    print("✅ All tests completed!")
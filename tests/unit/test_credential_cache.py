@@ -0,0 +1,220 @@
+"""
+Tests for the per-session credential cache with proactive refresh.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask, session
+
+from presentation_design.auth.credential_cache import (
+    CredentialCache,
+    CredentialRefreshError,
+    credentials_from_dict,
+    credentials_to_dict
+)
+from presentation_design.auth.web_oauth import WebOAuthManager
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class FakeTokenEndpoint:
+    """Refresh function issuing numbered one-hour tokens."""
+
+    def __init__(self, clock, delay=0.0, fail=False, error="invalid_grant"):
+        self.clock = clock
+        self.delay = delay
+        self.fail = fail
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, credentials):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(self.error)
+        with self._lock:
+            self.calls += 1
+            credentials.token = f"token-{self.calls}"
+        credentials.expiry = self.clock[0] + timedelta(hours=1)
+
+
+def session_data(token='token-0', expires_in=3600):
+    return {
+        'token': token,
+        'refresh_token': 'refresh',
+        'token_uri': 'https://oauth2.googleapis.com/token',
+        'client_id': 'client',
+        'client_secret': 'secret',
+        'scopes': ['scope'],
+        'expiry': (NOW + timedelta(seconds=expires_in)).isoformat() if expires_in is not None else None
+    }
+
+
+def make_cache(clock, endpoint, **kwargs):
+    return CredentialCache(refresh=endpoint, now=lambda: clock[0], background=False, **kwargs)
+
+
+def test_dict_round_trip_keeps_expiry():
+    credentials = credentials_from_dict(session_data())
+    assert credentials.expiry == NOW + timedelta(hours=1)
+    assert credentials_to_dict(credentials) == session_data()
+
+    legacy = session_data()
+    del legacy['expiry']
+    assert credentials_from_dict(legacy).expiry is None
+
+
+def test_valid_token_served_from_cache_without_refresh():
+    clock = [NOW]
+    endpoint = FakeTokenEndpoint(clock)
+    cache = make_cache(clock, endpoint)
+
+    first = cache.get(session_data())
+    second = cache.get(session_data())
+
+    assert first is second
+    assert endpoint.calls == 0
+    assert cache.stats()['hits'] == 1
+
+
+def test_refresh_ahead_inside_margin():
+    clock = [NOW]
+    endpoint = FakeTokenEndpoint(clock)
+    cache = make_cache(clock, endpoint, refresh_margin_seconds=300)
+
+    cache.get(session_data(expires_in=3600))
+    clock[0] = NOW + timedelta(seconds=3400)
+    # Still valid: caller is not blocked, refresh happens ahead
+    cache.get(session_data(expires_in=3600))
+
+    assert endpoint.calls == 1
+    assert cache.get(session_data()).token == 'token-1'
+
+
+def test_expired_token_refreshed_synchronously():
+    clock = [NOW + timedelta(hours=2)]
+    endpoint = FakeTokenEndpoint(clock)
+    cache = make_cache(clock, endpoint)
+
+    credentials = cache.get(session_data())
+    assert credentials.token == 'token-1'
+    assert cache.remaining_seconds(credentials) == 3600
+
+
+def test_min_valid_seconds_for_jobs():
+    clock = [NOW]
+    endpoint = FakeTokenEndpoint(clock)
+    cache = make_cache(clock, endpoint, refresh_margin_seconds=60)
+
+    # 20 minutes left is enough for a 10 minute job...
+    assert cache.get(session_data(expires_in=1200), min_valid_seconds=600).token == 'token-0'
+    # ...but not for a 30 minute one
+    assert cache.get(session_data(expires_in=1200), min_valid_seconds=1800).token == 'token-1'
+    # Requests beyond one token lifetime are capped instead of refreshing forever
+    assert cache.get(session_data(), min_valid_seconds=10 * 3600).token == 'token-1'
+    assert endpoint.calls == 1
+
+
+def test_concurrent_refreshes_are_coalesced():
+    clock = [NOW + timedelta(hours=2)]
+    endpoint = FakeTokenEndpoint(clock, delay=0.2)
+    cache = make_cache(clock, endpoint)
+    barrier = threading.Barrier(8)
+    tokens = []
+
+    def worker():
+        barrier.wait()
+        tokens.append(cache.get(session_data()).token)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert endpoint.calls == 1
+    assert tokens == ['token-1'] * 8
+
+
+def test_failed_refresh_raises():
+    clock = [NOW + timedelta(hours=2)]
+    cache = make_cache(clock, FakeTokenEndpoint(clock, fail=True))
+    try:
+        cache.get(session_data())
+        assert False, "Expected CredentialRefreshError"
+    except CredentialRefreshError:
+        pass
+
+
+def test_web_manager_memoizes_per_request_and_syncs_session():
+    clock = [NOW + timedelta(hours=2)]
+    endpoint = FakeTokenEndpoint(clock)
+    manager = WebOAuthManager('unused.json', make_cache(clock, endpoint))
+    app = Flask(__name__)
+    app.secret_key = 'test'
+
+    with app.test_request_context('/'):
+        session['credentials'] = session_data()
+        first = manager.get_credentials()
+        assert manager.get_credentials() is first
+        assert session['credentials']['token'] == 'token-1'
+
+        job_credentials = manager.get_credentials_for_job(600)
+        assert job_credentials['token'] == 'token-1'
+        assert job_credentials['expiry'] is not None
+        assert endpoint.calls == 1
+
+    endpoint.fail = True
+    clock[0] = NOW + timedelta(hours=5)
+    with app.test_request_context('/'):
+        session['credentials'] = session_data(token='token-1')
+        assert manager.get_credentials() is None
+        assert 'credentials' not in session
+
+
+def test_transient_refresh_failure_keeps_session():
+    clock = [NOW]
+    endpoint = FakeTokenEndpoint(clock, fail=True, error="connection timed out")
+    manager = WebOAuthManager('unused.json', make_cache(clock, endpoint, refresh_margin_seconds=60))
+    app = Flask(__name__)
+    app.secret_key = 'test'
+
+    # 20 minutes left: a job asking for 30 gets the still valid token
+    with app.test_request_context('/'):
+        session['credentials'] = session_data(expires_in=1200)
+        assert manager.get_credentials_for_job(1800)['token'] == 'token-0'
+        assert 'credentials' in session
+
+    # Expired: no credentials for this request, but the user stays logged in
+    clock[0] = NOW + timedelta(hours=2)
+    with app.test_request_context('/'):
+        session['credentials'] = session_data(expires_in=1200)
+        assert manager.get_credentials() is None
+        assert 'credentials' in session
+
+    # A revoked grant still fails a job that needs a longer-lived token
+    endpoint.error = "invalid_grant: Token has been expired or revoked."
+    clock[0] = NOW
+    try:
+        make_cache(clock, endpoint).get(session_data(expires_in=1200), min_valid_seconds=1800)
+        assert False, "Expected CredentialRefreshError"
+    except CredentialRefreshError as e:
+        assert e.permanent
+
+
+if __name__ == "__main__":
+    print("Running credential cache tests...\n")
+
+    test_dict_round_trip_keeps_expiry()
+    test_valid_token_served_from_cache_without_refresh()
+    test_refresh_ahead_inside_margin()
+    test_expired_token_refreshed_synchronously()
+    test_min_valid_seconds_for_jobs()
+    test_concurrent_refreshes_are_coalesced()
+    test_failed_refresh_raises()
+    test_web_manager_memoizes_per_request_and_syncs_session()
+    test_transient_refresh_failure_keeps_session()
+
+    print("\n✅ All tests completed!")
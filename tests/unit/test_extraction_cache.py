@@ -0,0 +1,196 @@
+"""
+Tests for the revision-aware extraction cache.
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from presentation_design.extraction.extraction_cache import (
+    ExtractionAccessError,
+    ExtractionCache
+)
+
+
+class _Call:
+    def __init__(self, run):
+        self.run = run
+
+    def execute(self):
+        return self.run()
+
+
+class FakeProvider:
+    """Counts metadata calls; deck state is controlled by the test."""
+
+    def __init__(self, revision='r1', modified_time='2025-01-01T00:00:00Z', status=None):
+        self.revision = revision
+        self.modified_time = modified_time
+        self.status = status
+        self.calls = []
+
+    def build_service(self, name, version):
+        return self
+
+    def presentations(self):
+        return self
+
+    def files(self):
+        return self
+
+    def get(self, presentationId=None, fileId=None, fields=None, **kwargs):
+        def run():
+            self.calls.append(('slides' if presentationId else 'drive', fields))
+            if self.status:
+                raise HttpError(httplib2.Response({'status': self.status}), b'{}')
+            if presentationId:
+                return {'revisionId': self.revision} if self.revision else {}
+            return {'modifiedTime': self.modified_time}
+        return _Call(run)
+
+
+def make_extract(counter, title='Deck'):
+    def extract():
+        counter.append(1)
+        return [{'title': title, 'content': '<p>text</p>', 'mainText': 'text'}]
+    return extract
+
+
+def test_unchanged_deck_served_after_one_metadata_call():
+    """Second import of the same revision skips extraction entirely."""
+    cache = ExtractionCache()
+    provider = FakeProvider()
+    extracted = []
+
+    first = cache.get_or_extract('deck1', provider, 'user:a', make_extract(extracted))
+    provider.calls.clear()
+    second = cache.get_or_extract('deck1', provider, 'user:a', make_extract(extracted))
+
+    assert first == second
+    assert len(extracted) == 1
+    assert provider.calls == [('slides', 'revisionId')]
+    assert cache.stats()['hits'] == 1
+
+    # Callers get independent copies
+    second[0]['title'] = 'changed'
+    assert cache.get_or_extract('deck1', provider, 'user:a', make_extract(extracted))[0]['title'] == 'Deck'
+
+
+def test_new_revision_is_extracted_again():
+    """A changed revisionId invalidates the cached slides."""
+    cache = ExtractionCache()
+    provider = FakeProvider()
+    extracted = []
+
+    cache.get_or_extract('deck1', provider, 'user:a', make_extract(extracted))
+    provider.revision = 'r2'
+    slides = cache.get_or_extract('deck1', provider, 'user:a', make_extract(extracted, 'Deck v2'))
+
+    assert len(extracted) == 2
+    assert slides[0]['title'] == 'Deck v2'
+    assert len(cache.memory) == 1
+
+
+def test_drive_modified_time_fallback():
+    """Viewers without revisionId fall back to the Drive modifiedTime."""
+    cache = ExtractionCache()
+    provider = FakeProvider(revision=None)
+    extracted = []
+
+    cache.get_or_extract('deck1', provider, 'sa:x', make_extract(extracted))
+    cache.get_or_extract('deck1', provider, 'sa:x', make_extract(extracted))
+    assert len(extracted) == 1
+
+    provider.modified_time = '2025-02-01T00:00:00Z'
+    cache.get_or_extract('deck1', provider, 'sa:x', make_extract(extracted))
+    assert len(extracted) == 2
+
+
+def test_entries_persist_in_sqlite():
+    """A new cache instance on the same database serves earlier entries."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'cache.db'
+        extracted = []
+
+        ExtractionCache(db_path=db_path).get_or_extract('deck1', FakeProvider(), 'user:a', make_extract(extracted))
+        restarted = ExtractionCache(db_path=db_path)
+        slides = restarted.get_or_extract('deck1', FakeProvider(), 'user:a', make_extract(extracted))
+
+        assert len(extracted) == 1
+        assert slides[0]['title'] == 'Deck'
+
+
+def test_negative_cache_for_inaccessible_decks():
+    """403/404 is remembered briefly and per identity."""
+    now = [0.0]
+    cache = ExtractionCache(negative_ttl_seconds=30, clock=lambda: now[0])
+    provider = FakeProvider(status=404)
+
+    for _ in range(2):
+        try:
+            cache.get_or_extract('deck1', provider, 'user:a', make_extract([]))
+            assert False, "expected an error"
+        except (HttpError, ExtractionAccessError):
+            pass
+    assert len(provider.calls) == 1
+
+    # Another identity may have access
+    provider.status = None
+    assert cache.get_or_extract('deck1', provider, 'user:b', make_extract([]))
+
+    # Expired negative entries are retried
+    now[0] = 31.0
+    assert cache.get_or_extract('deck1', provider, 'user:a', make_extract([]))
+
+
+def test_concurrent_imports_share_one_extraction():
+    """Users importing the same revision at once trigger one extraction."""
+    cache = ExtractionCache()
+    extracted = []
+    denied = FakeProvider(status=403)
+
+    def slow_extract():
+        extracted.append(1)
+        time.sleep(0.2)
+        return [{'title': 'Deck', 'content': '<p>text</p>', 'mainText': 'text'}]
+
+    results = {}
+    errors = {}
+    barrier = threading.Barrier(9)
+
+    def worker(user):
+        provider = denied if user == 'user:denied' else FakeProvider()
+        barrier.wait()
+        try:
+            results[user] = cache.get_or_extract('deck1', provider, user, slow_extract)
+        except Exception as e:
+            errors[user] = e
+
+    users = [f"user:{idx}" for idx in range(8)] + ['user:denied']
+    threads = [threading.Thread(target=worker, args=(user,)) for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(extracted) == 1
+    assert len(results) == 8
+    assert len({id(slides) for slides in results.values()}) == 8
+    # Access is still checked per caller
+    assert set(errors) == {'user:denied'}
+    assert cache.stats()['coalesced'] == 7
+
+
+if __name__ == "__main__":
+    test_unchanged_deck_served_after_one_metadata_call()
+    test_new_revision_is_extracted_again()
+    test_drive_modified_time_fallback()
+    test_entries_persist_in_sqlite()
+    test_negative_cache_for_inaccessible_decks()
+    test_concurrent_imports_share_one_extraction()
+
+    print("✅ All tests completed!")
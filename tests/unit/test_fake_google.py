@@ -0,0 +1,197 @@
+"""
+Tests for the offline fake Google Slides/Drive backend.
+
+Requests go through real googleapiclient service objects, so these tests
+also cover request serialization, media upload and field masks.
+"""
+
+import base64
+
+from googleapiclient.errors import HttpError
+
+from presentation_design.extraction.slides_extractor import SlidesExtractor
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.checkpoint import GenerationRetry, GenerationCheckpoint
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.testing.fake_google import (
+    FakeGoogleBackend,
+    apply_field_mask,
+    fake_provider,
+    parse_field_mask
+)
+
+PNG_DATA_URL = "data:image/png;base64," + base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'\0' * 64).decode('ascii')
+
+
+def make_builder(backend, **planner_kwargs):
+    planner = BatchPlanner(pipeline=False, **planner_kwargs)
+    return PresentationBuilder(fake_provider(backend), batch_planner=planner)
+
+
+def sample_slides(count=3):
+    return [
+        {'title': f"Slide {idx}", 'mainText': f"Body text {idx}\nSecond line"}
+        for idx in range(count)
+    ]
+
+
+def test_field_mask():
+    tree = parse_field_mask('title,slides(objectId,pageElements(objectId)),pageSize.width')
+    data = {
+        'title': 'Deck',
+        'revisionId': 'r1',
+        'pageSize': {'width': 1, 'height': 2},
+        'slides': [{'objectId': 's1', 'pageElements': [{'objectId': 'e1', 'shape': {}}], 'extra': 1}]
+    }
+    assert apply_field_mask(data, tree) == {
+        'title': 'Deck',
+        'pageSize': {'width': 1},
+        'slides': [{'objectId': 's1', 'pageElements': [{'objectId': 'e1'}]}]
+    }
+    assert parse_field_mask('*') is None
+    assert parse_field_mask('') is None
+
+
+def test_build_and_extract_round_trip():
+    backend = FakeGoogleBackend()
+    builder = make_builder(backend)
+
+    result = builder.build_simple_presentation(sample_slides(3), title="Fake deck")
+    presentation = backend.presentations[result['presentation_id']]
+
+    assert presentation['title'] == "Fake deck"
+    assert [slide['objectId'] for slide in presentation['slides']] == [
+        'pd_slide_000', 'pd_slide_001', 'pd_slide_002'
+    ]
+    assert result['failed_requests'] == []
+
+    extractor = SlidesExtractor(fake_provider(backend))
+    extracted = extractor.extract_presentation(result['presentation_id'], raw_mode=True)
+    assert len(extracted['slides']) == 3
+
+    slide = extractor.extract_slide(result['presentation_id'], 'pd_slide_001')
+    assert slide is not None
+    print("✓ Build/extract round trip through fake backend passed")
+
+
+def test_image_upload_and_permissions():
+    backend = FakeGoogleBackend()
+    builder = make_builder(backend)
+    slides = sample_slides(1)
+    slides[0]['images'] = [{'url': PNG_DATA_URL, 'position': {'x': 10, 'y': 10}, 'size': {'width': 50, 'height': 50}}]
+
+    result = builder.build_simple_presentation(slides, title="With image")
+
+    uploads = [record for record in backend.files.values() if record['mimeType'] == 'image/png']
+    assert len(uploads) == 1
+    assert uploads[0]['size'] == str(len(base64.b64decode(PNG_DATA_URL.split(',', 1)[1])))
+    assert uploads[0]['permissions'][0]['type'] == 'anyone'
+
+    elements = backend.presentations[result['presentation_id']]['slides'][0]['pageElements']
+    images = [element for element in elements if 'image' in element]
+    assert images and uploads[0]['id'] in images[0]['image']['sourceUrl']
+
+    stats = backend.stats()
+    assert stats['by_method']['drive.files.create']['calls'] >= 1
+    assert stats['by_method']['drive.permissions.create']['calls'] == 1
+
+
+def test_stats_count_round_trips_and_bytes():
+    backend = FakeGoogleBackend()
+    builder = make_builder(backend, max_requests=10)
+
+    builder.build_simple_presentation(sample_slides(5), title="Stats")
+    stats = backend.stats()
+
+    assert stats['by_method']['slides.presentations.create']['calls'] == 1
+    assert stats['by_method']['slides.presentations.batchUpdate']['calls'] >= 2
+    assert stats['bytes_sent'] > 0 and stats['bytes_received'] > 0
+    assert stats['errors'] == 0
+
+    backend.reset_stats()
+    assert backend.stats()['requests'] == 0
+
+
+def test_latency_is_simulated():
+    slept = []
+    backend = FakeGoogleBackend(
+        latency=lambda method: 0.5 if method.endswith('batchUpdate') else 0.1,
+        sleep=slept.append
+    )
+    make_builder(backend).build_simple_presentation(sample_slides(2), title="Slow")
+
+    assert 0.5 in slept and 0.1 in slept
+    assert backend.stats()['wall_seconds'] >= sum(slept)
+
+
+def test_quota_returns_429_with_retry_after():
+    now = [0.0]
+    backend = FakeGoogleBackend(clock=lambda: now[0])
+    backend.set_quota(limit=2, window_seconds=10)
+    provider = fake_provider(backend)
+    service = provider.build_service('slides', 'v1')
+
+    pid = service.presentations().create(body={'title': 'q'}).execute()['presentationId']
+    service.presentations().get(presentationId=pid).execute()
+    try:
+        service.presentations().get(presentationId=pid).execute()
+        assert False, "Expected 429"
+    except HttpError as e:
+        assert e.resp.status == 429
+        assert float(e.resp['retry-after']) == 10
+
+    now[0] = 10.0
+    service.presentations().get(presentationId=pid).execute()
+
+
+def test_failure_injection_resumes_without_duplicates():
+    backend = FakeGoogleBackend()
+    builder = make_builder(backend, max_requests=4)
+    backend.inject_failure('slides.presentations.batchUpdate', status=503, skip=1, after_apply=True)
+
+    checkpoint = GenerationCheckpoint()
+    try:
+        builder.build_simple_presentation(sample_slides(4), title="Flaky", checkpoint=checkpoint)
+        assert False, "Expected GenerationRetry"
+    except GenerationRetry as e:
+        checkpoint = e.checkpoint
+
+    result = builder.build_simple_presentation(sample_slides(4), title="Flaky", checkpoint=checkpoint)
+
+    assert len(backend.presentations) == 1
+    slides = backend.presentations[result['presentation_id']]['slides']
+    assert len(slides) == 4
+    assert backend.stats()['by_method']['slides.presentations.batchUpdate']['errors'] == 1
+
+
+def test_batch_update_is_atomic():
+    backend = FakeGoogleBackend()
+    service = fake_provider(backend).build_service('slides', 'v1')
+    pid = service.presentations().create(body={'title': 'atomic'}).execute()['presentationId']
+    before = backend.presentations[pid]['slides']
+
+    try:
+        service.presentations().batchUpdate(presentationId=pid, body={'requests': [
+            {'createSlide': {'objectId': 'new_slide_1'}},
+            {'deleteObject': {'objectId': 'does_not_exist'}}
+        ]}).execute()
+        assert False, "Expected 400"
+    except HttpError as e:
+        assert e.resp.status == 400
+
+    assert backend.presentations[pid]['slides'] == before
+
+
+if __name__ == "__main__":
+    print("Running fake Google backend tests...\n")
+
+    test_field_mask()
+    test_build_and_extract_round_trip()
+    test_image_upload_and_permissions()
+    test_stats_count_round_trips_and_bytes()
+    test_latency_is_simulated()
+    test_quota_returns_429_with_retry_after()
+    test_failure_injection_resumes_without_duplicates()
+    test_batch_update_is_atomic()
+
+    print("\n✅ All tests completed!")
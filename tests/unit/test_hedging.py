@@ -0,0 +1,135 @@
+"""
+Tests for hedged OAuth/Service-Account extraction.
+"""
+
+import threading
+import time
+
+from presentation_design.extraction.hedging import HedgedRunner, HedgingError, LatencyTracker
+
+
+def attempt(result=None, delay=0.0, error=None, log=None, name=None):
+    def run(cancel):
+        if log is not None:
+            log.append(('start', name))
+        time.sleep(delay)
+        if error:
+            raise error
+        if log is not None:
+            log.append(('done', name, cancel.is_set()))
+        return result
+    return run
+
+
+def test_hedged_starts_backup_after_delay():
+    runner = HedgedRunner(mode='hedged', hedge_delay=0.05)
+    log = []
+    started = time.monotonic()
+
+    name, result = runner.run('deck', [
+        ('oauth', attempt('slow', delay=0.5, log=log, name='oauth')),
+        ('service_account', attempt('fast', delay=0.01, log=log, name='service_account'))
+    ])
+
+    assert (name, result) == ('service_account', 'fast')
+    assert time.monotonic() - started < 0.4
+    assert runner.stats()['hedges'] == 1
+    assert runner.stats()['cancelled'] == 1
+
+
+def test_hedged_does_not_start_backup_when_fast():
+    runner = HedgedRunner(mode='hedged', hedge_delay=0.5)
+    log = []
+
+    name, _ = runner.run('deck', [
+        ('oauth', attempt('ok', delay=0.01, log=log, name='oauth')),
+        ('service_account', attempt('sa', log=log, name='service_account'))
+    ])
+
+    assert name == 'oauth'
+    assert ('start', 'service_account') not in log
+
+
+def test_failure_starts_next_path_immediately():
+    runner = HedgedRunner(mode='hedged', hedge_delay=5.0)
+    started = time.monotonic()
+
+    name, result = runner.run('deck', [
+        ('oauth', attempt(error=PermissionError("403"))),
+        ('service_account', attempt('public'))
+    ])
+
+    assert (name, result) == ('service_account', 'public')
+    assert time.monotonic() - started < 1.0
+
+
+def test_winner_is_remembered_per_deck():
+    runner = HedgedRunner(mode='sequential')
+    calls = []
+
+    def oauth(cancel):
+        calls.append('oauth')
+        raise PermissionError("403")
+
+    def service_account(cancel):
+        calls.append('service_account')
+        return 'ok'
+
+    runner.run('deck', [('oauth', oauth), ('service_account', service_account)])
+    calls.clear()
+    runner.run('deck', [('oauth', oauth), ('service_account', service_account)])
+    assert calls == ['service_account']
+
+    # Other decks keep the default order
+    calls.clear()
+    runner.run('other', [('oauth', oauth), ('service_account', service_account)])
+    assert calls == ['oauth', 'service_account']
+
+
+def test_concurrent_mode_and_all_failures():
+    runner = HedgedRunner(mode='concurrent')
+    barrier = threading.Barrier(2, timeout=2)
+
+    def together(value):
+        def run(cancel):
+            barrier.wait()
+            return value
+        return run
+
+    name, _ = runner.run('deck', [('oauth', together('a')), ('service_account', together('b'))])
+    assert name in ('oauth', 'service_account')
+
+    try:
+        runner.run('broken', [
+            ('oauth', attempt(error=PermissionError("403"))),
+            ('service_account', attempt(error=LookupError("404")))
+        ])
+        assert False, "Expected HedgingError"
+    except HedgingError as e:
+        assert set(e.errors) == {'oauth', 'service_account'}
+
+
+def test_hedge_delay_follows_p95():
+    runner = HedgedRunner(mode='hedged', default_hedge_delay=3.0, min_hedge_delay=0.1, max_hedge_delay=5.0)
+    assert runner.delay_for('oauth') == 3.0
+
+    for seconds in [0.2] * 18 + [0.9, 1.2]:
+        runner.latency.observe('oauth', seconds)
+    assert runner.delay_for('oauth') == 1.2
+
+    tracker = LatencyTracker()
+    tracker.observe('x', 1.0)
+    assert tracker.quantile('x') is None
+
+
+if __name__ == "__main__":
+    print("Running hedged extraction tests...\n")
+
+    test_hedged_starts_backup_after_delay()
+    test_hedged_does_not_start_backup_when_fast()
+    test_failure_starts_next_path_immediately()
+    test_winner_is_remembered_per_deck()
+    test_concurrent_mode_and_all_failures()
+    test_hedge_delay_follows_p95()
+
+    print("\n✅ All tests completed!")
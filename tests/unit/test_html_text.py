@@ -0,0 +1,111 @@
+"""
+Tests for the editor HTML to rich text converter.
+"""
+
+from presentation_design.extraction.inline_markup import StyleRun
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.html_text import (
+    Paragraph,
+    html_to_rich_text,
+    inserted_text,
+    plain_rich_text,
+    rich_text_requests
+)
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.generation.request_optimizer import RequestOptimizer
+from presentation_design.testing.fake_google import FakeGoogleBackend, fake_provider
+
+EDITOR_HTML = (
+    '<strong>Key points:</strong>\n<ul>\n<li>first <em>one</em></li>\n'
+    '<li>second<ul><li>nested</li></ul></li>\n</ul>\n\n<p><strong>Done</strong>.</p>'
+)
+
+
+def test_paragraphs_lists_and_runs():
+    rich = html_to_rich_text(EDITOR_HTML)
+
+    assert rich.text == 'Key points:\nfirst one\nsecond\nnested\nDone.'
+    assert [(p.list_level, p.ordered) for p in rich.paragraphs] == [
+        (None, False), (0, False), (0, False), (1, False), (None, False)
+    ]
+    assert rich.runs == [
+        StyleRun(0, 11, bold=True),
+        StyleRun(18, 21, italic=True),
+        StyleRun(36, 40, bold=True)
+    ]
+
+
+def test_whitespace_breaks_and_entities():
+    rich = html_to_rich_text('<div>one  <b>two</b></div><div><br></div><div><br></div><div>a&nbsp;&amp; b</div>')
+    assert rich.text == 'one two\n\na\xa0& b'
+    assert rich.runs == [StyleRun(4, 7, bold=True)]
+
+    # Newlines inside text are kept, empty lines are limited to one
+    assert html_to_rich_text('line1\nline2 <i>x</i>\n\n\n\nline3').text == 'line1\nline2 x\n\nline3'
+    assert html_to_rich_text('<p>a</p>\n<p>b</p>').text == 'a\nb'
+    assert html_to_rich_text('<ol><li>x</li></ol>').paragraphs == [Paragraph(0, 1, 0, True)]
+
+
+def test_requests_use_exact_ranges():
+    rich = html_to_rich_text(EDITOR_HTML)
+    assert inserted_text(rich) == 'Key points:\nfirst one\nsecond\n\tnested\nDone.'
+
+    requests = rich_text_requests('box', rich)
+    ranges = [
+        (next(iter(r)), r[next(iter(r))]['textRange']['startIndex'], r[next(iter(r))]['textRange']['endIndex'])
+        for r in requests
+    ]
+    # The last bold run follows the nesting tab, so it is shifted by one
+    assert ranges == [
+        ('updateTextStyle', 0, 11),
+        ('updateTextStyle', 18, 21),
+        ('updateTextStyle', 37, 41),
+        ('createParagraphBullets', 12, 36)
+    ]
+    assert requests[1]['updateTextStyle']['fields'] == 'italic'
+
+    # Slides API indexes are UTF-16 code units
+    emoji = html_to_rich_text('<p>😀 <b>go</b></p>')
+    assert rich_text_requests('box', emoji)[0]['updateTextStyle']['textRange']['startIndex'] == 3
+
+    assert rich_text_requests('box', plain_rich_text('just text\nmore')) == []
+
+
+def test_generated_deck_keeps_lists():
+    backend = FakeGoogleBackend()
+    builder = PresentationBuilder(
+        fake_provider(backend),
+        batch_planner=BatchPlanner(pipeline=False),
+        request_optimizer=RequestOptimizer()
+    )
+    slides = [{'title': 'Summary', 'mainText': EDITOR_HTML}]
+
+    for layout_mode in (False, True):
+        result = builder.build_simple_presentation(slides, title="Rich", layout_mode=layout_mode)
+        assert result['failed_requests'] == []
+
+        slide = backend.presentations[result['presentation_id']]['slides'][0]
+        body = next(
+            element for element in slide['pageElements']
+            if 'nested' in ''.join(
+                run.get('textRun', {}).get('content', '')
+                for run in element.get('shape', {}).get('text', {}).get('textElements', [])
+            )
+        )
+        elements = body['shape']['text']['textElements']
+        text = ''.join(item.get('textRun', {}).get('content', '') for item in elements)
+        bullets = [item['paragraphMarker'].get('bullet') for item in elements if 'paragraphMarker' in item]
+
+        assert text == 'Key points:\nfirst one\nsecond\nnested\nDone.'
+        assert [bullet and bullet['nestingLevel'] for bullet in bullets] == [None, 0, 0, 1, None]
+
+
+if __name__ == "__main__":
+    print("Running HTML text tests...\n")
+
+    test_paragraphs_lists_and_runs()
+    test_whitespace_breaks_and_entities()
+    test_requests_use_exact_ranges()
+    test_generated_deck_keeps_lists()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,76 @@
+"""
+Tests for the inline Markdown emphasis tokenizer.
+"""
+
+import random
+
+from presentation_design.extraction.inline_markup import StyleRun, inline_html, parse_inline
+from presentation_design.extraction.text_parser import TextParser
+
+
+def test_strong_and_em():
+    assert inline_html("**bold** and *em*") == '<strong>bold</strong> and <em>em</em>'
+    assert inline_html("__bold__ and _em_.") == '<strong>bold</strong> and <em>em</em>.'
+    assert inline_html("no markup here") == 'no markup here'
+
+
+def test_nested_emphasis():
+    assert inline_html("***both***") == '<em><strong>both</strong></em>'
+    assert inline_html("***a** b*") == '<em><strong>a</strong> b</em>'
+    assert inline_html("**a *b* c**") == '<strong>a <em>b</em> c</strong>'
+
+
+def test_intraword_underscores_stay_literal():
+    text = "Call snake_case_name, see http://example.com/a_b_c"
+    assert inline_html(text) == text
+    assert inline_html("2*3*4") == '2<em>3</em>4'
+
+
+def test_code_spans_and_escapes():
+    assert inline_html("`a *b* c` and \\*lit\\*") == '<code>a *b* c</code> and *lit*'
+    assert inline_html("``a`b``") == '<code>a`b</code>'
+    assert inline_html("`open and **bold**") == '`open and <strong>bold</strong>'
+    assert inline_html("**unclosed") == '**unclosed'
+
+
+def test_style_runs():
+    markup = parse_inline("Go **fast *now*** or `wait`")
+
+    assert markup.text == 'Go fast now or wait'
+    assert markup.runs == [
+        StyleRun(3, 8, bold=True),
+        StyleRun(8, 11, bold=True, italic=True),
+        StyleRun(15, 19, code=True)
+    ]
+    assert markup.html == 'Go <strong>fast <em>now</em></strong> or <code>wait</code>'
+
+
+def test_fast_path_matches_full_tokenizer():
+    rnd = random.Random(7)
+    for alphabet in ("a *_.(", "ab  **__*_)!", "a *_«»,x"):
+        for _ in range(3000):
+            text = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 16)))
+            assert inline_html(text) == parse_inline(text).html, text
+
+
+def test_parser_formats_lines_inline():
+    html = TextParser().format_content(["Use **bold**:", "- item with _em_", "file_name.py stays"])
+
+    assert html == (
+        '<strong>Use <strong>bold</strong>:</strong>\n<ul>\n<li>item with <em>em</em></li>\n</ul>\n'
+        '<p>file_name.py stays</p>'
+    )
+
+
+if __name__ == "__main__":
+    print("Running inline markup tests...\n")
+
+    test_strong_and_em()
+    test_nested_emphasis()
+    test_intraword_underscores_stay_literal()
+    test_code_spans_and_escapes()
+    test_style_runs()
+    test_fast_path_matches_full_tokenizer()
+    test_parser_formats_lines_inline()
+
+    print("\n✅ All tests completed!")
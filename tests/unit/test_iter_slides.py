@@ -0,0 +1,59 @@
+"""
+Tests for lazy slide parsing and chunked editor conversion.
+"""
+
+from presentation_design.extraction.editor_format import iter_editor_chunks
+from presentation_design.extraction.text_parser import TextParser
+
+
+def marked_text(count):
+    return ''.join(f"Slide {idx + 1} Topic {idx}\nIntro line.\n- point\n\n" for idx in range(count))
+
+
+def test_iter_slides_matches_parse_slides():
+    texts = [
+        marked_text(30),
+        "First topic\n- a\n- b\n1\n\nSecond topic\nDetails here.\n2\nLeftover",
+        "Welcome\nto the course\n\nA long paragraph that explains the goals.\n\n# Part two\nMore details",
+        "   ",
+    ]
+    parser = TextParser()
+    for text in texts:
+        assert list(parser.iter_slides(text)) == parser.parse_slides(text)
+
+
+def test_iter_slides_is_lazy():
+    calls = []
+    parser = TextParser()
+    original = parser._slide_from_rows
+
+    def counting(rows, slide_id):
+        calls.append(slide_id)
+        return original(rows, slide_id)
+
+    parser._slide_from_rows = counting
+
+    slides = parser.iter_slides(marked_text(1000))
+    first = next(slides)
+
+    assert first['title'] == 'Topic 0'
+    assert calls == ['1']
+
+
+def test_editor_chunks_double_in_size():
+    chunks = list(iter_editor_chunks(TextParser().iter_slides(marked_text(100)), first_chunk=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 20, 40, 30]
+    assert chunks[0][0]['content'] == '<h1>Topic 0</h1>\n<p>Intro line.</p>\n<ul>\n<li>point</li>\n</ul>'
+    assert chunks[-1][-1]['title'] == 'Topic 99'
+    assert chunks[1][0]['original_objectIds'] == []
+
+
+if __name__ == "__main__":
+    print("Running lazy slide parsing tests...\n")
+
+    test_iter_slides_matches_parse_slides()
+    test_iter_slides_is_lazy()
+    test_editor_chunks_double_in_size()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,94 @@
+"""
+Tests for resuming requeued generation jobs after a restart.
+"""
+
+import os
+import runpy
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+WEB_APP = str(Path(__file__).resolve().parents[2] / 'web_app.py')
+SLIDES = [{'title': 'Slide 0', 'mainText': 'Body'}]
+CHECKPOINT = {'version': 1, 'attempt': 1, 'presentation_id': 'pres-1', 'steps': {}, 'images': {}, 'chunks_applied': 2}
+
+
+def load_web_app(db_dir):
+    """web_app module namespace without start-up side effects, on a temporary database."""
+    # run_path returns a copy; patch the globals the functions actually use
+    web_app = runpy.run_path(WEB_APP, run_name='__mp_main__')['init_database'].__globals__
+    web_app['DB_PATH'] = os.path.join(db_dir, 'jobs.db')
+    web_app['init_database']()
+    return web_app
+
+
+def retrying_job(web_app, job_id, session_id, retry_at):
+    web_app['save_job_to_db'](job_id, {
+        'url': None,
+        'template': 'default',
+        'status': 'retrying',
+        'created_at': datetime.now().isoformat(),
+        'slides': SLIDES,
+        'settings': {},
+        'session_id': session_id,
+        'checkpoint': CHECKPOINT,
+        'retry_at': retry_at,
+        'error': 'Step failed'
+    })
+
+
+def test_retrying_jobs_resume_after_restart():
+    with tempfile.TemporaryDirectory() as db_dir:
+        web_app = load_web_app(db_dir)
+        web_app['save_user_session']('session-1', 'user@example.com', {'token': 'abc'})
+        retrying_job(web_app, 'job-ok', 'session-1', (datetime.now() - timedelta(seconds=5)).isoformat())
+        retrying_job(web_app, 'job-lost', 'session-missing', datetime.now().isoformat())
+
+        resumed = []
+        done = threading.Event()
+
+        def fake_process(job_id, slides, template_name=None, existing_presentation_id=None,
+                         credentials_dict=None, checkpoint_data=None):
+            resumed.append((job_id, slides, credentials_dict, checkpoint_data))
+            done.set()
+
+        web_app['process_slides_in_background'] = fake_process
+
+        assert web_app['resume_retrying_jobs']() == 1
+        assert done.wait(5)
+        assert resumed == [('job-ok', SLIDES, {'token': 'abc'}, CHECKPOINT)]
+        assert web_app['load_job_from_db']('job-ok')['status'] == 'processing'
+
+        # Without the owner's credentials the job fails instead of polling forever
+        lost = web_app['load_job_from_db']('job-lost')
+        assert lost['status'] == 'error'
+        assert 'restart' in lost['error']
+        assert lost['retry_at'] is None
+
+        # A job is resumed by one process only
+        assert not web_app['claim_retrying_job']('job-ok')
+
+
+def test_failed_generation_is_stored_as_error():
+    with tempfile.TemporaryDirectory() as db_dir:
+        web_app = load_web_app(db_dir)
+        retrying_job(web_app, 'job-1', 'session-1', None)
+        web_app['jobs']['job-1'] = web_app['load_job_from_db']('job-1')
+
+        # No credentials: the build fails before any API call
+        web_app['process_slides_in_background']('job-1', SLIDES, credentials_dict=None)
+
+        stored = web_app['load_job_from_db']('job-1')
+        assert web_app['jobs']['job-1']['status'] == stored['status'] == 'error'
+        assert stored['error'] == web_app['jobs']['job-1']['error']
+        assert stored['checkpoint'] == CHECKPOINT
+
+
+if __name__ == "__main__":
+    print("Running job resume tests...\n")
+
+    test_retrying_jobs_resume_after_restart()
+    test_failed_generation_is_stored_as_error()
+
+    print("\n✅ All tests completed!")
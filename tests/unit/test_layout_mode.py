@@ -0,0 +1,144 @@
+"""
+Tests for layout (placeholder) based slide generation.
+"""
+
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.checkpoint import GenerationCheckpoint, GenerationRetry
+from presentation_design.generation.layout_mode import dominant_style, placeholder_ids, text_style
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.generation.request_optimizer import RequestOptimizer
+from presentation_design.testing.fake_google import FakeGoogleBackend, fake_provider
+
+
+def uniform_slides(count):
+    return [
+        {'title': f"Slide {idx}", 'mainText': f"Point one\nPoint two {idx}", 'fontFamily': 'Roboto', 'textSize': 20}
+        for idx in range(count)
+    ]
+
+
+def make_builder(backend=None):
+    return PresentationBuilder(
+        fake_provider(backend) if backend else None,
+        batch_planner=BatchPlanner(pipeline=False),
+        request_optimizer=RequestOptimizer()
+    )
+
+
+def element_texts(slide):
+    texts = {}
+    for element in slide['pageElements']:
+        runs = element.get('shape', {}).get('text', {}).get('textElements', [])
+        texts[element['objectId']] = ''.join(run.get('textRun', {}).get('content', '') for run in runs)
+    return texts
+
+
+def test_layout_mode_cuts_requests():
+    slides = uniform_slides(100)
+    builder = make_builder()
+
+    boxes = builder.plan_simple_presentation(slides, layout_mode=False, include_requests=False)
+    layout = builder.plan_simple_presentation(slides, layout_mode=True, include_requests=False)
+
+    steps = {step['step']: step for step in layout['steps']}
+    assert steps['content']['request_types'] == {'insertText': 200}
+    assert steps['slides']['request_types'] == {'createSlide': 100, 'deleteObject': 1}
+    assert steps['layout']['requests_count'] <= 10
+    assert layout['totals']['requests'] <= 310
+    assert layout['totals']['requests'] * 2 < boxes['totals']['requests']
+    assert layout['totals']['bytes'] < boxes['totals']['bytes']
+
+
+def test_layout_build_fills_placeholders():
+    backend = FakeGoogleBackend()
+    slides = uniform_slides(3) + [{'title': 'Only a title', 'fontFamily': 'Roboto', 'textSize': 20}]
+
+    result = make_builder(backend).build_simple_presentation(slides, title="Layout", layout_mode=True)
+    assert result['failed_requests'] == []
+
+    presentation = backend.presentations[result['presentation_id']]
+    assert len(presentation['slides']) == 4
+    for idx, slide in enumerate(presentation['slides']):
+        assert slide['slideProperties']['layoutObjectId'] == 'layout_title_and_body'
+        ids = placeholder_ids(slide['objectId'])
+        texts = element_texts(slide)
+        assert texts[ids['TITLE']] == slides[idx]['title']
+        if 'mainText' in slides[idx]:
+            assert texts[ids['BODY']] == slides[idx]['mainText']
+        else:
+            # The unused body placeholder is removed
+            assert ids['BODY'] not in texts
+
+
+def test_deviating_slides_get_only_differing_overrides():
+    slides = uniform_slides(5)
+    slides[2] = dict(slides[2], textColor='#FF0000')
+    slides[3] = dict(slides[3], textPosition={'vertical': 'top', 'horizontal': 'center'})
+
+    plan = make_builder().plan_simple_presentation(slides, layout_mode=True)
+    content = plan['steps'][-1]['requests']
+
+    def requests_for(slide_index):
+        prefix = f"pd_slide_{slide_index:03d}_"
+        return [
+            request for request in content
+            if next(iter(request.values())).get('objectId', '').startswith(prefix)
+        ]
+
+    assert [next(iter(r)) for r in requests_for(0)] == ['insertText', 'insertText']
+
+    colored = [r for r in requests_for(2) if 'updateTextStyle' in r]
+    assert len(colored) == 2
+    assert all(r['updateTextStyle']['fields'] == 'foregroundColor' for r in colored)
+
+    centered = [next(iter(r)) for r in requests_for(3)]
+    assert centered.count('updatePageElementTransform') == 2
+    assert centered.count('updateParagraphStyle') == 2
+    assert 'updateTextStyle' not in centered
+
+
+def test_dominant_style_per_field():
+    styles = [
+        text_style({'fontFamily': 'Roboto', 'textColor': '#111111'}, {}),
+        text_style({'fontFamily': 'Roboto', 'textColor': '#222222'}, {}),
+        text_style({'fontFamily': 'Arial', 'textColor': '#222222'}, {}),
+    ]
+    style = dominant_style(styles)
+    assert style['font_family'] == 'Roboto'
+    assert style['text_color'] == '#222222'
+    assert dominant_style([])['font_family'] == 'Arial'
+
+
+def test_resume_after_lost_slides_response_keeps_placeholders():
+    backend = FakeGoogleBackend()
+    builder = make_builder(backend)
+    slides = uniform_slides(3)
+    # Call 1 installs the layout, call 2 creates the slides
+    backend.inject_failure('slides.presentations.batchUpdate', status=503, skip=1, after_apply=True)
+
+    checkpoint = GenerationCheckpoint()
+    try:
+        builder.build_simple_presentation(slides, checkpoint=checkpoint, layout_mode=True)
+        assert False, "Expected GenerationRetry"
+    except GenerationRetry as e:
+        checkpoint = e.checkpoint
+
+    result = builder.build_simple_presentation(slides, checkpoint=checkpoint, layout_mode=True)
+    assert result['failed_requests'] == []
+
+    presentation = backend.presentations[result['presentation_id']]
+    assert len(presentation['slides']) == 3
+    texts = element_texts(presentation['slides'][1])
+    assert texts[placeholder_ids('pd_slide_001')['TITLE']] == 'Slide 1'
+
+
+if __name__ == "__main__":
+    print("Running layout mode tests...\n")
+
+    test_layout_mode_cuts_requests()
+    test_layout_build_fills_placeholders()
+    test_deviating_slides_get_only_differing_overrides()
+    test_dominant_style_per_field()
+    test_resume_after_lost_slides_response_keeps_placeholders()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,99 @@
+"""
+Tests for the shared per-slide line index.
+"""
+
+from presentation_design.extraction.content_analyzer import ContentAnalyzer
+from presentation_design.extraction.content_parser import ContentParser
+from presentation_design.extraction.line_index import (
+    ALL_CAPS,
+    BLANK,
+    BULLET,
+    NUMBERED,
+    TEXT,
+    index_lines
+)
+from presentation_design.extraction.text_splitter import TextSplitter
+
+SLIDE_TEXT = """Ключевые задачи
+
+Основные цели проекта:
+  1. Разработать прототип
+2) Провести тестирование
+• Рост продаж
+КЛЮЧЕВЫЕ ПОКАЗАТЕЛИ
+Следующие шаги определены командой."""
+
+
+def test_kinds_counts_and_offsets():
+    index = index_lines(SLIDE_TEXT)
+
+    assert list(index.kinds) == [TEXT, BLANK, TEXT, NUMBERED, NUMBERED, BULLET, TEXT, TEXT]
+    assert list(index.words) == [2, 0, 3, 3, 3, 3, 2, 4]
+    assert index.line(3) == '1. Разработать прототип'
+    assert index.item(3) == 'Разработать прототип'
+    assert index.item(5) == 'Рост продаж'
+    assert SLIDE_TEXT[index.starts[3]:index.ends[3]] == index.line(3)
+
+    assert index.ends_with_colon(2) and index.is_heading(2)
+    assert index.is_heading(6) and index.flags[6] & ALL_CAPS
+    assert not index.is_heading(7)
+    assert index.content_rows() == [0, 2, 3, 4, 5, 6, 7]
+
+
+def test_marker_needs_following_text():
+    index = index_lines("1.5 liters\n-\n- \n-dash\n3: three")
+    assert list(index.kinds) == [TEXT, TEXT, TEXT, TEXT, NUMBERED]
+
+
+def test_analyzer_reads_component_rows():
+    index = index_lines(SLIDE_TEXT)
+    components = TextSplitter.split_slide_text(SLIDE_TEXT, 1, index=index)
+
+    assert [component['role'] for component in components] == ['TITLE', 'HEADING', 'BODY', 'HEADING', 'BODY']
+    assert components[2]['items'] == ['Разработать прототип', 'Провести тестирование']
+    assert components[2]['rows'] == [3, 4, 5]
+
+    for component in components:
+        if not component.get('is_list'):
+            assert ContentAnalyzer.analyze_lines(index, component['rows']) == \
+                ContentAnalyzer.analyze_text_structure(component['content'])
+
+
+def test_analyze_text_structure_results():
+    result = ContentAnalyzer.analyze_text_structure("Преимущества:\n• Высокая скорость\n\n- Простота\n")
+    assert result['content_type'] == 'bullet_list'
+    assert result['items'] == ['Высокая скорость', 'Простота']
+    # 3 of 6 words are capitalized (markers count as words)
+    assert result['is_title_case']
+
+    result = ContentAnalyzer.analyze_text_structure("ВАЖНАЯ ИНФОРМАЦИЯ\n\n2024 — ИТОГИ")
+    assert result['has_emphasis'] and result['is_title_case']
+    assert result['items'] == ['ВАЖНАЯ ИНФОРМАЦИЯ', '2024 — ИТОГИ']
+    assert not ContentAnalyzer.analyze_text_structure("ВАЖНО\nпочти")['has_emphasis']
+
+
+def test_parse_slide_uses_one_index():
+    slide = {
+        'objectId': 'p1',
+        'pageElements': [{'shape': {'text': {'textElements': [{'textRun': {'content': SLIDE_TEXT}}]}}}]
+    }
+
+    parsed = ContentParser.parse_slide(slide, 1)
+
+    analyses = [element['text_analysis'] for element in parsed['elements']]
+    assert analyses[1] == ContentAnalyzer.analyze_text_structure('Основные цели проекта:')
+    assert analyses[2]['content_type'] == 'numbered_list'
+    assert analyses[3]['has_emphasis']
+    assert analyses[4]['items'] == ['Следующие шаги определены командой.']
+
+
+if __name__ == "__main__":
+    print("Running line index tests...\n")
+
+    test_kinds_counts_and_offsets()
+    test_marker_needs_following_text()
+    test_analyzer_reads_component_rows()
+    test_analyze_text_structure_results()
+    test_parse_slide_uses_one_index()
+
+    print("\n✅ All tests completed!")
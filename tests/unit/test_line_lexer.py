@@ -0,0 +1,119 @@
+"""
+Tests for the line lexer and the token-based TextParser.
+"""
+
+from presentation_design.extraction.line_lexer import (
+    BLANK,
+    BULLET,
+    COLON_HEADER,
+    MARKER,
+    NUMBER_AFTER,
+    NUMBERED,
+    TEXT,
+    classify_line,
+    tokenize
+)
+from presentation_design.extraction.text_parser import TextParser
+
+
+def test_line_kinds():
+    tokens = tokenize(
+        "7\nSlide 2: Intro\nслайд 3\n4\n• point\n- dash\n2) item\nKey points:\n\n"
+        "# Heading\n1.5 million users\nPlain text"
+    )
+    assert tokens.kinds == [
+        TEXT, MARKER, MARKER, NUMBER_AFTER, BULLET, BULLET, NUMBERED,
+        COLON_HEADER, BLANK, TEXT, TEXT, TEXT
+    ]
+    assert tokens[1].number == '2' and tokens[1].rest == 'Intro'
+    assert tokens[2].rest is None
+    assert tokens[3].number == '4'
+    assert tokens[6].rest == 'item'
+    assert tokens[9].starts_slide and tokens[10].starts_slide
+    assert not tokens[11].starts_slide
+
+    # A list item ending with a colon is a header, like in the formatter
+    assert classify_line("- Benefits:").kind == COLON_HEADER
+
+
+def test_marker_title_is_not_duplicated():
+    parser = TextParser()
+    slides = parser.parse_slides("Slide 1\nIntroduction\nFirst point.\nSlide 2 Results\nIt worked.")
+
+    assert [slide['title'] for slide in slides] == ['Introduction', 'Results']
+    assert slides[0]['mainText'] == '<p>First point.</p>'
+    assert slides[1]['mainText'] == '<p>It worked.</p>'
+
+
+def test_number_after_strategy():
+    slides = TextParser().parse_slides("First topic\n- a\n- b\n1\n\nSecond topic\nDetails here.\n2\nLeftover")
+
+    assert [slide['id'] for slide in slides] == ['1', '2', '3']
+    assert slides[0]['mainText'] == '<ul>\n<li>a</li>\n<li>b</li>\n</ul>'
+    assert slides[2]['title'] == 'Leftover'
+
+
+def test_text_based_strategy_methods():
+    parser = TextParser()
+
+    text = "First topic\n- a\n1\n\nSecond topic\nDetails here.\n2\nLeftover"
+    matches = parser.detect_number_after_pattern(text)
+    assert [(match['number'], match['line']) for match in matches] == [('1', 2), ('2', 6)]
+    assert text[matches[0]['index']:matches[0]['end']] == '\n1'
+    expected = parser.parse_slides(text)
+    assert parser.parse_number_after_slides(text, matches) == expected
+    # Match lists without line numbers (built by older callers) still work
+    offsets_only = [{key: match[key] for key in ('number', 'index', 'end')} for match in matches]
+    assert parser.parse_number_after_slides(text, offsets_only) == expected
+
+    text = "Intro\nSlide 1\nIntroduction\nFirst point.\nSlide 2 Results\nIt worked."
+    matches = parser.detect_slide_markers(text)
+    assert [(match['number'], match['line'], match['index']) for match in matches] == [('1', 1, 5), ('2', 4, 39)]
+    expected = parser.parse_slides(text)
+    assert parser.parse_marked_slides(text, matches) == expected
+    offsets_only = [{key: match[key] for key in ('number', 'index', 'title_on_same_line')} for match in matches]
+    assert parser.parse_marked_slides(text, offsets_only) == expected
+
+
+def test_intelligent_blocks_strategy():
+    slides = TextParser().parse_slides(
+        "Welcome\nto the course\n\nA long opening paragraph that explains the goals.\n\n"
+        "# Part two\nMore details"
+    )
+
+    assert [slide['title'] for slide in slides] == ['Welcome', '# Part two']
+    assert slides[0]['mainText'] == 'to the course\nA long opening paragraph that explains the goals.'
+    assert slides[1]['mainText'] == 'More details'
+
+
+def test_formatting_from_tokens():
+    parser = TextParser()
+    html = parser.format_content(["Key points:", "1. first", "2) second", "", "**Done**."])
+
+    assert html == (
+        '<strong>Key points:</strong>\n<ul>\n<li>first</li>\n<li>second</li>\n</ul>\n\n'
+        '<p><strong>Done</strong>.</p>'
+    )
+
+
+def test_large_paste_is_linear():
+    text = ''.join(f"Slide {idx + 1} Topic {idx}\nIntro line.\n- point\n\n" for idx in range(25000))
+    assert len(tokenize(text)) == 100001
+
+    slides = TextParser().parse_slides(text)
+    assert len(slides) == 25000
+    assert slides[-1]['title'] == 'Topic 24999'
+
+
+if __name__ == "__main__":
+    print("Running line lexer tests...\n")
+
+    test_line_kinds()
+    test_marker_title_is_not_duplicated()
+    test_number_after_strategy()
+    test_text_based_strategy_methods()
+    test_intelligent_blocks_strategy()
+    test_formatting_from_tokens()
+    test_large_paste_is_linear()
+
+    print("\n✅ All tests completed!")
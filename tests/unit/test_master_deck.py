@@ -0,0 +1,137 @@
+"""
+Tests for template master decks.
+"""
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+
+from presentation_design.design.design_applicator import DesignApplicator
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.generation.request_optimizer import RequestOptimizer
+from presentation_design.templates.master_deck import MasterDeckGenerator, master_deck_info, theme_digest
+from presentation_design.templates.template_loader import TemplateLoader
+from presentation_design.templates.template_validator import TemplateValidationError, TemplateValidator
+from presentation_design.testing.fake_google import FakeGoogleBackend, fake_provider
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'presentation_design', 'templates')
+
+
+def load_template(name='corporate_blue'):
+    return TemplateLoader(TEMPLATES_DIR).load_template(name, use_cache=False)
+
+
+def extracted(count=4):
+    return {
+        'presentation_id': 'source',
+        'title': 'Quarterly',
+        'slides': [
+            {
+                'index': idx,
+                'slide_id': f"s{idx}",
+                'layout_type': 'content_slide',
+                'elements': [
+                    {'content': f"Title {idx}", 'role': 'title'},
+                    {'content': f"Body text {idx}", 'role': 'body'}
+                ]
+            }
+            for idx in range(count)
+        ]
+    }
+
+
+def make_builder(backend=None):
+    return PresentationBuilder(
+        fake_provider(backend) if backend else None,
+        batch_planner=BatchPlanner(pipeline=False),
+        request_optimizer=RequestOptimizer()
+    )
+
+
+def test_build_copies_master_deck():
+    backend = FakeGoogleBackend()
+    template = load_template()
+    template['master_deck'] = MasterDeckGenerator(fake_provider(backend)).generate(template)
+    master_id = template['master_deck']['presentation_id']
+
+    designed = DesignApplicator(template).apply_design(extracted())
+    assert designed['master_deck'] == {'presentation_id': master_id, 'background_color': '#1A237E'}
+
+    backend.reset_stats()
+    result = make_builder(backend).build_presentation(designed)
+    stats = backend.stats()['by_method']
+
+    assert result['presentation_id'] != master_id
+    assert stats['drive.files.copy']['calls'] == 1
+    assert 'slides.presentations.create' not in stats
+
+    presentation = backend.presentations[result['presentation_id']]
+    assert [slide['objectId'] for slide in presentation['slides']] == [f"pd_slide_{idx:03d}" for idx in range(4)]
+    # The master deck itself is untouched
+    assert len(backend.presentations[master_id]['slides']) == 1
+
+
+def test_master_deck_drops_per_slide_background():
+    template = load_template()
+    blank = make_builder().plan_presentation(DesignApplicator(template).apply_design(extracted()))
+
+    template['master_deck'] = {'presentation_id': 'master123', 'theme_digest': theme_digest(template)}
+    copied = make_builder().plan_presentation(DesignApplicator(template).apply_design(extracted()))
+
+    assert blank['steps'][2]['request_types']['updatePageProperties'] == 4
+    assert 'updatePageProperties' not in copied['steps'][2]['request_types']
+    assert copied['steps'][0]['source'] == 'master123'
+    assert copied['totals']['requests'] == blank['totals']['requests'] - 4
+
+
+def test_stale_master_deck_is_ignored():
+    template = load_template()
+    template['master_deck'] = {'presentation_id': 'master123', 'theme_digest': theme_digest(template)}
+    assert master_deck_info(template)['presentation_id'] == 'master123'
+
+    changed = copy.deepcopy(template)
+    changed['colors']['background'] = '#000000'
+    assert master_deck_info(changed) is None
+    assert 'master_deck' not in DesignApplicator(changed).apply_design(extracted(1))
+
+
+def test_validator_checks_master_deck():
+    template = load_template()
+    template['master_deck'] = {'presentation_id': ''}
+    try:
+        TemplateValidator.validate_template(template)
+        assert False, "Expected TemplateValidationError"
+    except TemplateValidationError:
+        pass
+
+    template['master_deck'] = {'presentation_id': 'abc'}
+    TemplateValidator.validate_template(template)
+
+
+def test_save_master_deck_updates_template_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copytree(os.path.join(TEMPLATES_DIR, 'designs'), os.path.join(tmp, 'designs'))
+        loader = TemplateLoader(tmp)
+        template = loader.load_template('default')
+        master_deck = {'presentation_id': 'deck1', 'theme_digest': theme_digest(template)}
+
+        loader.save_master_deck('default', master_deck)
+
+        with open(os.path.join(tmp, 'designs', 'default.json'), encoding='utf-8') as f:
+            assert json.load(f)['master_deck'] == master_deck
+        assert TemplateLoader(tmp).load_template('default')['master_deck'] == master_deck
+
+
+if __name__ == "__main__":
+    print("Running master deck tests...\n")
+
+    test_build_copies_master_deck()
+    test_master_deck_drops_per_slide_background()
+    test_stale_master_deck_is_ignored()
+    test_validator_checks_master_deck()
+    test_save_master_deck_updates_template_file()
+
+    print("\n✅ All tests completed!")
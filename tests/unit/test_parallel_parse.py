@@ -0,0 +1,110 @@
+"""
+Tests for parsing large decks in worker processes.
+"""
+
+import runpy
+from pathlib import Path
+
+from presentation_design.extraction.editor_format import (
+    _parse_items,
+    raw_data_to_editor_slides,
+    raw_slide_items
+)
+from presentation_design.extraction.parallel_parse import (
+    ParallelParseSettings,
+    ParsePool,
+    chunked,
+    get_parse_pool,
+    map_slide_chunks,
+    set_parse_pool
+)
+from presentation_design.extraction.text_parser import TextParser
+
+
+def deck_items(count):
+    return [
+        (f"Topic {idx}\nIntro with **bold** text {idx}.\n- point {idx}\n- other", str(idx + 1), [f"obj{idx}"])
+        for idx in range(count)
+    ]
+
+
+class BrokenPool(ParsePool):
+    """Pool whose processes cannot be started."""
+
+    def _get_executor(self):
+        raise OSError("no processes here")
+
+
+def test_chunked():
+    assert chunked(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert chunked([], 3) == []
+    assert chunked([1, 2], 0) == [[1], [2]]
+
+
+def test_pool_results_match_in_place_order():
+    items = deck_items(23)
+    expected = _parse_items(items, TextParser())
+    pool = ParsePool(workers=2)
+    set_parse_pool(pool)
+    try:
+        slides = map_slide_chunks(_parse_items, items, ParallelParseSettings(min_slides=10, chunk_slides=4))
+        assert slides == expected
+        assert [slide['id'] for slide in slides] == [str(idx + 1) for idx in range(23)]
+
+        # The pool is kept for the next large deck
+        assert map_slide_chunks(_parse_items, items[:12], ParallelParseSettings(min_slides=10, chunk_slides=5)) == expected[:12]
+        assert pool.counters == {'parallel': 2, 'in_place': 0, 'failures': 0}
+        assert get_parse_pool() is pool
+    finally:
+        set_parse_pool(None)
+
+
+def test_small_decks_and_failures_parse_in_place():
+    items = deck_items(6)
+    expected = _parse_items(items, TextParser())
+    pool = BrokenPool(workers=2)
+    set_parse_pool(pool)
+    try:
+        assert map_slide_chunks(_parse_items, items, ParallelParseSettings(min_slides=10)) == expected
+        assert map_slide_chunks(_parse_items, items, ParallelParseSettings(min_slides=0)) == expected
+        assert pool.counters['parallel'] == pool.counters['failures'] == 0
+
+        assert map_slide_chunks(_parse_items, items, ParallelParseSettings(min_slides=5, chunk_slides=2)) == expected
+        assert pool.counters == {'parallel': 0, 'in_place': 1, 'failures': 1}
+    finally:
+        set_parse_pool(None)
+
+
+def test_converters_keep_slide_numbers():
+    raw_data = {'slides': [
+        {'raw_elements': [{'objectId': 'a', 'content': 'Intro\r\nText'}]},
+        {'raw_elements': [{'objectId': 'b', 'content': '(макроуровень)'}]},
+        {'raw_elements': [{'objectId': 'c', 'content': 'Results\n- done'}]}
+    ]}
+    assert raw_slide_items(raw_data['slides']) == [('Intro \nText', '1', ['a']), ('Results\n- done', '3', ['c'])]
+
+    slides = raw_data_to_editor_slides(raw_data)
+    assert [slide['original_objectIds'] for slide in slides] == [['a'], ['c']]
+    assert slides[1]['title'] == 'Results'
+    assert raw_data_to_editor_slides(raw_data, TextParser()) == slides
+
+
+def test_spawned_workers_skip_web_app_startup():
+    # What a 'spawn' worker does with the parent's main script
+    web_app = runpy.run_path(str(Path(__file__).resolve().parents[2] / 'web_app.py'), run_name='__mp_main__')
+
+    assert web_app['oauth_manager'] is None
+    assert web_app['SERVICE_ACCOUNT_CREDENTIALS'] is None
+    assert web_app['app'] is not None
+
+
+if __name__ == "__main__":
+    print("Running parallel parse tests...\n")
+
+    test_chunked()
+    test_pool_results_match_in_place_order()
+    test_small_decks_and_failures_parse_in_place()
+    test_converters_keep_slide_numbers()
+    test_spawned_workers_skip_web_app_startup()
+
+    print("\n✅ All tests completed!")
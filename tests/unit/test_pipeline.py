@@ -0,0 +1,134 @@
+"""
+Tests for the staged extraction pipeline.
+"""
+
+from presentation_design.extraction.editor_format import raw_data_to_editor_slides
+from presentation_design.extraction.extraction_cache import ExtractionCache
+from presentation_design.extraction.hedging import HedgedRunner, HedgingError
+from presentation_design.extraction.pipeline import (
+    STAGES,
+    ApiKeySource,
+    CredentialSource,
+    ExtractionPipeline,
+    PipelineError
+)
+from presentation_design.extraction.slides_extractor import SlidesExtractor
+from presentation_design.testing.fake_google import (
+    FakeGoogleBackend,
+    fake_credentials,
+    fake_provider,
+    fake_service_factory
+)
+
+PRESENTATION_ID = 'pipeline_deck_0123456789abcdef'
+URL = f"https://docs.google.com/presentation/d/{PRESENTATION_ID}/edit"
+
+
+def text_shape(object_id, text, y=0):
+    return {
+        'objectId': object_id,
+        'transform': {'translateY': y},
+        'shape': {
+            'shapeType': 'TEXT_BOX',
+            'text': {'textElements': [{'textRun': {'content': text, 'style': {'bold': True}}}]}
+        }
+    }
+
+
+def deck_backend():
+    backend = FakeGoogleBackend()
+    backend.presentations[PRESENTATION_ID] = {
+        'presentationId': PRESENTATION_ID,
+        'title': 'Pipeline deck',
+        'revisionId': 'rev-1',
+        'slides': [
+            {'objectId': 's1', 'pageElements': [
+                text_shape('body', 'Intro with **bold** text\n- first\n- second\n', y=100),
+                text_shape('title', 'Overview\n')
+            ]},
+            {'objectId': 's2', 'pageElements': [text_shape('meta', '(макроуровень)\n')]},
+            {'objectId': 's3', 'pageElements': [text_shape('t3', 'Results\r\nIt\u000bworked.\n')]}
+        ]
+    }
+    return backend
+
+
+class FailingSource(CredentialSource):
+    """Source whose credentials are rejected."""
+
+    name = 'failing'
+
+    def service_provider(self):
+        raise PermissionError("access denied")
+
+
+def make_pipeline():
+    return ExtractionPipeline(cache=ExtractionCache(), runner=HedgedRunner(mode='sequential'))
+
+
+def test_pipeline_matches_extractor_conversion():
+    backend = deck_backend()
+    factory = fake_service_factory(backend)
+    expected = raw_data_to_editor_slides(
+        SlidesExtractor(fake_provider(backend, factory=factory)).extract_presentation(URL, raw_mode=True)
+    )
+
+    stored = []
+    result = make_pipeline().run(
+        URL,
+        [CredentialSource(fake_credentials(), factory=factory)],
+        persist=lambda name, slides: stored.append((name, slides))
+    )
+
+    assert result.slides == expected
+    assert [slide['original_objectIds'] for slide in result.slides] == [['title', 'body'], ['t3']]
+    assert stored == [('credentials', expected)]
+    assert result.extracted
+    assert list(result.timings) == list(STAGES) + ['total']
+
+
+def test_unchanged_deck_skips_extraction_stages():
+    backend = deck_backend()
+    pipeline = make_pipeline()
+    source = CredentialSource(fake_credentials(), factory=fake_service_factory(backend))
+
+    first = pipeline.run(URL, [source])
+    backend.reset_stats()
+    second = pipeline.run(URL, [source])
+
+    assert second.slides == first.slides
+    assert not second.extracted
+    assert 'fetch' not in second.timings and 'total' in second.timings
+    # Only the revision check reached the API
+    assert backend.stats()['by_method'] == {'slides.presentations.get': {'calls': 1, 'errors': 0}}
+
+
+def test_sources_are_tried_in_order():
+    backend = deck_backend()
+    factory = fake_service_factory(backend)
+
+    result = make_pipeline().run(URL, [FailingSource(), ApiKeySource('key-123', factory=factory)])
+    assert result.source == 'api_key'
+    assert result.slides[0]['title'] == 'Overview'
+
+    try:
+        make_pipeline().run(URL, [FailingSource()])
+        assert False, "expected HedgingError"
+    except HedgingError as e:
+        assert list(e.errors) == ['failing']
+
+    try:
+        make_pipeline().run('https://example.com/not-a-deck', [FailingSource()])
+        assert False, "expected PipelineError"
+    except PipelineError:
+        pass
+
+
+if __name__ == "__main__":
+    print("Running extraction pipeline tests...\n")
+
+    test_pipeline_matches_extractor_conversion()
+    test_unchanged_deck_skips_extraction_stages()
+    test_sources_are_tried_in_order()
+
+    print("\n✅ All tests completed!")
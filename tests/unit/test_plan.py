@@ -0,0 +1,124 @@
+"""
+Tests for dry-run generation plans.
+"""
+
+import base64
+import json
+import os
+import tempfile
+
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.plan import DEFAULT_SLIDE_PLACEHOLDER
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.generation.request_optimizer import RequestOptimizer
+from presentation_design.main import plan_from_file
+from presentation_design.testing.fake_google import FakeGoogleBackend, fake_provider
+
+PNG_DATA_URL = "data:image/png;base64," + base64.b64encode(b'\x89PNG\r\n\x1a\n' + b'\0' * 64).decode('ascii')
+
+
+def sample_slides(count=6):
+    return [
+        {'title': f"Slide {idx}", 'mainText': f"Body {idx}\nMore text", 'textSize': 20}
+        for idx in range(count)
+    ]
+
+
+def offline_builder(**planner_kwargs):
+    # No service provider at all: planning must not touch the API
+    return PresentationBuilder(
+        None,
+        batch_planner=BatchPlanner(pipeline=False, **planner_kwargs),
+        request_optimizer=RequestOptimizer()
+    )
+
+
+def test_plan_matches_real_build():
+    slides = sample_slides()
+    plan = offline_builder(max_requests=8).plan_simple_presentation(slides, title="Planned")
+
+    backend = FakeGoogleBackend()
+    builder = PresentationBuilder(
+        fake_provider(backend),
+        batch_planner=BatchPlanner(pipeline=False, max_requests=8),
+        request_optimizer=RequestOptimizer()
+    )
+    builder.build_simple_presentation(slides, title="Planned")
+    stats = backend.stats()
+
+    assert [step['step'] for step in plan['steps']] == ['create', 'slides', 'content']
+    assert plan['totals']['requests'] == stats['batch_requests']
+    assert plan['totals']['api_calls'] == stats['requests']
+    assert plan['totals']['batches'] == stats['by_method']['slides.presentations.batchUpdate']['calls']
+
+    slides_step = plan['steps'][1]
+    assert {'deleteObject': {'objectId': DEFAULT_SLIDE_PLACEHOLDER}} in slides_step['requests']
+
+
+def test_batch_boundaries_cover_requests():
+    plan = offline_builder(max_requests=5).plan_simple_presentation(sample_slides(4))
+    content = plan['steps'][2]
+    batches = content['batches']
+
+    assert batches[0]['start'] == 0
+    assert batches[-1]['end'] == content['requests_count'] == len(content['requests'])
+    assert all(batch['requests'] <= 5 for batch in batches)
+    assert all(earlier['end'] == later['start'] for earlier, later in zip(batches, batches[1:]))
+    assert sum(content['request_types'].values()) == content['requests_count']
+    assert content['optimizer']['requests_in'] >= content['requests_count']
+
+
+def test_images_are_not_uploaded():
+    slides = [{'title': 'Pictures', 'images': [{'url': PNG_DATA_URL}, {'url': 'https://example.com/a.png'}]}]
+    plan = offline_builder().plan_simple_presentation(slides)
+
+    assert plan['totals']['uploads'] == 1
+    images = [request['createImage'] for request in plan['steps'][2]['requests'] if 'createImage' in request]
+    assert images[0]['url'].startswith('https://drive.google.com/uc?export=view&id=dry-run-')
+    assert images[1]['url'] == 'https://example.com/a.png'
+
+
+def test_digest_is_stable_and_independent_of_request_lists():
+    builder = offline_builder()
+    full = builder.plan_simple_presentation(sample_slides(3))
+    again = builder.plan_simple_presentation(sample_slides(3))
+    summary = builder.plan_simple_presentation(sample_slides(3), include_requests=False)
+    changed = builder.plan_simple_presentation(sample_slides(4))
+
+    assert full['digest'] == again['digest'] == summary['digest']
+    assert 'requests' not in summary['steps'][2]
+    assert changed['digest'] != full['digest']
+    json.dumps(full)
+
+
+def test_plan_from_file_detects_input_format():
+    designed = {
+        'title': 'Designed',
+        'slides': [{'elements': [{'content': 'Hello', 'role': 'TITLE'}]}]
+    }
+    editor = {'slides': sample_slides(2), 'settings': {'pageOrientation': '4:3'}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for name, data in (('designed', designed), ('editor', editor), ('list', sample_slides(2))):
+            paths[name] = os.path.join(tmp, f"{name}.json")
+            with open(paths[name], 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+
+        assert plan_from_file(paths['designed'])['operation'] == 'build_presentation'
+        editor_plan = plan_from_file(paths['editor'])
+        assert editor_plan['operation'] == 'build_simple_presentation'
+        assert editor_plan['steps'][0]['body']['pageSize']['height']['magnitude'] == 6858000
+        assert plan_from_file(paths['list'])['totals']['requests'] > 0
+
+
+if __name__ == "__main__":
+    print("Running generation plan tests...\n")
+
+    test_plan_matches_real_build()
+    test_batch_boundaries_cover_requests()
+    test_images_are_not_uploaded()
+    test_digest_is_stable_and_independent_of_request_lists()
+    test_plan_from_file_detects_input_format()
+
+    print("\n✅ All tests completed!")
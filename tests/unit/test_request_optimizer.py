@@ -0,0 +1,194 @@
+"""
+Tests for the batchUpdate request optimizer.
+"""
+
+import copy
+
+from presentation_design.generation.batch_planner import BatchPlanner
+from presentation_design.generation.presentation_builder import PresentationBuilder
+from presentation_design.generation.request_optimizer import RequestOptimizer
+from presentation_design.testing.fake_google import FakeGoogleBackend, fake_provider
+
+
+def create_box(object_id):
+    return {'createShape': {'objectId': object_id, 'shapeType': 'TEXT_BOX',
+                            'elementProperties': {'pageObjectId': 'slide'}}}
+
+
+def insert_text(object_id, text='Hello\nWorld'):
+    return {'insertText': {'objectId': object_id, 'text': text, 'insertionIndex': 0}}
+
+
+def text_style(object_id, style, fields, text_range=None):
+    return {'updateTextStyle': {'objectId': object_id, 'textRange': text_range or {'type': 'ALL'},
+                                'style': style, 'fields': fields}}
+
+
+def paragraph_style(object_id, style, fields, text_range=None):
+    return {'updateParagraphStyle': {'objectId': object_id, 'textRange': text_range or {'type': 'ALL'},
+                                     'style': style, 'fields': fields}}
+
+
+def shape_properties(object_id, properties, fields):
+    return {'updateShapeProperties': {'objectId': object_id, 'shapeProperties': properties, 'fields': fields}}
+
+
+def fixed(start, end):
+    return {'type': 'FIXED_RANGE', 'startIndex': start, 'endIndex': end}
+
+
+def test_drops_defaults_of_new_text_boxes():
+    requests = [
+        create_box('box'),
+        insert_text('box'),
+        paragraph_style('box', {'alignment': 'START'}, 'alignment'),
+        shape_properties('box', {'contentAlignment': 'TOP'}, 'contentAlignment'),
+        text_style('box', {'bold': True}, ''),
+    ]
+    optimized, stats = RequestOptimizer().optimize_list(requests)
+
+    assert optimized == requests[:2]
+    assert stats['dropped'] == 3
+    assert stats['requests_in'] == 5 and stats['requests_out'] == 2
+    assert stats['bytes_out'] < stats['bytes_in']
+
+    # Not a default once the field was changed, or for existing objects
+    changed = [
+        create_box('box'),
+        paragraph_style('box', {'alignment': 'CENTER'}, 'alignment', fixed(0, 5)),
+        insert_text('box'),
+        paragraph_style('box', {'alignment': 'START'}, 'alignment'),
+        shape_properties('existing', {'contentAlignment': 'TOP'}, 'contentAlignment'),
+    ]
+    optimized, _ = RequestOptimizer().optimize_list(changed)
+    assert optimized == changed
+
+
+def test_prunes_only_default_fields():
+    request = paragraph_style('box', {'alignment': 'START', 'lineSpacing': 150}, 'alignment,lineSpacing')
+    optimized, stats = RequestOptimizer().optimize_list([create_box('box'), request])
+
+    assert optimized[1] == paragraph_style('box', {'lineSpacing': 150}, 'lineSpacing')
+    assert stats['fields_pruned'] == 1
+    # The caller's request is left untouched
+    assert request['updateParagraphStyle']['fields'] == 'alignment,lineSpacing'
+
+
+def test_merges_same_range_updates_across_other_style_updates():
+    requests = [
+        insert_text('box'),
+        text_style('box', {'fontFamily': 'Arial', 'bold': True}, 'fontFamily,bold'),
+        paragraph_style('box', {'alignment': 'CENTER'}, 'alignment'),
+        text_style('box', {'bold': False, 'fontSize': {'magnitude': 18, 'unit': 'PT'}}, 'bold,fontSize'),
+        text_style('box', {}, 'italic'),
+    ]
+    optimized, stats = RequestOptimizer().optimize_list(requests)
+
+    assert stats['merged'] == 2
+    assert optimized == [
+        insert_text('box'),
+        text_style(
+            'box',
+            {'fontFamily': 'Arial', 'bold': False, 'fontSize': {'magnitude': 18, 'unit': 'PT'}},
+            'fontFamily,bold,fontSize,italic'
+        ),
+        paragraph_style('box', {'alignment': 'CENTER'}, 'alignment'),
+    ]
+
+
+def test_never_merges_across_other_requests_or_overlapping_ranges():
+    requests = [
+        text_style('box', {'bold': True}, 'bold'),
+        insert_text('box', 'more'),
+        text_style('box', {'italic': True}, 'italic'),
+        text_style('box', {'bold': True}, 'bold', fixed(0, 3)),
+        text_style('box', {'bold': False}, 'bold'),
+    ]
+    optimized, stats = RequestOptimizer().optimize_list(requests)
+
+    assert optimized == requests
+    assert stats['merged'] == 0
+
+
+def test_joins_touching_paragraph_ranges():
+    indent = {'indentStart': {'magnitude': 20, 'unit': 'PT'}}
+    requests = [
+        paragraph_style('box', indent, 'indentStart', fixed(0, 5)),
+        paragraph_style('box', indent, 'indentStart', fixed(6, 11)),
+        text_style('box', {'bold': True}, 'bold', fixed(0, 2)),
+        text_style('box', {'bold': True}, 'bold', fixed(3, 4)),
+    ]
+    optimized, stats = RequestOptimizer().optimize_list(requests)
+
+    assert stats['merged'] == 1
+    assert optimized[0] == paragraph_style('box', indent, 'indentStart', fixed(0, 11))
+    # Text style ranges with a gap stay separate
+    assert optimized[1:] == requests[2:]
+
+
+def test_interns_identical_style_subtrees():
+    requests = [
+        text_style(f"box{idx}", {'foregroundColor': {'opaqueColor': {'rgbColor': {'red': 0.0, 'green': 0.0, 'blue': 1.0}}},
+                                 'fontFamily': 'Arial'}, 'foregroundColor,fontFamily')
+        for idx in range(3)
+    ]
+    original = copy.deepcopy(requests)
+    optimized, stats = RequestOptimizer().optimize_list(requests)
+
+    assert optimized == original
+    styles = [request['updateTextStyle']['style'] for request in optimized]
+    assert styles[0] is styles[1] is styles[2]
+    # style, foregroundColor, opaqueColor and rgbColor are shared by the repeats
+    assert stats['interned'] == 8
+
+    # Scalars of different types are not conflated
+    mixed = [shape_properties('a', {'x': 1}, 'x'), shape_properties('b', {'x': 1.0}, 'x')]
+    optimized, _ = RequestOptimizer().optimize_list(mixed)
+    assert optimized[1]['updateShapeProperties']['shapeProperties']['x'] == 1.0
+    assert isinstance(optimized[1]['updateShapeProperties']['shapeProperties']['x'], float)
+
+
+def test_disabled_optimizer_passes_requests_through():
+    requests = [create_box('box'), paragraph_style('box', {'alignment': 'START'}, 'alignment')]
+    optimized, stats = RequestOptimizer(enabled=False).optimize_list(requests)
+
+    assert optimized == requests
+    assert stats['requests_out'] == 2 and stats['bytes_in'] == stats['bytes_out']
+
+
+def test_builder_sends_fewer_requests_with_same_result():
+    slides = [
+        {'title': f"Slide {idx}", 'mainText': f"Body {idx}", 'textPosition': {'vertical': 'top', 'horizontal': 'left'}}
+        for idx in range(4)
+    ]
+    decks = {}
+    for enabled in (False, True):
+        backend = FakeGoogleBackend()
+        builder = PresentationBuilder(
+            fake_provider(backend),
+            batch_planner=BatchPlanner(pipeline=False),
+            request_optimizer=RequestOptimizer(enabled=enabled)
+        )
+        result = builder.build_simple_presentation(slides, title="Optimized")
+        assert result['failed_requests'] == []
+        decks[enabled] = (backend.presentations[result['presentation_id']], backend.stats()['bytes_sent'])
+
+    # Left/top aligned text boxes only carry font styling after optimization
+    assert decks[True][1] < decks[False][1]
+    assert [slide['objectId'] for slide in decks[True][0]['slides']] == \
+        [slide['objectId'] for slide in decks[False][0]['slides']]
+
+
+if __name__ == "__main__":
+    print("Running request optimizer tests...\n")
+
+    test_drops_defaults_of_new_text_boxes()
+    test_prunes_only_default_fields()
+    test_merges_same_range_updates_across_other_style_updates()
+    test_never_merges_across_other_requests_or_overlapping_ranges()
+    test_joins_touching_paragraph_ranges()
+    test_interns_identical_style_subtrees()
+    test_disabled_optimizer_passes_requests_through()
+    test_builder_sends_fewer_requests_with_same_result()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,107 @@
+"""
+Tests for pooled Google API service clients.
+"""
+
+from google.oauth2.credentials import Credentials
+
+from presentation_design.auth.service_factory import (
+    ServiceFactory,
+    CredentialServiceProvider,
+    credential_identity
+)
+from presentation_design.utils.lru import LRUCache
+
+
+def make_credentials(refresh_token='refresh-1', token='token-1'):
+    return Credentials(
+        token=token,
+        refresh_token=refresh_token,
+        token_uri='https://oauth2.googleapis.com/token',
+        client_id='client-id',
+        client_secret='client-secret'
+    )
+
+
+def test_client_reused_for_same_identity():
+    """Same credentials (even a new object) reuse the pooled client."""
+    factory = ServiceFactory()
+    first = factory.build('slides', 'v1', credentials=make_credentials())
+    refreshed = make_credentials(token='token-2')
+    second = factory.build('slides', 'v1', credentials=refreshed)
+
+    assert first is second
+    # Refreshed token is picked up without rebuilding the client
+    assert first._http.credentials is refreshed
+
+
+def test_clients_separated_by_identity_and_api():
+    """Different users and different APIs get different clients."""
+    factory = ServiceFactory()
+    user_a = factory.build('slides', 'v1', credentials=make_credentials('a'))
+    user_b = factory.build('slides', 'v1', credentials=make_credentials('b'))
+    drive_a = factory.build('drive', 'v3', credentials=make_credentials('a'))
+
+    assert user_a is not user_b
+    assert user_a is not drive_a
+
+
+def test_identity_does_not_leak_secrets():
+    """Identity strings are hashed."""
+    identity = credential_identity(make_credentials('super-secret'))
+    assert identity.startswith('user:')
+    assert 'super-secret' not in identity
+    assert credential_identity(developer_key='AIza-key').startswith('key:')
+
+
+def test_discovery_document_parsed_once():
+    """Building many clients parses each discovery document once."""
+    factory = ServiceFactory()
+    for idx in range(5):
+        factory.build('slides', 'v1', credentials=make_credentials(f"user-{idx}"))
+
+    assert factory.discovery.get('slides', 'v1') is factory.discovery.get('slides', 'v1')
+
+
+def test_pooled_clients_expire():
+    """Clients older than the TTL are rebuilt."""
+    now = [0.0]
+    factory = ServiceFactory(client_ttl_seconds=10)
+    factory.clients = LRUCache(maxsize=8, ttl=10, clock=lambda: now[0])
+
+    first = factory.build('slides', 'v1', credentials=make_credentials())
+    now[0] = 5.0
+    assert factory.build('slides', 'v1', credentials=make_credentials()) is first
+    now[0] = 20.0
+    assert factory.build('slides', 'v1', credentials=make_credentials()) is not first
+
+
+def test_provider_and_invalidate():
+    """Provider builds through the factory; invalidate drops the user's clients."""
+    factory = ServiceFactory()
+    credentials = make_credentials()
+    provider = CredentialServiceProvider(credentials, factory=factory)
+    service = provider.build_service('slides', 'v1')
+
+    assert provider.build_service('slides', 'v1') is service
+    factory.invalidate(credentials)
+    assert provider.build_service('slides', 'v1') is not service
+
+
+def test_api_key_client():
+    """API key clients send the key as a query parameter."""
+    factory = ServiceFactory()
+    service = factory.build('slides', 'v1', developer_key='test-key')
+    request = service.presentations().get(presentationId='abc')
+    assert 'key=test-key' in request.uri
+
+
+if __name__ == "__main__":
+    test_client_reused_for_same_identity()
+    test_clients_separated_by_identity_and_api()
+    test_identity_does_not_leak_secrets()
+    test_discovery_document_parsed_once()
+    test_pooled_clients_expire()
+    test_provider_and_invalidate()
+    test_api_key_client()
+
+    print("✅ All tests completed!")
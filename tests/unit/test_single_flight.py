@@ -0,0 +1,88 @@
+"""
+Tests for single-flight call coalescing.
+"""
+
+import threading
+import time
+
+from presentation_design.utils.single_flight import SingleFlight
+
+
+def run_concurrently(count, target):
+    results = [None] * count
+    errors = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(position):
+        barrier.wait()
+        try:
+            results[position] = target()
+        except Exception as e:
+            errors[position] = e
+
+    threads = [threading.Thread(target=worker, args=(position,)) for position in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_run_once():
+    flights = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'slides': [1, 2, 3]}
+
+    results, errors = run_concurrently(10, lambda: flights.do('deck', work))
+
+    assert errors == [None] * 10
+    assert len(calls) == 1
+    assert sum(1 for _, shared in results if shared) == 9
+    values = [value for value, _ in results]
+    assert all(value == {'slides': [1, 2, 3]} for value in values)
+    # Every caller owns its copy
+    assert len({id(value) for value in values}) == 10
+    assert flights.stats() == {'leaders': 1, 'coalesced': 9, 'in_flight': 0}
+
+
+def test_errors_reach_all_waiters():
+    flights = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    results, errors = run_concurrently(5, lambda: flights.do('deck', work))
+
+    assert len(calls) == 1
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flights.in_flight() == 0
+
+
+def test_sequential_and_distinct_keys_not_coalesced():
+    flights = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        return len(calls)
+
+    assert flights.do('a', work) == (1, False)
+    assert flights.do('a', work) == (2, False)
+    assert flights.do('b', work) == (3, False)
+
+
+if __name__ == "__main__":
+    print("Running single-flight tests...\n")
+
+    test_concurrent_calls_run_once()
+    test_errors_reach_all_waiters()
+    test_sequential_and_distinct_keys_not_coalesced()
+
+    print("\n✅ All tests completed!")
@@ -0,0 +1,134 @@
+"""
+Tests for single-page slide extraction.
+"""
+
+import threading
+import time
+
+from presentation_design.extraction.slides_extractor import SlidesExtractor, ExtractionError, PAGE_FIELDS
+
+
+def make_page(slide_id, text):
+    return {
+        'objectId': slide_id,
+        'pageElements': [{
+            'objectId': f"{slide_id}_body",
+            'shape': {'text': {'textElements': [{'textRun': {'content': text}}]}}
+        }]
+    }
+
+
+class _Call:
+    def __init__(self, run):
+        self.run = run
+
+    def execute(self):
+        return self.run()
+
+
+class FakeSlides:
+    """Records calls; pages().get sleeps to expose concurrency."""
+
+    def __init__(self, slide_count=20, delay=0.0):
+        self.slide_ids = [f"slide_{idx}" for idx in range(slide_count)]
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def build_service(self, name, version):
+        return self
+
+    def presentations(self):
+        return self
+
+    def pages(self):
+        return _Pages(self)
+
+    def get(self, presentationId, fields=None):
+        def run():
+            self.calls.append(('presentations.get', fields))
+            return {'slides': [{'objectId': slide_id} for slide_id in self.slide_ids]}
+        return _Call(run)
+
+
+class _Pages:
+    def __init__(self, service):
+        self.service = service
+
+    def get(self, presentationId, pageObjectId, fields=None):
+        service = self.service
+
+        def run():
+            with service._lock:
+                service.calls.append(('pages.get', fields))
+                service.active += 1
+                service.max_active = max(service.max_active, service.active)
+            time.sleep(service.delay)
+            with service._lock:
+                service.active -= 1
+            if pageObjectId not in service.slide_ids:
+                raise RuntimeError("not found")
+            return make_page(pageObjectId, f"Text of {pageObjectId}")
+        return _Call(run)
+
+
+def test_single_slide_uses_page_endpoint():
+    """One slide costs an id listing plus one masked page fetch."""
+    service = FakeSlides()
+    extractor = SlidesExtractor(service)
+
+    slide = extractor.extract_slide('deck', 'slide_7')
+
+    assert slide['slide_id'] == 'slide_7'
+    assert slide['index'] == 7
+    assert ('presentations.get', 'slides.objectId') in service.calls
+    assert ('pages.get', PAGE_FIELDS) in service.calls
+    assert not any(call == ('presentations.get', None) for call in service.calls)
+
+
+def test_page_cache_and_refresh():
+    """Repeated reads are cached; refresh forces a new fetch."""
+    service = FakeSlides()
+    extractor = SlidesExtractor(service)
+
+    extractor.extract_slide('deck', 'slide_1', index=1)
+    extractor.extract_slide('deck', 'slide_1', index=1)
+    assert sum(1 for name, _ in service.calls if name == 'pages.get') == 1
+
+    extractor.extract_slide('deck', 'slide_1', index=1, refresh=True)
+    assert sum(1 for name, _ in service.calls if name == 'pages.get') == 2
+
+
+def test_multiple_slides_fetched_concurrently_in_order():
+    """Batched variant keeps order and overlaps page requests."""
+    service = FakeSlides(delay=0.05)
+    extractor = SlidesExtractor(service)
+    wanted = ['slide_9', 'slide_2', 'slide_15', 'slide_4']
+
+    slides = extractor.extract_slides('deck', wanted, max_workers=4)
+
+    assert [slide['slide_id'] for slide in slides] == wanted
+    assert [slide['index'] for slide in slides] == [9, 2, 15, 4]
+    assert service.max_active > 1
+    assert sum(1 for name, _ in service.calls if name == 'presentations.get') == 1
+
+
+def test_missing_slide_raises():
+    """Unknown slide IDs raise ExtractionError."""
+    extractor = SlidesExtractor(FakeSlides())
+    try:
+        extractor.extract_slide('deck', 'nope')
+        assert False, "expected ExtractionError"
+    except ExtractionError:
+        pass
+
+
+if __name__ == "__main__":
+    test_single_slide_uses_page_endpoint()
+    test_page_cache_and_refresh()
+    test_multiple_slides_fetched_concurrently_in_order()
+    test_missing_slide_raises()
+
+    print("✅ All tests completed!")
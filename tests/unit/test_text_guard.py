@@ -0,0 +1,168 @@
+"""
+Tests for the pasted text limits (size, chunking, CPU budget).
+"""
+
+import time
+
+from presentation_design.extraction.text_guard import (
+    ParseBudget,
+    TextInputError,
+    TextLimits,
+    iter_guarded_slides,
+    plain_block_slides,
+    split_chunks
+)
+from presentation_design.extraction.text_parser import TextParser
+from presentation_design.generation.html_text import html_to_rich_text
+
+
+def marker_text(count):
+    return ''.join(f"Слайд {idx + 1}: Тема {idx}\nПервый пункт **важно**\n- деталь {idx}\n\n" for idx in range(count))
+
+
+def uncached_parser():
+    parser = TextParser()
+    parser.block_cache = None
+    return parser
+
+
+class StepClock:
+    """Clock advancing one second per call."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def test_size_limit():
+    limits = TextLimits(max_input_chars=100, chunk_chars=0, time_budget_seconds=0)
+    try:
+        list(iter_guarded_slides(uncached_parser(), 'x' * 101, limits))
+        assert False, "expected TextInputError"
+    except TextInputError as e:
+        assert '101' in str(e)
+
+    assert len(list(iter_guarded_slides(uncached_parser(), 'x' * 100, limits))) == 1
+
+
+def test_chunks_cut_at_natural_boundaries():
+    text = marker_text(200)
+    chunks = split_chunks(text, 1000)
+
+    assert ''.join(chunks) == text
+    assert len(chunks) > 5
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert all(chunk.startswith('Слайд ') for chunk in chunks)
+
+    numbered = ''.join(f"Content line {idx}\nmore text\n{idx + 1}\n" for idx in range(300))
+    assert all(chunk.endswith(f"{chunk.split()[-1]}\n") and chunk.split()[-1].isdigit()
+               for chunk in split_chunks(numbered, 500)[:-1])
+
+    # No line breaks at all: hard cut
+    assert [len(chunk) for chunk in split_chunks('a' * 2500, 1000)] == [1000, 1000, 500]
+
+
+def test_chunked_parse_matches_whole_parse():
+    text = marker_text(300)
+    limits = TextLimits(max_input_chars=0, chunk_chars=2000, time_budget_seconds=0)
+
+    assert list(iter_guarded_slides(uncached_parser(), text, limits)) == uncached_parser().parse_slides(text)
+
+
+def test_chunks_follow_the_whole_text_strategy():
+    # Number-after slides with a markdown header inside every slide
+    numbered = ''.join(
+        f"Title {idx}\n## Section {idx}\n" + ''.join(f"body line {line} of {idx}\n" for line in range(5)) + f"{idx}\n"
+        for idx in range(1, 40)
+    )
+    # Block slides: ids are counted, so they must continue across chunks
+    blocks = ''.join(f"# Heading {idx}\nIntro text {idx}\n\nMore about {idx}\n\n" for idx in range(120))
+    limits = TextLimits(max_input_chars=0, chunk_chars=1000, time_budget_seconds=0)
+
+    for text in (numbered, blocks):
+        assert len(split_chunks(text, 1000)) > 3
+        assert list(iter_guarded_slides(uncached_parser(), text, limits)) == uncached_parser().parse_slides(text)
+
+    assert len(uncached_parser().parse_slides(numbered)) == 39
+    assert all(chunk.startswith('Title ') for chunk in split_chunks(numbered, 1000))
+
+
+def test_budget_falls_back_to_plain_slides():
+    text = marker_text(50)
+    limits = TextLimits(max_input_chars=0, chunk_chars=0, time_budget_seconds=10)
+    budget = ParseBudget(10, clock=StepClock())
+
+    slides = list(iter_guarded_slides(uncached_parser(), text, limits, budget))
+
+    assert budget.exhausted
+    # Parsed normally until the budget ran out, every line kept afterwards
+    assert slides[0]['mainText'].startswith('<p>Первый пункт <strong>важно</strong></p>')
+    assert slides[-1] == {
+        'id': '50',
+        'title': 'Слайд 50: Тема 49',
+        'mainText': '<p>Первый пункт **важно**</p>\n<p>- деталь 49</p>',
+        'secondaryText': ''
+    }
+    assert len(slides) == 50
+
+
+def test_exhausted_budget_skips_remaining_chunks():
+    text = marker_text(100)
+    limits = TextLimits(max_input_chars=0, chunk_chars=500, time_budget_seconds=1)
+    budget = ParseBudget(1, clock=StepClock())
+
+    slides = list(iter_guarded_slides(uncached_parser(), text, limits, budget))
+
+    assert len(slides) == 100
+    assert [slide['id'] for slide in slides[-3:]] == ['98', '99', '100']
+
+
+def test_plain_block_slides():
+    slides = list(plain_block_slides(['', ' Title ', 'body', '', '', 'Next'], first_number=3))
+    assert slides == [
+        {'id': '3', 'title': 'Title', 'mainText': '<p>body</p>', 'secondaryText': ''},
+        {'id': '4', 'title': 'Next', 'mainText': '', 'secondaryText': ''}
+    ]
+
+
+def test_pathological_inputs_finish_quickly():
+    limits = TextLimits(max_input_chars=0, chunk_chars=200000, time_budget_seconds=5)
+    inputs = [
+        ('**a ' * 50000),
+        ('_a* ' * 50000),
+        ('a*b_c**d__e ' * 20000),
+        (''.join('`' * (idx % 300 + 1) + 'x' for idx in range(3000))),
+        ('\\' * 200000),
+        ('Slide 1\n' + 'x:\n' * 100000),
+        ('\n'.join(str(idx) for idx in range(100000))),
+        ('word ' * 400000),
+    ]
+    for text in inputs:
+        started = time.perf_counter()
+        slides = list(iter_guarded_slides(uncached_parser(), 'Intro\n' + text + '\n', limits))
+        assert slides
+        assert time.perf_counter() - started < 10, text[:20]
+
+    # Unclosed tags in editor HTML are text, not a quadratic scan
+    started = time.perf_counter()
+    assert html_to_rich_text('<a ' * 30000).text.startswith('<a <a')
+    assert html_to_rich_text('<a "' * 30000).text.startswith('<a "')
+    assert time.perf_counter() - started < 2
+
+
+if __name__ == "__main__":
+    print("Running text guard tests...\n")
+
+    test_size_limit()
+    test_chunks_cut_at_natural_boundaries()
+    test_chunked_parse_matches_whole_parse()
+    test_chunks_follow_the_whole_text_strategy()
+    test_budget_falls_back_to_plain_slides()
+    test_exhausted_budget_skips_remaining_chunks()
+    test_plain_block_slides()
+    test_pathological_inputs_finish_quickly()
+
+    print("\n✅ All tests completed!")
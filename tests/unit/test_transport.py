@@ -0,0 +1,90 @@
+"""
+Tests for the pooled keep-alive HTTP transport.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from presentation_design.auth.transport import PooledHttp
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler echoing method, path and body length."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length) if length else b''
+        payload = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'received': len(body)
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('X-Test', 'yes')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def test_httplib2_compatible_response():
+    """Responses look like httplib2 responses to googleapiclient."""
+    server = start_server()
+    try:
+        http = PooledHttp(timeout=5)
+        url = f"http://127.0.0.1:{server.server_port}/v1/presentations/abc"
+        response, content = http.request(url, 'POST', body='{"a": 1}', headers={'content-type': 'application/json'})
+
+        assert response.status == 200
+        assert response['x-test'] == 'yes'
+        assert response['content-type'] == 'application/json'
+        data = json.loads(content)
+        assert data['method'] == 'POST'
+        assert data['received'] == len('{"a": 1}')
+    finally:
+        server.shutdown()
+
+
+def test_connections_reused_across_threads():
+    """Many requests from several threads reuse a few pooled connections."""
+    server = start_server()
+    try:
+        http = PooledHttp(timeout=5, pool_maxsize=4)
+        url = f"http://127.0.0.1:{server.server_port}/ping"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(executor.map(lambda _: http.request(url)[0].status, range(40)))
+
+        assert statuses == [200] * 40
+        stats = http.stats()
+        assert stats['requests'] == 40
+        assert stats['errors'] == 0
+        pool = next(iter(stats['pools'].values()))
+        assert pool['requests'] == 40
+        assert pool['connections_opened'] <= 4
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_httplib2_compatible_response()
+    test_connections_reused_across_threads()
+
+    print("✅ All tests completed!")
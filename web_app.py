@@ -24,37 +24,53 @@ from presentation_design.main import process_presentation
 from presentation_design.templates.template_loader import TemplateLoader
 from presentation_design.utils.config import get_config
 from presentation_design.auth.web_oauth import WebOAuthManager
+from presentation_design.auth.credential_cache import CredentialCache, credentials_from_dict, credentials_to_dict
+from presentation_design.auth.service_factory import get_service_factory, CredentialServiceProvider
+from presentation_design.extraction.hedging import HedgingError
+from presentation_design.extraction.editor_format import iter_editor_chunks
+from presentation_design.extraction.pipeline import (
+    get_extraction_pipeline,
+    OAuthSource,
+    ServiceAccountSource,
+    PipelineError
+)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
-# Initialize Web OAuth Manager
 CLIENT_SECRETS_FILE = os.path.join(os.path.dirname(__file__), 'credentials', 'client_secret.json')
-oauth_manager = WebOAuthManager(CLIENT_SECRETS_FILE)
-
-# Load Service Account credentials for server-side access
 SERVICE_ACCOUNT_FILE = os.path.join(os.path.dirname(__file__), 'credentials', 'service_account.json')
+
+# Set by init_app()
+oauth_manager = None
 SERVICE_ACCOUNT_CREDENTIALS = None
 
-if os.path.exists(SERVICE_ACCOUNT_FILE):
+
+def load_service_account_credentials():
+    """Load Service Account credentials for server-side access (None if not configured)."""
+    if not os.path.exists(SERVICE_ACCOUNT_FILE):
+        print("No Service Account configured - OAuth required for URL import")
+        print(f"To enable server-side access, follow guide: SETUP_SERVICE_ACCOUNT.md")
+        return None
+    
     try:
         from google.oauth2 import service_account
         SCOPES = [
             'https://www.googleapis.com/auth/presentations.readonly',
             'https://www.googleapis.com/auth/drive.readonly'
         ]
-        SERVICE_ACCOUNT_CREDENTIALS = service_account.Credentials.from_service_account_file(
+        credentials = service_account.Credentials.from_service_account_file(
             SERVICE_ACCOUNT_FILE,
             scopes=SCOPES
         )
         with open(SERVICE_ACCOUNT_FILE, 'r') as f:
             sa_data = json.load(f)
         print(f"✓ Service Account loaded: {sa_data.get('client_email', 'unknown')}")
+        return credentials
     except Exception as e:
         print(f"Warning: Could not load Service Account: {e}")
-else:
-    print("No Service Account configured - OAuth required for URL import")
-    print(f"To enable server-side access, follow guide: SETUP_SERVICE_ACCOUNT.md")
+        return None
+
 
 # In-memory storage for processing jobs (use database in production)
 jobs = {}
@@ -99,6 +115,13 @@ def init_database():
         )
     ''')
     
+    # Migrate older databases: generation checkpoint and requeue time columns
+    job_columns = [row[1] for row in cursor.execute('PRAGMA table_info(jobs)')]
+    if 'checkpoint_json' not in job_columns:
+        cursor.execute('ALTER TABLE jobs ADD COLUMN checkpoint_json TEXT')
+    if 'retry_at' not in job_columns:
+        cursor.execute('ALTER TABLE jobs ADD COLUMN retry_at TIMESTAMP')
+    
     # Create indexes for performance
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_created_at ON jobs(created_at)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_updated_at ON jobs(updated_at)')
@@ -126,12 +149,15 @@ def save_job_to_db(job_id, job_data):
         # Serialize complex fields to JSON
         slides_json = json.dumps(job_data.get('slides', []))
         settings_json = json.dumps(job_data.get('settings', {}))
+        checkpoint = job_data.get('checkpoint')
+        checkpoint_json = json.dumps(checkpoint) if checkpoint else None
         
         cursor.execute('''
             INSERT OR REPLACE INTO jobs 
             (id, presentation_url, template, status, created_at, updated_at, 
-             slides_json, settings_json, generated_presentation_id, error, session_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             slides_json, settings_json, generated_presentation_id, error, session_id,
+             checkpoint_json, retry_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             job_id,
             job_data.get('url'),
@@ -143,7 +169,9 @@ def save_job_to_db(job_id, job_data):
             settings_json,
             job_data.get('generated_presentation_id'),
             job_data.get('error'),
-            job_data.get('session_id')  # Add session_id
+            job_data.get('session_id'),  # Add session_id
+            checkpoint_json,
+            job_data.get('retry_at')
         ))
         
         conn.commit()
@@ -156,6 +184,54 @@ def save_job_to_db(job_id, job_data):
         traceback.print_exc()
         return False
 
+def save_job_checkpoint(job_id, status, checkpoint, generated_presentation_id=None, error=None, retry_at=None):
+    """Persist the generation checkpoint, status, error and requeue time of a job."""
+    try:
+        conn = get_db_connection()
+        conn.execute('''
+            UPDATE jobs
+            SET checkpoint_json = ?, status = ?, updated_at = ?,
+                generated_presentation_id = COALESCE(?, generated_presentation_id),
+                error = ?, retry_at = ?
+            WHERE id = ?
+        ''', (
+            json.dumps(checkpoint) if checkpoint else None,
+            status,
+            datetime.now().isoformat(),
+            generated_presentation_id,
+            error,
+            retry_at,
+            job_id
+        ))
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Error saving job checkpoint: {e}")
+        return False
+
+def claim_retrying_job(job_id):
+    """Atomically move a 'retrying' job to 'processing'.
+    
+    Every server process schedules the requeued jobs it knows of, so the
+    claim makes sure only one of them resumes a job.
+    
+    Returns:
+        True if this process claimed the job
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.execute('''
+            UPDATE jobs SET status = 'processing', retry_at = NULL, updated_at = ?
+            WHERE id = ? AND status = 'retrying'
+        ''', (datetime.now().isoformat(), job_id))
+        conn.commit()
+        conn.close()
+        return cursor.rowcount == 1
+    except Exception as e:
+        print(f"Error claiming job {job_id}: {e}")
+        return False
+
 def load_job_from_db(job_id):
     """Load job from database."""
     try:
@@ -189,6 +265,13 @@ def load_job_from_db(job_id):
             else:
                 job_data['settings'] = {}
             
+            if job_data.get('checkpoint_json'):
+                try:
+                    job_data['checkpoint'] = json.loads(job_data['checkpoint_json'])
+                except json.JSONDecodeError:
+                    print(f"Warning: Failed to parse checkpoint_json for job {job_id}")
+                    job_data['checkpoint'] = None
+            
             # Map database fields to job format
             job_data['url'] = job_data.get('presentation_url')
             job_data['id'] = job_data.get('id')
@@ -466,8 +549,27 @@ def delete_user_session(session_id):
         print(f"Error deleting user session: {e}")
         return False
 
-# Initialize database on startup
-init_database()
+def init_app():
+    """Start-up side effects: OAuth manager, Service Account, database and
+    requeued generation jobs.
+    
+    Runs when the module is imported by the server, but not when a
+    'spawn' worker process (e.g. of the parse pool, see
+    extraction/parallel_parse.py) re-runs this file as __mp_main__.
+    """
+    global oauth_manager, SERVICE_ACCOUNT_CREDENTIALS
+    
+    credential_cache_settings = get_config().get('credential_cache', {}) or {}
+    oauth_manager = WebOAuthManager(
+        CLIENT_SECRETS_FILE,
+        CredentialCache(
+            refresh_margin_seconds=credential_cache_settings.get('refresh_margin_seconds', 300),
+            max_entries=credential_cache_settings.get('max_entries', 1024)
+        )
+    )
+    SERVICE_ACCOUNT_CREDENTIALS = load_service_account_credentials()
+    init_database()
+    resume_retrying_jobs()
 
 
 def requires_auth(f):
@@ -535,8 +637,7 @@ def auth_callback():
         
         # Try to get user email from Google
         try:
-            from googleapiclient.discovery import build
-            oauth_service = build('oauth2', 'v2', credentials=credentials)
+            oauth_service = get_service_factory().build('oauth2', 'v2', credentials=credentials)
             user_info = oauth_service.userinfo().get().execute()
             user_email = user_info.get('email')
             session['user_email'] = user_email
@@ -545,15 +646,7 @@ def auth_callback():
         
         # Save session to database
         session_id = get_session_id()
-        credentials_dict = {
-            'token': credentials.token,
-            'refresh_token': credentials.refresh_token,
-            'token_uri': credentials.token_uri,
-            'client_id': credentials.client_id,
-            'client_secret': credentials.client_secret,
-            'scopes': credentials.scopes
-        }
-        save_user_session(session_id, user_email, credentials_dict)
+        save_user_session(session_id, user_email, credentials_to_dict(credentials))
         
         # Redirect to the originally requested URL or home
         next_url = session.pop('next_url', None)
@@ -576,6 +669,11 @@ def logout():
     if session_id:
         delete_user_session(session_id)
     
+    # Drop pooled API clients bound to this user's credentials
+    credentials = oauth_manager.get_credentials()
+    if credentials:
+        get_service_factory().invalidate(credentials)
+    
     # Clear OAuth session
     oauth_manager.logout()
     
@@ -638,19 +736,11 @@ def process():
             'session_id': session_id
         }
         
-        # Try OAuth first, then API Key for public presentations
-        credentials = oauth_manager.get_credentials()
-        credentials_dict = None
-        
-        if credentials:
-            credentials_dict = {
-                'token': credentials.token,
-                'refresh_token': credentials.refresh_token,
-                'token_uri': credentials.token_uri,
-                'client_id': credentials.client_id,
-                'client_secret': credentials.client_secret,
-                'scopes': credentials.scopes
-            }
+        # Try OAuth first, then Service Account for public presentations;
+        # the token is valid for the whole expected extraction
+        credentials_dict = oauth_manager.get_credentials_for_job(
+            get_config().get('processing.expected_extraction_seconds', 300)
+        )
         
         # Extract content in background thread
         thread = threading.Thread(
@@ -667,6 +757,12 @@ def process():
         if not raw_text or not raw_text.strip():
             return jsonify({'error': 'Text content is required'}), 400
         
+        from presentation_design.extraction.text_guard import TextInputError, check_input_size, get_text_limits
+        try:
+            check_input_size(raw_text, get_text_limits())
+        except TextInputError as e:
+            return jsonify({'error': str(e)}), 413
+        
         # Create job for text parsing
         job_id = str(uuid.uuid4())[:8]
         jobs[job_id] = {
@@ -694,23 +790,13 @@ def process():
         return jsonify({'error': 'Invalid input method'}), 400
 
 
-def extract_presentation_id(url):
-    """Extract presentation ID from Google Slides URL."""
-    import re
-    patterns = [
-        r'/presentation/d/([a-zA-Z0-9_-]+)',
-        r'/d/([a-zA-Z0-9_-]+)',
-        r'id=([a-zA-Z0-9_-]+)'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
-
-
 def extract_for_editor_smart(job_id, presentation_url, credentials_dict=None, service_account_creds=None):
-    """Smart extraction - tries OAuth first, then Service Account for public presentations.
+    """Smart extraction - races user OAuth and Service Account credential paths.
+    
+    The extraction pipeline (presentation_design/extraction/pipeline.py)
+    starts the path that last worked for this deck (OAuth by default) and
+    starts the other one if the first is slow or fails; the first success
+    wins and is stored on the job with its per-stage timings.
     
     Args:
         job_id: Job identifier
@@ -718,32 +804,33 @@ def extract_for_editor_smart(job_id, presentation_url, credentials_dict=None, se
         credentials_dict: Optional user OAuth credentials dictionary
         service_account_creds: Optional Service Account credentials
     """
-    # Try OAuth extraction first if user credentials available
+    sources = []
     if credentials_dict:
-        print("User OAuth credentials available, using OAuth extraction...")
-        try:
-            extract_for_editor(job_id, presentation_url, credentials_dict)
-            return
-        except Exception as e:
-            print(f"OAuth extraction failed: {e}")
-            import traceback
-            traceback.print_exc()
-            # Continue to try Service Account
-    
-    # Try Service Account extraction for public/shared presentations
+        sources.append(OAuthSource(credentials_dict))
     if service_account_creds:
-        print("Trying Service Account extraction...")
+        sources.append(ServiceAccountSource(service_account_creds))
+    
+    error = None
+    if sources:
         try:
-            extract_with_service_account(job_id, presentation_url, service_account_creds)
+            result = get_extraction_pipeline().run(
+                presentation_url,
+                sources,
+                persist=lambda path, slides: finish_extraction(job_id, slides, path)
+            )
+            jobs[job_id]['extraction_timings'] = result.timings
             return
-        except Exception as e:
-            print(f"Service Account extraction failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except PipelineError as e:
+            print(f"Invalid presentation URL: {e}")
+            error = 'Неверный формат ссылки на Google Slides'
+        except HedgingError as e:
+            print(f"All extraction paths failed: {e}")
     
     # All extraction methods failed
     jobs[job_id]['status'] = 'error'
-    if not credentials_dict and not service_account_creds:
+    if error:
+        jobs[job_id]['error'] = error
+    elif not credentials_dict and not service_account_creds:
         jobs[job_id]['error'] = 'Для импорта презентации необходимо войти в Google-аккаунт или настроить Service Account. См. SETUP_SERVICE_ACCOUNT.md'
     elif credentials_dict and not service_account_creds:
         jobs[job_id]['error'] = 'Не удалось извлечь презентацию с вашими учётными данными. Проверьте доступ к презентации.'
@@ -753,405 +840,90 @@ def extract_for_editor_smart(job_id, presentation_url, credentials_dict=None, se
     save_job_to_db(job_id, jobs[job_id])
 
 
-def extract_with_service_account(job_id, presentation_url, service_account_creds):
-    """Extract presentation using Service Account (for public/shared presentations).
-    
-    Uses the same extraction logic as OAuth but with Service Account credentials.
-    
-    Args:
-        job_id: Job identifier
-        presentation_url: URL of presentation to extract
-        service_account_creds: Service Account credentials object
-    """
-    try:
-        from presentation_design.extraction.slides_extractor import SlidesExtractor
-        from googleapiclient.discovery import build
-        
-        presentation_id = extract_presentation_id(presentation_url)
-        if not presentation_id:
-            raise ValueError('Неверный формат ссылки на Google Slides')
-        
-        print(f"Extracting presentation {presentation_id} with Service Account...")
-        
-        # Create a wrapper to provide the service method (same as OAuth)
-        class ServiceAccountWrapper:
-            def __init__(self, credentials):
-                self.credentials = credentials
-            
-            def build_service(self, service_name, version):
-                return build(service_name, version, credentials=self.credentials)
-        
-        sa_wrapper = ServiceAccountWrapper(service_account_creds)
-        
-        # Extract content in RAW MODE (preserve original text) - same as OAuth
-        extractor = SlidesExtractor(sa_wrapper)
-        raw_data = extractor.extract_presentation(presentation_url, raw_mode=True)
-        
-        print(f"DEBUG: Extracted {len(raw_data.get('slides', []))} slides in raw mode")
-        
-        # Convert raw data to editor format - ALL TEXT goes to mainText, preserve 1:1 order
-        slides = []
-        for idx, slide in enumerate(raw_data.get('slides', [])):
-            raw_elements = slide.get('raw_elements', [])
-            print(f"\n=== DEBUG: Slide {idx} ===")
-            print(f"Total raw elements: {len(raw_elements)}")
-            
-            # Collect ALL text in the EXACT order it appears
-            all_text_parts = []
-            
-            for i, element in enumerate(raw_elements):
-                content = element.get('content', '')
-                placeholder_type = element.get('placeholder_type', '')
-                
-                # Clean up special characters: replace vertical tab and other whitespace with regular space
-                content = content.replace('\v', ' ').replace('\r', ' ')
-                
-                # Filter out metadata lines like "(макроуровень)", "(микроуровень)" etc.
-                import re as re_filter
-                content_stripped = content.strip()
-                if re_filter.match(r'^\([^)]+уровень\)$', content_stripped, re_filter.IGNORECASE):
-                    print(f"  Element {i}: FILTERED OUT metadata '{content_stripped}'")
-                    continue
-                
-                print(f"  Element {i}: type='{placeholder_type}', content_length={len(content)}, preview='{content[:80] if content else '(empty)'}...")
-                
-                # Add ALL non-empty content to mainText
-                if content.strip():
-                    all_text_parts.append(content)
-                    print(f"    -> Added to mainText")
-                else:
-                    print(f"    -> Skipped (empty)")
-            
-            # SKIP slides that have no text content (empty slides or image-only slides)
-            if not all_text_parts:
-                print(f"  -> Skipping slide {idx}: no text content")
-                continue
-            
-            # Use TextParser to format the content (same as text paste)
-            from presentation_design.extraction.text_parser import TextParser
-            parser = TextParser()
-            
-            # Combine all text parts and parse as a single slide
-            all_text_content = '\n'.join(all_text_parts)
-            parsed_slide = parser.create_slide_from_content(all_text_content, str(idx + 1))
-            
-            # Format with HTML using the same function as text paste
-            formatted_content = format_slide_content(parsed_slide)
-            
-            editor_slide = {
-                'content': formatted_content,  # Formatted HTML with title, lists, etc.
-                'title': parsed_slide.get('title', ''),
-                'mainText': parsed_slide.get('mainText', ''),
-                'secondaryText': '',
-                'original_objectIds': [e.get('object_id') for e in raw_elements if e.get('object_id')]
-            }
-            
-            print(f"  -> Created editor slide with title: '{editor_slide['title'][:50] if editor_slide['title'] else '(no title)'}...'")
-            slides.append(editor_slide)
-        
-        print(f"\n=== FINAL: Created {len(slides)} editor slides ===")
-        
-        jobs[job_id]['status'] = 'extracted'
-        jobs[job_id]['slides'] = slides
-        jobs[job_id]['completed_at'] = datetime.now().isoformat()
-        save_job_to_db(job_id, jobs[job_id])
-        
-    except Exception as e:
-        print(f"Service Account extraction error: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
-
-
-def extract_with_api_key(job_id, presentation_url, api_key):
-    """Extract presentation using API Key (for public presentations only).
-    
-    Args:
-        job_id: Job identifier
-        presentation_url: URL of presentation to extract
-        api_key: Google API Key
-    """
-    from googleapiclient.discovery import build
-    from presentation_design.extraction.text_parser import TextParser
-    
-    presentation_id = extract_presentation_id(presentation_url)
-    if not presentation_id:
-        raise ValueError('Неверный формат ссылки на Google Slides')
-    
-    print(f"Extracting presentation {presentation_id} with API Key...")
-    print(f"API Key (first 10 chars): {api_key[:10]}...")
-    
-    # Build service with API Key
-    try:
-        service = build('slides', 'v1', developerKey=api_key)
-        print("Service built successfully")
-    except Exception as e:
-        print(f"Failed to build service: {e}")
-        raise
-    
-    # Get presentation data
-    try:
-        print(f"Attempting to get presentation {presentation_id}...")
-        presentation = service.presentations().get(presentationId=presentation_id).execute()
-        print(f"Successfully retrieved presentation data")
-    except Exception as e:
-        print(f"Failed to get presentation: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
-    
-    slides_data = presentation.get('slides', [])
-    print(f"Got {len(slides_data)} slides from API")
-    
-    # Convert to editor format
-    editor_slides = []
-    parser = TextParser()
-    
-    for idx, slide in enumerate(slides_data):
-        # Extract text from all shapes
-        all_text_parts = []
-        
-        for element in slide.get('pageElements', []):
-            shape = element.get('shape', {})
-            text_content = shape.get('text', {})
-            
-            for text_element in text_content.get('textElements', []):
-                text_run = text_element.get('textRun', {})
-                content = text_run.get('content', '')
-                if content.strip():
-                    all_text_parts.append(content.strip())
-        
-        if not all_text_parts:
-            continue
-        
-        # Parse and format
-        all_text_content = '\n'.join(all_text_parts)
-        parsed_slide = parser.create_slide_from_content(all_text_content, str(idx + 1))
-        formatted_content = format_slide_content(parsed_slide)
-        
-        editor_slide = {
-            'content': formatted_content,
-            'title': parsed_slide.get('title', ''),
-            'mainText': parsed_slide.get('mainText', ''),
-            'secondaryText': '',
-            'original_objectIds': []
-        }
-        editor_slides.append(editor_slide)
-    
-    print(f"Extracted {len(editor_slides)} slides with API Key")
-    
+def finish_extraction(job_id, slides, path=None):
+    """Store extracted editor slides (and the winning credential path) on the job and persist it."""
+    if path:
+        jobs[job_id]['extraction_path'] = path
     jobs[job_id]['status'] = 'extracted'
-    jobs[job_id]['slides'] = editor_slides
+    jobs[job_id]['slides'] = slides
     jobs[job_id]['completed_at'] = datetime.now().isoformat()
     save_job_to_db(job_id, jobs[job_id])
 
-def extract_for_editor(job_id, presentation_url, credentials_dict):
-    """Extract presentation content for editor - preserve exact 1:1 structure from Google Slides.
-    
-    Args:
-        job_id: Job identifier
-        presentation_url: URL of presentation to extract
-        credentials_dict: User credentials dictionary from session
-    """
-    try:
-        from presentation_design.extraction.slides_extractor import SlidesExtractor
-        from presentation_design.extraction.content_parser import ContentParser
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-        
-        # Reconstruct credentials from dictionary
-        credentials = Credentials(
-            token=credentials_dict.get('token'),
-            refresh_token=credentials_dict.get('refresh_token'),
-            token_uri=credentials_dict.get('token_uri'),
-            client_id=credentials_dict.get('client_id'),
-            client_secret=credentials_dict.get('client_secret'),
-            scopes=credentials_dict.get('scopes')
-        )
-        
-        # Create a simple wrapper to provide the service method
-        class CredentialWrapper:
-            def __init__(self, credentials):
-                self.credentials = credentials
-            
-            def build_service(self, service_name, version):
-                return build(service_name, version, credentials=self.credentials)
-        
-        oauth_wrapper = CredentialWrapper(credentials)
-        
-        # Extract content in RAW MODE (preserve original text)
-        extractor = SlidesExtractor(oauth_wrapper)
-        raw_data = extractor.extract_presentation(presentation_url, raw_mode=True)
-        
-        print(f"DEBUG: Extracted {len(raw_data.get('slides', []))} slides in raw mode")
-        
-        # Convert raw data to editor format - ALL TEXT goes to mainText, preserve 1:1 order
-        slides = []
-        for idx, slide in enumerate(raw_data.get('slides', [])):
-            raw_elements = slide.get('raw_elements', [])
-            print(f"\n=== DEBUG: Slide {idx} ===")
-            print(f"Total raw elements: {len(raw_elements)}")
-            
-            # Collect ALL text in the EXACT order it appears
-            all_text_parts = []
-            
-            for i, element in enumerate(raw_elements):
-                content = element.get('content', '')
-                placeholder_type = element.get('placeholder_type', '')
-                
-                # Clean up special characters: replace vertical tab and other whitespace with regular space
-                content = content.replace('\v', ' ').replace('\r', ' ')
-                
-                # Filter out metadata lines like "(макроуровень)", "(микроуровень)" etc.
-                import re as re_filter
-                content_stripped = content.strip()
-                if re_filter.match(r'^\([^)]+уровень\)$', content_stripped, re_filter.IGNORECASE):
-                    print(f"  Element {i}: FILTERED OUT metadata '{content_stripped}'")
-                    continue
-                
-                print(f"  Element {i}: type='{placeholder_type}', content_length={len(content)}, preview='{content[:80] if content else '(empty)'}...")
-                
-                # Add ALL non-empty content to mainText
-                if content.strip():
-                    all_text_parts.append(content)
-                    print(f"    -> Added to mainText")
-                else:
-                    print(f"    -> Skipped (empty)")
-            
-            # SKIP slides that have no text content (empty slides or image-only slides)
-            if not all_text_parts:
-                print(f"  -> Skipping slide {idx}: no text content")
-                continue
-            
-            # Use TextParser to format the content (same as text paste)
-            from presentation_design.extraction.text_parser import TextParser
-            parser = TextParser()
-            
-            # Combine all text parts and parse as a single slide
-            all_text_content = '\n'.join(all_text_parts)
-            parsed_slide = parser.create_slide_from_content(all_text_content, str(idx + 1))
-            
-            # Format with HTML using the same function as text paste
-            formatted_content = format_slide_content(parsed_slide)
-            
-            editor_slide = {
-                'content': formatted_content,  # Formatted HTML with title, lists, etc.
-                'title': parsed_slide.get('title', ''),
-                'mainText': parsed_slide.get('mainText', ''),
-                'secondaryText': '',
-                'original_objectIds': [el.get('objectId', '') for el in raw_elements]
-            }
-            
-            print(f"\n  RESULT: content_length={len(editor_slide['content'])}, mainText_length={len(editor_slide['mainText'])}")
-            print(f"  Content preview: '{editor_slide['content'][:150]}..." if editor_slide['content'] else "  Content: (empty)")
-            slides.append(editor_slide)
-        
-        print(f"DEBUG: Total slides for editor: {len(slides)}")
-        print(f"\nDEBUG: Slide 0 data being saved to jobs:")
-        if slides:
-            print(f"  content length: {len(slides[0].get('content', ''))}")
-            print(f"  content preview: '{slides[0].get('content', '')[:100]}'")
-            print(f"  mainText length: {len(slides[0].get('mainText', ''))}")
-        jobs[job_id]['status'] = 'extracted'
-        jobs[job_id]['slides'] = slides
-        jobs[job_id]['completed_at'] = datetime.now().isoformat()
-        print(f"\nDEBUG: Saved to jobs['{job_id}']['slides'], count: {len(jobs[job_id]['slides'])}")
-        
-        # Save to database
-        save_job_to_db(job_id, jobs[job_id])
-        
-    except Exception as e:
-        print(f"Error extracting presentation: {e}")
-        import traceback
-        traceback.print_exc()
-        jobs[job_id]['status'] = 'error'
-        jobs[job_id]['error'] = str(e)
-        jobs[job_id]['completed_at'] = datetime.now().isoformat()
-        
-        # Save error to database
-        save_job_to_db(job_id, jobs[job_id])
-
 
 def parse_text_for_editor(job_id, raw_text):
     """Parse raw text into formatted slides.
     
+    Slides are parsed lazily and stored in chunks of doubling size: the
+    job stays 'parsing' with a growing slide list and progress counter, so
+    the editor can open on the first chunk while the rest is parsed.
+    
+    Parsing runs within the text_parsing limits (see text_guard): large
+    text is parsed in chunks, and once the CPU budget is spent the rest
+    becomes plain slides (progress['plain_fallback']).
+    
     Args:
         job_id: Job identifier
         raw_text: User-pasted text content
     """
+    job = jobs[job_id]
     try:
+        from presentation_design.extraction.text_guard import ParseBudget, get_text_limits, iter_guarded_slides
         from presentation_design.extraction.text_parser import TextParser
         
         print(f"\n=== Parsing text for job {job_id} ===")
         print(f"Text length: {len(raw_text)} characters")
         
         parser = TextParser()
-        slides_data = parser.parse_slides(raw_text)
+        first_chunk = get_config().get('text_parsing.first_chunk_slides', 20)
+        limits = get_text_limits()
+        budget = ParseBudget(limits.time_budget_seconds)
         
-        print(f"Parsed {len(slides_data)} slides")
-        
-        # Convert to editor format
+        # The parser thread owns this list until parsing finishes
         editor_slides = []
-        for slide in slides_data:
-            formatted_content = format_slide_content(slide)
-            editor_slide = {
-                'content': formatted_content,  # Primary field used by slide_editor.html
-                'title': slide.get('title', ''),  # Legacy compatibility
-                'mainText': slide.get('mainText', ''),  # Legacy compatibility
-                'secondaryText': '',
-                'original_objectIds': []
-            }
-            editor_slides.append(editor_slide)
-            print(f"  Slide {slide.get('id', '?')}: title='{slide.get('title', '')}', content_length={len(formatted_content)}")
-        
-        jobs[job_id]['status'] = 'extracted'
-        jobs[job_id]['slides'] = editor_slides
-        jobs[job_id]['completed_at'] = datetime.now().isoformat()
+        job['slides'] = editor_slides
+        job['progress'] = {'slides_ready': 0, 'done': False, 'plain_fallback': False}
+        
+        slides = iter_guarded_slides(parser, raw_text, limits, budget)
+        for chunk in iter_editor_chunks(slides, first_chunk):
+            editor_slides.extend(chunk)
+            job['progress']['slides_ready'] = len(editor_slides)
+            job['progress']['plain_fallback'] = budget.exhausted
+            print(f"  {len(editor_slides)} slides ready")
+            
+            # Persist what is ready (the editor may already be open)
+            save_job_to_db(job_id, job)
+        
+        job['status'] = 'extracted'
+        job['progress']['done'] = True
+        job['completed_at'] = datetime.now().isoformat()
         
         print(f"Successfully parsed {len(editor_slides)} slides for editor")
         
         # Save to database
-        save_job_to_db(job_id, jobs[job_id])
+        save_job_to_db(job_id, job)
         
     except Exception as e:
         print(f"Error parsing text: {e}")
         import traceback
         traceback.print_exc()
-        jobs[job_id]['status'] = 'error'
-        jobs[job_id]['error'] = str(e)
-        jobs[job_id]['completed_at'] = datetime.now().isoformat()
+        job['status'] = 'error'
+        job['error'] = str(e)
+        job['completed_at'] = datetime.now().isoformat()
         
         # Save error to database
-        save_job_to_db(job_id, jobs[job_id])
+        save_job_to_db(job_id, job)
 
 
-def format_slide_content(slide):
-    """Format slide content with HTML tags.
+def parsing_job(job_id):
+    """Return the in-memory job while its pasted text is still being parsed.
     
-    Args:
-        slide: Parsed slide data with title, mainText, etc.
-        
-    Returns:
-        Formatted HTML string
+    The parser thread keeps adding slides to that record; the database
+    only holds the last stored chunk, so it must not replace the cache.
     """
-    html_parts = []
-    
-    # Add title if present
-    if slide.get('title'):
-        html_parts.append(f"<h1>{slide['title']}</h1>")
-    
-    # Add main text with formatting (already formatted by parser)
-    main_text = slide.get('mainText', '')
-    if main_text:
-        # Main text is already formatted as HTML by the parser
-        html_parts.append(main_text)
-    
-    # Add secondary text if present
-    secondary_text = slide.get('secondaryText', '')
-    if secondary_text:
-        html_parts.append(f"<p class='text-sm text-gray-600'>{secondary_text}</p>")
-    
-    return '\n'.join(html_parts)
+    job = jobs.get(job_id)
+    if job and job.get('status') == 'parsing':
+        return job
+    return None
 
 
 def process_in_background(job_id, presentation_url, template_name):
@@ -1185,7 +957,8 @@ def slide_editor():
             return render_template('auth_error.html', error='Access denied: This job belongs to another user'), 403
         
         # ALWAYS load from database to get latest saved data
-        job = load_job_from_db(job_id)
+        # (except while text parsing is still adding slides)
+        job = parsing_job(job_id) or load_job_from_db(job_id)
         if job:
             # Update memory cache with fresh data
             jobs[job_id] = job
@@ -1252,8 +1025,8 @@ def extraction_status(job_id):
     if not job:
         return "Job not found", 404
     
-    # If extraction completed, redirect to editor
-    if job['status'] == 'extracted':
+    # If extraction completed (or the first parsed slides are ready), redirect to editor
+    if job['status'] == 'extracted' or (job['status'] == 'parsing' and job.get('slides')):
         # Don't pass slides in URL - too long!
         # Instead, pass job_id and fetch slides from jobs dict
         return redirect(url_for('slide_editor',
@@ -1277,21 +1050,14 @@ def process_slides():
     existing_presentation_id = data.get('existing_presentation_id')  # For updates
     settings = data.get('settings', {})  # NEW: presentation settings
     
-    # Get credentials from session
-    credentials = oauth_manager.get_credentials()
-    if not credentials:
+    # Credentials valid for the expected build duration, so a long build
+    # does not stall on a token refresh midway
+    credentials_dict = oauth_manager.get_credentials_for_job(
+        get_config().get('processing.expected_generation_seconds', 1800)
+    )
+    if not credentials_dict:
         return jsonify({'error': 'Not authenticated'}), 401
     
-    # Convert credentials to dictionary
-    credentials_dict = {
-        'token': credentials.token,
-        'refresh_token': credentials.refresh_token,
-        'token_uri': credentials.token_uri,
-        'client_id': credentials.client_id,
-        'client_secret': credentials.client_secret,
-        'scopes': credentials.scopes
-    }
-    
     # Get session ID
     session_id = get_session_id()
     
@@ -1352,40 +1118,30 @@ def process_slides_direct():
     return redirect(url_for('job_status', job_id=job_id))
 
 
-def process_slides_in_background(job_id, slides, template_name=None, existing_presentation_id=None, credentials_dict=None):
+def process_slides_in_background(job_id, slides, template_name=None, existing_presentation_id=None, credentials_dict=None, checkpoint_data=None):
     """Process edited slides in background - create presentation with advanced formatting.
     
+    Generation is checkpointed on the job. When a step fails with a
+    transient error the job is requeued after the suggested delay (honoring
+    Retry-After) and resumes from the failed step instead of starting over.
+    
     Args:
         job_id: Job identifier
         slides: Slides data
         template_name: Template name (optional)
         existing_presentation_id: Existing presentation ID for updates (optional)
         credentials_dict: User credentials dictionary from session
+        checkpoint_data: Checkpoint of a previous attempt (set when requeued)
     """
     try:
         from presentation_design.generation.presentation_builder import PresentationBuilder
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-        
-        # Reconstruct credentials from dictionary
-        credentials = Credentials(
-            token=credentials_dict.get('token'),
-            refresh_token=credentials_dict.get('refresh_token'),
-            token_uri=credentials_dict.get('token_uri'),
-            client_id=credentials_dict.get('client_id'),
-            client_secret=credentials_dict.get('client_secret'),
-            scopes=credentials_dict.get('scopes')
-        )
+        from presentation_design.generation.checkpoint import GenerationCheckpoint, GenerationRetry
         
-        # Create a simple wrapper to provide the service method
-        class CredentialWrapper:
-            def __init__(self, credentials):
-                self.credentials = credentials
-            
-            def build_service(self, service_name, version):
-                return build(service_name, version, credentials=self.credentials)
+        # Reconstruct credentials (with expiry) from dictionary
+        credentials = credentials_from_dict(credentials_dict)
         
-        oauth_wrapper = CredentialWrapper(credentials)
+        # Pooled service clients for the user's credentials
+        oauth_wrapper = CredentialServiceProvider(credentials)
         
         # Build presentation with advanced formatting
         builder = PresentationBuilder(oauth_wrapper)
@@ -1393,20 +1149,56 @@ def process_slides_in_background(job_id, slides, template_name=None, existing_pr
         # Get presentation settings from job data
         settings = jobs[job_id].get('settings', {})
         
-        print(f"Creating presentation with {len(slides)} slides")
-        print(f"Settings: {settings}")
+        def persist_checkpoint(data):
+            jobs[job_id]['checkpoint'] = data
+            save_job_checkpoint(job_id, jobs[job_id].get('status'), data, data.get('presentation_id'))
         
-        result = builder.build_simple_presentation(
-            slides_data=slides,
-            title="New Presentation",
-            settings=settings
+        checkpoint = GenerationCheckpoint(
+            checkpoint_data or jobs[job_id].get('checkpoint'),
+            on_update=persist_checkpoint
         )
+        jobs[job_id].update({'status': 'processing', 'retry_at': None})
+        
+        print(f"Creating presentation with {len(slides)} slides (attempt {checkpoint.attempt + 1})")
+        print(f"Settings: {settings}")
+        
+        try:
+            result = builder.build_simple_presentation(
+                slides_data=slides,
+                title="New Presentation",
+                settings=settings,
+                checkpoint=checkpoint
+            )
+        except GenerationRetry as retry:
+            max_retries = get_config().get('processing.retry_count', 3)
+            if retry.attempt > max_retries:
+                raise
+            
+            # Requeue instead of blocking this worker thread
+            jobs[job_id].update({
+                'status': 'retrying',
+                'retry_at': (datetime.now() + timedelta(seconds=retry.delay)).isoformat(),
+                'error': str(retry)
+            })
+            save_job_checkpoint(
+                job_id, 'retrying', retry.checkpoint.to_dict(), retry.checkpoint.presentation_id,
+                error=str(retry), retry_at=jobs[job_id]['retry_at']
+            )
+            print(f"Job {job_id}: {retry}")
+            
+            schedule_generation_retry(
+                job_id, retry.delay, slides, template_name, existing_presentation_id,
+                credentials_dict, retry.checkpoint.to_dict()
+            )
+            return
         
         jobs[job_id].update({
             'status': 'completed',
             'result': result,
+            'error': None,
             'generated_presentation_id': result.get('presentation_id')
         })
+        save_job_checkpoint(job_id, 'completed', checkpoint.to_dict(), result.get('presentation_id'))
         
     except Exception as e:
         print(f"Error processing slides: {e}")
@@ -1416,6 +1208,80 @@ def process_slides_in_background(job_id, slides, template_name=None, existing_pr
             'status': 'error',
             'error': str(e)
         })
+        save_job_checkpoint(job_id, 'error', jobs[job_id].get('checkpoint'), error=str(e))
+
+
+def schedule_generation_retry(job_id, delay, slides, template_name, existing_presentation_id, credentials_dict, checkpoint_data):
+    """Resume a requeued generation job after delay seconds.
+    
+    The timer only lives in this process; the job is also stored as
+    'retrying' with its checkpoint and retry_at, so resume_retrying_jobs()
+    picks it up again after a restart.
+    """
+    def resume():
+        if not claim_retrying_job(job_id):
+            print(f"Job {job_id} is no longer waiting for a retry")
+            return
+        process_slides_in_background(
+            job_id, slides, template_name, existing_presentation_id,
+            credentials_dict, checkpoint_data=checkpoint_data
+        )
+    
+    timer = threading.Timer(max(0.0, delay), resume)
+    timer.daemon = True
+    timer.start()
+
+
+def resume_retrying_jobs():
+    """Requeue the generation jobs that were waiting for a retry at start-up.
+    
+    Jobs resume from their stored checkpoint at their stored retry_at (at
+    once if it has passed), with the credentials of the owner's session.
+    A job that cannot resume (session expired, no slides) is marked as
+    failed so its status page stops polling.
+    
+    Returns:
+        Number of jobs requeued
+    """
+    try:
+        conn = get_db_connection()
+        job_ids = [row['id'] for row in conn.execute("SELECT id FROM jobs WHERE status = 'retrying'")]
+        conn.close()
+    except Exception as e:
+        print(f"Error loading jobs waiting for a retry: {e}")
+        return 0
+    
+    requeued = 0
+    for job_id in job_ids:
+        job = load_job_from_db(job_id)
+        if not job:
+            continue
+        jobs[job_id] = job
+        
+        user_session = load_user_session(job.get('session_id')) if job.get('session_id') else None
+        credentials_dict = (user_session or {}).get('credentials')
+        if not credentials_dict or not job.get('slides'):
+            error = 'Generation was interrupted by a server restart and cannot resume: please sign in and generate again'
+            job.update({'status': 'error', 'error': error, 'retry_at': None})
+            save_job_checkpoint(job_id, 'error', job.get('checkpoint'), error=error)
+            continue
+        
+        delay = 0.0
+        if job.get('retry_at'):
+            try:
+                delay = (datetime.fromisoformat(job['retry_at']) - datetime.now()).total_seconds()
+            except ValueError:
+                pass
+        
+        schedule_generation_retry(
+            job_id, delay, job['slides'], job.get('template'), None,
+            credentials_dict, job.get('checkpoint')
+        )
+        requeued += 1
+    
+    if requeued:
+        print(f"Requeued {requeued} generation job(s) waiting for a retry")
+    return requeued
 
 
 @app.route('/job/<job_id>')
@@ -1468,13 +1334,49 @@ def api_job_status(job_id):
         'created_at': job.get('created_at'),
         'updated_at': job.get('updated_at'),
         'generated_presentation_id': job.get('generated_presentation_id'),
+        'retry_at': job.get('retry_at'),
         'has_slides': len(job.get('slides', [])) > 0,
-        'slides_count': len(job.get('slides', []))
+        'slides_count': len(job.get('slides', [])),
+        'progress': job.get('progress')
     }
     
     return jsonify(response)
 
 
+@app.route('/api/job/<job_id>/plan')
+def api_job_plan(job_id):
+    """Dry-run request plan for generating a job's slides (no API calls).
+    
+    Query parameters:
+        requests: '0' omits the request lists (counts, sizes and batches only)
+    """
+    session_id = get_session_id()
+    
+    if not user_owns_job(job_id, session_id):
+        return jsonify({'error': 'Access denied'}), 403
+    
+    job = jobs.get(job_id) or load_job_from_db(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    slides = job.get('slides') or []
+    if not slides:
+        return jsonify({'error': 'Job has no slides to plan'}), 409
+    
+    from presentation_design.generation.presentation_builder import PresentationBuilder
+    
+    builder = PresentationBuilder(oauth_manager=None)
+    plan = builder.plan_simple_presentation(
+        slides,
+        title="New Presentation",
+        settings=job.get('settings') or {},
+        include_requests=request.args.get('requests', '1') != '0'
+    )
+    plan['job_id'] = job_id
+    
+    return jsonify(plan)
+
+
 @app.route('/api/save_slides', methods=['POST'])
 def api_save_slides():
     """Save slides and settings to database."""
@@ -1499,6 +1401,10 @@ def api_save_slides():
         if existing_job and existing_job.get('session_id') != session_id:
             return jsonify({'error': 'Access denied'}), 403
         
+        # The parser still owns the slide list; the editor saves once all slides are in
+        if parsing_job(job_id):
+            return jsonify({'error': 'Slides are still being parsed', 'status': 'parsing'}), 409
+        
         # Get or create job
         job = jobs.get(job_id)
         if not job:
@@ -1561,8 +1467,12 @@ def api_load_slides():
         if not user_owns_job(job_id, session_id):
             return jsonify({'error': 'Access denied'}), 403
         
+        # Slides ready so far are requested from this index on
+        offset = request.args.get('offset', 0, type=int)
+        
         # ALWAYS load from database to get latest saved data
-        job = load_job_from_db(job_id)
+        # (except while text parsing is still adding slides)
+        job = parsing_job(job_id) or load_job_from_db(job_id)
         if job:
             # Update memory cache with fresh data
             jobs[job_id] = job
@@ -1574,11 +1484,14 @@ def api_load_slides():
                 'message': 'No saved slides found'
             })
         
+        slides = job.get('slides', [])
         return jsonify({
-            'slides': job.get('slides', []),
+            'slides': slides[offset:] if offset else slides,
+            'slides_total': len(slides),
             'settings': job.get('settings', {}),
             'last_updated': job.get('updated_at', job.get('created_at')),
-            'status': job.get('status')
+            'status': job.get('status'),
+            'progress': job.get('progress')
         })
         
     except Exception as e:
@@ -1622,10 +1535,11 @@ def history():
                           user_email=user_email)
 
 
+if __name__ != '__mp_main__':
+    init_app()
+
+
 if __name__ == '__main__':
-    # Initialize database on startup
-    init_database()
-    
     print("="*60)
     print("Presentation Design System - Web Interface")
     print("="*60)